@@ -26,19 +26,25 @@ Carried forward from v0.4.1/v0.5.0:
 - Streamable HTTP transport for MCP protocol
 - Per-agent provider routing (construction-time fallback; no runtime failover yet)
 """
+import contextlib
 import logging
 import os
 import time
 from datetime import datetime, timezone
 
 logger = logging.getLogger(__name__)
-from fastapi.responses import JSONResponse
+# orjson-rendered when installed; identical stdlib output otherwise.
+from verifimind_mcp.utils.fast_json import FastJSONResponse as JSONResponse
 from starlette.applications import Starlette
 from starlette.responses import HTMLResponse, PlainTextResponse, RedirectResponse, Response
 from starlette.routing import Mount, Route
 from starlette.middleware.cors import CORSMiddleware
 from verifimind_mcp.server import create_http_server
 from verifimind_mcp.middleware import RateLimitMiddleware, get_rate_limit_stats, check_tier, IPBlocklistMiddleware
+from verifimind_mcp.middleware import LLMAdmissionMiddleware, get_llm_admission_stats
+from verifimind_mcp.middleware import CompressionMiddleware, get_compression_stats
+from verifimind_mcp.middleware.polar_adapter import shutdown_polar_adapter
+from verifimind_mcp.coordination.handoff_store import get_store as get_handoff_store
 from verifimind_mcp.registration import (
     EarlyAdopterRegistration,
     FeedbackRequest,
@@ -54,10 +60,9 @@ from verifimind_mcp.registration import (
     UserRegistrationRequest,
     register_user,
 )
-from verifimind_mcp.contract import (
-    get_public_contract,
-    free_tier_models_display,
-)
+from verifimind_mcp.contract import free_tier_models_display
+from verifimind_mcp.contract_snapshot import contract_snapshot, etag_matches
+from verifimind_mcp.utils.fast_json import dumps as json_dumps
 from verifimind_mcp.policies import (
     PRIVACY_POLICY,
     PRIVACY_POLICY_VERSION,
@@ -68,12 +73,16 @@ from verifimind_mcp.policies.privacy_policy import PRIVACY_POLICY_EFFECTIVE_DATE
 from verifimind_mcp.policies.terms import TERMS_EFFECTIVE_DATE
 from verifimind_mcp.pages import get_register_page, get_optout_page, get_privacy_page, get_terms_page, get_research_page, get_library_page, get_dashboard_page, get_paradox_page, get_cowork_page, get_evaluation_roadmap_page
 from verifimind_mcp.utils.trinity_history import read_trinity_history
+from verifimind_mcp.utils.log_pipeline import install_log_pipeline, shutdown_log_pipeline
+from verifimind_mcp.utils.loop_monitor import get_loop_monitor_stats, start_loop_monitor, stop_loop_monitor
+from verifimind_mcp.utils.offload import get_offload_stats, run_in_thread, shutdown_offload
+from verifimind_mcp.templates.registry import get_registry as get_template_registry
 from verifimind_mcp.llm.provider import PROVIDER_CONFIGS, PROVIDER_DEFAULT_GEMINI_MODEL
+from verifimind_mcp.llm.health_prober import get_provider_prober_stats, start_provider_prober, stop_provider_prober
 from verifimind_mcp.availability import (
     COORDINATION_MAINTENANCE_PREFIX,
     CUSTOM_TEMPLATE_MAINTENANCE_PREFIX,
     DEFINED_TOOL_COUNT,
-    get_tool_availability,
 )
 
 COORDINATION_MAINTENANCE_USE_FOR = (
@@ -83,7 +92,7 @@ COORDINATION_MAINTENANCE_USE_FOR = (
 
 def _tool_availability() -> dict:
     """Canonical current availability projected onto every public surface."""
-    return get_tool_availability()
+    return contract_snapshot().tool_availability
 
 # v0.5.51 (D-85-2): display copy for the free-tier Gemini default is projected
 # from the runtime constant - a model migration updates every surface at once.
@@ -158,7 +167,7 @@ def _get_inference_mode() -> str:
 
 def _hosted_routing_display() -> dict:
     """Per-agent hosted routing, generated from the truth contract (D-85-2)."""
-    routing = get_public_contract()["free_tier_routing"]
+    routing = contract_snapshot().contract["free_tier_routing"]
     display = {
         f"agent_{aid.lower()}": f"{r['model']} ({r['provider']}, developer key - FREE; construction fallback: {r['construction_fallback']})"
         for aid, r in routing.items()
@@ -167,11 +176,32 @@ def _hosted_routing_display() -> dict:
     return display
 
 
+def _request_base_url(request) -> str:
+    scheme = request.headers.get("x-forwarded-proto", request.url.scheme)
+    host = request.headers.get("host", request.url.netloc)
+    return f"{scheme}://{host}"
+
+
+def _document_response(request, key, build) -> Response:
+    """Serve a discovery document from the contract snapshot.
+
+    The body is serialized once per configuration generation; a matching
+    If-None-Match gets 304. ``no-cache`` makes intermediaries revalidate, so
+    they cannot keep serving an old generation (cf. /health, v0.5.60 P3-C).
+    """
+    document = contract_snapshot().document(key, lambda: json_dumps(build()))
+    headers = {"ETag": document.etag, "Cache-Control": "no-cache"}
+    if_none_match = request.headers.get("if-none-match", "") if request is not None else ""
+    if etag_matches(if_none_match, document.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(document.body, media_type="application/json", headers=headers)
+
+
 async def health_handler(request):
     """Health check endpoint — v2 with uptime and session tracing (v0.5.0)."""
     rate_stats = get_rate_limit_stats()
     uptime_seconds = int(time.time() - _SERVER_START_TIME)
-    contract = get_public_contract()
+    contract = contract_snapshot().contract
 
     payload = {
         "status": "healthy",
@@ -219,6 +249,11 @@ async def health_handler(request):
             "global": f"{rate_stats['global_limit']} req/{rate_stats['window_seconds']}s",
             "current_load": f"{rate_stats['global_requests_in_window']}/{rate_stats['global_limit']}"
         },
+        "llm_admission": get_llm_admission_stats(),
+        "compression": get_compression_stats(),
+        "event_loop": get_loop_monitor_stats(),
+        "offload": get_offload_stats(),
+        "provider_probe": get_provider_prober_stats(),
         "quick_start": f"Run: {MCP_REMOTE_QUICKSTART}"
     }
     # WP-B (D-88-5 + B-90-7): evidence + aggregate circuit state, served ONLY
@@ -237,6 +272,10 @@ async def health_handler(request):
             "circuit": circuit_snapshot(),
             "admission_scope": ADMISSION_SCOPE,
         }
+    # Preview: detached Trinity job pool load, only while the preview is on.
+    if "submit_trinity" in payload["tool_availability"].get("preview_tools", ()):
+        from verifimind_mcp.utils.trinity_jobs import get_trinity_job_runner
+        payload["trinity_jobs"] = get_trinity_job_runner().stats()
     # v0.5.60 (P3-C): /health is a liveness/version truth surface — it must
     # never be served stale. The origin previously sent NO cache header, which
     # let intermediaries (observed: CDN edge during the v0.5.58 rollout) cache
@@ -252,210 +291,211 @@ async def mcp_config_handler(request):
     - Explicit tool listings
     - BYOK authentication instructions
     """
-    # Get the base URL from the request
-    scheme = request.headers.get("x-forwarded-proto", request.url.scheme)
-    host = request.headers.get("host", request.url.netloc)
-    base_url = f"{scheme}://{host}"
-
-    # v0.5.54 (T S88 criterion 4): hosted-route copy is GENERATED from the
-    # truth contract so tool descriptions cannot drift from actual routing.
-    # B-90-7: the SAME contract read feeds the runtime-failover flag below —
-    # every surface projects one live truth, never a hardcoded copy.
-    _contract = get_public_contract()
-    _routing = _contract["free_tier_routing"]
-    _rx, _rz, _rcs = _routing["X"], _routing["Z"], _routing["CS"]
-
-    return JSONResponse({
-        "mcpServers": {
-            "verifimind-genesis": {
-                "url": f"{base_url}/mcp/",
-                "iconUrl": f"{base_url}/logo.png",
-                "description": "VerifiMind PEAS Genesis Methodology MCP Server - Multi-Model AI Validation with RefleXion Trinity",
-                "version": SERVER_VERSION,
-                "transport": "streamable-http",
-                "resources": 4,
-                "tools": DEFINED_TOOL_COUNT,
-                "tool_availability": _tool_availability(),
-                "features": {
-                    "agents": ["X (Innovation)", "Z (Ethics)", "CS (Security)"],
-                    # v0.5.51 (D-85-2): generated from the truth contract — never hand-edit
-                    "models": free_tier_models_display() + ["BYOK: 6 providers (Gemini, Anthropic, OpenAI, Groq, Cerebras, Mistral)"],
-                    "cost_per_validation": "$0 (FREE tier)",
-                    "byok": True,
-                    "construction_fallback": True,
-                    "runtime_failover": _contract["runtime_failover_enabled"],
-                    "rate_limiting": True
-                },
-                "headers": {
-                    "Accept": "application/json, text/event-stream, text/markdown"
+    base_url = _request_base_url(request)
+
+    def build() -> dict:
+        # v0.5.54 (T S88 criterion 4): hosted-route copy is GENERATED from the
+        # truth contract so tool descriptions cannot drift from actual routing.
+        # B-90-7: the SAME contract read feeds the runtime-failover flag below —
+        # every surface projects one live truth, never a hardcoded copy.
+        _contract = contract_snapshot().contract
+        _routing = _contract["free_tier_routing"]
+        _rx, _rz, _rcs = _routing["X"], _routing["Z"], _routing["CS"]
+
+        return {
+            "mcpServers": {
+                "verifimind-genesis": {
+                    "url": f"{base_url}/mcp/",
+                    "iconUrl": f"{base_url}/logo.png",
+                    "description": "VerifiMind PEAS Genesis Methodology MCP Server - Multi-Model AI Validation with RefleXion Trinity",
+                    "version": SERVER_VERSION,
+                    "transport": "streamable-http",
+                    "resources": 4,
+                    "tools": DEFINED_TOOL_COUNT,
+                    "tool_availability": _tool_availability(),
+                    "features": {
+                        "agents": ["X (Innovation)", "Z (Ethics)", "CS (Security)"],
+                        # v0.5.51 (D-85-2): generated from the truth contract — never hand-edit
+                        "models": free_tier_models_display(_contract) + ["BYOK: 6 providers (Gemini, Anthropic, OpenAI, Groq, Cerebras, Mistral)"],
+                        "cost_per_validation": "$0 (FREE tier)",
+                        "byok": True,
+                        "construction_fallback": True,
+                        "runtime_failover": _contract["runtime_failover_enabled"],
+                        "rate_limiting": True
+                    },
+                    "headers": {
+                        "Accept": "application/json, text/event-stream, text/markdown"
+                    }
                 }
-            }
-        },
-        # Ready-to-paste config snippets
-        "quickstart": {
-            "claude_code": {
-                "description": "Run this command in your terminal to add the server",
-                "command": MCP_REMOTE_QUICKSTART,
-                "project_scope": f"claude mcp add -s project verifimind -- npx -y mcp-remote {MCP_SERVER_URL}"
             },
-            "claude_desktop": {
-                "description": "Add this to your claude_desktop_config.json",
-                "config": {
-                    "mcpServers": {
-                        "verifimind": {
-                            "command": "npx",
-                            "args": ["-y", "mcp-remote", MCP_SERVER_URL]
+            # Ready-to-paste config snippets
+            "quickstart": {
+                "claude_code": {
+                    "description": "Run this command in your terminal to add the server",
+                    "command": MCP_REMOTE_QUICKSTART,
+                    "project_scope": f"claude mcp add -s project verifimind -- npx -y mcp-remote {MCP_SERVER_URL}"
+                },
+                "claude_desktop": {
+                    "description": "Add this to your claude_desktop_config.json",
+                    "config": {
+                        "mcpServers": {
+                            "verifimind": {
+                                "command": "npx",
+                                "args": ["-y", "mcp-remote", MCP_SERVER_URL]
+                            }
                         }
+                    },
+                    "config_path": {
+                        "windows": "%APPDATA%\\Claude\\claude_desktop_config.json",
+                        "macos": "~/Library/Application Support/Claude/claude_desktop_config.json",
+                        "linux": "~/.config/Claude/claude_desktop_config.json"
                     }
                 },
-                "config_path": {
-                    "windows": "%APPDATA%\\Claude\\claude_desktop_config.json",
-                    "macos": "~/Library/Application Support/Claude/claude_desktop_config.json",
-                    "linux": "~/.config/Claude/claude_desktop_config.json"
+                "direct_http": {
+                    "description": "For custom MCP clients using HTTP transport",
+                    "url": f"{base_url}/mcp/",
+                    "transport": "streamable-http",
+                    "method": "POST",
+                    "headers": {
+                        "Content-Type": CT_JSON,
+                        "Accept": "application/json, text/event-stream"
+                    }
                 }
             },
-            "direct_http": {
-                "description": "For custom MCP clients using HTTP transport",
-                "url": f"{base_url}/mcp/",
-                "transport": "streamable-http",
-                "method": "POST",
-                "headers": {
-                    "Content-Type": CT_JSON,
-                    "Accept": "application/json, text/event-stream"
-                }
-            }
-        },
-        # Explicit tool listings
-        "tools": [
-            {
-                "name": "consult_agent_x",
-                "description": f"Innovation & Strategy analysis (hosted: {_rx['model']} via {_rx['provider']}, FREE; any provider via BYOK)",
-                "parameters": ["concept_name", "concept_description", "context (optional)"]
-            },
-            {
-                "name": "consult_agent_z",
-                "description": f"Ethics & Safety review with VETO power (hosted: {_rz['model']} via {_rz['provider']}, FREE; any provider via BYOK)",
-                "parameters": ["concept_name", "concept_description", "context (optional)", "prior_reasoning (optional)"]
-            },
-            {
-                "name": "consult_agent_cs",
-                "description": f"Security & Feasibility validation (hosted: {_rcs['model']} via {_rcs['provider']}, FREE; any provider via BYOK)",
-                "parameters": ["concept_name", "concept_description", "context (optional)", "prior_reasoning (optional)"]
-            },
-            {
-                "name": "run_full_trinity",
-                "description": "Complete X → Z → CS validation with per-agent optimized providers; returns auditable reasoning by default",
-                "parameters": ["concept_name", "concept_description", "context (optional)", "save_to_history (default: false)", "detail (summary|standard|full, default: standard)"]
-            },
-            # v0.4.0 Template Tools
-            {
-                "name": "list_prompt_templates",
-                "description": "List available prompt templates with filtering",
-                "parameters": ["agent_id (optional)", "category (optional)", "tags (optional)"]
-            },
-            {
-                "name": "get_prompt_template",
-                "description": "Get a specific template by ID",
-                "parameters": ["template_id", "include_content (default: true)"]
-            },
-            {
-                "name": "export_prompt_template",
-                "description": "Export template to Markdown or JSON",
-                "parameters": ["template_id", "format (markdown/json)"]
-            },
-            {
-                "name": "register_custom_template",
-                "description": CUSTOM_TEMPLATE_MAINTENANCE_PREFIX + "Register a new custom prompt template",
-                "parameters": ["name", "agent_id", "content", "category", "description", "tags"]
-            },
-            {
-                "name": "import_template_from_url",
-                "description": CUSTOM_TEMPLATE_MAINTENANCE_PREFIX + "Import template from URL (GitHub Gist, raw file)",
-                "parameters": ["url", "validate (default: true)"]
-            },
-            {
-                "name": "get_template_statistics",
-                "description": "Get template registry statistics",
-                "parameters": []
-            },
-            # v0.5.16 Coordination Tools (free for everyone since v0.5.28)
-            {
-                "name": "coordination_handoff_create",
-                "description": COORDINATION_MAINTENANCE_PREFIX + "Create a structured agent handoff record",
-                "parameters": ["agent_id", "session_type", "completed", "decisions", "artifacts", "pending", "pioneer_key"]
-            },
-            {
-                "name": "coordination_handoff_read",
-                "description": COORDINATION_MAINTENANCE_PREFIX + "Read the latest handoff record for a given agent",
-                "parameters": ["pioneer_key", "agent_id (optional)", "count (default: 1)"]
-            },
-            {
-                "name": "coordination_team_status",
-                "description": COORDINATION_MAINTENANCE_PREFIX + "Get current status of all coordination agents",
-                "parameters": ["pioneer_key"]
-            }
-        ],
-        # Resources
-        "resources": [
-            {"uri": "genesis://config/master_prompt", "description": "Genesis methodology — live X/Z/CS production prompts"},
-            {"uri": "genesis://history/latest", "description": "Most recent validation result"},
-            {"uri": "genesis://history/all", "description": "Complete validation history"},
-            {"uri": "genesis://state/project_info", "description": "Project metadata and agent info"}
-        ],
-        # BYOK Authentication
-        "authentication": {
-            "description": "Bring Your Own Key (BYOK) - provide API keys via session config",
-            "supported_providers": ["gemini", "groq", "cerebras", "openai", "anthropic", "mistral", "ollama", "mock"],
-            "default_provider": "mock",
-            "important_note": "BYOK session config applies ONE provider to all agents (X, Z, CS). The hosted free tier routes per-agent (see hosted_server_config, generated from the live routing contract).",
-            "hosted_server_config": _hosted_routing_display(),
-            "setup_options": {
-                "option_1_use_hosted": {
-                    "description": "Use the hosted server with developer-provided keys (multi-provider free tier — per-agent routing in hosted_server_config)",
-                    "cost": "FREE (covered by developer)",
-                    "action": "Just use the tools - no configuration needed"
+            # Explicit tool listings
+            "tools": [
+                {
+                    "name": "consult_agent_x",
+                    "description": f"Innovation & Strategy analysis (hosted: {_rx['model']} via {_rx['provider']}, FREE; any provider via BYOK)",
+                    "parameters": ["concept_name", "concept_description", "context (optional)"]
                 },
-                "option_2_environment_variables": {
-                    "description": "Set environment variables before starting Claude Code",
-                    "variables": {
-                        "LLM_PROVIDER": "gemini | groq | cerebras | anthropic | openai | mistral | mock",
-                        "GEMINI_API_KEY": "your-gemini-api-key",
-                        "GROQ_API_KEY": "your-groq-api-key",
-                        "CEREBRAS_API_KEY": "your-csk_-prefixed-key",
-                        "ANTHROPIC_API_KEY": "your-anthropic-api-key",
-                        "OPENAI_API_KEY": "your-openai-api-key",
-                        "MISTRAL_API_KEY": "your-mistral-api-key"
-                    },
-                    "example_bash": "export GEMINI_API_KEY='your-key' && export LLM_PROVIDER='gemini' && claude",
-                    "example_powershell": "$env:GEMINI_API_KEY='your-key'; $env:LLM_PROVIDER='gemini'; claude"
+                {
+                    "name": "consult_agent_z",
+                    "description": f"Ethics & Safety review with VETO power (hosted: {_rz['model']} via {_rz['provider']}, FREE; any provider via BYOK)",
+                    "parameters": ["concept_name", "concept_description", "context (optional)", "prior_reasoning (optional)"]
                 },
-                "option_3_claude_desktop_env": {
-                    "description": "Add env to Claude Desktop config",
-                    "config_example": {
-                        "mcpServers": {
-                            "verifimind": {
-                                "command": "npx",
-                                "args": ["-y", "mcp-remote", MCP_SERVER_URL],
-                                "env": {
-                                    "LLM_PROVIDER": "gemini",
-                                    "GEMINI_API_KEY": "your-api-key"
+                {
+                    "name": "consult_agent_cs",
+                    "description": f"Security & Feasibility validation (hosted: {_rcs['model']} via {_rcs['provider']}, FREE; any provider via BYOK)",
+                    "parameters": ["concept_name", "concept_description", "context (optional)", "prior_reasoning (optional)"]
+                },
+                {
+                    "name": "run_full_trinity",
+                    "description": "Complete X → Z → CS validation with per-agent optimized providers; returns auditable reasoning by default",
+                    "parameters": ["concept_name", "concept_description", "context (optional)", "save_to_history (default: false)", "detail (summary|standard|full, default: standard)"]
+                },
+                # v0.4.0 Template Tools
+                {
+                    "name": "list_prompt_templates",
+                    "description": "List available prompt templates with filtering",
+                    "parameters": ["agent_id (optional)", "category (optional)", "tags (optional)"]
+                },
+                {
+                    "name": "get_prompt_template",
+                    "description": "Get a specific template by ID",
+                    "parameters": ["template_id", "include_content (default: true)"]
+                },
+                {
+                    "name": "export_prompt_template",
+                    "description": "Export template to Markdown or JSON",
+                    "parameters": ["template_id", "format (markdown/json)"]
+                },
+                {
+                    "name": "register_custom_template",
+                    "description": CUSTOM_TEMPLATE_MAINTENANCE_PREFIX + "Register a new custom prompt template",
+                    "parameters": ["name", "agent_id", "content", "category", "description", "tags"]
+                },
+                {
+                    "name": "import_template_from_url",
+                    "description": CUSTOM_TEMPLATE_MAINTENANCE_PREFIX + "Import template from URL (GitHub Gist, raw file)",
+                    "parameters": ["url", "validate (default: true)"]
+                },
+                {
+                    "name": "get_template_statistics",
+                    "description": "Get template registry statistics",
+                    "parameters": []
+                },
+                # v0.5.16 Coordination Tools (free for everyone since v0.5.28)
+                {
+                    "name": "coordination_handoff_create",
+                    "description": COORDINATION_MAINTENANCE_PREFIX + "Create a structured agent handoff record",
+                    "parameters": ["agent_id", "session_type", "completed", "decisions", "artifacts", "pending", "pioneer_key"]
+                },
+                {
+                    "name": "coordination_handoff_read",
+                    "description": COORDINATION_MAINTENANCE_PREFIX + "Read the latest handoff record for a given agent",
+                    "parameters": ["pioneer_key", "agent_id (optional)", "count (default: 1)"]
+                },
+                {
+                    "name": "coordination_team_status",
+                    "description": COORDINATION_MAINTENANCE_PREFIX + "Get current status of all coordination agents",
+                    "parameters": ["pioneer_key"]
+                }
+            ],
+            # Resources
+            "resources": [
+                {"uri": "genesis://config/master_prompt", "description": "Genesis methodology — live X/Z/CS production prompts"},
+                {"uri": "genesis://history/latest", "description": "Most recent validation result"},
+                {"uri": "genesis://history/all", "description": "Complete validation history"},
+                {"uri": "genesis://state/project_info", "description": "Project metadata and agent info"}
+            ],
+            # BYOK Authentication
+            "authentication": {
+                "description": "Bring Your Own Key (BYOK) - provide API keys via session config",
+                "supported_providers": ["gemini", "groq", "cerebras", "openai", "anthropic", "mistral", "ollama", "mock"],
+                "default_provider": "mock",
+                "important_note": "BYOK session config applies ONE provider to all agents (X, Z, CS). The hosted free tier routes per-agent (see hosted_server_config, generated from the live routing contract).",
+                "hosted_server_config": _hosted_routing_display(),
+                "setup_options": {
+                    "option_1_use_hosted": {
+                        "description": "Use the hosted server with developer-provided keys (multi-provider free tier — per-agent routing in hosted_server_config)",
+                        "cost": "FREE (covered by developer)",
+                        "action": "Just use the tools - no configuration needed"
+                    },
+                    "option_2_environment_variables": {
+                        "description": "Set environment variables before starting Claude Code",
+                        "variables": {
+                            "LLM_PROVIDER": "gemini | groq | cerebras | anthropic | openai | mistral | mock",
+                            "GEMINI_API_KEY": "your-gemini-api-key",
+                            "GROQ_API_KEY": "your-groq-api-key",
+                            "CEREBRAS_API_KEY": "your-csk_-prefixed-key",
+                            "ANTHROPIC_API_KEY": "your-anthropic-api-key",
+                            "OPENAI_API_KEY": "your-openai-api-key",
+                            "MISTRAL_API_KEY": "your-mistral-api-key"
+                        },
+                        "example_bash": "export GEMINI_API_KEY='your-key' && export LLM_PROVIDER='gemini' && claude",
+                        "example_powershell": "$env:GEMINI_API_KEY='your-key'; $env:LLM_PROVIDER='gemini'; claude"
+                    },
+                    "option_3_claude_desktop_env": {
+                        "description": "Add env to Claude Desktop config",
+                        "config_example": {
+                            "mcpServers": {
+                                "verifimind": {
+                                    "command": "npx",
+                                    "args": ["-y", "mcp-remote", MCP_SERVER_URL],
+                                    "env": {
+                                        "LLM_PROVIDER": "gemini",
+                                        "GEMINI_API_KEY": "your-api-key"
+                                    }
                                 }
                             }
                         }
                     }
-                }
-            },
-            "get_free_api_keys": {
-                "gemini": "https://aistudio.google.com (FREE tier)",
-                "groq": "https://console.groq.com (FREE tier)",
-                "cerebras": "https://cloud.cerebras.ai (free tier available; limits vary by account)",
-                "anthropic": "https://console.anthropic.com (paid)",
-                "openai": "https://platform.openai.com (paid)",
-                "mistral": "https://console.mistral.ai (paid)"
-            },
-            "security_warning": "NEVER share API keys in chat messages. Use environment variables or config files."
+                },
+                "get_free_api_keys": {
+                    "gemini": "https://aistudio.google.com (FREE tier)",
+                    "groq": "https://console.groq.com (FREE tier)",
+                    "cerebras": "https://cloud.cerebras.ai (free tier available; limits vary by account)",
+                    "anthropic": "https://console.anthropic.com (paid)",
+                    "openai": "https://platform.openai.com (paid)",
+                    "mistral": "https://console.mistral.ai (paid)"
+                },
+                "security_warning": "NEVER share API keys in chat messages. Use environment variables or config files."
+            }
         }
-    })
+
+    return _document_response(request, ("mcp-config", base_url), build)
+
 
 ROOT_HTML = """<!DOCTYPE html>
 <html lang="en">
@@ -631,156 +671,158 @@ async def root_post_redirect(request):
 
 
 async def setup_handler(request):
-    # v0.5.52 (T S87 WP-A): descriptive fields project from the truth contract
-    _routing = get_public_contract()["free_tier_routing"]
-    _x, _z, _cs = _routing["X"], _routing["Z"], _routing["CS"]
     """User-friendly setup page with step-by-step instructions"""
-    # Get the base URL from the request
-    scheme = request.headers.get("x-forwarded-proto", request.url.scheme)
-    host = request.headers.get("host", request.url.netloc)
-    base_url = f"{scheme}://{host}"
+    base_url = _request_base_url(request)
 
-    return JSONResponse({
-        "title": "VerifiMind MCP Server Setup Guide",
-        "version": SERVER_VERSION,
+    def build() -> dict:
+        # v0.5.52 (T S87 WP-A): descriptive fields project from the truth contract
+        _routing = contract_snapshot().contract["free_tier_routing"]
+        _x, _z, _cs = _routing["X"], _routing["Z"], _routing["CS"]
 
-        "step_1_choose_client": {
-            "description": "Choose your MCP client",
-            "options": ["Claude Code (CLI)", "Claude Desktop (App)", "Custom Client"]
-        },
+        return {
+            "title": "VerifiMind MCP Server Setup Guide",
+            "version": SERVER_VERSION,
 
-        "step_2_claude_code": {
-            "title": "Setup for Claude Code",
-            "steps": [
-                {
-                    "step": 1,
-                    "action": "Open terminal and run",
-                    "command": MCP_REMOTE_QUICKSTART,
-                    "note": "Use '-s project' instead of '-s user' for project-specific setup"
-                },
-                {
-                    "step": 2,
-                    "action": "Verify connection",
-                    "command": "claude mcp list",
-                    "expected": "verifimind: ... - Connected"
-                },
-                {
-                    "step": 3,
-                    "action": "Restart Claude Code",
-                    "command": "Exit and re-run 'claude' in your terminal"
-                },
-                {
-                    "step": 4,
-                    "action": "Check available tools",
-                    "command": "Type /mcp in Claude Code"
-                }
-            ]
-        },
+            "step_1_choose_client": {
+                "description": "Choose your MCP client",
+                "options": ["Claude Code (CLI)", "Claude Desktop (App)", "Custom Client"]
+            },
 
-        "step_2_claude_desktop": {
-            "title": "Setup for Claude Desktop",
-            "steps": [
-                {
-                    "step": 1,
-                    "action": "Find your config file",
-                    "paths": {
-                        "windows": "%APPDATA%\\Claude\\claude_desktop_config.json",
-                        "macos": "~/Library/Application Support/Claude/claude_desktop_config.json",
-                        "linux": "~/.config/Claude/claude_desktop_config.json"
+            "step_2_claude_code": {
+                "title": "Setup for Claude Code",
+                "steps": [
+                    {
+                        "step": 1,
+                        "action": "Open terminal and run",
+                        "command": MCP_REMOTE_QUICKSTART,
+                        "note": "Use '-s project' instead of '-s user' for project-specific setup"
+                    },
+                    {
+                        "step": 2,
+                        "action": "Verify connection",
+                        "command": "claude mcp list",
+                        "expected": "verifimind: ... - Connected"
+                    },
+                    {
+                        "step": 3,
+                        "action": "Restart Claude Code",
+                        "command": "Exit and re-run 'claude' in your terminal"
+                    },
+                    {
+                        "step": 4,
+                        "action": "Check available tools",
+                        "command": "Type /mcp in Claude Code"
                     }
-                },
-                {
-                    "step": 2,
-                    "action": "Add this configuration",
-                    "config": {
-                        "mcpServers": {
-                            "verifimind": {
-                                "command": "npx",
-                                "args": ["-y", "mcp-remote", MCP_SERVER_URL]
+                ]
+            },
+
+            "step_2_claude_desktop": {
+                "title": "Setup for Claude Desktop",
+                "steps": [
+                    {
+                        "step": 1,
+                        "action": "Find your config file",
+                        "paths": {
+                            "windows": "%APPDATA%\\Claude\\claude_desktop_config.json",
+                            "macos": "~/Library/Application Support/Claude/claude_desktop_config.json",
+                            "linux": "~/.config/Claude/claude_desktop_config.json"
+                        }
+                    },
+                    {
+                        "step": 2,
+                        "action": "Add this configuration",
+                        "config": {
+                            "mcpServers": {
+                                "verifimind": {
+                                    "command": "npx",
+                                    "args": ["-y", "mcp-remote", MCP_SERVER_URL]
+                                }
                             }
                         }
+                    },
+                    {
+                        "step": 3,
+                        "action": "Restart Claude Desktop"
                     }
-                },
-                {
-                    "step": 3,
-                    "action": "Restart Claude Desktop"
-                }
-            ]
-        },
+                ]
+            },
 
-        "step_3_test": {
-            "title": "Test the connection",
-            "example_prompts": [
-                "Use the run_full_trinity tool to validate a concept called 'AI-powered code review' that uses machine learning to detect bugs",
-                "Consult Agent X about the innovation potential of blockchain voting systems",
-                "Ask Agent Z to evaluate the ethics of facial recognition in schools"
-            ]
-        },
+            "step_3_test": {
+                "title": "Test the connection",
+                "example_prompts": [
+                    "Use the run_full_trinity tool to validate a concept called 'AI-powered code review' that uses machine learning to detect bugs",
+                    "Consult Agent X about the innovation potential of blockchain voting systems",
+                    "Ask Agent Z to evaluate the ethics of facial recognition in schools"
+                ]
+            },
 
-        "available_tools": {
-            "_total": "13 defined: 8 active (4 Trinity + 4 built-in template reads); 5 tools temporarily unavailable",
-            "_availability": _tool_availability(),
-            "trinity": {
-                "consult_agent_x": {
-                    "description": "Innovation & Strategy analysis",
-                    "powered_by": f"{_x['model']} ({_x['provider']}, FREE)",
-                    "use_for": "Evaluating market potential, competitive positioning, innovation score"
-                },
-                "consult_agent_z": {
-                    "description": "Ethics & Safety review",
-                    "powered_by": f"{_z['model']} ({_z['provider']}, FREE; any provider via BYOK)",
-                    "use_for": "Privacy concerns, bias detection, social impact, Z-Protocol compliance",
-                    "special": "Has VETO POWER - can reject unethical concepts"
-                },
-                "consult_agent_cs": {
-                    "description": "Security & Feasibility validation",
-                    "powered_by": f"{_cs['model']} ({_cs['provider']}, FREE; any provider via BYOK)",
-                    "use_for": "Security vulnerabilities, attack vectors, Socratic questioning"
+            "available_tools": {
+                "_total": "13 defined: 8 active (4 Trinity + 4 built-in template reads); 5 tools temporarily unavailable",
+                "_availability": _tool_availability(),
+                "trinity": {
+                    "consult_agent_x": {
+                        "description": "Innovation & Strategy analysis",
+                        "powered_by": f"{_x['model']} ({_x['provider']}, FREE)",
+                        "use_for": "Evaluating market potential, competitive positioning, innovation score"
+                    },
+                    "consult_agent_z": {
+                        "description": "Ethics & Safety review",
+                        "powered_by": f"{_z['model']} ({_z['provider']}, FREE; any provider via BYOK)",
+                        "use_for": "Privacy concerns, bias detection, social impact, Z-Protocol compliance",
+                        "special": "Has VETO POWER - can reject unethical concepts"
+                    },
+                    "consult_agent_cs": {
+                        "description": "Security & Feasibility validation",
+                        "powered_by": f"{_cs['model']} ({_cs['provider']}, FREE; any provider via BYOK)",
+                        "use_for": "Security vulnerabilities, attack vectors, Socratic questioning"
+                    },
+                    "run_full_trinity": {
+                        "description": "Complete validation workflow with per-agent optimized providers",
+                        "flow": f"X ({_x['provider']}/{_x['model']}) -> Z ({_z['provider']}/{_z['model']}) -> CS ({_cs['provider']}/{_cs['model']}) -> Synthesis",
+                        "use_for": "Comprehensive concept validation with all three agents"
+                    }
                 },
-                "run_full_trinity": {
-                    "description": "Complete validation workflow with per-agent optimized providers",
-                    "flow": f"X ({_x['provider']}/{_x['model']}) -> Z ({_z['provider']}/{_z['model']}) -> CS ({_cs['provider']}/{_cs['model']}) -> Synthesis",
-                    "use_for": "Comprehensive concept validation with all three agents"
+                "coordination": {
+                    "coordination_handoff_create": {
+                        "description": COORDINATION_MAINTENANCE_PREFIX + "Create a structured agent handoff record",
+                        "tier": "Free pricing; temporarily unavailable during security maintenance",
+                        "use_for": COORDINATION_MAINTENANCE_USE_FOR
+                    },
+                    "coordination_handoff_read": {
+                        "description": COORDINATION_MAINTENANCE_PREFIX + "Read the latest handoff record for a given agent",
+                        "tier": "Free pricing; temporarily unavailable during security maintenance",
+                        "use_for": COORDINATION_MAINTENANCE_USE_FOR
+                    },
+                    "coordination_team_status": {
+                        "description": COORDINATION_MAINTENANCE_PREFIX + "Get the current status of all coordination agents",
+                        "tier": "Free pricing; temporarily unavailable during security maintenance",
+                        "use_for": COORDINATION_MAINTENANCE_USE_FOR
+                    }
                 }
             },
-            "coordination": {
-                "coordination_handoff_create": {
-                    "description": COORDINATION_MAINTENANCE_PREFIX + "Create a structured agent handoff record",
-                    "tier": "Free pricing; temporarily unavailable during security maintenance",
-                    "use_for": COORDINATION_MAINTENANCE_USE_FOR
-                },
-                "coordination_handoff_read": {
-                    "description": COORDINATION_MAINTENANCE_PREFIX + "Read the latest handoff record for a given agent",
-                    "tier": "Free pricing; temporarily unavailable during security maintenance",
-                    "use_for": COORDINATION_MAINTENANCE_USE_FOR
+
+            "troubleshooting": {
+                "no_mcp_servers_found": {
+                    "problem": "/mcp shows 'No MCP servers configured'",
+                    "solutions": [
+                        "Make sure you ran 'claude mcp add' (not just edited settings.json)",
+                        "Check with 'claude mcp list' outside of Claude Code",
+                        "Restart Claude Code completely"
+                    ]
                 },
-                "coordination_team_status": {
-                    "description": COORDINATION_MAINTENANCE_PREFIX + "Get the current status of all coordination agents",
-                    "tier": "Free pricing; temporarily unavailable during security maintenance",
-                    "use_for": COORDINATION_MAINTENANCE_USE_FOR
+                "connection_failed": {
+                    "problem": "Server shows as disconnected",
+                    "solutions": [
+                        "Check your internet connection",
+                        f"Verify server is online: curl {base_url}/health",
+                        "Try removing and re-adding: claude mcp remove verifimind && claude mcp add ..."
+                    ]
                 }
             }
-        },
-
-        "troubleshooting": {
-            "no_mcp_servers_found": {
-                "problem": "/mcp shows 'No MCP servers configured'",
-                "solutions": [
-                    "Make sure you ran 'claude mcp add' (not just edited settings.json)",
-                    "Check with 'claude mcp list' outside of Claude Code",
-                    "Restart Claude Code completely"
-                ]
-            },
-            "connection_failed": {
-                "problem": "Server shows as disconnected",
-                "solutions": [
-                    "Check your internet connection",
-                    f"Verify server is online: curl {base_url}/health",
-                    "Try removing and re-adding: claude mcp remove verifimind && claude mcp add ..."
-                ]
-            }
         }
-    })
+
+    return _document_response(request, ("setup", base_url), build)
+
 
 ROBOTS_TXT = """\
 User-agent: *
@@ -983,226 +1025,230 @@ async def smithery_server_card_handler(request):
     publish spec; the Smithery listing sunset 2026-03-01, but this endpoint
     remains a valid MCP discovery card served directly at the deployment URL.
     """
-    contract = get_public_contract()
-    routing = contract["free_tier_routing"]
-    x_route = routing["X"]
-    z_route = routing["Z"]
-    cs_route = routing["CS"]
-    hosted_route_display = (
-        f"X: {x_route['model']} via {x_route['provider']}; "
-        f"Z: {z_route['model']} via {z_route['provider']}; "
-        f"CS: {cs_route['model']} via {cs_route['provider']}"
-    )
 
-    return JSONResponse({
-        "displayName": "VerifiMind-PEAS",
-        "description": (
-            "Multi-model AI validation framework. Validate concepts end-to-end across "
-            "innovation (X Agent), ethics & compliance (Z Agent), and security (CS Agent) "
-            "via the X-Z-CS RefleXion Trinity. 8 MCP tools are active; 5 tools "
-            "are temporarily unavailable during access-control and custom-template "
-            "security maintenance. Auditable reasoning "
-            "returned by default — per-step reasoning, framework citations, ethics scoring "
-            "breakdown, and Socratic questions. BYOK across 6 providers (Gemini, Anthropic, "
-            "OpenAI, Groq, Cerebras, Mistral). Hosted free-tier routing — "
-            f"{hosted_route_display}."
-        ),
-        "version": SERVER_VERSION,
-        "iconUrl": "https://verifimind.ysenseai.org/logo.png",
-        "connections": [
-            {
-                "type": "http",
-                "deploymentUrl": MCP_SERVER_URL,
-                "configSchema": {
-                    "type": "object",
-                    "properties": {},
-                    "description": f"No configuration required. Hosted free-tier routing — {hosted_route_display}. Optional: set LLM_PROVIDER + API key headers for BYOK (gemini, anthropic, openai, groq, cerebras, mistral)."
+    def build() -> dict:
+        contract = contract_snapshot().contract
+        routing = contract["free_tier_routing"]
+        x_route = routing["X"]
+        z_route = routing["Z"]
+        cs_route = routing["CS"]
+        hosted_route_display = (
+            f"X: {x_route['model']} via {x_route['provider']}; "
+            f"Z: {z_route['model']} via {z_route['provider']}; "
+            f"CS: {cs_route['model']} via {cs_route['provider']}"
+        )
+
+        return {
+            "displayName": "VerifiMind-PEAS",
+            "description": (
+                "Multi-model AI validation framework. Validate concepts end-to-end across "
+                "innovation (X Agent), ethics & compliance (Z Agent), and security (CS Agent) "
+                "via the X-Z-CS RefleXion Trinity. 8 MCP tools are active; 5 tools "
+                "are temporarily unavailable during access-control and custom-template "
+                "security maintenance. Auditable reasoning "
+                "returned by default — per-step reasoning, framework citations, ethics scoring "
+                "breakdown, and Socratic questions. BYOK across 6 providers (Gemini, Anthropic, "
+                "OpenAI, Groq, Cerebras, Mistral). Hosted free-tier routing — "
+                f"{hosted_route_display}."
+            ),
+            "version": SERVER_VERSION,
+            "iconUrl": "https://verifimind.ysenseai.org/logo.png",
+            "connections": [
+                {
+                    "type": "http",
+                    "deploymentUrl": MCP_SERVER_URL,
+                    "configSchema": {
+                        "type": "object",
+                        "properties": {},
+                        "description": f"No configuration required. Hosted free-tier routing — {hosted_route_display}. Optional: set LLM_PROVIDER + API key headers for BYOK (gemini, anthropic, openai, groq, cerebras, mistral)."
+                    }
                 }
-            }
-        ],
-        "tools": [
-            {
-                "name": "run_full_trinity",
-                "description": "Complete X → Z → CS Trinity validation. X (Innovation/Strategy) → Z (Ethics/Compliance, VETO power) → CS (Security/Feasibility) → synthesis with proceed/proceed_with_caution/revise/reject recommendation.",
-                "inputSchema": {
-                    "type": "object",
-                    "required": ["concept_name", "concept_description"],
-                    "properties": {
-                        "concept_name": {"type": "string"},
-                        "concept_description": {"type": "string"},
-                        "context": {"type": "string"},
-                        "save_to_history": {
-                            "type": "boolean",
-                            "default": False,
-                            "description": (
-                                "Opt in to shared instance-local full-result history. "
-                                "At most 20 newest entries are retained; oldest entries "
-                                "are evicted on read/write and instance replacement "
-                                "clears the store. Do not enable for sensitive concepts."
-                            ),
+            ],
+            "tools": [
+                {
+                    "name": "run_full_trinity",
+                    "description": "Complete X → Z → CS Trinity validation. X (Innovation/Strategy) → Z (Ethics/Compliance, VETO power) → CS (Security/Feasibility) → synthesis with proceed/proceed_with_caution/revise/reject recommendation.",
+                    "inputSchema": {
+                        "type": "object",
+                        "required": ["concept_name", "concept_description"],
+                        "properties": {
+                            "concept_name": {"type": "string"},
+                            "concept_description": {"type": "string"},
+                            "context": {"type": "string"},
+                            "save_to_history": {
+                                "type": "boolean",
+                                "default": False,
+                                "description": (
+                                    "Opt in to shared instance-local full-result history. "
+                                    "At most 20 newest entries are retained; oldest entries "
+                                    "are evicted on read/write and instance replacement "
+                                    "clears the store. Do not enable for sensitive concepts."
+                                ),
+                            }
                         }
                     }
-                }
-            },
-            {
-                "name": "consult_agent_x",
-                "description": "X Agent — Innovation & Strategy analysis. Market opportunity, competitive positioning (vs LangChain/CrewAI/AutoGen), innovation score.",
-                "inputSchema": {
-                    "type": "object",
-                    "required": ["concept_name", "concept_description"],
-                    "properties": {
-                        "concept_name": {"type": "string"},
-                        "concept_description": {"type": "string"},
-                        "context": {"type": "string"}
+                },
+                {
+                    "name": "consult_agent_x",
+                    "description": "X Agent — Innovation & Strategy analysis. Market opportunity, competitive positioning (vs LangChain/CrewAI/AutoGen), innovation score.",
+                    "inputSchema": {
+                        "type": "object",
+                        "required": ["concept_name", "concept_description"],
+                        "properties": {
+                            "concept_name": {"type": "string"},
+                            "concept_description": {"type": "string"},
+                            "context": {"type": "string"}
+                        }
                     }
-                }
-            },
-            {
-                "name": "consult_agent_z",
-                "description": "Z Agent — Ethics & Compliance review with VETO POWER. Z-Protocol v1.1: 21 frameworks across 4 jurisdictional tiers (International, EU/EEA, US, ASEAN). Triggers veto on ethical red lines.",
-                "inputSchema": {
-                    "type": "object",
-                    "required": ["concept_name", "concept_description"],
-                    "properties": {
-                        "concept_name": {"type": "string"},
-                        "concept_description": {"type": "string"},
-                        "context": {"type": "string"},
-                        "prior_reasoning": {"type": "string"}
+                },
+                {
+                    "name": "consult_agent_z",
+                    "description": "Z Agent — Ethics & Compliance review with VETO POWER. Z-Protocol v1.1: 21 frameworks across 4 jurisdictional tiers (International, EU/EEA, US, ASEAN). Triggers veto on ethical red lines.",
+                    "inputSchema": {
+                        "type": "object",
+                        "required": ["concept_name", "concept_description"],
+                        "properties": {
+                            "concept_name": {"type": "string"},
+                            "concept_description": {"type": "string"},
+                            "context": {"type": "string"},
+                            "prior_reasoning": {"type": "string"}
+                        }
                     }
-                }
-            },
-            {
-                "name": "consult_agent_cs",
-                "description": "CS Agent — Security & Feasibility validation. CS Security v1.1: 6-stage, 12-dimension, OWASP Agentic AI (ASI01-ASI10), Socratic interrogation framework.",
-                "inputSchema": {
-                    "type": "object",
-                    "required": ["concept_name", "concept_description"],
-                    "properties": {
-                        "concept_name": {"type": "string"},
-                        "concept_description": {"type": "string"},
-                        "context": {"type": "string"},
-                        "prior_reasoning": {"type": "string"}
+                },
+                {
+                    "name": "consult_agent_cs",
+                    "description": "CS Agent — Security & Feasibility validation. CS Security v1.1: 6-stage, 12-dimension, OWASP Agentic AI (ASI01-ASI10), Socratic interrogation framework.",
+                    "inputSchema": {
+                        "type": "object",
+                        "required": ["concept_name", "concept_description"],
+                        "properties": {
+                            "concept_name": {"type": "string"},
+                            "concept_description": {"type": "string"},
+                            "context": {"type": "string"},
+                            "prior_reasoning": {"type": "string"}
+                        }
                     }
-                }
-            },
-            {
-                "name": "list_prompt_templates",
-                "description": "List available Genesis prompt templates with optional filtering by agent, category, or tags.",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "agent_id": {"type": "string"},
-                        "category": {"type": "string"},
-                        "tags": {"type": "array", "items": {"type": "string"}}
+                },
+                {
+                    "name": "list_prompt_templates",
+                    "description": "List available Genesis prompt templates with optional filtering by agent, category, or tags.",
+                    "inputSchema": {
+                        "type": "object",
+                        "properties": {
+                            "agent_id": {"type": "string"},
+                            "category": {"type": "string"},
+                            "tags": {"type": "array", "items": {"type": "string"}}
+                        }
                     }
-                }
-            },
-            {
-                "name": "get_prompt_template",
-                "description": "Get a specific Genesis prompt template by ID.",
-                "inputSchema": {
-                    "type": "object",
-                    "required": ["template_id"],
-                    "properties": {
-                        "template_id": {"type": "string"},
-                        "include_content": {"type": "boolean", "default": True}
+                },
+                {
+                    "name": "get_prompt_template",
+                    "description": "Get a specific Genesis prompt template by ID.",
+                    "inputSchema": {
+                        "type": "object",
+                        "required": ["template_id"],
+                        "properties": {
+                            "template_id": {"type": "string"},
+                            "include_content": {"type": "boolean", "default": True}
+                        }
                     }
-                }
-            },
-            {
-                "name": "export_prompt_template",
-                "description": "Export a Genesis prompt template to Markdown or JSON format.",
-                "inputSchema": {
-                    "type": "object",
-                    "required": ["template_id", "format"],
-                    "properties": {
-                        "template_id": {"type": "string"},
-                        "format": {"type": "string", "enum": ["markdown", "json"]}
+                },
+                {
+                    "name": "export_prompt_template",
+                    "description": "Export a Genesis prompt template to Markdown or JSON format.",
+                    "inputSchema": {
+                        "type": "object",
+                        "required": ["template_id", "format"],
+                        "properties": {
+                            "template_id": {"type": "string"},
+                            "format": {"type": "string", "enum": ["markdown", "json"]}
+                        }
                     }
-                }
-            },
-            {
-                "name": "register_custom_template",
-                "description": CUSTOM_TEMPLATE_MAINTENANCE_PREFIX + "Register a new custom Genesis prompt template.",
-                "inputSchema": {
-                    "type": "object",
-                    "required": ["name", "agent_id", "content", "category", "description"],
-                    "properties": {
-                        "name": {"type": "string"},
-                        "agent_id": {"type": "string"},
-                        "content": {"type": "string"},
-                        "category": {"type": "string"},
-                        "description": {"type": "string"},
-                        "tags": {"type": "array", "items": {"type": "string"}}
+                },
+                {
+                    "name": "register_custom_template",
+                    "description": CUSTOM_TEMPLATE_MAINTENANCE_PREFIX + "Register a new custom Genesis prompt template.",
+                    "inputSchema": {
+                        "type": "object",
+                        "required": ["name", "agent_id", "content", "category", "description"],
+                        "properties": {
+                            "name": {"type": "string"},
+                            "agent_id": {"type": "string"},
+                            "content": {"type": "string"},
+                            "category": {"type": "string"},
+                            "description": {"type": "string"},
+                            "tags": {"type": "array", "items": {"type": "string"}}
+                        }
                     }
-                }
-            },
-            {
-                "name": "import_template_from_url",
-                "description": CUSTOM_TEMPLATE_MAINTENANCE_PREFIX + "Import a Genesis prompt template from a URL (GitHub Gist, raw file).",
-                "inputSchema": {
-                    "type": "object",
-                    "required": ["url"],
-                    "properties": {
-                        "url": {"type": "string"},
-                        "validate": {"type": "boolean", "default": True}
+                },
+                {
+                    "name": "import_template_from_url",
+                    "description": CUSTOM_TEMPLATE_MAINTENANCE_PREFIX + "Import a Genesis prompt template from a URL (GitHub Gist, raw file).",
+                    "inputSchema": {
+                        "type": "object",
+                        "required": ["url"],
+                        "properties": {
+                            "url": {"type": "string"},
+                            "validate": {"type": "boolean", "default": True}
+                        }
                     }
-                }
-            },
-            {
-                "name": "get_template_statistics",
-                "description": "Get Genesis prompt template registry statistics.",
-                "inputSchema": {"type": "object", "properties": {}}
-            },
-            {
-                "name": "coordination_handoff_create",
-                "description": COORDINATION_MAINTENANCE_PREFIX + "Create a structured agent handoff record for multi-agent session continuity.",
-                "inputSchema": {
-                    "type": "object",
-                    "required": ["agent_id", "session_type", "completed", "decisions", "artifacts", "pending", "pioneer_key"],
-                    "properties": {
-                        "agent_id": {"type": "string"},
-                        "session_type": {"type": "string"},
-                        "completed": {"type": "array", "items": {"type": "string"}},
-                        "decisions": {"type": "array", "items": {"type": "string"}},
-                        "artifacts": {"type": "array", "items": {"type": "string"}},
-                        "pending": {"type": "array", "items": {"type": "string"}},
-                        "pioneer_key": {"type": "string"}
+                },
+                {
+                    "name": "get_template_statistics",
+                    "description": "Get Genesis prompt template registry statistics.",
+                    "inputSchema": {"type": "object", "properties": {}}
+                },
+                {
+                    "name": "coordination_handoff_create",
+                    "description": COORDINATION_MAINTENANCE_PREFIX + "Create a structured agent handoff record for multi-agent session continuity.",
+                    "inputSchema": {
+                        "type": "object",
+                        "required": ["agent_id", "session_type", "completed", "decisions", "artifacts", "pending", "pioneer_key"],
+                        "properties": {
+                            "agent_id": {"type": "string"},
+                            "session_type": {"type": "string"},
+                            "completed": {"type": "array", "items": {"type": "string"}},
+                            "decisions": {"type": "array", "items": {"type": "string"}},
+                            "artifacts": {"type": "array", "items": {"type": "string"}},
+                            "pending": {"type": "array", "items": {"type": "string"}},
+                            "pioneer_key": {"type": "string"}
+                        }
                     }
-                }
-            },
-            {
-                "name": "coordination_handoff_read",
-                "description": COORDINATION_MAINTENANCE_PREFIX + "Read the latest handoff record for a given agent.",
-                "inputSchema": {
-                    "type": "object",
-                    "required": ["pioneer_key"],
-                    "properties": {
-                        "pioneer_key": {"type": "string"},
-                        "agent_id": {"type": "string"},
-                        "count": {"type": "integer", "default": 1}
+                },
+                {
+                    "name": "coordination_handoff_read",
+                    "description": COORDINATION_MAINTENANCE_PREFIX + "Read the latest handoff record for a given agent.",
+                    "inputSchema": {
+                        "type": "object",
+                        "required": ["pioneer_key"],
+                        "properties": {
+                            "pioneer_key": {"type": "string"},
+                            "agent_id": {"type": "string"},
+                            "count": {"type": "integer", "default": 1}
+                        }
                     }
-                }
-            },
-            {
-                "name": "coordination_team_status",
-                "description": COORDINATION_MAINTENANCE_PREFIX + "Get current status of all coordination agents and active handoffs.",
-                "inputSchema": {
-                    "type": "object",
-                    "required": ["pioneer_key"],
-                    "properties": {
-                        "pioneer_key": {"type": "string"}
+                },
+                {
+                    "name": "coordination_team_status",
+                    "description": COORDINATION_MAINTENANCE_PREFIX + "Get current status of all coordination agents and active handoffs.",
+                    "inputSchema": {
+                        "type": "object",
+                        "required": ["pioneer_key"],
+                        "properties": {
+                            "pioneer_key": {"type": "string"}
+                        }
                     }
                 }
-            }
-        ],
-        "resources": [
-            {"uri": "genesis://config/master_prompt", "name": "Genesis Methodology — Live Production Prompts", "description": "Current production prompts defining X/Z/CS agent roles and citation architecture."},
-            {"uri": "genesis://history/latest", "name": "Latest Validation", "description": "Privacy-safe summary of the newest retained Trinity validation."},
-            {"uri": "genesis://history/all", "name": "Validation History", "description": "Bounded aggregate statistics; no concept text or raw records."},
-            {"uri": "genesis://state/project_info", "name": "Project Info", "description": "Project metadata, agent info, and version details."}
-        ]
-    })
+            ],
+            "resources": [
+                {"uri": "genesis://config/master_prompt", "name": "Genesis Methodology — Live Production Prompts", "description": "Current production prompts defining X/Z/CS agent roles and citation architecture."},
+                {"uri": "genesis://history/latest", "name": "Latest Validation", "description": "Privacy-safe summary of the newest retained Trinity validation."},
+                {"uri": "genesis://history/all", "name": "Validation History", "description": "Bounded aggregate statistics; no concept text or raw records."},
+                {"uri": "genesis://state/project_info", "name": "Project Info", "description": "Project metadata, agent info, and version details."}
+            ]
+        }
+
+    return _document_response(request, "server-card", build)
 
 
 async def _extract_tool_call_metadata(request) -> tuple[str | None, str | None]:
@@ -1425,7 +1471,7 @@ async def ea_dashboard_handler(request):
             status_code=404,
         )
     firestore_available = _get_firestore() is not None
-    records = read_trinity_history(uuid, limit=50)
+    records = await run_in_thread(read_trinity_history, uuid, limit=50)
     return HTMLResponse(get_dashboard_page(uuid, records, firestore_available=firestore_available))
 
 
@@ -1920,6 +1966,27 @@ async def mcp_sse_deprecated_handler(request):
     )
 
 
+@contextlib.asynccontextmanager
+async def app_lifespan(starlette_app):
+    """MCP session lifespan, with log output handed to a background writer,
+    the event loop watched for blocking callbacks and (opt-in) the hosted
+    providers probed while serving. Queued handoff writes are committed
+    before shutdown."""
+    install_log_pipeline()
+    start_loop_monitor()
+    start_provider_prober()
+    try:
+        async with mcp_app.lifespan(starlette_app):
+            yield
+    finally:
+        await stop_provider_prober()
+        stop_loop_monitor()
+        await get_handoff_store().flush()
+        await shutdown_polar_adapter()
+        shutdown_offload()
+        shutdown_log_pipeline()
+
+
 # Create Starlette app with proper lifespan from MCP app
 app = Starlette(
     routes=[
@@ -1964,7 +2031,7 @@ app = Starlette(
         Route("/sse", mcp_sse_deprecated_handler),
         Mount("/mcp", app=mcp_app),
     ],
-    lifespan=mcp_app.lifespan,  # CRITICAL: Pass lifespan for session initialization
+    lifespan=app_lifespan,  # CRITICAL: wraps mcp_app.lifespan for session initialization
     exception_handlers={404: http_exception_handler, 400: http_exception_handler, 405: http_exception_handler, 406: http_exception_handler},
 )
 
@@ -1974,10 +2041,18 @@ app = Starlette(
 app.router.redirect_slashes = False
 
 # IMPORTANT: Starlette add_middleware uses insert(0) — last added runs FIRST (outermost).
-# Execution order: IPBlocklist → CORS → RateLimiting → route handlers
-# 1. IP Blocklist (outermost — rejects known rogue IPs before any processing)
-# 2. CORS (handles browser preflight OPTIONS before rate-limiting fires)
-# 3. Rate Limiting (EDoS protection for legitimate traffic)
+# Execution order: IPBlocklist → Compression → CORS → RateLimiting → LLM Admission → route handlers
+# 1. IP Blocklist (outermost — rejects known rogue IPs before any processing;
+#    blocked requests never cost compression CPU)
+# 2. Compression (wraps every response below it, including CORS preflights,
+#    429s and admission 503s; streamed MCP responses are flushed per event)
+# 3. CORS (handles browser preflight OPTIONS before rate-limiting fires)
+# 4. Rate Limiting (EDoS protection for legitimate traffic)
+# 5. LLM Admission (bounds in-flight LLM tool calls; only rate-allowed
+#    requests ever occupy a queue position)
+
+# LLM admission control - tier-priority queue + 503 load shedding
+app.add_middleware(LLMAdmissionMiddleware)
 
 # Rate limiting middleware - EDoS protection
 app.add_middleware(RateLimitMiddleware)
@@ -1995,10 +2070,18 @@ app.add_middleware(
     max_age=86400,
 )
 
+# Response compression - negotiated zstd/br/gzip, flushed per streamed event
+app.add_middleware(CompressionMiddleware)
+
 # IP Blocklist middleware — outermost layer, runs first
 # Blocks 3 rogue IPs identified by AY forensic scan (T Security Directive 2026-04-27)
 app.add_middleware(IPBlocklistMiddleware)
 
+# Template library: load now (from the compiled snapshot when it is current)
+# so the first template call does not pay the YAML parse, and re-read edited
+# library files every TEMPLATE_RELOAD_INTERVAL seconds when that is set.
+get_template_registry().start_watching()
+
 # Print server info when module is loaded
 print("=" * 70)
 print(f"VerifiMind-PEAS MCP Server - HTTP Mode (v{SERVER_VERSION})")
@@ -2015,7 +2098,7 @@ print(f"  Global Limit:  {os.getenv('RATE_LIMIT_GLOBAL', '100')} req/min per ins
 print(f"  CORS: Enabled (all origins)")
 print("-" * 70)
 print("FREE-TIER ROUTING (generated from the truth contract, v0.5.52):")
-_banner_routing = get_public_contract()["free_tier_routing"]
+_banner_routing = contract_snapshot().contract["free_tier_routing"]
 for _aid in ("X", "Z", "CS"):
     _r = _banner_routing[_aid]
     print(f"  {_aid} Agent: {_r['provider']}/{_r['model']} (construction fallback: {_r['construction_fallback']}; BYOK any provider)")
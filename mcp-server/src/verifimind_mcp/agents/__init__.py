@@ -8,11 +8,13 @@ from .base_agent import BaseAgent, AgentRegistry
 from .x_agent import XAgent
 from .z_agent import ZAgent
 from .cs_agent import CSAgent
+from .triage_agent import TriageAgent
 
 __all__ = [
     "BaseAgent",
     "AgentRegistry",
     "XAgent",
     "ZAgent",
-    "CSAgent"
+    "CSAgent",
+    "TriageAgent"
 ]
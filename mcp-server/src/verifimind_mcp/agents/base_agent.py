@@ -8,6 +8,7 @@ Chain of Thought reasoning and LLM interaction.
 
 import logging
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import Optional, Dict, Any, Type
 
 from pydantic import BaseModel
@@ -36,6 +37,15 @@ logger = logging.getLogger(__name__)
 GROQ_SAFE_MAX_OUTPUT_TOKENS = 4096
 
 
+@lru_cache(maxsize=None)
+def _output_schema(output_model: Type[BaseModel]) -> Dict[str, Any]:
+    """One schema dict per output model, so providers can cache its wire form.
+
+    Callers must treat the returned dict as read-only.
+    """
+    return output_model.model_json_schema()
+
+
 class BaseAgent(ABC):
     """
     Abstract base class for all VerifiMind agents.
@@ -69,7 +79,7 @@ class BaseAgent(ABC):
         self.config = config or get_agent_config(self.AGENT_ID)
         self.llm = llm_provider or get_provider()
         
-        logger.info(f"Initialized {self.config.name} agent with {self.llm.get_model_name()}")
+        logger.info("Initialized %s agent with %s", self.config.name, self.llm.get_model_name())
     
     def build_prompt(
         self,
@@ -112,19 +122,24 @@ class BaseAgent(ABC):
 
         return date_header + prompt
 
-    def _effective_max_tokens(self) -> int:
+    def _effective_max_tokens(self, budget_key: Optional[tuple] = None) -> int:
         """
         Resolve the output-token budget for the active provider.
 
         Configs request 8192 so verbose models don't truncate; Groq's tighter
         total-request budget is honored by clamping to a safe ceiling. Detected
         by provider class name to avoid importing every provider type here.
+        With a ``budget_key``, the ceiling is lowered to the budget learned
+        from observed outputs (utils/completion_budget.py).
         """
         configured = self.config.max_tokens
         provider_name = type(self.llm).__name__.lower()
         if "groq" in provider_name:
-            return min(configured, GROQ_SAFE_MAX_OUTPUT_TOKENS)
-        return configured
+            configured = min(configured, GROQ_SAFE_MAX_OUTPUT_TOKENS)
+        if budget_key is None:
+            return configured
+        from ..utils.completion_budget import get_completion_budget_controller
+        return get_completion_budget_controller().budget_for(budget_key, configured)
 
     async def analyze(
         self,
@@ -135,6 +150,10 @@ class BaseAgent(ABC):
         """
         Analyze a concept with Chain of Thought reasoning.
         
+        Hosted lanes with a configured draft model run it first and escalate
+        to the configured model per AGENT_CASCADE_POLICY (see
+        utils/model_cascade.py); every other lane makes exactly one call.
+        
         Args:
             concept: The concept to analyze
             prior_reasoning: Optional reasoning from previous agents
@@ -143,6 +162,68 @@ class BaseAgent(ABC):
         Returns:
             Structured analysis result (specific to agent type)
         """
+        from ..utils.model_cascade import analyze_with_cascade, cascade_draft_provider
+        draft_provider = cascade_draft_provider(self.AGENT_ID, self.llm)
+        if draft_provider is not None:
+            return await analyze_with_cascade(
+                self, draft_provider, concept, prior_reasoning, metrics
+            )
+        return await self._analyze(concept, prior_reasoning, metrics)
+
+    async def _analyze(
+        self,
+        concept: Concept,
+        prior_reasoning: Optional[PriorReasoning] = None,
+        metrics: Optional[Any] = None
+    ) -> BaseModel:
+        """One structured analysis on this agent's provider.
+
+        When a learned completion budget (utils/completion_budget.py) is
+        below the configured one and the output fills it, the call is made
+        once more at the configured budget instead of returning a cut-off
+        answer.
+        """
+        from ..llm.failover import _safe_model_name
+        from ..utils.completion_budget import budget_key
+        output_budget_key = budget_key(
+            self.AGENT_ID,
+            _safe_model_name(self.llm),
+            orchestrated=bool(prior_reasoning and prior_reasoning.chains),
+        )
+        configured = self._effective_max_tokens()
+        max_tokens = self._effective_max_tokens(output_budget_key)
+        if max_tokens >= configured:
+            return await self._analyze_call(
+                concept, prior_reasoning, metrics, output_budget_key, max_tokens
+            )
+        try:
+            result = await self._analyze_call(
+                concept, prior_reasoning, metrics, output_budget_key, max_tokens
+            )
+        except Exception as exc:
+            if not getattr(exc, "_provider_output_truncated", False):
+                raise
+        else:
+            reservation = getattr(result, "_completion_token_reservation", None)
+            if result._output_tokens < (reservation or max_tokens):
+                return result
+        logger.info(
+            "%s output filled its learned budget (%d); retrying at %d",
+            self.config.name, max_tokens, configured,
+        )
+        return await self._analyze_call(
+            concept, prior_reasoning, metrics, output_budget_key, configured
+        )
+
+    async def _analyze_call(
+        self,
+        concept: Concept,
+        prior_reasoning: Optional[PriorReasoning],
+        metrics: Optional[Any],
+        output_budget_key: tuple,
+        max_tokens: int,
+    ) -> BaseModel:
+        """One structured analysis call with a ``max_tokens`` reservation."""
         if self.OUTPUT_MODEL is None:
             raise ValueError("OUTPUT_MODEL must be defined in subclass")
         
@@ -158,21 +239,48 @@ class BaseAgent(ABC):
         logger.debug("%s analysis started", self.config.name)
         
         # Get output schema
-        output_schema = self.OUTPUT_MODEL.model_json_schema()
+        output_schema = _output_schema(self.OUTPUT_MODEL)
         
         # Call LLM — through the WP-B failover executor. For unmarked
         # providers (all BYOK/Ollama/override/mock) or with the runtime flag
         # off, this is a plain delegated provider.generate() call.
         from ..llm.failover import generate_with_failover
+        from ..utils.completion_budget import get_completion_budget_controller
         completion_token_reservation = None
         try:
-            response = await generate_with_failover(
-                self.llm,
-                prompt=prompt,
-                output_schema=output_schema,
-                temperature=self.config.temperature,
-                max_tokens=self._effective_max_tokens()
+            def _generate():
+                return generate_with_failover(
+                    self.llm,
+                    prompt=prompt,
+                    output_schema=output_schema,
+                    temperature=self.config.temperature,
+                    max_tokens=max_tokens
+                )
+
+            # Concurrent identical calls (host retries, duplicate demo
+            # submissions) await one provider call — never across different
+            # API keys. The shared call carries no caller's deadline; each
+            # caller waits only as long as its own. See
+            # utils/single_flight.py for the contract.
+            from ..utils.deadline import await_within_deadline
+            from ..utils.single_flight import (
+                agent_call_key,
+                get_single_flight,
+                single_flight_enabled,
             )
+            if single_flight_enabled():
+                response = await await_within_deadline(get_single_flight().do(
+                    agent_call_key(
+                        agent_id=self.AGENT_ID,
+                        provider=self.llm,
+                        prompt=prompt,
+                        temperature=self.config.temperature,
+                        max_tokens=max_tokens,
+                    ),
+                    _generate,
+                ))
+            else:
+                response = await _generate()
             
             # Extract content, usage, and inference quality from response
             if isinstance(response, dict) and "content" in response:
@@ -242,6 +350,13 @@ class BaseAgent(ABC):
             result._output_tokens = usage.get("output_tokens", 0) if usage else 0
             if completion_token_reservation is not None:
                 result._completion_token_reservation = completion_token_reservation
+            # Feed the adaptive completion budget. Output that filled its
+            # reservation was cut off whatever the provider reported.
+            budgets = get_completion_budget_controller()
+            if result._output_tokens >= (completion_token_reservation or max_tokens):
+                budgets.record_truncation(output_budget_key)
+            elif inference_quality == "real":
+                budgets.record_output(output_budget_key, result._output_tokens)
 
             # Update metrics if provided
             if metrics:
@@ -253,11 +368,16 @@ class BaseAgent(ABC):
                 metrics.success = True
                 metrics.finish()
 
-            logger.info(f"{self.config.name} completed analysis with confidence: {result.confidence} (quality: {inference_quality})")
+            logger.info(
+                "%s completed analysis with confidence: %s (quality: %s)",
+                self.config.name, result.confidence, inference_quality,
+            )
 
             return result
             
         except Exception as exc:
+            if getattr(exc, "_provider_output_truncated", False):
+                get_completion_budget_controller().record_truncation(output_budget_key)
             if completion_token_reservation is not None:
                 try:
                     exc._completion_token_reservation = completion_token_reservation
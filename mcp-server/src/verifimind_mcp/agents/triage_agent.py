@@ -0,0 +1,55 @@
+"""
+Trinity Triage Agent for VerifiMind-PEAS MCP Server.
+
+Triage is a single compact call that scores a concept from the X, Z and CS
+perspectives at once. It backs run_full_trinity(mode="triage") for
+high-volume first-pass screening; its output is expanded into the three
+agent analyses and synthesized by the same rules as a full run.
+"""
+
+from typing import Optional
+
+from ..models import (
+    AgentConfig,
+    TriageAnalysis,
+    TRIAGE_AGENT_CONFIG
+)
+from ..llm import LLMProvider
+from .base_agent import BaseAgent
+
+
+class TriageAgent(BaseAgent):
+    """
+    Trinity Triage - one-call X/Z/CS pre-screen.
+
+    Not a Trinity stage: it is never registered in AgentRegistry and never
+    receives prior reasoning.
+    """
+
+    AGENT_ID = "TRIAGE"
+    OUTPUT_MODEL = TriageAnalysis
+
+    def __init__(
+        self,
+        config: Optional[AgentConfig] = None,
+        llm_provider: Optional[LLMProvider] = None
+    ):
+        """
+        Initialize the triage agent.
+
+        Args:
+            config: Agent configuration (uses TRIAGE_AGENT_CONFIG if not provided)
+            llm_provider: LLM provider instance
+        """
+        super().__init__(
+            config=config or TRIAGE_AGENT_CONFIG,
+            llm_provider=llm_provider
+        )
+
+    def get_focus_summary(self) -> str:
+        """Return a brief summary of the triage screen."""
+        return (
+            "Trinity Triage scores innovation, ethics and security in one "
+            "compact call. Focus: is this concept clearly worth (or clearly "
+            "not worth) a full Trinity validation?"
+        )
@@ -6,8 +6,9 @@ may remain registered for protocol compatibility while being fail-closed.
 
 from __future__ import annotations
 
+import os
 import re
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 
 
 DEFINED_TOOL_COUNT = 13
@@ -30,13 +31,57 @@ UNAVAILABLE_TOOL_NAMES = (
 
 ACTIVE_TOOL_COUNT = DEFINED_TOOL_COUNT - len(UNAVAILABLE_TOOL_NAMES)
 
+# Preview tools are dark-launched: registered only when the operator names
+# their group in PREVIEW_TOOLS_ENV. They are deliberately outside the
+# defined/active taxonomy above, so the public 13/8/5 truth is unchanged
+# while a preview is off, and surfaces list them separately while it is on.
+PREVIEW_TOOLS_ENV = "VERIFIMIND_PREVIEW_TOOLS"
+
+PREVIEW_TOOL_GROUPS: Dict[str, Tuple[str, ...]] = {
+    "trinity_jobs": (
+        "submit_trinity",
+        "get_trinity_job",
+        "wait_trinity_job",
+    ),
+    "template_search": (
+        "search_prompt_templates",
+    ),
+}
+
+PREVIEW_TOOL_NAMES = tuple(
+    name for names in PREVIEW_TOOL_GROUPS.values() for name in names
+)
+
 COORDINATION_MAINTENANCE_PREFIX = "TEMPORARILY UNAVAILABLE (maintenance) — "
 CUSTOM_TEMPLATE_MAINTENANCE_PREFIX = "TEMPORARILY UNAVAILABLE (security maintenance) — "
 
 
+def enabled_preview_groups() -> Tuple[str, ...]:
+    """Live read of the preview groups the operator switched on.
+
+    Unknown group names are ignored rather than rejected, so a typo in the
+    env value can only leave a preview off — never turn something else on.
+    """
+    raw = os.getenv(PREVIEW_TOOLS_ENV, "")
+    requested = {part.strip().lower() for part in raw.split(",") if part.strip()}
+    return tuple(group for group in PREVIEW_TOOL_GROUPS if group in requested)
+
+
+def preview_group_enabled(group: str) -> bool:
+    return group in enabled_preview_groups()
+
+
+def enabled_preview_tools() -> Tuple[str, ...]:
+    return tuple(
+        name
+        for group in enabled_preview_groups()
+        for name in PREVIEW_TOOL_GROUPS[group]
+    )
+
+
 def get_tool_availability() -> Dict[str, Any]:
     """Return the exact availability set projected onto public surfaces."""
-    return {
+    availability = {
         "defined": DEFINED_TOOL_COUNT,
         "active": ACTIVE_TOOL_COUNT,
         "temporarily_unavailable": len(UNAVAILABLE_TOOL_NAMES),
@@ -51,6 +96,11 @@ def get_tool_availability() -> Dict[str, Any]:
             ),
         },
     }
+    # Strictly additive: absent unless a preview is actually registered.
+    preview = enabled_preview_tools()
+    if preview:
+        availability["preview_tools"] = list(preview)
+    return availability
 
 
 _ALL_TOOLS_CLAIM = re.compile(
@@ -54,6 +54,17 @@ AGENT_PROVIDER_DEFAULTS = {
     }
 }
 
+# Confidence-gated model cascade (hosted lanes only — see utils/model_cascade.py).
+# An agent cascades only when <AGENT>_AGENT_DRAFT_MODEL names a smaller model of
+# the provider family its hosted lane resolved to; the draft result is kept
+# unless it is degraded, schema-repaired, below min_confidence, or (with
+# confirm_veto) a Z veto that the configured model must confirm.
+AGENT_CASCADE_POLICY = {
+    "X": {"min_confidence": 0.7, "confirm_veto": False},
+    "Z": {"min_confidence": 0.75, "confirm_veto": True},
+    "CS": {"min_confidence": 0.75, "confirm_veto": False},
+}
+
 # ============================================================================
 # BYOK v0.4.5 — Per-Tool-Call Ephemeral Provider
 # ============================================================================
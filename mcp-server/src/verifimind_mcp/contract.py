@@ -15,7 +15,7 @@ propagates everywhere in one edit — the same pattern as /health's ``firestore`
 field: make the truth observable, don't police the copies.
 """
 
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 
 def get_public_contract() -> Dict[str, Any]:
@@ -65,6 +65,7 @@ def get_public_contract() -> Dict[str, Any]:
     # failover. The flag is a LIVE, FAIL-CLOSED read (env switch + validated
     # evidence tuple, B-90-7); default off => False, same as v0.5.54.
     from .llm.failover import runtime_failover_enabled
+    from .utils.model_cascade import draft_model_for, model_cascade_enabled
     for agent_id, entry in free_tier_routing.items():
         cfg = AGENT_PROVIDER_DEFAULTS.get(agent_id, {})
         fallback = cfg.get("fallback")
@@ -72,6 +73,11 @@ def get_public_contract() -> Dict[str, Any]:
         entry["runtime_hop_chain"] = (
             [fallback] if fallback and fallback not in ("mock", primary) else []
         )
+        # Confidence-gated cascade: the draft model tried first on this hosted
+        # lane (null = no cascade; utils/model_cascade.py).
+        entry["draft_model"] = (
+            draft_model_for(agent_id) if model_cascade_enabled() else None
+        )
 
     enabled = runtime_failover_enabled()
     currency_issues = provider_catalog_currency_issues()
@@ -97,10 +103,11 @@ def get_public_contract() -> Dict[str, Any]:
     }
 
 
-def free_tier_models_display() -> list:
+def free_tier_models_display(contract: Optional[Dict[str, Any]] = None) -> list:
     """Human-readable model list for landing/root surfaces, generated (never
     hand-written) so display copy cannot drift from the runtime truth."""
-    contract = get_public_contract()
+    if contract is None:
+        contract = get_public_contract()
     routing = contract["free_tier_routing"]
     seen = []
     for agent_id in ("X", "Z", "CS"):
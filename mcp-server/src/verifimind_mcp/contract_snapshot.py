@@ -0,0 +1,208 @@
+"""
+Contract snapshot — the public truth contract, built once per configuration
+generation.
+
+``get_public_contract()``, ``get_tool_availability()``, ``get_project_info()``
+and ``load_master_prompt()`` rebuild their output from the live runtime
+constants on every call, and uptime checks plus MCP discovery traffic call
+them constantly. Their inputs only change with a deploy or an env update, so
+the public surfaces read a ``ContractSnapshot`` instead:
+
+- The generation key covers every input the builders read at call time:
+  SERVER_VERSION, the date (model-catalogue currency is date-based), the
+  env settings behind runtime failover, the model cascade and preview tools,
+  and the build-identity file the failover evidence binds to.
+- A changed key rebuilds the snapshot on the next read; an unchanged key is
+  a tuple comparison.
+- Discovery documents (server card, MCP config, setup guide) are serialized
+  to bytes once per generation and carry a weak ETag derived from the body,
+  so a client that revalidates with If-None-Match gets a 304 instead of the
+  document.
+
+The builders themselves stay live and uncached — they remain the truth the
+snapshot is taken from. The snapshot's dicts are shared between requests and
+must be treated as read-only.
+
+Evidence that does not validate yet (flag on, timestamp still in the future)
+can start validating without any input changing, so such a snapshot expires
+after EVIDENCE_RECHECK_SECONDS.
+
+Environment:
+  VERIFIMIND_CONTRACT_SNAPSHOT  0/false/no/off rebuilds on every read
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from datetime import date
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+SNAPSHOT_ENV = "VERIFIMIND_CONTRACT_SNAPSHOT"
+EVIDENCE_RECHECK_SECONDS = 60
+MAX_DOCUMENTS = 32  # per generation; keys include the request base URL
+
+_AGENT_IDS = ("X", "Z", "CS")
+
+
+def snapshot_enabled() -> bool:
+    return os.getenv(SNAPSHOT_ENV, "1").strip().lower() not in ("0", "false", "no", "off")
+
+
+_env_names: Optional[Tuple[str, ...]] = None
+
+
+def _input_env_names() -> Tuple[str, ...]:
+    global _env_names
+    if _env_names is not None:
+        return _env_names
+    from .availability import PREVIEW_TOOLS_ENV
+    from .llm.failover import ENABLE_ENV, EVIDENCE_BUILD_ENV, EVIDENCE_TESTED_ENV
+    from .utils.model_cascade import CASCADE_ENV, DRAFT_MODEL_ENV_SUFFIX
+
+    _env_names = (
+        ENABLE_ENV, EVIDENCE_TESTED_ENV, EVIDENCE_BUILD_ENV, "K_REVISION",
+        CASCADE_ENV, PREVIEW_TOOLS_ENV,
+    ) + tuple(f"{agent_id}{DRAFT_MODEL_ENV_SUFFIX}" for agent_id in _AGENT_IDS)
+    return _env_names
+
+
+def configuration_generation() -> tuple:
+    """Everything the contract builders read at call time, as a hashable key."""
+    from .llm import failover
+    from .server import SERVER_VERSION
+
+    return (
+        SERVER_VERSION,
+        date.today(),
+        failover._BUILD_IDENTITY_FILE,
+        tuple(os.getenv(name) for name in _input_env_names()),
+    )
+
+
+def _etag(body: bytes) -> str:
+    # Weak: CompressionMiddleware may re-encode the body on the way out.
+    return f'W/"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+class Document:
+    """A pre-serialized public document and its ETag."""
+
+    __slots__ = ("body", "etag")
+
+    def __init__(self, body: bytes):
+        self.body = body
+        self.etag = _etag(body)
+
+
+class ContractSnapshot:
+    """Contract, availability and static resources for one generation."""
+
+    def __init__(self, generation: tuple):
+        from .availability import get_tool_availability
+        from .contract import get_public_contract
+        from .llm.failover import _flag_on
+        from .server import get_project_info
+
+        self.generation = generation
+        self.contract: Dict[str, Any] = get_public_contract()
+        self.tool_availability: Dict[str, Any] = get_tool_availability()
+        self.project_info_json = json.dumps(get_project_info(), indent=2)
+        self.expires_at: Optional[float] = None
+        if _flag_on() and not self.contract["runtime_failover_enabled"]:
+            self.expires_at = time.monotonic() + EVIDENCE_RECHECK_SECONDS
+        self._master_prompt: Optional[str] = None
+        self._documents: Dict[Hashable, Document] = {}
+        self._lock = threading.Lock()
+
+    def expired(self) -> bool:
+        return self.expires_at is not None and time.monotonic() >= self.expires_at
+
+    def master_prompt(self) -> str:
+        """The methodology markdown; a failed build is not kept."""
+        prompt = self._master_prompt
+        if prompt is None:
+            from .server import MASTER_PROMPT_UNAVAILABLE, load_master_prompt
+            prompt = load_master_prompt()
+            if prompt != MASTER_PROMPT_UNAVAILABLE:
+                self._master_prompt = prompt
+        return prompt
+
+    def document(self, key: Hashable, build: Callable[[], bytes]) -> Document:
+        """The serialized document for ``key``, built on first use.
+
+        Once MAX_DOCUMENTS keys exist, further keys are built per call and
+        not stored: keys derived from request headers cannot grow the cache.
+        """
+        document = self._documents.get(key)
+        if document is not None:
+            return document
+        document = Document(build())
+        with self._lock:
+            if len(self._documents) < MAX_DOCUMENTS:
+                document = self._documents.setdefault(key, document)
+        return document
+
+
+_snapshot: Optional[ContractSnapshot] = None
+_snapshot_lock = threading.Lock()
+_rebuilds = 0
+
+
+def contract_snapshot() -> ContractSnapshot:
+    """The snapshot for the current configuration generation."""
+    global _snapshot, _rebuilds
+    generation = configuration_generation()
+    snapshot = _snapshot
+    if (
+        snapshot is not None
+        and snapshot.generation == generation
+        and not snapshot.expired()
+        and snapshot_enabled()
+    ):
+        return snapshot
+    with _snapshot_lock:
+        snapshot = _snapshot
+        if (
+            snapshot is None
+            or snapshot.generation != generation
+            or snapshot.expired()
+            or not snapshot_enabled()
+        ):
+            snapshot = ContractSnapshot(generation)
+            _snapshot = snapshot
+            _rebuilds += 1
+    return snapshot
+
+
+def reset_contract_snapshot() -> None:
+    """Drop the current snapshot (tests, or after patching runtime constants)."""
+    global _snapshot
+    with _snapshot_lock:
+        _snapshot = None
+
+
+def get_contract_snapshot_stats() -> Dict[str, Any]:
+    snapshot = _snapshot
+    return {
+        "enabled": snapshot_enabled(),
+        "rebuilds": _rebuilds,
+        "documents": len(snapshot._documents) if snapshot is not None else 0,
+    }
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """If-None-Match comparison (weak, as RFC 9110 requires for GET)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
@@ -13,35 +13,130 @@ The HandoffStore is process-global and thread-safe. Each pioneer_key is an isola
 namespace — one user's handoffs are never visible to another user.
 
 Max handoffs per key (in-memory): 50 (configurable via MAX_HANDOFFS_PER_KEY).
+
+Non-blocking I/O:
+  - Writes are write-behind: add() updates memory and queues the Firestore
+    document; a background task on the running loop commits queued documents
+    in batches through the async client. Outside an event loop (scripts) the
+    write is made synchronously, as before.
+  - aget() reads through: the first read of a pioneer key this instance has
+    not seen loads its newest records from Firestore (matched on
+    ``pioneer_key_hash``, SHA-256 of the key, stored on every document), so
+    another instance's handoffs become visible. Concurrent first reads share
+    one query. Documents written before the hash field existed carry only an
+    8-character key prefix and are deliberately not read back — a prefix
+    cannot tell two users apart.
+  - Each key keeps a per-agent index, so agent-filtered reads touch only that
+    agent's records; at most MAX_HANDOFF_KEYS keys stay in memory (LRU).
 """
 
+import asyncio
+import hashlib
 import logging
 import os
 import threading
 import uuid
-from collections import defaultdict, deque
+from collections import OrderedDict, deque
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Optional
 
 logger = logging.getLogger(__name__)
 
 # Firestore collection for coordination handoffs
 COLLECTION_HANDOFFS = "coordination_handoffs"
 
+# Write-behind: seconds a queued write may wait for batch-mates, and the
+# Firestore batch limit.
+HANDOFF_FLUSH_INTERVAL = float(os.getenv("HANDOFF_FLUSH_INTERVAL", "0.25"))
+FIRESTORE_BATCH_LIMIT = 500
+
+_firestore_client = None
+_firestore_async_client = None
+
+
+def _firestore_project() -> Optional[str]:
+    return os.environ.get("FIRESTORE_PROJECT_ID") or os.environ.get("GOOGLE_CLOUD_PROJECT")
+
 
 def _get_firestore_client():
     """Lazy-init Firestore client. Returns None if unavailable."""
-    project_id = os.environ.get("FIRESTORE_PROJECT_ID") or os.environ.get("GOOGLE_CLOUD_PROJECT")
+    global _firestore_client
+    if _firestore_client is not None:
+        return _firestore_client
+    project_id = _firestore_project()
     if not project_id:
         return None
     try:
         from google.cloud import firestore  # type: ignore
-        return firestore.Client(project=project_id)
+        _firestore_client = firestore.Client(project=project_id)
+        return _firestore_client
     except Exception as e:
         logger.warning("Firestore unavailable for handoff store: %s", e)
         return None
 
+
+def _get_firestore_async_client():
+    """Lazy-init async Firestore client. Returns None if unavailable."""
+    global _firestore_async_client
+    if _firestore_async_client is not None:
+        return _firestore_async_client
+    project_id = _firestore_project()
+    if not project_id:
+        return None
+    try:
+        from google.cloud import firestore  # type: ignore
+        _firestore_async_client = firestore.AsyncClient(project=project_id)
+        return _firestore_async_client
+    except Exception as e:
+        logger.warning("Async Firestore unavailable for handoff store: %s", e)
+        return None
+
+
+def pioneer_key_hash(pioneer_key: str) -> str:
+    """Stable, non-reversible Firestore lookup value for a pioneer key."""
+    return hashlib.sha256(pioneer_key.encode("utf-8")).hexdigest()
+
+
+def _document(pioneer_key: str, handoff: dict) -> tuple[str, dict]:
+    doc_id = handoff.get("filename", handoff.get("handoff_id", str(uuid.uuid4())))
+    doc_data = {
+        **handoff,
+        "pioneer_key_prefix": pioneer_key[:8],
+        "pioneer_key_hash": pioneer_key_hash(pioneer_key),
+    }
+    return doc_id, doc_data
+
+
+def _record_id(record: dict) -> Any:
+    return record.get("handoff_id") or record.get("filename")
+
+
 MAX_HANDOFFS_PER_KEY = 50
+MAX_HANDOFF_KEYS = int(os.getenv("HANDOFF_MAX_KEYS", "1000"))
+
+
+class _Namespace:
+    """One pioneer key's records, newest-last, with a per-agent index."""
+
+    __slots__ = ("records", "by_agent")
+
+    def __init__(self, max_records: int):
+        self.records: deque = deque(maxlen=max_records)
+        self.by_agent: dict[Any, deque] = {}
+
+    def append(self, record: dict) -> None:
+        records = self.records
+        if records.maxlen is not None and len(records) == records.maxlen:
+            # The evicted record is the oldest overall, hence also the oldest
+            # of its agent.
+            evicted = records[0]
+            agent_records = self.by_agent.get(evicted.get("agent_id"))
+            if agent_records:
+                agent_records.popleft()
+                if not agent_records:
+                    del self.by_agent[evicted.get("agent_id")]
+        records.append(record)
+        self.by_agent.setdefault(record.get("agent_id"), deque()).append(record)
 
 
 class HandoffStore:
@@ -51,31 +146,122 @@ class HandoffStore:
     Values are deques of handoff dicts, newest-last.
     """
 
-    def __init__(self, max_per_key: int = MAX_HANDOFFS_PER_KEY):
+    def __init__(self, max_per_key: int = MAX_HANDOFFS_PER_KEY, max_keys: int = MAX_HANDOFF_KEYS):
         self._max = max_per_key
+        self._max_keys = max(1, max_keys)
         self._lock = threading.Lock()
-        self._data: dict[str, deque] = defaultdict(lambda: deque(maxlen=self._max))
+        self._data: "OrderedDict[str, _Namespace]" = OrderedDict()
+        # Keys whose Firestore history is already merged into memory.
+        self._loaded: set[str] = set()
+        self._loading: dict[str, asyncio.Future] = {}
+        self._pending: list[tuple[str, dict]] = []
+        self._writer: Optional[asyncio.Task] = None
+        self._writer_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+
+    # -- local state -------------------------------------------------------
+
+    def _namespace(self, pioneer_key: str, create: bool = False) -> Optional[_Namespace]:
+        """Caller holds the lock. Touches the key for LRU purposes."""
+        namespace = self._data.get(pioneer_key)
+        if namespace is not None:
+            self._data.move_to_end(pioneer_key)
+            return namespace
+        if not create:
+            return None
+        namespace = self._data[pioneer_key] = _Namespace(self._max)
+        self._evict()
+        return namespace
+
+    def _evict(self) -> None:
+        """Caller holds the lock. Drop least-recently-used keys over the bound."""
+        while len(self._data) > self._max_keys:
+            evicted, _ = self._data.popitem(last=False)
+            self._loaded.discard(evicted)
+
+    # -- writes ------------------------------------------------------------
 
     def add(self, pioneer_key: str, handoff: dict) -> None:
         """Append a handoff record under the given pioneer_key.
 
-        Writes to Firestore (coordination_handoffs collection) when available,
-        then appends to in-memory deque. If Firestore fails, in-memory only.
+        The in-memory append is immediate. The Firestore write is queued for
+        the background batch writer when an event loop is running, or made
+        synchronously otherwise. If Firestore fails, in-memory only.
         """
-        # Firestore write (primary persistence — cross-instance)
+        with self._lock:
+            self._namespace(pioneer_key, create=True).append(handoff)
+
+        if not _firestore_project():
+            return
+        document = _document(pioneer_key, handoff)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._write_now(document)
+            return
+        with self._lock:
+            self._pending.append(document)
+        self._ensure_writer(loop)
+
+    async def aadd(self, pioneer_key: str, handoff: dict) -> None:
+        """Async form of add(); never waits on Firestore."""
+        self.add(pioneer_key, handoff)
+
+    def _write_now(self, document: tuple[str, dict]) -> None:
+        doc_id, doc_data = document
         try:
             db = _get_firestore_client()
             if db is not None:
-                doc_id = handoff.get("filename", handoff.get("handoff_id", str(uuid.uuid4())))
-                doc_data = {**handoff, "pioneer_key_prefix": pioneer_key[:8]}
                 db.collection(COLLECTION_HANDOFFS).document(doc_id).set(doc_data)
                 logger.debug("Handoff persisted to Firestore: %s", doc_id)
         except Exception as e:
             logger.warning("Firestore handoff write failed (in-memory fallback): %s", e)
 
-        # In-memory write (fast reads, process-lifetime)
+    def _ensure_writer(self, loop: asyncio.AbstractEventLoop) -> None:
+        # The writer binds to the loop that is running when the first write
+        # arrives; a new loop (as in the unit suite) gets a fresh writer.
+        if self._writer_loop is not loop or self._writer is None or self._writer.done():
+            self._writer_loop = loop
+            self._wakeup = asyncio.Event()
+            self._writer = loop.create_task(self._write_behind(), name="handoff-write-behind")
+        self._wakeup.set()
+
+    async def _write_behind(self) -> None:
+        wakeup = self._wakeup
+        while True:
+            await wakeup.wait()
+            wakeup.clear()
+            await asyncio.sleep(HANDOFF_FLUSH_INTERVAL)
+            await self.flush()
+
+    async def flush(self) -> int:
+        """Commit every queued write in Firestore batches; returns the count sent."""
         with self._lock:
-            self._data[pioneer_key].append(handoff)
+            pending, self._pending = self._pending, []
+        if not pending:
+            return 0
+        db = _get_firestore_async_client()
+        if db is None:
+            return 0
+        collection = db.collection(COLLECTION_HANDOFFS)
+        sent = 0
+        for start in range(0, len(pending), FIRESTORE_BATCH_LIMIT):
+            chunk = pending[start:start + FIRESTORE_BATCH_LIMIT]
+            try:
+                batch = db.batch()
+                for doc_id, doc_data in chunk:
+                    batch.set(collection.document(doc_id), doc_data)
+                await batch.commit()
+                sent += len(chunk)
+            except Exception as e:
+                logger.warning(
+                    "Firestore handoff batch write failed (%d records, in-memory only): %s",
+                    len(chunk), e,
+                )
+        logger.debug("Handoff write-behind committed %d records", sent)
+        return sent
+
+    # -- reads -------------------------------------------------------------
 
     def get(
         self,
@@ -85,6 +271,8 @@ class HandoffStore:
     ) -> list[dict]:
         """Return the most recent `count` handoffs for a pioneer_key.
 
+        Reads local memory only; see aget() for the Firestore read-through.
+
         Args:
             pioneer_key: User namespace key.
             agent_id: If provided, filter to handoffs from this agent only.
@@ -95,28 +283,103 @@ class HandoffStore:
         """
         count = max(1, min(count, self._max))
         with self._lock:
-            records = list(self._data[pioneer_key])
-
-        if agent_id:
-            records = [r for r in records if r.get("agent_id") == agent_id]
-
-        # Return newest first
-        return list(reversed(records))[:count]
+            namespace = self._namespace(pioneer_key)
+            if namespace is None:
+                return []
+            records = namespace.by_agent.get(agent_id, ()) if agent_id else namespace.records
+            newest = []
+            for record in reversed(records):
+                newest.append(record)
+                if len(newest) == count:
+                    break
+        return newest
+
+    async def aget(
+        self,
+        pioneer_key: str,
+        agent_id: str | None = None,
+        count: int = 1,
+    ) -> list[dict]:
+        """get(), after loading this key's Firestore history on first sight."""
+        await self._read_through(pioneer_key)
+        return self.get(pioneer_key, agent_id=agent_id, count=count)
+
+    async def _read_through(self, pioneer_key: str) -> None:
+        if pioneer_key in self._loaded or not _firestore_project():
+            return
+        loading = self._loading.get(pioneer_key)
+        if loading is not None:
+            await asyncio.shield(loading)
+            return
+        loading = self._loading[pioneer_key] = asyncio.get_running_loop().create_future()
+        try:
+            records = await self._fetch(pioneer_key)
+            self._merge(pioneer_key, records)
+        finally:
+            self._loading.pop(pioneer_key, None)
+            loading.set_result(None)
+
+    async def _fetch(self, pioneer_key: str) -> list[dict]:
+        """Newest-first Firestore records for a key (empty on failure).
+
+        The query needs the composite index (pioneer_key_hash ASC,
+        timestamp DESC). A failed read is logged once per key and the key is
+        served from local records, exactly as before read-through existed.
+        """
+        db = _get_firestore_async_client()
+        if db is None:
+            return []
+        try:
+            from google.cloud.firestore_v1 import FieldFilter, Query  # type: ignore
+            query = (
+                db.collection(COLLECTION_HANDOFFS)
+                .where(filter=FieldFilter("pioneer_key_hash", "==", pioneer_key_hash(pioneer_key)))
+                .order_by("timestamp", direction=Query.DESCENDING)
+                .limit(self._max)
+            )
+            docs = await query.get()
+        except Exception as e:
+            logger.warning("Firestore handoff read failed (local records only): %s", e)
+            return []
+        records = []
+        for doc in docs:
+            data = doc.to_dict() or {}
+            data.pop("pioneer_key_prefix", None)
+            data.pop("pioneer_key_hash", None)
+            records.append(data)
+        return records
+
+    def _merge(self, pioneer_key: str, fetched: list[dict]) -> None:
+        with self._lock:
+            namespace = self._namespace(pioneer_key)
+            local = list(namespace.records) if namespace is not None else []
+            seen = {_record_id(r) for r in local}
+            merged = [r for r in fetched if _record_id(r) not in seen] + local
+            merged.sort(key=lambda r: r.get("timestamp") or "")
+            fresh = self._data[pioneer_key] = _Namespace(self._max)
+            self._data.move_to_end(pioneer_key)
+            for record in merged:
+                fresh.append(record)
+            self._loaded.add(pioneer_key)
+            self._evict()
 
     def get_all(self, pioneer_key: str) -> list[dict]:
         """Return all handoffs for a pioneer_key (oldest first)."""
         with self._lock:
-            return list(self._data[pioneer_key])
+            namespace = self._namespace(pioneer_key)
+            return list(namespace.records) if namespace is not None else []
 
     def count(self, pioneer_key: str) -> int:
         """Return total number of stored handoffs for a key."""
         with self._lock:
-            return len(self._data[pioneer_key])
+            namespace = self._namespace(pioneer_key)
+            return len(namespace.records) if namespace is not None else 0
 
     def clear(self, pioneer_key: str) -> None:
         """Remove all handoffs for a key (testing / cleanup use only)."""
         with self._lock:
-            self._data[pioneer_key].clear()
+            if self._data.pop(pioneer_key, None) is not None:
+                self._data[pioneer_key] = _Namespace(self._max)
 
 
 # Process-global singleton
@@ -13,11 +13,19 @@ Architecture:
       → tier_gate.check_tier()                      ← access enforcement
     ← PolarWebhookHandler (webhooks/polar_webhook.py)  ← proactive cache updates
 
+Connections: one httpx.AsyncClient per PolarClient, created on first use and
+kept open, so successive lookups reuse a kept-alive TLS connection instead of
+handshaking per call. The pool is bound to the event loop that created it and
+is rebuilt if a call arrives on a different loop.
+
 Polar docs: https://docs.polar.sh/api/v1/customers/get-customer-state-external
 """
 
+import asyncio
 import os
 import logging
+from typing import Optional
+
 import httpx
 
 logger = logging.getLogger(__name__)
@@ -30,6 +38,9 @@ POLAR_PIONEER_BENEFIT_TYPE = "feature"
 # Metadata key that identifies the Pioneer tier benefit
 POLAR_PIONEER_TIER_KEY = "pioneer"
 
+_REQUEST_TIMEOUT = 10.0
+_POOL_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=60.0)
+
 
 class PolarClient:
     """HTTP client for the Polar Customer State API.
@@ -60,6 +71,27 @@ class PolarClient:
             "Content-Type": "application/json",
             "Accept": "application/json",
         }
+        self._http: Optional[httpx.AsyncClient] = None
+        self._http_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _client(self) -> httpx.AsyncClient:
+        """Return the pooled client for the running loop, creating it if needed."""
+        loop = asyncio.get_running_loop()
+        if self._http is None or self._http_loop is not loop or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                timeout=_REQUEST_TIMEOUT,
+                limits=_POOL_LIMITS,
+                headers=self._headers,
+            )
+            self._http_loop = loop
+        return self._http
+
+    async def aclose(self) -> None:
+        """Close the pooled connections (a later call opens a new pool)."""
+        http, self._http = self._http, None
+        if http is not None and self._http_loop is asyncio.get_running_loop():
+            await http.aclose()
+        self._http_loop = None
 
     # ------------------------------------------------------------------
     # API calls
@@ -82,13 +114,11 @@ class PolarClient:
             httpx.HTTPStatusError: 401 invalid token, 404 customer not found,
                                    5xx Polar server error.
         """
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            resp = await client.get(
-                f"{self.base_url}/customers/external/{external_id}/state",
-                headers=self._headers,
-            )
-            resp.raise_for_status()
-            return resp.json()
+        resp = await self._client().get(
+            f"{self.base_url}/customers/external/{external_id}/state",
+        )
+        resp.raise_for_status()
+        return resp.json()
 
     # ------------------------------------------------------------------
     # State inspection
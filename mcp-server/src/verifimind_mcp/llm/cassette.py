@@ -0,0 +1,258 @@
+"""
+Record/replay cassettes for provider calls.
+
+Performance work on the Trinity pipeline is hard to compare run to run:
+provider latency and output both vary. With LLM_CASSETTE_MODE set, every
+agent call through ``generate_with_failover`` (the one path from the agents
+to ``LLMProvider.generate``) goes through a cassette:
+
+- record: the call runs normally, and its response dict, usage, measured
+  latency, model name, sanitized prompt and the raw model text (every
+  string the provider handed to ``strip_markdown_code_fences`` before
+  parsing) are appended to ``{LLM_CASSETTE_DIR}/{key}.jsonl``.
+- replay: the recorded response is served without calling the provider,
+  after the recorded latency multiplied by LLM_CASSETTE_TIME_SCALE (1 keeps
+  the original timing, 0 answers at once). Repeated calls with one key get
+  the recordings in order, then the last one again. A call with no
+  recording raises ``CassetteMissError`` — a replay run never falls through
+  to the network.
+
+The key is the SHA-256 of the prompt, output schema and temperature — not
+of the model or of max_tokens, which the agents size per model — so a prompt
+or schema change misses instead of replaying a stale answer, and a run with
+no API keys (every agent on ``MockProvider``) replays a real run's
+recordings. The raw text lets a benchmark feed real response shapes, such
+as Groq's multi-object outputs, straight to
+``GeminiProvider._extract_best_json`` / ``_merge_json_objects`` via
+``Cassette.entries()``. Failed calls are not recorded.
+
+Prompts, raw text and response strings are scrubbed of email addresses and
+provider API keys before they are written; the key is computed from the
+unscrubbed prompt.
+
+Environment:
+  LLM_CASSETTE_MODE        record | replay (default unset: no cassette)
+  LLM_CASSETTE_DIR         cassette directory (default .cassettes)
+  LLM_CASSETTE_TIME_SCALE  replay latency multiplier (default 1.0)
+"""
+
+import asyncio
+import contextvars
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+CASSETTE_MODE_ENV = "LLM_CASSETTE_MODE"
+CASSETTE_DIR_ENV = "LLM_CASSETTE_DIR"
+CASSETTE_TIME_SCALE_ENV = "LLM_CASSETTE_TIME_SCALE"
+DEFAULT_CASSETTE_DIR = ".cassettes"
+
+RECORD = "record"
+REPLAY = "replay"
+
+# Ephemeral per-call keys that must not be frozen into a recording.
+_EPHEMERAL_KEYS = ("_failover_correlation",)
+
+_SECRET_PATTERNS = (
+    (re.compile(r"[\w.+-]+@[\w-]+\.[\w.-]+"), "[email]"),
+    (re.compile(r"\b(?:sk-ant-|sk-|gsk_|csk-|AIza)[\w-]{16,}"), "[api_key]"),
+)
+
+
+class CassetteMissError(LookupError):
+    """Replay found no recording for a call."""
+
+    def __init__(self, key: str):
+        super().__init__(f"no cassette recording for key {key}")
+        self.key = key
+
+
+_raw_outputs: contextvars.ContextVar[Optional[List[str]]] = contextvars.ContextVar(
+    "cassette_raw_outputs", default=None,
+)
+
+
+def note_raw_output(text: str) -> None:
+    """Keep a provider's raw model text for the call being recorded (no-op otherwise)."""
+    sink = _raw_outputs.get()
+    if sink is not None:
+        sink.append(text)
+
+
+def scrub(value: Any) -> Any:
+    """Email addresses and API keys replaced in every string of ``value``."""
+    if isinstance(value, str):
+        for pattern, replacement in _SECRET_PATTERNS:
+            value = pattern.sub(replacement, value)
+        return value
+    if isinstance(value, dict):
+        return {k: scrub(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [scrub(v) for v in value]
+    return value
+
+
+def cassette_key(
+    prompt: str,
+    output_schema: Optional[Dict[str, Any]] = None,
+    temperature: float = 0.7,
+) -> str:
+    """Content hash of one call's inputs (defaults match ``LLMProvider.generate``)."""
+    canonical = json.dumps(
+        {"prompt": prompt, "output_schema": output_schema, "temperature": temperature},
+        sort_keys=True, separators=(",", ":"), default=str,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class Cassette:
+    """One cassette directory in record or replay mode."""
+
+    def __init__(self, directory: str, mode: str, time_scale: float = 1.0):
+        if mode not in (RECORD, REPLAY):
+            raise ValueError(f"cassette mode must be {RECORD!r} or {REPLAY!r}, not {mode!r}")
+        self.directory = Path(directory)
+        self.mode = mode
+        self.time_scale = max(0.0, time_scale)
+        self._loaded: Dict[str, List[Dict[str, Any]]] = {}
+        self._cursor: Dict[str, int] = {}
+        self._write_lock = threading.Lock()
+        self.recorded = 0
+        self.replayed = 0
+        self.misses = 0
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.jsonl"
+
+    async def generate(
+        self,
+        provider: Any,
+        kwargs: Dict[str, Any],
+        call: Callable[..., Awaitable[Any]],
+    ) -> Any:
+        """Serve one ``generate`` call from, or record it to, the cassette."""
+        key = cassette_key(
+            kwargs.get("prompt", ""), kwargs.get("output_schema"), kwargs.get("temperature", 0.7),
+        )
+        if self.mode == REPLAY:
+            return await self._replay(key)
+        return await self._record(key, provider, kwargs, call)
+
+    async def _replay(self, key: str) -> Dict[str, Any]:
+        from ..utils.offload import run_in_thread
+
+        if key not in self._loaded:
+            self._loaded[key] = await run_in_thread(self._read, key)
+        entries = self._loaded[key]
+        if not entries:
+            self.misses += 1
+            raise CassetteMissError(key)
+        index = min(self._cursor.get(key, 0), len(entries) - 1)
+        self._cursor[key] = index + 1
+        entry = entries[index]
+        delay = entry.get("latency_ms", 0) / 1000 * self.time_scale
+        if delay > 0:
+            await asyncio.sleep(delay)
+        self.replayed += 1
+        return json.loads(json.dumps(entry["response"]))  # a fresh copy per call
+
+    def _read(self, key: str) -> List[Dict[str, Any]]:
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                return [json.loads(line) for line in f if line.strip()]
+        except FileNotFoundError:
+            return []
+
+    async def _record(self, key: str, provider: Any, kwargs: Dict[str, Any], call) -> Any:
+        from ..utils.offload import run_in_thread
+
+        raw: List[str] = []
+        token = _raw_outputs.set(raw)
+        start = time.monotonic()
+        try:
+            response = await call(provider, **kwargs)
+        finally:
+            _raw_outputs.reset(token)
+        latency_ms = (time.monotonic() - start) * 1000
+
+        recorded = response
+        if isinstance(response, dict):
+            recorded = {k: v for k, v in response.items() if k not in _EPHEMERAL_KEYS}
+        try:
+            model = provider.get_model_name()
+        except Exception:
+            model = type(provider).__name__
+        entry = {
+            "key": key,
+            "model": model,
+            "prompt": scrub(kwargs.get("prompt", "")),
+            "output_schema_title": (kwargs.get("output_schema") or {}).get("title"),
+            "max_tokens": kwargs.get("max_tokens"),
+            "response": scrub(recorded),
+            "usage": recorded.get("usage") if isinstance(recorded, dict) else None,
+            "raw": scrub(raw),
+            "latency_ms": round(latency_ms, 1),
+            "recorded_at": datetime.now(timezone.utc).isoformat(),
+        }
+        line = json.dumps(entry, default=str, ensure_ascii=False)
+        await run_in_thread(self._append, key, line)
+        self.recorded += 1
+        return response
+
+    def _append(self, key: str, line: str) -> None:
+        with self._write_lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(self._path(key), "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+
+    def entries(self) -> Iterator[Dict[str, Any]]:
+        """Every recording in the directory (benchmarks read ``raw`` from these)."""
+        for path in sorted(self.directory.glob("*.jsonl")):
+            yield from self._read(path.stem)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "mode": self.mode,
+            "directory": str(self.directory),
+            "recorded": self.recorded,
+            "replayed": self.replayed,
+            "misses": self.misses,
+        }
+
+
+_cassette: Optional[Cassette] = None
+_configured = False
+
+
+def active_cassette() -> Optional[Cassette]:
+    """The cassette configured by LLM_CASSETTE_MODE, or None (read once)."""
+    global _cassette, _configured
+    if not _configured:
+        mode = os.getenv(CASSETTE_MODE_ENV, "").strip().lower()
+        if mode and mode not in (RECORD, REPLAY):
+            logger.warning("Ignoring %s=%r (expected %s or %s)", CASSETTE_MODE_ENV, mode, RECORD, REPLAY)
+        elif mode:
+            _cassette = Cassette(
+                os.getenv(CASSETTE_DIR_ENV, DEFAULT_CASSETTE_DIR),
+                mode,
+                float(os.getenv(CASSETTE_TIME_SCALE_ENV, "1.0")),
+            )
+            logger.warning("LLM cassette active: %s from %s", mode, _cassette.directory)
+        _configured = True
+    return _cassette
+
+
+def reset_cassette() -> None:
+    """Forget the configured cassette so the environment is read again (tests)."""
+    global _cassette, _configured
+    _cassette = None
+    _configured = False
@@ -50,6 +50,12 @@ Every public surface projects this one live read.
 The whole layer ships DARK: flag unset (default) means
 `generate_with_failover` delegates 1:1 to `provider.generate()` — behavior is
 byte-identical to v0.5.54.
+
+Request deadline: when the caller's run publishes an end-to-end deadline
+(utils/deadline.py), both paths are additionally bounded by it — the dark
+path wraps the provider call in the remaining time, and the enabled path's
+total deadline (and with it every Retry-After wait and hop decision) is the
+earlier of its own cap and the request's. Without one, nothing changes.
 """
 
 import asyncio
@@ -61,6 +67,8 @@ from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
 from typing import Any, Dict, List, Optional, Tuple
 
+from .cassette import active_cassette
+
 logger = logging.getLogger(__name__)
 
 # --- configuration -----------------------------------------------------------
@@ -480,10 +488,27 @@ def admission_snapshot() -> Dict[str, int]:
     return {name: count for name, count in sorted(_admission.items()) if count}
 
 
+# --- real-traffic marks (per-process) -----------------------------------------
+
+_last_traffic: Dict[str, float] = {}
+
+
+def note_provider_traffic(provider_name: str) -> None:
+    """Mark that a real request just used this family (the background
+    prober stands down while a family carries live traffic)."""
+    _last_traffic[provider_name] = time.monotonic()
+
+
+def last_provider_traffic(provider_name: str) -> Optional[float]:
+    """Monotonic time of the family's last real request, or None."""
+    return _last_traffic.get(provider_name)
+
+
 def reset_circuits() -> None:
     """Test hook: clear all circuit + admission state."""
     _circuits.clear()
     _admission.clear()
+    _last_traffic.clear()
 
 
 # --- typed boundary errors (B-90-8) ------------------------------------------
@@ -658,6 +683,7 @@ class _FailoverRun:
             raise self._exhausted(f"backup {target} admission limit reached",
                                   reason="backup_admission_rejected")
         self.admission_held = target
+        note_provider_traffic(target)
         try:
             from . import get_provider
             provider = get_provider(target)
@@ -767,6 +793,9 @@ class _FailoverRun:
 async def generate_with_failover(provider: Any, **kwargs: Any) -> Any:
     """generate() with bounded runtime failover for marked hosted providers.
 
+    With LLM_CASSETTE_MODE set, the call is recorded to or replayed from a
+    cassette (llm/cassette.py) around everything below.
+
     Dark path (flag off / evidence invalid / provider unmarked — every
     BYOK/Ollama/override/mock provider): a plain delegated call, no wrapping,
     no telemetry keys — byte-identical legacy behavior.
@@ -777,8 +806,33 @@ async def generate_with_failover(provider: Any, **kwargs: Any) -> Any:
     whatever the FINAL provider truly stamped — a hop never upgrades quality,
     so the Z-veto and degraded-caps consumers read the same truth as today).
     """
+    cassette = active_cassette()
+    if cassette is not None:
+        return await cassette.generate(provider, kwargs, _generate_with_failover)
+    return await _generate_with_failover(provider, **kwargs)
+
+
+async def _generate_with_failover(provider: Any, **kwargs: Any) -> Any:
+    from ..utils.deadline import RequestDeadlineExceeded, current_deadline
+    deadline = current_deadline()
+    if deadline is not None and deadline.expired():
+        raise RequestDeadlineExceeded("request deadline reached before provider call")
+
     agent_id = hosted_failover_agent(provider)
+    if agent_id is not None:
+        note_provider_traffic(_provider_family(provider))
     if agent_id is None or not runtime_failover_enabled():
-        return await provider.generate(**kwargs)
+        if deadline is None:
+            return await provider.generate(**kwargs)
+        try:
+            return await asyncio.wait_for(
+                provider.generate(**kwargs), timeout=deadline.remaining())
+        except asyncio.TimeoutError:
+            if not deadline.expired():
+                raise  # the provider's own timeout, not ours
+            raise RequestDeadlineExceeded(
+                "provider call cut off at the request deadline") from None
     run = _FailoverRun(provider, agent_id, hosted_hop_chain(provider), kwargs)
+    if deadline is not None:
+        run.deadline = min(run.deadline, time.monotonic() + deadline.remaining())
     return await run.execute()
@@ -0,0 +1,309 @@
+"""
+Background health probing for the hosted provider families.
+
+The failover circuits (llm/failover.py) only learn about an outage from the
+requests it hurts: the first CIRCUIT_FAILURE_THRESHOLD consultations after a
+provider goes down each pay a full attempt timeout before the circuit opens,
+and after a scale-up the first consultation on a fresh instance pays for the
+SDK imports, client construction and TLS handshakes. When enabled, the
+prober walks the hosted families ahead of the traffic:
+
+- Families are the ones ``get_agent_provider`` resolves for X, Z and CS with
+  the hosted failover marker, plus their resolved hop targets — the only
+  families the circuits govern. BYOK, overrides, Ollama and Mock are never
+  probed.
+- A probe is ``LLMProvider.probe()``: a model-metadata read, one
+  authenticated round trip that spends no tokens, bounded by
+  PROVIDER_PROBE_TIMEOUT.
+- Results feed the circuits with the executor's own rules. An
+  infrastructure failure (``classify_failure(...).circuit_relevant``) is
+  recorded like a failed attempt, and the family is re-probed after
+  PROVIDER_PROBE_RETRY_SECONDS instead of a full interval, so a dead provider
+  opens its circuit within the failure window without a user request paying
+  for it. Auth, rate-limit and unclassified failures never touch the
+  circuit. A success closes a circuit only through its half-open probe slot
+  — a closed circuit's failure count is left to real traffic.
+- Open circuits are not probed; real requests and probes share the single
+  half-open slot.
+- A family that served real traffic within PROVIDER_PROBE_IDLE_SECONDS is
+  skipped: live requests already measure it, and probing would only add
+  load. Probes across all families are capped at PROVIDER_PROBE_BUDGET per
+  rolling hour.
+
+Latency (last and EWMA) and outcomes per family are served on /health via
+``get_provider_prober_stats()``. The first round runs as soon as the
+lifespan starts the prober, which is what warms a new instance.
+
+Environment:
+  PROVIDER_PROBE_ENABLED        1/true/yes/on enables the prober (default off)
+  PROVIDER_PROBE_INTERVAL       seconds between probes of a family (default 60)
+  PROVIDER_PROBE_RETRY_SECONDS  re-probe delay after an infrastructure failure (default 10)
+  PROVIDER_PROBE_BUDGET         probes per rolling hour, all families (default 240)
+  PROVIDER_PROBE_IDLE_SECONDS   skip families with real traffic this recent (default 30)
+  PROVIDER_PROBE_TIMEOUT        per-probe timeout in seconds (default 5)
+"""
+
+import asyncio
+import collections
+import logging
+import os
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Deque, Dict, Optional
+
+from .failover import (
+    _provider_family,
+    acquire_slot,
+    classify_failure,
+    hosted_failover_agent,
+    hosted_hop_chain,
+    last_provider_traffic,
+    record_provider_failure,
+    record_provider_success,
+    release_probe,
+)
+
+logger = logging.getLogger(__name__)
+
+PROBE_ENV = "PROVIDER_PROBE_ENABLED"
+PROVIDER_PROBE_INTERVAL = float(os.getenv("PROVIDER_PROBE_INTERVAL", "60"))
+PROVIDER_PROBE_RETRY_SECONDS = float(os.getenv("PROVIDER_PROBE_RETRY_SECONDS", "10"))
+PROVIDER_PROBE_BUDGET = int(os.getenv("PROVIDER_PROBE_BUDGET", "240"))
+PROVIDER_PROBE_IDLE_SECONDS = float(os.getenv("PROVIDER_PROBE_IDLE_SECONDS", "30"))
+PROVIDER_PROBE_TIMEOUT = float(os.getenv("PROVIDER_PROBE_TIMEOUT", "5"))
+
+PROBE_AGENTS = ("X", "Z", "CS")
+BUDGET_WINDOW_S = 3600.0
+LATENCY_EWMA_ALPHA = 0.3
+MIN_SLEEP_S = 0.5
+
+# Outcomes of ProviderProber.probe_family()
+OK = "ok"
+SKIPPED_TRAFFIC = "skipped_traffic"
+SKIPPED_OPEN = "skipped_circuit_open"
+SKIPPED_BUDGET = "skipped_budget"
+_SKIPS = (SKIPPED_TRAFFIC, SKIPPED_OPEN, SKIPPED_BUDGET)
+
+
+def provider_probe_enabled() -> bool:
+    return os.getenv(PROBE_ENV, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def resolve_hosted_providers() -> Dict[str, Any]:
+    """family -> provider for every hosted family the circuits govern.
+
+    Blocking (SDK imports, client construction): run it off the loop.
+    """
+    from ..config_helper import get_agent_provider
+    from . import get_provider
+
+    found: Dict[str, Any] = {}
+    for agent_id in PROBE_AGENTS:
+        try:
+            provider = get_agent_provider(agent_id)
+        except Exception as e:
+            logger.debug("provider prober: agent %s did not resolve: %s", agent_id, e)
+            continue
+        if hosted_failover_agent(provider) is None:
+            continue
+        found.setdefault(_provider_family(provider), provider)
+        for target in hosted_hop_chain(provider):
+            if target in found:
+                continue
+            try:
+                found[target] = get_provider(target)
+            except Exception as e:
+                logger.debug("provider prober: hop target %s did not resolve: %s", target, e)
+    return found
+
+
+class _FamilyStats:
+    def __init__(self):
+        self.probes = 0
+        self.failures = 0
+        self.skipped = collections.Counter()
+        self.last_outcome: Optional[str] = None
+        self.last_probe_at: Optional[str] = None
+        self.last_ms: Optional[float] = None
+        self.ewma_ms: Optional[float] = None
+        self.circuit_failure = False
+
+    def observe(self, outcome: str, latency_ms: float, circuit_failure: bool = False) -> None:
+        self.probes += 1
+        self.last_outcome = outcome
+        self.circuit_failure = circuit_failure
+        self.last_probe_at = datetime.now(timezone.utc).isoformat()
+        self.last_ms = round(latency_ms, 1)
+        if outcome != OK:
+            self.failures += 1
+            return
+        if self.ewma_ms is None:
+            self.ewma_ms = self.last_ms
+        else:
+            self.ewma_ms = round(LATENCY_EWMA_ALPHA * latency_ms + (1 - LATENCY_EWMA_ALPHA) * self.ewma_ms, 1)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "probes": self.probes,
+            "failures": self.failures,
+            "skipped": dict(self.skipped),
+            "last_outcome": self.last_outcome,
+            "last_probe_at": self.last_probe_at,
+            "latency_ms": {"last": self.last_ms, "ewma": self.ewma_ms},
+        }
+
+
+class ProviderProber:
+    """Probes each hosted family on its own schedule; see the module docstring."""
+
+    def __init__(
+        self,
+        interval: float = PROVIDER_PROBE_INTERVAL,
+        retry_seconds: float = PROVIDER_PROBE_RETRY_SECONDS,
+        budget: int = PROVIDER_PROBE_BUDGET,
+        idle_seconds: float = PROVIDER_PROBE_IDLE_SECONDS,
+        timeout: float = PROVIDER_PROBE_TIMEOUT,
+        resolve: Optional[Callable[[], Dict[str, Any]]] = None,
+    ):
+        self.interval = interval
+        self.retry_seconds = retry_seconds
+        self.budget = budget
+        self.idle_seconds = idle_seconds
+        self.timeout = timeout
+        self._resolve = resolve or resolve_hosted_providers
+        self._providers: Dict[str, Any] = {}
+        self._due: Dict[str, float] = {}
+        self._spent: Deque[float] = collections.deque()
+        self._stats: Dict[str, _FamilyStats] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._resolved_at: Optional[float] = None
+
+    def start(self) -> None:
+        self._task = asyncio.get_running_loop().create_task(self._run(), name="provider-prober")
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.run_due()
+            except Exception:
+                logger.warning("provider prober round failed", exc_info=True)
+            await asyncio.sleep(self._sleep_for())
+
+    def _sleep_for(self) -> float:
+        if not self._due:
+            return self.interval
+        return max(MIN_SLEEP_S, min(self._due.values()) - time.monotonic())
+
+    async def _ensure_providers(self) -> None:
+        now = time.monotonic()
+        if self._providers or (self._resolved_at is not None and now - self._resolved_at < self.interval):
+            return
+        from ..utils.offload import run_in_thread
+
+        self._resolved_at = now
+        self._providers = await run_in_thread(self._resolve)
+        for family in self._providers:
+            self._due.setdefault(family, now)
+
+    async def run_due(self) -> None:
+        """Probe every family whose next probe is due, one at a time."""
+        await self._ensure_providers()
+        for family, provider in self._providers.items():
+            if self._due.get(family, 0.0) > time.monotonic():
+                continue
+            outcome = await self.probe_family(family, provider)
+            retry = outcome not in _SKIPS and self._stats[family].circuit_failure
+            self._due[family] = time.monotonic() + (self.retry_seconds if retry else self.interval)
+
+    def _budget_left(self, now: float) -> bool:
+        while self._spent and now - self._spent[0] >= BUDGET_WINDOW_S:
+            self._spent.popleft()
+        return len(self._spent) < self.budget
+
+    async def probe_family(self, family: str, provider: Any) -> str:
+        """Probe one family now (subject to stand-down, circuit and budget)."""
+        stats = self._stats.setdefault(family, _FamilyStats())
+        now = time.monotonic()
+        last = last_provider_traffic(family)
+        if last is not None and now - last < self.idle_seconds:
+            stats.skipped[SKIPPED_TRAFFIC] += 1
+            return SKIPPED_TRAFFIC
+        if not self._budget_left(now):
+            stats.skipped[SKIPPED_BUDGET] += 1
+            return SKIPPED_BUDGET
+        allowed, probe_held = acquire_slot(family)
+        if not allowed:
+            stats.skipped[SKIPPED_OPEN] += 1
+            return SKIPPED_OPEN
+
+        self._spent.append(now)
+        start = time.monotonic()
+        try:
+            await asyncio.wait_for(provider.probe(), timeout=self.timeout)
+        except asyncio.CancelledError:
+            if probe_held:
+                release_probe(family)
+            raise
+        except Exception as exc:
+            decision = classify_failure(exc)
+            if decision.circuit_relevant:
+                record_provider_failure(family)
+            elif probe_held:
+                release_probe(family)
+            stats.observe(decision.reason_class, (time.monotonic() - start) * 1000,
+                          circuit_failure=decision.circuit_relevant)
+            logger.info("provider probe %s failed (%s)", family, decision.reason_class)
+            return decision.reason_class
+        if probe_held:
+            record_provider_success(family)
+        stats.observe(OK, (time.monotonic() - start) * 1000)
+        return OK
+
+    def stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        self._budget_left(now)
+        return {
+            "enabled": True,
+            "interval_s": self.interval,
+            "budget_per_hour": self.budget,
+            "budget_used": len(self._spent),
+            "families": {family: s.as_dict() for family, s in sorted(self._stats.items())},
+        }
+
+
+_prober: Optional[ProviderProber] = None
+
+
+def start_provider_prober() -> bool:
+    """Start probing from the running loop. True when a prober is active."""
+    global _prober
+    if not provider_probe_enabled():
+        return False
+    if _prober is None:
+        prober = ProviderProber()
+        prober.start()
+        _prober = prober
+    return True
+
+
+async def stop_provider_prober() -> None:
+    global _prober
+    prober, _prober = _prober, None
+    if prober is not None:
+        await prober.stop()
+
+
+def get_provider_prober_stats() -> Dict[str, Any]:
+    prober = _prober
+    if prober is None:
+        return {"enabled": False}
+    return prober.stats()
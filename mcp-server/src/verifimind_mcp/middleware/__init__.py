@@ -5,6 +5,9 @@ v0.3.1 - Security & Sustainability
 v0.5.11 - Tier-Gating (Pioneer vs Scholar)
 v0.5.12 - Polar adapter (Pioneer payment integration)
 v0.5.22 - IP Blocklist (T Security Directive — 3 rogue IPs blocked)
+LLM admission control (tier-priority in-flight limit + 503 load shedding)
+Response compression (negotiated gzip/br/zstd, streaming-safe)
+Pure-ASGI blocklist + rate limiting sharing one per-request identity parse
 """
 
 from .ip_blocklist import (
@@ -20,6 +23,16 @@ from .rate_limiter import (
     RATE_LIMIT_GLOBAL,
     RATE_LIMIT_WINDOW,
 )
+from .llm_admission import (
+    LLMAdmissionMiddleware,
+    get_llm_admission_stats,
+    LLM_MAX_IN_FLIGHT,
+)
+from .compression import (
+    CompressionMiddleware,
+    get_compression_stats,
+    COMPRESSION_MIN_SIZE,
+)
 from .tier_gate import (
     check_tier,
     tier_gate_error,
@@ -43,6 +56,12 @@ __all__ = [
     "RATE_LIMIT_PER_IP",
     "RATE_LIMIT_GLOBAL",
     "RATE_LIMIT_WINDOW",
+    "LLMAdmissionMiddleware",
+    "get_llm_admission_stats",
+    "LLM_MAX_IN_FLIGHT",
+    "CompressionMiddleware",
+    "get_compression_stats",
+    "COMPRESSION_MIN_SIZE",
     "check_tier",
     "tier_gate_error",
     "sanitize_handoff_content",
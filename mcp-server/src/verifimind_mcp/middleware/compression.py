@@ -0,0 +1,337 @@
+"""
+Response compression for VerifiMind MCP Server.
+
+Markdown Trinity reports, full reasoning blocks and the discovery documents
+(/.well-known/mcp-config, /research/index.json, the server card) are large,
+highly repetitive text that previously went out uncompressed. This middleware
+negotiates a content coding from Accept-Encoding and compresses eligible
+responses:
+
+  zstd  — when the optional ``zstandard`` package is installed
+  br    — when the optional ``brotli`` (or ``brotlicffi``) package is installed
+  gzip  — always available (stdlib zlib)
+
+The server prefers zstd > br > gzip among the codings the client accepts
+(q > 0). Only compressible media types are touched (text/*, JSON, XML, JS,
+SVG); responses that already carry a Content-Encoding, 204/304 responses,
+HEAD requests and ``Cache-Control: no-transform`` pass through unchanged.
+
+A complete (single-message) body smaller than COMPRESSION_MIN_SIZE bytes is
+sent as-is, and so is one that compression would not shrink. A STREAMED body
+(streamable-http SSE, MCP GET streams) is compressed message by message and
+FLUSHED after every ASGI body message, so each event reaches the client as
+soon as the app sends it — compression never holds an event back.
+
+Implemented as a plain ASGI middleware (not BaseHTTPMiddleware) for the same
+reason as LLMAdmissionMiddleware: streamed responses must pass through
+incrementally. Bytes-in/bytes-out counters are exposed through
+get_compression_stats() on /health. COMPRESSION_ENABLED=false disables it.
+"""
+
+import logging
+import os
+import zlib
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+try:
+    import brotli
+except ImportError:  # optional dependency
+    try:
+        import brotlicffi as brotli
+    except ImportError:
+        brotli = None
+
+try:
+    import zstandard
+except ImportError:  # optional dependency
+    zstandard = None
+
+# Configuration from environment variables
+COMPRESSION_ENABLED = os.getenv("COMPRESSION_ENABLED", "true").lower() == "true"
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+GZIP_LEVEL = int(os.getenv("COMPRESSION_GZIP_LEVEL", "6"))
+BROTLI_QUALITY = int(os.getenv("COMPRESSION_BROTLI_QUALITY", "4"))
+ZSTD_LEVEL = int(os.getenv("COMPRESSION_ZSTD_LEVEL", "3"))
+
+COMPRESSIBLE_TYPES = frozenset({
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+})
+SKIP_STATUS = frozenset({204, 304})
+
+
+class _GzipEncoder:
+    def __init__(self):
+        self._obj = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.compress(data)
+
+    def flush(self) -> bytes:
+        return self._obj.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._obj.flush(zlib.Z_FINISH)
+
+
+class _BrotliEncoder:
+    def __init__(self):
+        self._obj = brotli.Compressor(quality=BROTLI_QUALITY)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.process(data)
+
+    def flush(self) -> bytes:
+        return self._obj.flush()
+
+    def finish(self) -> bytes:
+        return self._obj.finish()
+
+
+class _ZstdEncoder:
+    def __init__(self):
+        self._obj = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.compress(data)
+
+    def flush(self) -> bytes:
+        return self._obj.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._obj.flush()
+
+
+def available_encodings() -> List[str]:
+    """Codings this instance can produce, in server preference order."""
+    encodings = []
+    if zstandard is not None:
+        encodings.append("zstd")
+    if brotli is not None:
+        encodings.append("br")
+    encodings.append("gzip")
+    return encodings
+
+
+_ENCODERS = {"zstd": _ZstdEncoder, "br": _BrotliEncoder, "gzip": _GzipEncoder}
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """Pick the preferred available coding the client accepts, or None."""
+    accepted: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[name] = q
+    wildcard = accepted.get("*", 0.0)
+    for encoding in available_encodings():
+        if accepted.get(encoding, wildcard) > 0:
+            return encoding
+    return None
+
+
+def _is_compressible(content_type: str) -> bool:
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    return (
+        media_type.startswith("text/")
+        or media_type in COMPRESSIBLE_TYPES
+        or media_type.endswith("+json")
+        or media_type.endswith("+xml")
+    )
+
+
+class CompressionStats:
+    """Process-local byte counters for compressed responses."""
+
+    def __init__(self):
+        self.responses_compressed = 0
+        self.streams_compressed = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.by_encoding: Dict[str, int] = {}
+
+    def count_response(self, encoding: str, streamed: bool) -> None:
+        if streamed:
+            self.streams_compressed += 1
+        else:
+            self.responses_compressed += 1
+        self.by_encoding[encoding] = self.by_encoding.get(encoding, 0) + 1
+
+    def record(self, bytes_in: int, bytes_out: int) -> None:
+        self.bytes_in += bytes_in
+        self.bytes_out += bytes_out
+
+    def get_stats(self) -> Dict:
+        return {
+            "enabled": COMPRESSION_ENABLED,
+            "encodings": available_encodings(),
+            "min_size": COMPRESSION_MIN_SIZE,
+            "responses_compressed": self.responses_compressed,
+            "streams_compressed": self.streams_compressed,
+            "by_encoding": dict(self.by_encoding),
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "bytes_saved": self.bytes_in - self.bytes_out,
+        }
+
+
+_stats = CompressionStats()
+
+
+def get_compression_stats() -> Dict:
+    """Get current compression statistics (for monitoring)."""
+    return _stats.get_stats()
+
+
+def reset_compression_stats() -> None:
+    global _stats
+    _stats = CompressionStats()
+
+
+def _header(headers: List[Tuple[bytes, bytes]], name: bytes) -> str:
+    for key, value in headers:
+        if key.lower() == name:
+            return value.decode("latin-1")
+    return ""
+
+
+def _encoded_headers(
+    headers: List[Tuple[bytes, bytes]],
+    encoding: str,
+    content_length: Optional[int],
+) -> List[Tuple[bytes, bytes]]:
+    out = [
+        (key, value) for key, value in headers
+        if key.lower() not in (b"content-length", b"vary")
+    ]
+    vary = _header(headers, b"vary")
+    if "accept-encoding" not in vary.lower():
+        vary = f"{vary}, Accept-Encoding" if vary else "Accept-Encoding"
+    out.append((b"vary", vary.encode("latin-1")))
+    out.append((b"content-encoding", encoding.encode("latin-1")))
+    if content_length is not None:
+        out.append((b"content-length", str(content_length).encode("latin-1")))
+    return out
+
+
+class _CompressingSend:
+    """Wraps ``send`` for one response; decides at the first body message."""
+
+    def __init__(self, send, encoding: str, minimum_size: int):
+        self._send = send
+        self._encoding = encoding
+        self._minimum_size = minimum_size
+        self._start: Optional[dict] = None
+        self._encoder = None
+        self._passthrough = False
+
+    async def __call__(self, message: dict) -> None:
+        kind = message["type"]
+        if kind == "http.response.start":
+            headers = list(message.get("headers", []))
+            if (
+                message.get("status", 200) in SKIP_STATUS
+                or _header(headers, b"content-encoding")
+                or not _is_compressible(_header(headers, b"content-type"))
+                or "no-transform" in _header(headers, b"cache-control").lower()
+            ):
+                self._passthrough = True
+                await self._send(message)
+                return
+            self._start = message
+            return
+        if self._passthrough or kind != "http.response.body":
+            await self._release_start()
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self._encoder is None and self._start is not None:
+            if not more_body:
+                await self._send_complete(body)
+                return
+            await self._begin_stream()
+
+        if self._encoder is None:  # start already released uncompressed
+            await self._send(message)
+            return
+        chunk = self._encoder.compress(body)
+        chunk += self._encoder.flush() if more_body else self._encoder.finish()
+        _stats.record(len(body), len(chunk))
+        await self._send({
+            "type": "http.response.body",
+            "body": chunk,
+            "more_body": more_body,
+        })
+
+    async def _release_start(self) -> None:
+        if self._start is not None:
+            start, self._start = self._start, None
+            await self._send(start)
+
+    async def _send_complete(self, body: bytes) -> None:
+        start, self._start = self._start, None
+        if len(body) >= self._minimum_size:
+            encoder = _ENCODERS[self._encoding]()
+            compressed = encoder.compress(body) + encoder.finish()
+            if len(compressed) < len(body):
+                _stats.count_response(self._encoding, streamed=False)
+                _stats.record(len(body), len(compressed))
+                await self._send({
+                    **start,
+                    "headers": _encoded_headers(
+                        list(start.get("headers", [])), self._encoding, len(compressed)
+                    ),
+                })
+                await self._send({"type": "http.response.body", "body": compressed})
+                return
+        await self._send(start)
+        await self._send({"type": "http.response.body", "body": body})
+
+    async def _begin_stream(self) -> None:
+        start, self._start = self._start, None
+        self._encoder = _ENCODERS[self._encoding]()
+        _stats.count_response(self._encoding, streamed=True)
+        await self._send({
+            **start,
+            "headers": _encoded_headers(
+                list(start.get("headers", [])), self._encoding, None
+            ),
+        })
+
+
+class CompressionMiddleware:
+    """Negotiated gzip/br/zstd response compression, streaming-safe."""
+
+    def __init__(self, app, minimum_size: int = COMPRESSION_MIN_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] != "http"
+            or not COMPRESSION_ENABLED
+            or scope.get("method") == "HEAD"
+        ):
+            await self.app(scope, receive, send)
+            return
+        headers = scope.get("headers", [])
+        encoding = negotiate_encoding(_header(headers, b"accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        await self.app(scope, receive, _CompressingSend(send, encoding, self.minimum_size))
@@ -0,0 +1,92 @@
+"""
+Per-request caller identity shared by the ASGI middleware stack.
+
+IPBlocklistMiddleware, RateLimitMiddleware and LLMAdmissionMiddleware all need
+the same few facts about a request: the X-Forwarded-For chain, the client IP,
+the User-Agent and the tier behind X-VerifiMind-UUID. ``request_identity``
+decodes the raw ASGI headers once, stores the result in the scope, and every
+later layer reuses it — one header decode per request instead of one Request
+object per layer, and one tier resolution shared by rate limiting and
+admission.
+"""
+
+from typing import Dict, Optional, Tuple
+
+SCOPE_KEY = "verifimind.identity"
+
+
+class RequestIdentity:
+    """Lazily derived caller facts for one request (see module docstring)."""
+
+    __slots__ = ("headers", "client_host", "_tier")
+
+    def __init__(self, headers: Dict[str, str], client_host: str):
+        self.headers = headers
+        self.client_host = client_host
+        self._tier: Optional[Tuple[str, str]] = None
+
+    @classmethod
+    def from_scope(cls, scope) -> "RequestIdentity":
+        headers: Dict[str, str] = {}
+        for key, value in scope.get("headers") or ():
+            name = key.decode("latin-1").lower()
+            if name not in headers:  # first occurrence wins, as in Starlette's Headers.get
+                headers[name] = value.decode("latin-1")
+        client = scope.get("client")
+        return cls(headers, client[0] if client and client[0] else "")
+
+    @property
+    def forwarded(self) -> str:
+        return self.headers.get("x-forwarded-for", "")
+
+    @property
+    def user_agent(self) -> str:
+        return self.headers.get("user-agent", "")
+
+    @property
+    def uuid_header(self) -> str:
+        return self.headers.get("x-verifimind-uuid", "").strip()
+
+    @property
+    def client_ip(self) -> str:
+        """Original client: first XFF hop, then X-Real-IP, then the socket peer."""
+        forwarded = self.forwarded
+        if forwarded:
+            return forwarded.split(",", 1)[0].strip()
+        real_ip = self.headers.get("x-real-ip")
+        if real_ip:
+            return real_ip.strip()
+        return self.client_host or "unknown"
+
+    def tier(self) -> Tuple[str, str]:
+        """(tier, uuid_status) from X-VerifiMind-UUID, resolved once per request.
+
+        uuid_status is "absent" (no header), "invalid" (header present but not
+        a valid UUID) or "valid"; anything but a valid UUID is "anonymous".
+        """
+        if self._tier is None:
+            self._tier = _resolve_tier(self.uuid_header)
+        return self._tier
+
+
+def _resolve_tier(uuid_header: str) -> Tuple[str, str]:
+    if not uuid_header:
+        return "anonymous", "absent"
+    try:
+        from verifimind_mcp.utils.uuid_tracer import is_valid_uuid
+        from .rate_limiter import _resolve_uuid_tier
+        if is_valid_uuid(uuid_header):
+            return _resolve_uuid_tier(uuid_header), "valid"
+    # A malformed optional UUID header intentionally falls back to anonymous.
+    except Exception:  # nosec B110
+        pass
+    return "anonymous", "invalid"
+
+
+def request_identity(scope) -> RequestIdentity:
+    """The scope's RequestIdentity, parsed on first use."""
+    identity = scope.get(SCOPE_KEY)
+    if identity is None:
+        identity = RequestIdentity.from_scope(scope)
+        scope[SCOPE_KEY] = identity
+    return identity
@@ -9,6 +9,27 @@ Block criteria:
   2. User-Agent substring match against BLOCKED_UA_PATTERNS
   3. ALL IPs in X-Forwarded-For chain are checked (GFE proxy-aware)
 
+Matching cost does not grow with the lists (this runs before rate limiting,
+so it sees every scanner flood in full):
+  - CIDR ranges: one hash table per (IP version, prefix length), probed
+    longest prefix first — a level-compressed prefix trie. Cost scales with
+    the number of distinct prefix lengths, not the number of ranges; the
+    most specific range's reason wins.
+  - User-Agent patterns: one Aho-Corasick automaton, a single pass over the
+    UA whatever the pattern count; the earliest-listed matching pattern is
+    reported.
+  - Verdicts are memoised in a bounded LRU keyed by (X-Forwarded-For,
+    client host) and by User-Agent string, so a flood repeating the same
+    identity costs one dict lookup.
+
+Runtime additions: IP_BLOCKLIST_FILE names a local JSON file whose entries
+are merged with the lists below (it can add, never remove):
+  {"ips": [["<ip>", "<REASON>", ...]], "cidrs": [["<cidr>", "<REASON>", ...]],
+   "user_agents": ["<substring>"]}
+The file is re-read when its mtime/size changes, checked at most every
+IP_BLOCKLIST_RELOAD_INTERVAL seconds; a file that fails to parse or validate
+is logged and the previous lists stay in force.
+
 Audit log format:
   [IP_BLOCKED] ip=<ip> reason=<code> path=<path> ua=<ua> ts=<iso>
   [UA_BLOCKED] pattern=<pat> ip=<ip> path=<path> ua=<ua> ts=<iso>
@@ -16,13 +37,23 @@ Audit log format:
 
 import datetime
 import ipaddress
+import json
 import logging
-from starlette.middleware.base import BaseHTTPMiddleware
+import os
+import time
+from collections import OrderedDict, deque
+from typing import Iterable, Optional
 from starlette.requests import Request
 from starlette.responses import JSONResponse
 
+from .identity import request_identity
+
 logger = logging.getLogger(__name__)
 
+BLOCKLIST_FILE_ENV = "IP_BLOCKLIST_FILE"
+BLOCKLIST_RELOAD_INTERVAL = float(os.getenv("IP_BLOCKLIST_RELOAD_INTERVAL", "30"))
+BLOCKLIST_CACHE_SIZE = int(os.getenv("IP_BLOCKLIST_CACHE_SIZE", "4096"))
+
 # Blocked IPs — updated by T (CTO) + AY (COO) forensic scans
 # Format: (ip_address, reason_code, date_added, added_by)
 BLOCKED_IPS: list[tuple[str, str, str, str]] = [
@@ -159,9 +190,6 @@ BLOCKED_UA_PATTERNS: list[str] = [
 _BLOCKED_IP_SET: frozenset[str] = frozenset(ip.lower() for ip, *_ in BLOCKED_IPS)
 _BLOCKED_IP_REASONS: dict[str, str] = {ip.lower(): reason for ip, reason, *_ in BLOCKED_IPS}
 _BLOCKED_UA_LOWER: list[str] = [p.lower() for p in BLOCKED_UA_PATTERNS]
-_BLOCKED_NETWORKS: list[tuple[ipaddress.IPv4Network | ipaddress.IPv6Network, str]] = [
-    (ipaddress.ip_network(cidr), reason) for cidr, reason, *_ in BLOCKED_CIDRS
-]
 
 # Minimal 403 response — no implementation details disclosed
 _FORBIDDEN_BODY = {
@@ -170,77 +198,363 @@ _FORBIDDEN_BODY = {
     "message": "Access denied by security policy.",
 }
 
+_NOT_BLOCKED: tuple[bool, str, str] = (False, "", "")
 
-def _get_all_ips(request: Request) -> list[str]:
-    """Return all IPs from X-Forwarded-For chain plus direct client (lowercase)."""
+
+class _PrefixIndex:
+    """Longest-prefix match for one IP version: {prefix length: {prefix: reason}}."""
+
+    def __init__(self, bits: int):
+        self._bits = bits
+        self._tables: dict[int, dict[int, str]] = {}
+        self._lengths: list[int] = []
+
+    def add(self, network: ipaddress.IPv4Network | ipaddress.IPv6Network, reason: str) -> None:
+        length = network.prefixlen
+        table = self._tables.setdefault(length, {})
+        # An identical range listed twice keeps its first reason
+        table.setdefault(int(network.network_address) >> (self._bits - length), reason)
+        self._lengths = sorted(self._tables, reverse=True)
+
+    def lookup(self, value: int) -> str:
+        for length in self._lengths:
+            reason = self._tables[length].get(value >> (self._bits - length))
+            if reason is not None:
+                return reason
+        return ""
+
+    def __len__(self) -> int:
+        return sum(len(table) for table in self._tables.values())
+
+
+class _PatternMatcher:
+    """Aho-Corasick automaton over lower-cased substrings.
+
+    ``search`` returns the earliest-listed pattern occurring in the text (the
+    same answer as testing the patterns in order with ``in``), or "".
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns: list[str] = list(dict.fromkeys(p.lower() for p in patterns if p))
+        goto: list[dict[str, int]] = [{}]
+        best: list[int] = [len(self.patterns)]  # lowest pattern index ending here
+        for index, pattern in enumerate(self.patterns):
+            state = 0
+            for char in pattern:
+                nxt = goto[state].get(char)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][char] = nxt
+                    goto.append({})
+                    best.append(len(self.patterns))
+                state = nxt
+            best[state] = min(best[state], index)
+
+        # Breadth-first: resolve failure links into a transition table so the
+        # scan never backtracks. A row holds every non-root transition of its
+        # state; a missing key falls back to the root row.
+        root = goto[0]
+        delta: list[dict[str, int]] = [root] + [{} for _ in goto[1:]]
+        fail = [0] * len(goto)
+        queue = deque(root.values())
+        while queue:
+            state = queue.popleft()
+            parent_fail = fail[state]
+            best[state] = min(best[state], best[parent_fail])
+            row = dict(delta[parent_fail]) if parent_fail else {}
+            for char, nxt in goto[state].items():
+                if parent_fail:
+                    fail[nxt] = delta[parent_fail].get(char, root.get(char, 0))
+                else:
+                    fail[nxt] = root.get(char, 0)
+                row[char] = nxt
+                queue.append(nxt)
+            delta[state] = row
+        self._root = delta[0]
+        self._delta = delta
+        self._best = best
+
+    def search(self, text: str) -> str:
+        if not self.patterns:
+            return ""
+        none = len(self.patterns)
+        found = none
+        root, delta, best = self._root, self._delta, self._best
+        state = 0
+        for char in text:
+            state = delta[state].get(char, -1) if state else root.get(char, 0)
+            if state < 0:
+                state = root.get(char, 0)
+            if best[state] < found:
+                found = best[state]
+                if found == 0:
+                    break
+        return self.patterns[found] if found < none else ""
+
+
+class CompiledBlocklist:
+    """Immutable lookup structures for one version of the lists, plus its verdict cache."""
+
+    def __init__(
+        self,
+        ips: Iterable[tuple[str, str]],
+        cidrs: Iterable[tuple[str, str]],
+        ua_patterns: Iterable[str],
+        cache_size: int = BLOCKLIST_CACHE_SIZE,
+    ):
+        self.ip_reasons: dict[str, str] = {}
+        for ip, reason in ips:
+            self.ip_reasons.setdefault(ip.lower(), reason)
+        self._networks = {4: _PrefixIndex(32), 6: _PrefixIndex(128)}
+        for cidr, reason in cidrs:
+            network = ipaddress.ip_network(cidr)
+            self._networks[network.version].add(network, reason)
+        self._ua = _PatternMatcher(ua_patterns)
+        self._cache_size = cache_size
+        self._ip_verdicts: OrderedDict[tuple[str, str], tuple[bool, str, str]] = OrderedDict()
+        self._ua_verdicts: OrderedDict[str, str] = OrderedDict()
+
+    @property
+    def ua_patterns(self) -> list[str]:
+        return list(self._ua.patterns)
+
+    def network_count(self) -> int:
+        return sum(len(index) for index in self._networks.values())
+
+    def match_cidr(self, ip: str) -> str:
+        try:
+            addr = ipaddress.ip_address(ip)
+        except ValueError:
+            return ""  # malformed XFF fragment — not a blockable address
+        return self._networks[addr.version].lookup(int(addr))
+
+    def check_ips(self, ips: Iterable[str]) -> tuple[bool, str, str]:
+        for ip in ips:
+            reason = self.ip_reasons.get(ip)
+            if reason is not None:
+                return True, ip, reason
+            cidr_reason = self.match_cidr(ip)
+            if cidr_reason:
+                return True, ip, cidr_reason
+        return _NOT_BLOCKED
+
+    def match_ua(self, ua: str) -> str:
+        return self._ua.search(ua.lower())
+
+    def _remember(self, cache: OrderedDict, key, verdict):
+        cache[key] = verdict
+        if len(cache) > self._cache_size:
+            cache.popitem(last=False)
+        return verdict
+
+    def cached_ip_verdict(self, forwarded: str, host: str) -> tuple[bool, str, str]:
+        key = (forwarded, host)
+        verdict = self._ip_verdicts.get(key)
+        if verdict is not None:
+            self._ip_verdicts.move_to_end(key)
+            return verdict
+        return self._remember(self._ip_verdicts, key, self.check_ips(_split_ips(forwarded, host)))
+
+    def cached_ua_verdict(self, ua: str) -> str:
+        pattern = self._ua_verdicts.get(ua)
+        if pattern is not None:
+            self._ua_verdicts.move_to_end(ua)
+            return pattern
+        return self._remember(self._ua_verdicts, ua, self.match_ua(ua))
+
+
+def _entries(data: dict, field: str) -> list[tuple[str, str]]:
+    """[value, reason, ...] rows (or bare values) from a blocklist file section."""
+    rows = []
+    for item in data.get(field) or []:
+        if isinstance(item, str):
+            rows.append((item, "FILE_BLOCKLIST"))
+        elif isinstance(item, (list, tuple)) and item and isinstance(item[0], str):
+            rows.append((item[0], str(item[1]) if len(item) > 1 else "FILE_BLOCKLIST"))
+        else:
+            raise ValueError(f"{field}: unsupported entry {item!r}")
+    return rows
+
+
+def _read_blocklist_file(path: str) -> tuple[list, list, list]:
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    if not isinstance(data, dict):
+        raise ValueError("top level must be an object")
+    ips = _entries(data, "ips")
+    for ip, _ in ips:
+        ipaddress.ip_address(ip)
+    cidrs = _entries(data, "cidrs")
+    for cidr, _ in cidrs:
+        ipaddress.ip_network(cidr)
+    user_agents = data.get("user_agents") or []
+    if not all(isinstance(p, str) and p for p in user_agents):
+        raise ValueError("user_agents must be non-empty strings")
+    return ips, cidrs, user_agents
+
+
+def build_blocklist(path: Optional[str] = None) -> CompiledBlocklist:
+    """Compile the built-in lists, plus the entries of ``path`` when given.
+
+    Raises OSError/ValueError when the file cannot be read or validated.
+    """
+    ips = [(ip, reason) for ip, reason, *_ in BLOCKED_IPS]
+    cidrs = [(cidr, reason) for cidr, reason, *_ in BLOCKED_CIDRS]
+    ua_patterns = list(BLOCKED_UA_PATTERNS)
+    if path:
+        file_ips, file_cidrs, file_uas = _read_blocklist_file(path)
+        ips += file_ips
+        cidrs += file_cidrs
+        ua_patterns += file_uas
+    return CompiledBlocklist(ips, cidrs, ua_patterns)
+
+
+def _file_signature(path: str) -> Optional[tuple[int, int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+_active: CompiledBlocklist = build_blocklist()
+_loaded_signature: Optional[tuple[int, int]] = None
+_next_check = 0.0
+
+
+def reload_blocklist() -> CompiledBlocklist:
+    """Recompile from the built-ins and IP_BLOCKLIST_FILE, swapping the lists in whole.
+
+    A file that fails to load leaves the current lists (and cache) in force.
+    """
+    global _active, _loaded_signature
+    path = os.getenv(BLOCKLIST_FILE_ENV, "").strip()
+    signature = _file_signature(path) if path else None
+    try:
+        compiled = build_blocklist(path if signature else None)
+    except (OSError, ValueError) as e:
+        logger.warning("[BLOCKLIST_RELOAD_FAILED] file=%s error=%s", path, e)
+        _loaded_signature = signature
+        return _active
+    if path and signature is None:
+        logger.warning("[BLOCKLIST_RELOAD_FAILED] file=%s error=missing", path)
+    _active, _loaded_signature = compiled, signature
+    logger.info(
+        "[BLOCKLIST_LOADED] ips=%d cidrs=%d ua_patterns=%d file=%s",
+        len(compiled.ip_reasons), compiled.network_count(), len(compiled.ua_patterns), path or "-",
+    )
+    return compiled
+
+
+def get_blocklist() -> CompiledBlocklist:
+    """Active lists; re-reads IP_BLOCKLIST_FILE when it changed (rate-limited by interval)."""
+    global _next_check
+    path = os.getenv(BLOCKLIST_FILE_ENV, "").strip()
+    if not path and _loaded_signature is None:
+        return _active
+    now = time.monotonic()
+    if now >= _next_check:
+        _next_check = now + BLOCKLIST_RELOAD_INTERVAL
+        if (_file_signature(path) if path else None) != _loaded_signature:
+            return reload_blocklist()
+    return _active
+
+
+def _split_ips(forwarded: str, host: str) -> list[str]:
     ips: list[str] = []
-    forwarded = request.headers.get("x-forwarded-for", "")
     if forwarded:
         ips.extend(part.strip().lower() for part in forwarded.split(",") if part.strip())
-    if request.client and request.client.host:
-        ips.append(request.client.host.lower())
+    if host:
+        ips.append(host.lower())
     return ips
 
 
+def _client_host(request: Request) -> str:
+    return request.client.host if request.client and request.client.host else ""
+
+
+def _get_all_ips(request: Request) -> list[str]:
+    """Return all IPs from X-Forwarded-For chain plus direct client (lowercase)."""
+    return _split_ips(request.headers.get("x-forwarded-for", ""), _client_host(request))
+
+
 def _match_blocked_cidr(ip: str) -> str:
     """Return the reason code if ip falls inside a blocked CIDR range, else ""."""
-    try:
-        addr = ipaddress.ip_address(ip)
-    except ValueError:
-        return ""  # malformed XFF fragment — not a blockable address
-    for network, reason in _BLOCKED_NETWORKS:
-        if addr.version == network.version and addr in network:
-            return reason
-    return ""
+    return get_blocklist().match_cidr(ip)
 
 
 def _check_ip(request: Request) -> tuple[bool, str, str]:
     """Return (blocked, matched_ip, reason_code). Checks full XFF chain, then CIDR ranges."""
-    for ip in _get_all_ips(request):
-        if ip in _BLOCKED_IP_SET:
-            return True, ip, _BLOCKED_IP_REASONS[ip]
-        cidr_reason = _match_blocked_cidr(ip)
-        if cidr_reason:
-            return True, ip, cidr_reason
-    return False, "", ""
+    return get_blocklist().cached_ip_verdict(
+        request.headers.get("x-forwarded-for", ""), _client_host(request),
+    )
 
 
 def _check_ua(request: Request) -> tuple[bool, str]:
     """Return (blocked, matched_pattern). Case-insensitive substring match."""
-    ua_lower = request.headers.get("user-agent", "").lower()
-    for pattern in _BLOCKED_UA_LOWER:
-        if pattern in ua_lower:
-            return True, pattern
-    return False, ""
+    pattern = get_blocklist().cached_ua_verdict(request.headers.get("user-agent", ""))
+    return bool(pattern), pattern
 
 
-class IPBlocklistMiddleware(BaseHTTPMiddleware):
-    """Block rogue IPs and unauthorized scanners before any route processing."""
+def _blocked_response(path: str, forwarded: str, client_host: str, ua_header: str) -> Optional[JSONResponse]:
+    """The 403 for a blocked caller (audit line logged), or None to let it through."""
+    blocklist = get_blocklist()
 
-    async def dispatch(self, request: Request, call_next):
+    # 1. IP check — covers all XFF hops
+    blocked, matched_ip, reason = blocklist.cached_ip_verdict(forwarded, client_host)
+    if blocked:
         ts = datetime.datetime.now(datetime.timezone.utc).isoformat()
-        ua = request.headers.get("user-agent", "")[:200]
-
-        # 1. IP check — covers all XFF hops
-        blocked, matched_ip, reason = _check_ip(request)
-        if blocked:
-            logger.warning(
-                "[IP_BLOCKED] ip=%s reason=%s path=%s ua=%s ts=%s",
-                matched_ip, reason, request.url.path, ua, ts,
-            )
-            return JSONResponse(_FORBIDDEN_BODY, status_code=403)
-
-        # 2. User-Agent check — catches scanner tools regardless of IP rotation
-        ua_blocked, matched_pattern = _check_ua(request)
-        if ua_blocked:
-            xff = request.headers.get("x-forwarded-for", "")
-            client_ip = xff.split(",")[0].strip() if xff else (
-                request.client.host if request.client else "unknown"
-            )
-            logger.warning(
-                "[UA_BLOCKED] pattern=%s ip=%s path=%s ua=%s ts=%s",
-                matched_pattern, client_ip, request.url.path, ua, ts,
-            )
-            return JSONResponse(_FORBIDDEN_BODY, status_code=403)
+        logger.warning(
+            "[IP_BLOCKED] ip=%s reason=%s path=%s ua=%s ts=%s",
+            matched_ip, reason, path, ua_header[:200], ts,
+        )
+        return JSONResponse(_FORBIDDEN_BODY, status_code=403)
 
+    # 2. User-Agent check — catches scanner tools regardless of IP rotation
+    matched_pattern = blocklist.cached_ua_verdict(ua_header)
+    if matched_pattern:
+        ts = datetime.datetime.now(datetime.timezone.utc).isoformat()
+        client_ip = forwarded.split(",")[0].strip() if forwarded else (client_host or "unknown")
+        logger.warning(
+            "[UA_BLOCKED] pattern=%s ip=%s path=%s ua=%s ts=%s",
+            matched_pattern, client_ip, path, ua_header[:200], ts,
+        )
+        return JSONResponse(_FORBIDDEN_BODY, status_code=403)
+    return None
+
+
+class IPBlocklistMiddleware:
+    """Block rogue IPs and unauthorized scanners before any route processing.
+
+    Plain ASGI: an allowed request is handed straight to the wrapped app with
+    its original receive/send, so streamed MCP responses pass through
+    untouched and no per-request task or memory stream is created.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        identity = request_identity(scope)
+        response = _blocked_response(
+            scope.get("path", ""), identity.forwarded, identity.client_host, identity.user_agent,
+        )
+        if response is not None:
+            await response(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
+    async def dispatch(self, request: Request, call_next):
+        """Request-level form of the same check (returns the 403 or call_next's response)."""
+        response = _blocked_response(
+            request.url.path,
+            request.headers.get("x-forwarded-for", ""),
+            _client_host(request),
+            request.headers.get("user-agent", ""),
+        )
+        if response is not None:
+            return response
         return await call_next(request)
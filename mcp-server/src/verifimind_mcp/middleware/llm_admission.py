@@ -0,0 +1,357 @@
+"""
+LLM Admission Control for VerifiMind MCP Server.
+
+RateLimitMiddleware counts requests per window; it does not bound how much
+LLM work is in flight at once. A burst of run_full_trinity calls therefore fans
+out into dozens of simultaneous provider calls that are all 429'd together.
+This middleware admits at most LLM_MAX_IN_FLIGHT LLM-bound tool calls per
+instance and queues the rest by tier:
+
+  Pioneer  (EA + Pioneer UUID)  — served first
+  Scholar  (valid UUID)         — next
+  Anonymous (no/invalid UUID)   — last
+
+Within a tier, FIFO. When the queue is full, a higher-tier arrival displaces
+the newest lowest-tier waiter; otherwise the arrival is shed. Shed, displaced
+and timed-out requests get a fast 503 (``reason`` says which) with a
+Retry-After estimated from queue depth and the observed duration of admitted
+calls — graceful degradation instead of collective provider collapse.
+
+Time spent queued counts against the run's deadline: an admitted request is
+passed on with ADMISSION_WAIT_HEADER (seconds since it arrived; any client
+value is replaced), and utils/deadline.py subtracts it from the budget.
+
+Only POST /mcp JSON-RPC ``tools/call`` requests for LLM_TOOL_NAMES are gated;
+every other request (initialize, tools/list, templates, health) passes
+through untouched. A JSON-RPC batch is admitted as one unit, one slot
+however many calls it carries: the streamable-HTTP transport validates a
+single message per POST and rejects a batch before any tool runs. LLM_MAX_IN_FLIGHT=0 disables admission control. The body
+is buffered to classify it; a POST /mcp body over LLM_ADMISSION_MAX_BODY
+bytes is refused with 413 rather than held in memory (tool arguments are
+capped at a few KB by input sanitization, so no real call comes close).
+
+Implemented as a plain ASGI middleware (not BaseHTTPMiddleware) so the slot is
+held until the response — including a streamed SSE tool result — has been
+fully sent, and is always released when the client disconnects.
+"""
+
+import asyncio
+import heapq
+import itertools
+import json
+import logging
+import math
+import os
+import time
+from typing import Dict, List, Optional
+
+from starlette.responses import JSONResponse
+
+from ..utils.deadline import ADMISSION_WAIT_HEADER
+from .identity import request_identity
+
+logger = logging.getLogger(__name__)
+
+# Configuration from environment variables
+LLM_MAX_IN_FLIGHT = int(os.getenv("LLM_MAX_IN_FLIGHT", "8"))
+LLM_ADMISSION_QUEUE_LIMIT = int(os.getenv("LLM_ADMISSION_QUEUE_LIMIT", "16"))
+LLM_ADMISSION_MAX_WAIT = float(os.getenv("LLM_ADMISSION_MAX_WAIT", "20"))
+# Seed for the latency estimate until real calls have been observed.
+LLM_ADMISSION_INITIAL_LATENCY = float(os.getenv("LLM_ADMISSION_INITIAL_LATENCY", "30"))
+LLM_ADMISSION_MAX_BODY = int(os.getenv("LLM_ADMISSION_MAX_BODY", str(1024 * 1024)))
+LATENCY_EWMA_ALPHA = 0.2
+RETRY_AFTER_MIN = 1
+RETRY_AFTER_MAX = 120
+
+# Tools whose execution calls an LLM provider. The detached-job tools return
+# immediately (their own worker pool bounds the work) and are not gated.
+LLM_TOOL_NAMES = frozenset({
+    "consult_agent_x",
+    "consult_agent_z",
+    "consult_agent_cs",
+    "run_full_trinity",
+})
+
+# Lower value = served first.
+TIER_PRIORITY: Dict[str, int] = {
+    "pioneer": 0,
+    "scholar": 1,
+    "anonymous": 2,
+}
+
+
+class AdmissionRejected(Exception):
+    """Raised by ``acquire`` when a caller is shed or waited too long."""
+
+    def __init__(self, reason: str, retry_after: int):
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class LLMAdmissionController:
+    """Bounded in-flight counter with a tier-priority wait queue."""
+
+    def __init__(
+        self,
+        max_in_flight: int = LLM_MAX_IN_FLIGHT,
+        queue_limit: int = LLM_ADMISSION_QUEUE_LIMIT,
+        max_wait: float = LLM_ADMISSION_MAX_WAIT,
+    ):
+        self.max_in_flight = max_in_flight
+        self.queue_limit = max(0, queue_limit)
+        self.max_wait = max_wait
+        self.in_flight = 0
+        # heap of [priority, seq, future]; a resolved/cancelled future is stale
+        self._waiters: List[list] = []
+        self._seq = itertools.count()
+        self.avg_latency = LLM_ADMISSION_INITIAL_LATENCY
+        self.admitted = 0
+        self.shed = 0
+        self.displaced = 0
+        self.timed_out = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_in_flight > 0
+
+    def queue_depth(self) -> int:
+        return sum(1 for entry in self._waiters if not entry[2].done())
+
+    def retry_after(self) -> int:
+        """Seconds until a new arrival could plausibly be admitted."""
+        slots = max(1, self.max_in_flight)
+        waves = (self.queue_depth() + 1) / slots
+        estimate = math.ceil(waves * self.avg_latency)
+        return max(RETRY_AFTER_MIN, min(RETRY_AFTER_MAX, estimate))
+
+    def _shed_one_below(self, priority: int) -> bool:
+        """Reject the newest waiter of the lowest tier ranked below ``priority``."""
+        live = [entry for entry in self._waiters if not entry[2].done()]
+        if not live:
+            return False
+        victim = max(live, key=lambda entry: (entry[0], entry[1]))
+        if victim[0] <= priority:
+            return False
+        self.displaced += 1
+        victim[2].set_exception(AdmissionRejected("displaced", self.retry_after()))
+        return True
+
+    async def acquire(self, tier: str) -> None:
+        if not self.enabled:
+            return
+        if self.in_flight < self.max_in_flight and self.queue_depth() == 0:
+            self.in_flight += 1
+            self.admitted += 1
+            return
+
+        priority = TIER_PRIORITY.get(tier, TIER_PRIORITY["anonymous"])
+        if self.queue_depth() >= self.queue_limit and not self._shed_one_below(priority):
+            self.shed += 1
+            raise AdmissionRejected("queue_full", self.retry_after())
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, [priority, next(self._seq), future])
+        try:
+            await asyncio.wait_for(asyncio.shield(future), self.max_wait)
+        except asyncio.TimeoutError:
+            if future.done():
+                # Granted or displaced in the same tick the wait expired:
+                # report what actually happened, not the timeout.
+                displaced = future.exception()
+                if displaced is None:
+                    return
+                raise displaced from None
+            future.cancel()
+            self.timed_out += 1
+            raise AdmissionRejected("queue_timeout", self.retry_after()) from None
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled() and not future.exception():
+                # The slot was handed over just as the client left.
+                self.release()
+            else:
+                future.cancel()
+            raise
+        # A granted future carries the slot: in_flight was incremented by release().
+
+    def release(self, duration: Optional[float] = None) -> None:
+        if not self.enabled:
+            return
+        if duration is not None:
+            self.avg_latency += LATENCY_EWMA_ALPHA * (duration - self.avg_latency)
+        # Hand the slot directly to the best live waiter, else free it.
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                self.admitted += 1
+                return
+        self.in_flight = max(0, self.in_flight - 1)
+
+    def get_stats(self) -> Dict:
+        return {
+            "enabled": self.enabled,
+            "max_in_flight": self.max_in_flight,
+            "in_flight": self.in_flight,
+            "queued": self.queue_depth(),
+            "queue_limit": self.queue_limit,
+            "avg_call_seconds": round(self.avg_latency, 2),
+            "admitted": self.admitted,
+            "shed": self.shed,
+            "displaced": self.displaced,
+            "timed_out": self.timed_out,
+        }
+
+
+_controller = LLMAdmissionController()
+
+
+def get_llm_admission_controller() -> LLMAdmissionController:
+    return _controller
+
+
+def get_llm_admission_stats() -> Dict:
+    """Get current admission-control statistics (for monitoring)."""
+    return _controller.get_stats()
+
+
+def _llm_tool_calls(body: bytes) -> int:
+    """Count LLM-bound tools/call messages in a JSON-RPC body (or batch)."""
+    try:
+        message = json.loads(body)
+    except (ValueError, UnicodeDecodeError):
+        return 0
+    messages = message if isinstance(message, list) else [message]
+    count = 0
+    for item in messages:
+        if not isinstance(item, dict) or item.get("method") != "tools/call":
+            continue
+        params = item.get("params")
+        if isinstance(params, dict) and params.get("name") in LLM_TOOL_NAMES:
+            count += 1
+    return count
+
+
+class LLMAdmissionMiddleware:
+    """Tier-priority admission queue in front of LLM-bound MCP tool calls."""
+
+    def __init__(self, app, controller: Optional[LLMAdmissionController] = None):
+        self.app = app
+        self.controller = controller or _controller
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] != "http"
+            or scope.get("method") != "POST"
+            or not scope.get("path", "").startswith("/mcp")
+            or not self.controller.enabled
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        arrived = time.monotonic()
+        # Buffer the (small) JSON-RPC body so it can be inspected, then replay
+        # it unchanged to the MCP app. Refuse it once it outgrows the cap.
+        if _declared_length(scope) > LLM_ADMISSION_MAX_BODY:
+            await _too_large(scope, receive, send)
+            return
+        chunks = []
+        size = 0
+        more_body = True
+        while more_body:
+            message = await receive()
+            if message["type"] != "http.request":
+                await self.app(scope, _replay([message], receive), send)
+                return
+            chunk = message.get("body", b"")
+            size += len(chunk)
+            if size > LLM_ADMISSION_MAX_BODY:
+                await _too_large(scope, receive, send)
+                return
+            chunks.append(chunk)
+            more_body = message.get("more_body", False)
+        body = b"".join(chunks)
+        replay = _replay(
+            [{"type": "http.request", "body": body, "more_body": False}], receive
+        )
+
+        if not _llm_tool_calls(body):
+            await self.app(scope, replay, send)
+            return
+
+        tier, _ = request_identity(scope).tier()
+        try:
+            await self.controller.acquire(tier)
+        except AdmissionRejected as rejected:
+            logger.warning(
+                "LLM admission rejected: tier=%s reason=%s retry_after=%ss stats=%s",
+                tier, rejected.reason, rejected.retry_after, self.controller.get_stats(),
+            )
+            response = JSONResponse(
+                status_code=503,
+                content={
+                    "error": "server_busy",
+                    "message": (
+                        "The server is at its concurrent analysis limit. "
+                        f"Please try again in {rejected.retry_after} seconds."
+                    ),
+                    "reason": rejected.reason,
+                    "tier": tier,
+                    "retry_after": rejected.retry_after,
+                },
+                headers={"Retry-After": str(rejected.retry_after)},
+            )
+            await response(scope, replay, send)
+            return
+
+        started = time.monotonic()
+        scope = _with_admission_wait(scope, started - arrived)
+        completed = False
+        try:
+            await self.app(scope, replay, send)
+            completed = True
+        finally:
+            # Only completed calls feed the latency estimate; an aborted
+            # request's partial duration would bias Retry-After low.
+            self.controller.release(time.monotonic() - started if completed else None)
+
+
+def _with_admission_wait(scope, seconds: float):
+    """``scope`` with ADMISSION_WAIT_HEADER set to ``seconds`` (any client value dropped)."""
+    name = ADMISSION_WAIT_HEADER.encode("latin-1")
+    headers = [(k, v) for k, v in scope.get("headers") or () if k.lower() != name]
+    headers.append((name, f"{seconds:.3f}".encode("latin-1")))
+    return {**scope, "headers": headers}
+
+
+def _declared_length(scope) -> int:
+    for name, value in scope.get("headers") or ():
+        if name == b"content-length":
+            try:
+                return int(value)
+            except ValueError:
+                return 0
+    return 0
+
+
+async def _too_large(scope, receive, send) -> None:
+    logger.warning("LLM admission: refused %s body over %s bytes", scope.get("path"), LLM_ADMISSION_MAX_BODY)
+    response = JSONResponse(
+        status_code=413,
+        content={
+            "error": "payload_too_large",
+            "message": f"Request body exceeds {LLM_ADMISSION_MAX_BODY} bytes.",
+        },
+    )
+    await response(scope, receive, send)
+
+
+def _replay(messages: list, receive):
+    pending = list(messages)
+
+    async def replay_receive():
+        if pending:
+            return pending.pop(0)
+        return await receive()
+
+    return replay_receive
@@ -13,31 +13,53 @@ v0.5.13 additions (X-Agent Item 3 hardening sprint):
   - Structured failure logging (timestamp, error_type, attempt count)
   - Env-var fallback restricted to local dev (no POLAR_ACCESS_TOKEN)
 
+Cache behaviour under concurrency:
+  - Single-flight per UUID: concurrent checks for the same UUID share one
+    Polar lookup (and its retries), so a burst of calls from one pioneer whose
+    entry just expired costs one request and at most one circuit failure.
+  - Size-bounded LRU: at most POLAR_CACHE_MAX_ENTRIES UUIDs are kept; the
+    least recently checked entry is evicted first.
+  - Refresh-ahead: a hit within POLAR_REFRESH_AHEAD_SECONDS of expiry returns
+    the cached value and refreshes the entry in the background, so active
+    pioneers do not wait on Polar when their entry turns over.
+
 Integration flow:
   Tool call with pioneer_key (UUID)
     → check_tier() [tier_gate.py]
     → PolarAdapter.check_pioneer_access(uuid)
       → Circuit open? → raise CircuitOpenError → tier_gate: deny
-      → Cache hit: return cached result (no network call)
-      → Cache miss: GET /v1/customers/external/{uuid}/state (with retry)
+      → Cache hit: return cached result (no network call; refresh-ahead near expiry)
+      → Cache miss: GET /v1/customers/external/{uuid}/state (with retry, coalesced)
       → Cache updated by PolarWebhookHandler on customer.state_changed
 
 Phase 1 (v0.5.11): PIONEER_ACCESS_KEYS env var (local dev / no POLAR_ACCESS_TOKEN).
 Phase 2 (v0.5.13): PolarAdapter used when POLAR_ACCESS_TOKEN is set.
+
+Environment:
+  POLAR_ACCESS_TOKEN            enables the adapter
+  POLAR_ENVIRONMENT             "production" (default) or "sandbox"
+  POLAR_CACHE_TTL               seconds a cached tier is fresh (default 300)
+  POLAR_CACHE_MAX_ENTRIES       LRU bound on cached UUIDs (default 10000)
+  POLAR_REFRESH_AHEAD_SECONDS   background refresh window before expiry (default 30; 0 disables)
 """
 
 import asyncio
 import os
 import time
 import logging
+from collections import OrderedDict
 from typing import Optional, TYPE_CHECKING
 
+from ..utils.single_flight import SingleFlight
+
 if TYPE_CHECKING:
     from ..integrations.polar_client import PolarClient
 
 logger = logging.getLogger(__name__)
 
 _DEFAULT_CACHE_TTL = 300  # 5 minutes — matches Polar webhook SLA
+_DEFAULT_CACHE_MAX_ENTRIES = 10_000
+_DEFAULT_REFRESH_AHEAD = 30  # seconds before expiry a hit triggers a background refresh
 
 # Circuit breaker constants (X-Agent Item 3)
 _CIRCUIT_FAILURE_THRESHOLD = 5   # consecutive failures before opening
@@ -85,10 +107,18 @@ def get_polar_adapter() -> Optional["PolarAdapter"]:
 
     env = os.environ.get("POLAR_ENVIRONMENT", "production")
     ttl = int(os.environ.get("POLAR_CACHE_TTL", str(_DEFAULT_CACHE_TTL)))
-
-    _adapter = PolarAdapter(PolarClient(token, environment=env), cache_ttl=ttl)
+    max_entries = int(os.environ.get("POLAR_CACHE_MAX_ENTRIES", str(_DEFAULT_CACHE_MAX_ENTRIES)))
+    refresh_ahead = int(os.environ.get("POLAR_REFRESH_AHEAD_SECONDS", str(_DEFAULT_REFRESH_AHEAD)))
+
+    _adapter = PolarAdapter(
+        PolarClient(token, environment=env),
+        cache_ttl=ttl,
+        max_entries=max_entries,
+        refresh_ahead=refresh_ahead,
+    )
     logger.info(
-        "PolarAdapter initialised (environment=%s, cache_ttl=%ss)", env, ttl
+        "PolarAdapter initialised (environment=%s, cache_ttl=%ss, max_entries=%d, refresh_ahead=%ss)",
+        env, ttl, max_entries, refresh_ahead,
     )
     return _adapter
 
@@ -103,14 +133,25 @@ def reset_polar_adapter() -> None:
     _adapter = None
 
 
+async def shutdown_polar_adapter() -> None:
+    """Close the adapter's pooled Polar connections (HTTP server lifespan)."""
+    if _adapter is not None:
+        await _adapter.aclose()
+
+
 class PolarAdapter:
     """Caching adapter between Polar Customer State API and tier_gate.py.
 
     Cache behaviour:
       Hit (< cache_ttl): return cached result — no Polar API call.
-      Miss or expired: query Polar Customer State API (with retry), cache result.
-      Webhook update: immediately overwrite cache (timer reset).
+      Hit within refresh_ahead of expiry: return cached result and refresh
+        the entry in the background.
+      Miss or expired: query Polar Customer State API (with retry), cache
+        result. Concurrent misses for one UUID share a single lookup.
+      Webhook update: immediately overwrite cache (timer reset); a lookup
+        already in flight does not overwrite the webhook's value.
       404 from Polar: cache as False (Scholar tier) — customer not registered.
+      More than max_entries UUIDs: least recently checked entry is evicted.
 
     Circuit breaker behaviour (v0.5.13):
       After _CIRCUIT_FAILURE_THRESHOLD consecutive failures within
@@ -128,16 +169,35 @@ class PolarAdapter:
     cache in sync with actual subscription state for real-time transitions.
     """
 
-    def __init__(self, polar_client: "PolarClient", cache_ttl: int = _DEFAULT_CACHE_TTL):
+    def __init__(
+        self,
+        polar_client: "PolarClient",
+        cache_ttl: int = _DEFAULT_CACHE_TTL,
+        max_entries: int = _DEFAULT_CACHE_MAX_ENTRIES,
+        refresh_ahead: int = _DEFAULT_REFRESH_AHEAD,
+    ):
         """Initialise the adapter.
 
         Args:
             polar_client: PolarClient instance (sandbox or production).
             cache_ttl: Seconds before a cached entry is considered stale.
+            max_entries: Maximum number of cached UUIDs (LRU eviction).
+            refresh_ahead: Seconds before expiry at which a hit schedules a
+                background refresh (0 disables refresh-ahead).
         """
         self.client = polar_client
         self.cache_ttl = cache_ttl
-        self._cache: dict[str, tuple[bool, float]] = {}
+        self.max_entries = max(1, max_entries)
+        self.refresh_ahead = refresh_ahead
+        self._cache: "OrderedDict[str, tuple[bool, float]]" = OrderedDict()
+
+        # Lookup coalescing and cache-write ordering
+        self._flights = SingleFlight()
+        self._webhook_epoch: int = 0
+        self._refresh_tasks: dict[str, asyncio.Task] = {}
+        self._lookups: int = 0
+        self._refreshes: int = 0
+        self._evictions: int = 0
 
         # Circuit breaker state
         self._consecutive_failures: int = 0
@@ -233,12 +293,10 @@ class PolarAdapter:
 
         Flow:
           1. Circuit open? → raise CircuitOpenError (fail-closed).
-          2. Cache hit? → return cached result (no network call).
-          3. Retry loop (max 3 attempts, 1s/2s/4s backoff):
-             a. GET /v1/customers/external/{uuid}/state
-             b. 404 → Scholar (not in Polar); cache + return False.
-             c. 5xx / timeout → retry; on exhaustion → record failure.
-          4. All retries failed → record failure → re-raise last error.
+          2. Cache hit? → return cached result (no network call); within
+             refresh_ahead of expiry, also refresh the entry in the background.
+          3. Cache miss → join the in-flight lookup for this UUID, or start
+             one (see _lookup for the retry loop).
 
         Args:
             user_uuid: VerifiMind user UUID (stored as Polar External ID).
@@ -251,8 +309,6 @@ class PolarAdapter:
             httpx.HTTPStatusError: On auth (401) or non-retryable Polar errors.
             httpx.TimeoutException / httpx.ConnectError: If all retries fail.
         """
-        import httpx
-
         if not user_uuid or not user_uuid.strip():
             return False
 
@@ -266,13 +322,52 @@ class PolarAdapter:
             )
 
         # 2. Cache hit
-        if uuid in self._cache:
-            has_access, cached_at = self._cache[uuid]
-            if time.time() - cached_at < self.cache_ttl:
+        entry = self._cache.get(uuid)
+        if entry is not None:
+            has_access, cached_at = entry
+            age = time.time() - cached_at
+            if age < self.cache_ttl:
+                self._cache.move_to_end(uuid)
+                if 0 < self.refresh_ahead < self.cache_ttl and age >= self.cache_ttl - self.refresh_ahead:
+                    self._refresh_in_background(uuid)
                 logger.debug("Cache hit for %s…: pioneer=%s", uuid[:8], has_access)
                 return has_access
 
-        # 3. Retry loop
+        # 3. Cache miss — one lookup per UUID, however many callers wait on it
+        epoch = self._webhook_epoch
+        return await self._flights.do(uuid, lambda: self._lookup(uuid, epoch))
+
+    def _refresh_in_background(self, uuid: str) -> None:
+        """Start a refresh lookup for a soon-to-expire entry unless one is running."""
+        if uuid in self._refresh_tasks or self._flights.is_in_flight(uuid):
+            return
+        self._refreshes += 1
+        task = asyncio.ensure_future(self._refresh(uuid, self._webhook_epoch))
+        self._refresh_tasks[uuid] = task
+        task.add_done_callback(lambda _t: self._refresh_tasks.pop(uuid, None))
+
+    async def _refresh(self, uuid: str, epoch: int) -> None:
+        try:
+            await self._flights.do(uuid, lambda: self._lookup(uuid, epoch))
+        except Exception as e:
+            # Already logged and counted by _lookup; the cached entry stays
+            # valid until its TTL, after which callers see the error directly.
+            logger.debug("Polar refresh-ahead failed for %s…: %s", uuid[:8], type(e).__name__)
+
+    async def _lookup(self, uuid: str, epoch: int) -> bool:
+        """Query Polar for one UUID and cache the answer.
+
+        ``epoch`` is the webhook epoch when the lookup was requested; see _store.
+
+        Retry loop (max 3 attempts, 1s/2s/4s backoff):
+          a. GET /v1/customers/external/{uuid}/state
+          b. 404 → Scholar (not in Polar); cache + return False.
+          c. 5xx / timeout → retry; on exhaustion → record failure.
+        All retries failed → record failure → re-raise last error.
+        """
+        import httpx
+
+        self._lookups += 1
         last_error: Exception | None = None
         for attempt in range(_RETRY_MAX_ATTEMPTS):
             try:
@@ -280,7 +375,7 @@ class PolarAdapter:
                 has_access = self.client.has_pioneer_access(state)
                 logger.debug("Polar API: %s… pioneer=%s", uuid[:8], has_access)
                 self._record_success()
-                self._cache[uuid] = (has_access, time.time())
+                self._store(uuid, has_access, epoch)
                 return has_access
 
             except httpx.HTTPStatusError as e:
@@ -289,7 +384,7 @@ class PolarAdapter:
                     # Customer not registered in Polar → Scholar; not a failure
                     logger.debug("Polar customer not found: %s… → Scholar", uuid[:8])
                     self._record_success()
-                    self._cache[uuid] = (False, time.time())
+                    self._store(uuid, False, epoch)
                     return False
                 if status == 401:
                     # Auth error — do not retry; count as failure immediately
@@ -321,7 +416,7 @@ class PolarAdapter:
                 )
                 await asyncio.sleep(delay)
 
-        # 4. All retries exhausted — record this as a single circuit-breaker failure
+        # All retries exhausted — record this as a single circuit-breaker failure
         error_type = type(last_error).__name__ if last_error else "unknown"
         self._record_failure(error_type, _RETRY_MAX_ATTEMPTS if last_error else 0)
 
@@ -329,6 +424,24 @@ class PolarAdapter:
             raise last_error
         raise RuntimeError("Polar: all retries exhausted with no error captured")
 
+    def _store(self, uuid: str, has_access: bool, epoch: int) -> None:
+        """Cache a lookup result unless a webhook changed the cache since it began.
+
+        A lookup requested before a customer.state_changed webhook may
+        carry the pre-change state; its callers still get that answer, but
+        the cache keeps the webhook's value.
+        """
+        if epoch != self._webhook_epoch:
+            return
+        self._put(uuid, has_access)
+
+    def _put(self, uuid: str, has_access: bool) -> None:
+        self._cache[uuid] = (has_access, time.time())
+        self._cache.move_to_end(uuid)
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+            self._evictions += 1
+
     # ------------------------------------------------------------------
     # Cache management (called by PolarWebhookHandler)
     # ------------------------------------------------------------------
@@ -343,7 +456,9 @@ class PolarAdapter:
             user_uuid: VerifiMind user UUID.
             has_pioneer_access: Current pioneer access state from Polar event.
         """
-        self._cache[user_uuid] = (has_pioneer_access, time.time())
+        self._webhook_epoch += 1
+        self._flights.forget(user_uuid)
+        self._put(user_uuid, has_pioneer_access)
         logger.info(
             "Cache updated via webhook: %s… pioneer=%s",
             user_uuid[:8] if user_uuid else "?",
@@ -356,6 +471,8 @@ class PolarAdapter:
         Args:
             user_uuid: VerifiMind user UUID to evict.
         """
+        self._webhook_epoch += 1
+        self._flights.forget(user_uuid)
         self._cache.pop(user_uuid, None)
 
     def get_cache_stats(self) -> dict:
@@ -363,7 +480,8 @@ class PolarAdapter:
 
         Returns:
             Dict with total_cached, active_entries, expired_entries,
-            cache_ttl_seconds, circuit_open, consecutive_failures.
+            cache_ttl_seconds, max_entries, evictions, lookups, coalesced,
+            refreshes, in_flight, circuit_open, consecutive_failures.
         """
         now = time.time()
         active = sum(
@@ -374,6 +492,20 @@ class PolarAdapter:
             "active_entries": active,
             "expired_entries": len(self._cache) - active,
             "cache_ttl_seconds": self.cache_ttl,
+            "max_entries": self.max_entries,
+            "evictions": self._evictions,
+            "lookups": self._lookups,
+            "coalesced": self._flights.coalesced,
+            "refreshes": self._refreshes,
+            "in_flight": self._flights.in_flight(),
             "circuit_open": self._circuit_open,
             "consecutive_failures": self._consecutive_failures,
         }
+
+    async def aclose(self) -> None:
+        """Cancel background refreshes and close the client's connection pool."""
+        for task in list(self._refresh_tasks.values()):
+            task.cancel()
+        close = getattr(self.client, "aclose", None)
+        if close is not None:
+            await close()
@@ -20,11 +20,12 @@ import os
 import time
 import logging
 from collections import defaultdict
-from typing import Dict, Tuple, Optional
-from starlette.middleware.base import BaseHTTPMiddleware
+from typing import Dict, List, Tuple, Optional
 from starlette.requests import Request
 from starlette.responses import JSONResponse
 
+from .identity import request_identity
+
 logger = logging.getLogger(__name__)
 
 # Configuration from environment variables
@@ -240,37 +241,36 @@ def get_client_ip(request: Request) -> str:
     return "unknown"
 
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    """UUID tier-aware rate limiting. Anonymous→IP, Scholar/Pioneer→UUID."""
+class RateLimitMiddleware:
+    """UUID tier-aware rate limiting. Anonymous→IP, Scholar/Pioneer→UUID.
+
+    Plain ASGI: the X-RateLimit-* headers are added by wrapping ``send`` at
+    the response start, so streamed MCP responses are forwarded as they are
+    produced. Headers and tier come from the shared per-request identity.
+    """
 
-    async def dispatch(self, request: Request, call_next):
-        if request.url.path in EXEMPT_PATHS:
-            return await call_next(request)
-        if request.method == "OPTIONS":
-            return await call_next(request)
+    def __init__(self, app):
+        self.app = app
 
-        client_ip = get_client_ip(request)
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] != "http"
+            or scope.get("path") in EXEMPT_PATHS
+            or scope.get("method") == "OPTIONS"
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        identity = request_identity(scope)
+        client_ip = identity.client_ip
 
         # Resolve tier from X-VerifiMind-UUID header.
         # Track WHY a request is anonymous (uuid_status) so the 429 body can tell a
         # misconfigured Scholar (header present but invalid) apart from a true
         # anonymous caller (no header) — tier-audit findings T1/T2/T5, v0.5.37.
-        uuid_header = request.headers.get("x-verifimind-uuid", "").strip()
-        tier = "anonymous"
-        active_limit = TIER_LIMITS["anonymous"]
-        uuid_status = "absent"  # absent | invalid | valid
-
-        if uuid_header:
-            uuid_status = "invalid"  # present until proven valid
-            try:
-                from verifimind_mcp.utils.uuid_tracer import is_valid_uuid
-                if is_valid_uuid(uuid_header):
-                    tier = _resolve_uuid_tier(uuid_header)
-                    active_limit = TIER_LIMITS[tier]
-                    uuid_status = "valid"
-            # A malformed optional UUID header intentionally falls back to anonymous.
-            except Exception:  # nosec B110
-                pass  # invalid header → fall back to anonymous (uuid_status="invalid")
+        uuid_header = identity.uuid_header
+        tier, uuid_status = identity.tier()  # uuid_status: absent | invalid | valid
+        active_limit = TIER_LIMITS[tier]
 
         if tier == "anonymous":
             allowed, retry_after, limit_type = _rate_limit_store.check_and_record(client_ip)
@@ -283,13 +283,13 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             logger.warning(
                 "Rate limited: tier=%s uuid_status=%s key=%s type=%s path=%s retry_after=%ss",
                 tier, uuid_status, (uuid_header[:8] if uuid_header else client_ip),
-                limit_type, request.url.path, retry_after,
+                limit_type, scope.get("path", ""), retry_after,
             )
             # Branch the CTA so a misconfigured Scholar (UUID present but invalid) gets a
             # RECOVERY hint, while a true anonymous caller gets the acquisition pitch —
             # tier-audit findings T4/T5, v0.5.37.
             upgrade_hint, from_the_builder = _build_rate_limit_cta(tier, uuid_status)
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=429,
                 content={
                     "error": "rate_limit_exceeded",
@@ -311,12 +311,30 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                     "X-RateLimit-Tier": tier,
                 },
             )
-
-        response = await call_next(request)
-        response.headers["X-RateLimit-Limit"] = str(active_limit)
-        response.headers["X-RateLimit-Window"] = str(RATE_LIMIT_WINDOW)
-        response.headers["X-RateLimit-Tier"] = tier
-        return response
+            await response(scope, receive, send)
+            return
+
+        await self.app(scope, receive, _with_headers(send, [
+            (b"x-ratelimit-limit", str(active_limit).encode("latin-1")),
+            (b"x-ratelimit-window", str(RATE_LIMIT_WINDOW).encode("latin-1")),
+            (b"x-ratelimit-tier", tier.encode("latin-1")),
+        ]))
+
+
+def _with_headers(send, extra: List[Tuple[bytes, bytes]]):
+    """Wrap ``send`` so the response start carries ``extra`` (replacing same-named headers)."""
+    names = {name for name, _ in extra}
+
+    async def send_with_headers(message):
+        if message["type"] == "http.response.start":
+            headers = [
+                (key, value) for key, value in message.get("headers", [])
+                if key.lower() not in names
+            ]
+            message = {**message, "headers": headers + extra}
+        await send(message)
+
+    return send_with_headers
 
 
 def get_rate_limit_stats() -> Dict:
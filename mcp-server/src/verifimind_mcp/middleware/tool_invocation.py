@@ -1,10 +1,10 @@
 """Privacy-minimal aggregate telemetry for public MCP tool invocations."""
 
-import json
-import sys
-
 from fastmcp.server.middleware import Middleware
 
+from ..availability import PREVIEW_TOOL_NAMES
+from ..utils.log_pipeline import emit_json
+
 
 # Exact allowlist prevents unknown caller-controlled names from creating
 # high-cardinality log labels. Keep this equal to the registered public tools.
@@ -24,20 +24,25 @@ INSTRUMENTED_TOOL_NAMES = frozenset({
     "coordination_team_status",
 })
 
+# Dark-launched preview tools are only registered when enabled, so they live
+# in their own allowlist rather than widening the public set above.
+INSTRUMENTED_PREVIEW_TOOL_NAMES = frozenset(PREVIEW_TOOL_NAMES)
+
 
 def emit_tool_invoked(tool_name: object) -> None:
     """Emit one name-only event for an allowlisted public tool."""
-    if not isinstance(tool_name, str) or tool_name not in INSTRUMENTED_TOOL_NAMES:
+    if not isinstance(tool_name, str):
+        return
+    if (
+        tool_name not in INSTRUMENTED_TOOL_NAMES
+        and tool_name not in INSTRUMENTED_PREVIEW_TOOL_NAMES
+    ):
         return
-    print(
-        json.dumps({
-            "severity": "INFO",
-            "event": "tool_invoked",
-            "tool": tool_name,
-        }),
-        file=sys.stderr,
-        flush=True,
-    )
+    emit_json({
+        "severity": "INFO",
+        "event": "tool_invoked",
+        "tool": tool_name,
+    })
 
 
 class ToolInvocationTelemetry(Middleware):
@@ -12,6 +12,7 @@ from .concepts import (
     X_AGENT_CONFIG,
     Z_AGENT_CONFIG,
     CS_AGENT_CONFIG,
+    TRIAGE_AGENT_CONFIG,
     AGENT_CONFIGS,
     get_agent_config
 )
@@ -22,6 +23,7 @@ from .reasoning import (
     XAgentAnalysis,
     ZAgentAnalysis,
     CSAgentAnalysis,
+    TriageAnalysis,
     PriorReasoning
 )
 
@@ -40,6 +42,7 @@ __all__ = [
     "X_AGENT_CONFIG",
     "Z_AGENT_CONFIG",
     "CS_AGENT_CONFIG",
+    "TRIAGE_AGENT_CONFIG",
     "AGENT_CONFIGS",
     "get_agent_config",
     
@@ -49,6 +52,7 @@ __all__ = [
     "XAgentAnalysis",
     "ZAgentAnalysis",
     "CSAgentAnalysis",
+    "TriageAnalysis",
     "PriorReasoning",
     
     # Results
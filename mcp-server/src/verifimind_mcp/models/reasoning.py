@@ -279,6 +279,93 @@ class CSAgentAnalysis(BaseModel):
         )
 
 
+class TriageAnalysis(BaseModel):
+    """
+    Single-call triage screen — the decision-bearing fields of the X, Z and CS
+    analyses in one compact schema.
+
+    Field names and bounds mirror XAgentAnalysis / ZAgentAnalysis /
+    CSAgentAnalysis so the result converts losslessly into those models and
+    runs through the unchanged synthesis rules. It is a first-pass filter,
+    not a substitute for the full Trinity chain.
+    """
+    agent: str = Field(default="Trinity Triage")
+    reasoning_steps: List[ReasoningStep] = Field(
+        default_factory=list,
+        description="At most three short steps: one per perspective (X, Z, CS)",
+    )
+    innovation_score: float = Field(..., ge=0.0, le=10.0, description="Innovation potential score")
+    strategic_value: float = Field(..., ge=0.0, le=10.0, description="Strategic value score")
+    ethics_score: float = Field(..., ge=0.0, le=10.0, description="Ethics compliance score")
+    veto_triggered: bool = Field(
+        default=False,
+        description="True if ethical red line crossed - concept should not proceed"
+    )
+    veto_reason: Optional[str] = Field(None, description="Which red line triggered the veto, if any")
+    security_score: float = Field(..., ge=0.0, le=10.0, description="Security assessment score")
+    top_concerns: List[str] = Field(
+        default_factory=list,
+        description="The three most important concerns across all perspectives",
+    )
+    recommendation: str = Field(..., description="Final recommendation")
+    confidence: float = Field(..., ge=0.0, le=1.0, description="Overall confidence")
+
+    def to_agent_analyses(self) -> tuple:
+        """
+        Expand into (XAgentAnalysis, ZAgentAnalysis, CSAgentAnalysis).
+
+        Every expanded result carries this call's inference quality marker, so
+        a degraded triage call degrades all three stages in synthesis.
+        """
+        concerns = list(self.top_concerns[:3])
+        steps = list(self.reasoning_steps[:3])
+        x_result = XAgentAnalysis(
+            agent="X Intelligent (triage)",
+            reasoning_steps=steps[:1],
+            innovation_score=self.innovation_score,
+            strategic_value=self.strategic_value,
+            opportunities=[],
+            risks=concerns,
+            recommendation=self.recommendation,
+            confidence=self.confidence,
+        )
+        z_result = ZAgentAnalysis(
+            agent="Z Guardian (triage)",
+            reasoning_steps=steps[1:2],
+            ethics_score=self.ethics_score,
+            z_protocol_compliance=not self.veto_triggered,
+            ethical_concerns=(
+                [self.veto_reason] if self.veto_triggered and self.veto_reason else []
+            ) + concerns,
+            mitigation_measures=[],
+            recommendation=self.recommendation,
+            veto_triggered=self.veto_triggered,
+            veto_reason=self.veto_reason,
+            confidence=self.confidence,
+        )
+        cs_result = CSAgentAnalysis(
+            agent="CS Security (triage)",
+            reasoning_steps=steps[2:3],
+            security_score=self.security_score,
+            vulnerabilities=[],
+            attack_vectors=[],
+            security_recommendations=[],
+            socratic_questions=[],
+            recommendation=self.recommendation,
+            confidence=self.confidence,
+        )
+        for result in (x_result, z_result, cs_result):
+            result._inference_quality = getattr(self, "_inference_quality", "unknown")
+            result._schema_repaired_fields = list(
+                getattr(self, "_schema_repaired_fields", [])
+            )
+            result._schema_incomplete_fields = list(
+                getattr(self, "_schema_incomplete_fields", [])
+            )
+            result._output_tokens = 0
+        return x_result, z_result, cs_result
+
+
 class PriorReasoning(BaseModel):
     """
     Container for prior reasoning from previous agents.
@@ -65,6 +65,26 @@ class TrinitySynthesis(BaseModel):
         default_factory=list,
         description="Required agent IDs whose inference quality was not real",
     )
+    skipped_agents: List[str] = Field(
+        default_factory=list,
+        description=(
+            "Required agent IDs deliberately not run (subset of degraded_agents)"
+        ),
+    )
+    short_circuit: Optional[str] = Field(
+        default=None,
+        description=(
+            "Why later stages were skipped: 'z_veto' when on_veto='short_circuit' "
+            "stopped the run after a real Z veto; null otherwise"
+        ),
+    )
+    analysis_grade: Literal["full", "triage"] = Field(
+        default="full",
+        description=(
+            "'triage' when the scores come from one compact screening call "
+            "(run_full_trinity mode='triage') rather than the full X → Z → CS chain"
+        ),
+    )
     quality_gate: dict = Field(
         default_factory=dict,
         description="Machine-readable per-agent quality gate used for the decision",
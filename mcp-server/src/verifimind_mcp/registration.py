@@ -6,7 +6,10 @@ Two registration paths:
   1. POST /register           — Lightweight (v0.5.13): email optional, UUIDv7 identity spine
   2. POST /early-adopters/register — Full EA (v0.5.6): email required, feedback, invite codes
 
-Storage: Google Cloud Firestore (free tier, GCP project)
+Storage: Google Cloud Firestore (free tier, GCP project). Slot caps and email
+dedup go through registration_store (async client, maintained counters,
+email-hash index); the synchronous queries below are the fallback when the
+async client is unavailable.
 UUID format: UUIDv7-compatible (timestamp-ordered per AI Council recommendation)
 """
 import logging
@@ -16,6 +19,8 @@ from typing import Optional
 
 from pydantic import BaseModel, EmailStr, Field, field_validator
 
+from . import registration_store
+from .utils.offload import run_in_thread
 from .utils.uuid_helper import generate_ea_uuid, generate_feedback_id
 from .policies import PRIVACY_POLICY_VERSION, TERMS_VERSION
 
@@ -318,16 +323,51 @@ async def register_early_adopter(data: EarlyAdopterRegistration) -> Registration
     max_slots = PILOT_MAX_SLOTS if is_pilot else EA_MAX_SLOTS
 
     if db is not None:
-        # ── Slot cap check ──────────────────────────────────────────────────────
-        current_slots = _count_tier_slots(db, tier)
-        if current_slots >= max_slots:
-            logger.info(f"Slot cap reached for tier={tier}: {current_slots}/{max_slots}")
-            raise SlotCapReachedError(tier, max_slots)
-
-        # ── Duplicate email check ───────────────────────────────────────────────
-        existing = db.collection(COLLECTION_EA).where("email", "==", str(data.email)).limit(1).get()
-        if existing:
-            doc = existing[0].to_dict()
+        new_uuid = generate_ea_uuid()
+        record = {
+            "uuid": new_uuid,
+            "email": str(data.email),  # stored securely in Firestore, never logged
+            "name": data.name,
+            "registered_at": now,
+            "tier": tier,
+            "tc_accepted": True,
+            "tc_version": TERMS_VERSION,
+            "tc_accepted_at": now,
+            "privacy_acknowledged": True,
+            "privacy_version": PRIVACY_POLICY_VERSION,
+            "privacy_acknowledged_at": now,
+            "updates_consent": data.updates_consent,
+            "registration_feedback": data.feedback,
+            "feedback_type": data.feedback_type or ("new_user" if not data.feedback else "general"),
+            "status": "active",
+        }
+        if is_pilot:
+            record["pilot_source"] = "system_notice_invite"
+
+        stored = await registration_store.register(
+            COLLECTION_EA, record, str(data.email), max_slots=max_slots,
+        )
+        if stored is not None:
+            # ── Slot cap, dedup and write in one transaction ────────────────────
+            if stored.status == registration_store.FULL:
+                logger.info(f"Slot cap reached for tier={tier}: {max_slots}/{max_slots}")
+                raise SlotCapReachedError(tier, max_slots)
+            existing = stored.record if stored.status == registration_store.EXISTING else None
+        else:
+            # ── Slot cap check ──────────────────────────────────────────────────
+            current_slots = await run_in_thread(_count_tier_slots, db, tier)
+            if current_slots >= max_slots:
+                logger.info(f"Slot cap reached for tier={tier}: {current_slots}/{max_slots}")
+                raise SlotCapReachedError(tier, max_slots)
+
+            # ── Duplicate email check ───────────────────────────────────────────
+            matches = await run_in_thread(
+                db.collection(COLLECTION_EA).where("email", "==", str(data.email)).limit(1).get
+            )
+            existing = matches[0].to_dict() if matches else None
+
+        if existing is not None:
+            doc = existing
             existing_tier = doc.get("tier", "early_adopter")
             existing_label = "Pilot Member" if existing_tier == "pilot" else "Early Adopter"
             logger.info(f"Duplicate registration for masked email {_mask_email(str(data.email))} — returning existing UUID")
@@ -349,27 +389,8 @@ async def register_early_adopter(data: EarlyAdopterRegistration) -> Registration
             )
 
         # ── New registration ────────────────────────────────────────────────────
-        new_uuid = generate_ea_uuid()
-        record = {
-            "uuid": new_uuid,
-            "email": str(data.email),  # stored securely in Firestore, never logged
-            "name": data.name,
-            "registered_at": now,
-            "tier": tier,
-            "tc_accepted": True,
-            "tc_version": TERMS_VERSION,
-            "tc_accepted_at": now,
-            "privacy_acknowledged": True,
-            "privacy_version": PRIVACY_POLICY_VERSION,
-            "privacy_acknowledged_at": now,
-            "updates_consent": data.updates_consent,
-            "registration_feedback": data.feedback,
-            "feedback_type": data.feedback_type or ("new_user" if not data.feedback else "general"),
-            "status": "active",
-        }
-        if is_pilot:
-            record["pilot_source"] = "system_notice_invite"
-        db.collection(COLLECTION_EA).document(new_uuid).set(record)
+        if stored is None:
+            await run_in_thread(db.collection(COLLECTION_EA).document(new_uuid).set, record)
         logger.info(f"New {tier} registered: UUID={new_uuid}")
 
         # ── Store feedback separately ───────────────────────────────────────────
@@ -383,7 +404,8 @@ async def register_early_adopter(data: EarlyAdopterRegistration) -> Registration
                 "email": None,  # never store email in feedback collection
                 "connection_context": "registration",
             }
-            db.collection(COLLECTION_FEEDBACK).add(feedback_record)
+            if not await registration_store.add_document(COLLECTION_FEEDBACK, feedback_record):
+                await run_in_thread(db.collection(COLLECTION_FEEDBACK).add, feedback_record)
 
     else:
         # F-RES-1 (v0.5.50): Firestore unavailable — the registration CANNOT be
@@ -434,7 +456,7 @@ async def get_ea_status(uuid: str) -> Optional[EAStatusResponse]:
     if db is None:
         return None
 
-    doc = db.collection(COLLECTION_EA).document(uuid).get()
+    doc = await run_in_thread(db.collection(COLLECTION_EA).document(uuid).get)
     if not doc.exists:
         return None
 
@@ -465,7 +487,7 @@ async def submit_feedback(data: FeedbackRequest) -> FeedbackResponse:
     }
 
     if db is not None:
-        db.collection(COLLECTION_FEEDBACK).document(feedback_id).set(record)
+        await run_in_thread(db.collection(COLLECTION_FEEDBACK).document(feedback_id).set, record)
         logger.info(f"Feedback received: id={feedback_id}, type={data.feedback_type}")
     else:
         logger.warning(f"Firestore unavailable — feedback {feedback_id} not persisted")
@@ -491,17 +513,23 @@ async def process_optout(uuid: str) -> OptOutResponse:
         return build_optout_unavailable_response()
 
     try:
-        doc_ref = db.collection(COLLECTION_EA).document(uuid)
-        doc = doc_ref.get()
-        if doc.exists:
-            doc_ref.update({
-                "status": "deletion_requested",
-                "deletion_requested_at": _now_iso(),
-                # Immediately nullify PII fields
-                "email": "[deletion_requested]",
-                "name": None,
-                "registration_feedback": None,
-            })
+        update = {
+            "status": "deletion_requested",
+            "deletion_requested_at": _now_iso(),
+            # Immediately nullify PII fields
+            "email": "[deletion_requested]",
+            "name": None,
+            "registration_feedback": None,
+        }
+        # The transactional path also frees the slot and the email index entry.
+        matched = await registration_store.release(COLLECTION_EA, uuid, update)
+        if matched is None:
+            doc_ref = db.collection(COLLECTION_EA).document(uuid)
+            doc = await run_in_thread(doc_ref.get)
+            matched = doc.exists
+            if matched:
+                await run_in_thread(doc_ref.update, update)
+        if matched:
             logger.info("Opt-out processed for a stored account")
         else:
             # Do not reveal whether a caller-supplied UUID belongs to an account.
@@ -639,51 +667,62 @@ async def register_user(data: UserRegistrationRequest) -> UserRegistrationRespon
     db = _get_firestore()
     now = _now_iso()
     new_uuid = generate_ea_uuid()
+    record = {
+        "uuid": new_uuid,
+        "email": str(data.email) if data.email else None,
+        "display_name": data.display_name,
+        "tier": "ea",
+        "registered_at": now,
+        "consent": True,
+        "consent_ts": now,
+        "privacy_version": PRIVACY_POLICY_VERSION,
+        "tc_version": TERMS_VERSION,
+        "status": "active",
+        "registration_path": "lightweight_v0513",
+    }
+    stored = None
+    existing = None
+    if db is not None:
+        # Email dedup by index document and the write, in one transaction
+        stored = await registration_store.register(
+            COLLECTION_REGISTRATIONS, record, str(data.email) if data.email else None,
+        )
+        if stored is not None and stored.status == registration_store.EXISTING:
+            existing = stored.record
     # Best-effort email dedup (only when email provided and Firestore available)
-    if data.email and db is not None:
-        existing = (
+    if stored is None and data.email and db is not None:
+        matches = await run_in_thread(
             db.collection(COLLECTION_REGISTRATIONS)
             .where("email", "==", str(data.email))
             .limit(1)
-            .get()
+            .get
+        )
+        existing = matches[0].to_dict() if matches else None
+    if existing is not None:
+        doc = existing
+        logger.info(
+            "Lightweight register: duplicate email %s — returning existing UUID",
+            _mask_email(str(data.email)),
+        )
+        extras = _build_registration_extras(doc["uuid"])
+        return UserRegistrationResponse(
+            uuid=doc["uuid"],
+            tier=doc.get("tier", "ea"),
+            registered_at=doc["registered_at"],
+            message=(
+                "You're already registered. Save your UUID — it is your "
+                f"persistent identifier. {CURRENT_AVAILABILITY_NOTICE}"
+            ),
+            opt_out_url=f"/early-adopters/optout/{doc['uuid']}",
+            privacy_version=PRIVACY_POLICY_VERSION,
+            tc_version=TERMS_VERSION,
+            **extras,
         )
-        if existing:
-            doc = existing[0].to_dict()
-            logger.info(
-                "Lightweight register: duplicate email %s — returning existing UUID",
-                _mask_email(str(data.email)),
-            )
-            extras = _build_registration_extras(doc["uuid"])
-            return UserRegistrationResponse(
-                uuid=doc["uuid"],
-                tier=doc.get("tier", "ea"),
-                registered_at=doc["registered_at"],
-                message=(
-                    "You're already registered. Save your UUID — it is your "
-                    f"persistent identifier. {CURRENT_AVAILABILITY_NOTICE}"
-                ),
-                opt_out_url=f"/early-adopters/optout/{doc['uuid']}",
-                privacy_version=PRIVACY_POLICY_VERSION,
-                tc_version=TERMS_VERSION,
-                **extras,
-            )
 
     # Store in Firestore (when available)
     if db is not None:
-        record = {
-            "uuid": new_uuid,
-            "email": str(data.email) if data.email else None,
-            "display_name": data.display_name,
-            "tier": "ea",
-            "registered_at": now,
-            "consent": True,
-            "consent_ts": now,
-            "privacy_version": PRIVACY_POLICY_VERSION,
-            "tc_version": TERMS_VERSION,
-            "status": "active",
-            "registration_path": "lightweight_v0513",
-        }
-        db.collection(COLLECTION_REGISTRATIONS).document(new_uuid).set(record)
+        if stored is None:
+            await run_in_thread(db.collection(COLLECTION_REGISTRATIONS).document(new_uuid).set, record)
         logger.info("Lightweight registration: UUID=%s", new_uuid)
     else:
         logger.warning("Firestore unavailable — lightweight registration UUID=%s not persisted", new_uuid)
@@ -0,0 +1,266 @@
+"""
+Registration data layer — async Firestore access for the registration paths.
+
+``register_early_adopter`` used to run two synchronous queries on every call:
+an aggregation counting the tier's active records (the slot cap) and a
+``where("email", "==", ...)`` lookup (dedup). Both held a worker while
+Firestore scanned, both grew with the collection, and the check-then-write
+gap let two concurrent sign-ups for one email or the last free slot both
+succeed. This module replaces them with a fixed number of document reads and
+writes through the async client, in one transaction per registration:
+
+- Slot counters. Each tier's active-registration count is one document,
+  ``registration_counters/{tier}`` (field ``count``). A registration reads
+  it, is refused once it reaches the cap, and increments it; an opt-out
+  decrements it. The caps are small (tens of slots), so a single document
+  per tier stays well inside Firestore's per-document write rate.
+- Email index. ``{collection}_email_index/{sha256(normalized email)}`` maps
+  an email to its record's UUID, so dedup is one document read by a
+  deterministic id. The index entry is written with the record and removed on
+  opt-out, when the record's email is de-identified.
+- Seeding. Records written before the counters existed are accounted for
+  once per collection: the first registration a process handles streams the
+  collection, backfills missing index entries and sets the counters, then
+  writes ``registration_meta/{collection}``. The counters and the marker are
+  written in one transaction that checks the marker first, so two instances
+  seeding at once produce the counts once; registrations wait for the
+  marker, so none can land between the count and the counters.
+
+Every entry point returns None when the async client is unavailable, and
+``registration.py`` then falls back to its offloaded synchronous queries.
+"""
+
+import hashlib
+import logging
+import os
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, NamedTuple, Optional
+
+from .utils.single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+COLLECTION_COUNTERS = "registration_counters"
+COLLECTION_META = "registration_meta"
+
+FIRESTORE_BATCH_LIMIT = 500
+
+# Outcomes of register()
+CREATED = "created"
+EXISTING = "existing"
+FULL = "full"
+
+
+class Registration(NamedTuple):
+    status: str
+    record: Optional[Dict[str, Any]]
+
+
+_firestore_async_client = None
+_seeded: set = set()
+_seeding = SingleFlight()
+
+
+def _get_firestore_async():
+    """Lazy-init async Firestore client. Returns None if unavailable."""
+    global _firestore_async_client
+    if _firestore_async_client is not None:
+        return _firestore_async_client
+    project_id = os.environ.get("FIRESTORE_PROJECT_ID") or os.environ.get("GOOGLE_CLOUD_PROJECT")
+    if not project_id:
+        return None
+    try:
+        from google.cloud import firestore  # type: ignore
+        _firestore_async_client = firestore.AsyncClient(project=project_id)
+        return _firestore_async_client
+    except Exception as e:
+        logger.warning("Async Firestore unavailable for registration: %s", e)
+        return None
+
+
+def reset_registration_store() -> None:
+    """Drop the client and the seeded-collection memo (tests)."""
+    global _firestore_async_client
+    _firestore_async_client = None
+    _seeded.clear()
+
+
+async def _run_transaction(db, fn: Callable, *args: Any) -> Any:
+    """Run ``fn(transaction, *args)`` in a Firestore transaction, retried on contention."""
+    from google.cloud.firestore import async_transactional  # type: ignore
+    return await async_transactional(fn)(db.transaction(), *args)
+
+
+def email_key(email: str) -> str:
+    """Deterministic index document id for an email (SHA-256 of the normalized address)."""
+    return hashlib.sha256(email.strip().lower().encode("utf-8")).hexdigest()
+
+
+def _index_ref(db, collection: str, email: str):
+    return db.collection(f"{collection}_email_index").document(email_key(email))
+
+
+def _counter_ref(db, tier: str):
+    return db.collection(COLLECTION_COUNTERS).document(tier)
+
+
+def _counter_value(snapshot) -> int:
+    if not snapshot.exists:
+        return 0
+    return int((snapshot.to_dict() or {}).get("count", 0))
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+# ─────────────────────────────────────────────
+# Seeding
+# ─────────────────────────────────────────────
+
+async def _ensure_seeded(db, collection: str, counted: bool) -> None:
+    if collection in _seeded:
+        return
+    await _seeding.do(collection, lambda: _seed(db, collection, counted))
+    _seeded.add(collection)
+
+
+async def _seed(db, collection: str, counted: bool) -> None:
+    meta_ref = db.collection(COLLECTION_META).document(collection)
+    if (await meta_ref.get()).exists:
+        return
+
+    counts: Dict[str, int] = {}
+    earliest: Dict[str, tuple] = {}
+    async for doc in db.collection(collection).stream():
+        data = doc.to_dict() or {}
+        if data.get("status") != "active":
+            continue
+        tier = data.get("tier")
+        counts[tier] = counts.get(tier, 0) + 1
+        email = data.get("email")
+        if email and data.get("uuid"):
+            key = email_key(email)
+            entry = (data.get("registered_at") or "", data["uuid"], tier)
+            if key not in earliest or entry < earliest[key]:
+                earliest[key] = entry
+
+    index = db.collection(f"{collection}_email_index")
+    entries = list(earliest.items())
+    for start in range(0, len(entries), FIRESTORE_BATCH_LIMIT):
+        batch = db.batch()
+        for key, (_, uuid, tier) in entries[start:start + FIRESTORE_BATCH_LIMIT]:
+            batch.set(index.document(key), {"uuid": uuid, "tier": tier})
+        await batch.commit()
+
+    async def write_counters(transaction):
+        if (await meta_ref.get(transaction=transaction)).exists:
+            return
+        if counted:
+            for tier, count in counts.items():
+                transaction.set(_counter_ref(db, tier), {"count": count})
+        transaction.set(meta_ref, {"seeded_at": _now_iso(), "counts": counts if counted else {}})
+
+    await _run_transaction(db, write_counters)
+    logger.info(
+        "Registration store seeded for %s (%d active records, %d index entries)",
+        collection, sum(counts.values()), len(entries),
+    )
+
+
+# ─────────────────────────────────────────────
+# Registration
+# ─────────────────────────────────────────────
+
+async def register(
+    collection: str,
+    record: Dict[str, Any],
+    email: Optional[str],
+    max_slots: Optional[int] = None,
+) -> Optional[Registration]:
+    """Create ``record`` unless its email is already registered or its tier is full.
+
+    With ``max_slots`` the record's tier counter enforces the cap; without it
+    no counter is kept. Returns None when the async client is unavailable.
+    """
+    db = _get_firestore_async()
+    if db is None:
+        return None
+    await _ensure_seeded(db, collection, counted=max_slots is not None)
+
+    records = db.collection(collection)
+    index_ref = _index_ref(db, collection, email) if email else None
+    counter_ref = _counter_ref(db, record["tier"]) if max_slots is not None else None
+
+    async def attempt(transaction):
+        index = await index_ref.get(transaction=transaction) if index_ref is not None else None
+        count = 0
+        if counter_ref is not None:
+            count = _counter_value(await counter_ref.get(transaction=transaction))
+            if count >= max_slots:
+                return Registration(FULL, None)
+        if index is not None and index.exists:
+            existing = await records.document(index.to_dict()["uuid"]).get(transaction=transaction)
+            if existing.exists:
+                return Registration(EXISTING, existing.to_dict())
+
+        transaction.set(records.document(record["uuid"]), record)
+        if index_ref is not None:
+            transaction.set(index_ref, {"uuid": record["uuid"], "tier": record["tier"]})
+        if counter_ref is not None:
+            transaction.set(counter_ref, {"count": count + 1})
+        return Registration(CREATED, record)
+
+    return await _run_transaction(db, attempt)
+
+
+async def release(
+    collection: str,
+    uuid: str,
+    update: Dict[str, Any],
+    counted: bool = True,
+) -> Optional[bool]:
+    """Apply an opt-out ``update`` to a record, freeing its slot and its email index entry.
+
+    Returns True when the UUID matched a record, False when it did not, and
+    None when the async client is unavailable.
+    """
+    db = _get_firestore_async()
+    if db is None:
+        return None
+    await _ensure_seeded(db, collection, counted=counted)
+
+    record_ref = db.collection(collection).document(uuid)
+
+    async def attempt(transaction):
+        snapshot = await record_ref.get(transaction=transaction)
+        if not snapshot.exists:
+            return False
+        data = snapshot.to_dict() or {}
+        active = data.get("status") == "active"
+        email = data.get("email")
+
+        index_ref = _index_ref(db, collection, email) if active and email else None
+        index = await index_ref.get(transaction=transaction) if index_ref is not None else None
+        counter_ref = _counter_ref(db, data.get("tier")) if active and counted else None
+        count = 0
+        if counter_ref is not None:
+            count = _counter_value(await counter_ref.get(transaction=transaction))
+
+        transaction.update(record_ref, update)
+        if index is not None and index.exists and index.to_dict().get("uuid") == uuid:
+            transaction.delete(index_ref)
+        if count > 0:
+            transaction.set(counter_ref, {"count": count - 1})
+        return True
+
+    return await _run_transaction(db, attempt)
+
+
+async def add_document(collection: str, data: Dict[str, Any]) -> bool:
+    """Add ``data`` under an auto-generated id. False when the async client is unavailable."""
+    db = _get_firestore_async()
+    if db is None:
+        return False
+    await db.collection(collection).add(data)
+    return True
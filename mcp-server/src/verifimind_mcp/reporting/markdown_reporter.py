@@ -71,6 +71,12 @@ def generate_yaml_frontmatter(result: TrinityResult) -> str:
         f"confidence_valid: {'true' if s.confidence_valid else 'false'}",
         f"analysis_incomplete: {'true' if s.analysis_incomplete else 'false'}",
         f'degraded_agents: "{degraded}"',
+    ]
+    # Only short-circuited runs carry this key, so every other report's
+    # frontmatter is unchanged.
+    if s.skipped_agents:
+        lines.append(f'skipped_agents: "{", ".join(s.skipped_agents)}"')
+    lines += [
         f"timestamp: {iso_ts}",
         f"generator: verifimind-peas/{_server_version()}",
         f"format: {FORMAT_VERSION}",
@@ -167,6 +173,8 @@ def _section_executive_summary(s: TrinitySynthesis) -> str:
     gate_agents = s.quality_gate.get("agents", {}) if s.quality_gate else {}
 
     def _score(agent_id: str, value: Optional[float]) -> str:
+        if gate_agents.get(agent_id) == "skipped":
+            return "skipped"
         if value is None or gate_agents.get(agent_id, "real") != "real":
             return "unavailable"
         return f"{value:.1f}/10"
@@ -413,6 +421,17 @@ def _nullable_score(value: Optional[float], yaml: bool = False) -> str:
 
 
 def _degraded_agent_section(agent_name: str, role: str, quality: str) -> str:
+    if quality == "skipped":
+        return "\n".join([
+            f"## {agent_name} — {role}",
+            "",
+            (
+                "> ⏭️ **AGENT ANALYSIS SKIPPED:** this stage was not run because "
+                "a real Z veto had already decided the verdict "
+                "(`on_veto=short_circuit`). No score or findings exist for it."
+            ),
+            "",
+        ])
     return "\n".join([
         f"## {agent_name} — {role}",
         "",
@@ -25,8 +25,9 @@ import json
 import logging
 import os
 import re
+import threading
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, List, Optional
 
 from fastmcp import FastMCP, Context
 
@@ -34,6 +35,7 @@ from pydantic import BaseModel, Field
 
 from verifimind_mcp.utils.uuid_tracer import emit_tracer
 from verifimind_mcp.utils.trinity_history import persist_trinity_result
+from verifimind_mcp.utils.offload import run_in_thread
 from verifimind_mcp.utils.provider_failures import (
     emit_structured_failure,
     emit_trinity_run_event,
@@ -42,6 +44,12 @@ from verifimind_mcp.utils.provider_failures import (
     trinity_stage_failure,
 )
 from verifimind_mcp.llm.failover import FailoverExhaustedError, FailoverTerminalError
+from verifimind_mcp.utils.deadline import (
+    request_headers,
+    reset_current_deadline,
+    resolve_deadline,
+    set_current_deadline,
+)
 from verifimind_mcp.availability import system_notice_is_compatible
 from verifimind_mcp.middleware.tool_invocation import ToolInvocationTelemetry
 
@@ -134,6 +142,9 @@ def attach_failover_disclosure(payload: dict, result) -> None:
         correlation = getattr(result, "_failover_correlation", None)
         if correlation:
             payload["_failover_correlation"] = correlation
+    cascade = getattr(result, "_model_cascade", None)
+    if cascade:
+        payload["_model_cascade"] = cascade
 
 
 def trinity_failover_meta(stage_results: dict) -> dict:
@@ -164,6 +175,27 @@ def trinity_failover_meta(stage_results: dict) -> dict:
     return meta
 
 
+def _synthesis_payload(synthesis) -> dict:
+    """The public ``synthesis`` block shared by full and triage Trinity runs."""
+    return {
+        "overall_score": synthesis.overall_score,
+        "recommendation": synthesis.recommendation,
+        "veto_triggered": synthesis.veto_triggered,
+        "strengths": synthesis.strengths[:3],
+        "concerns": synthesis.concerns[:3],
+        "confidence": synthesis.confidence,
+        "confidence_valid": synthesis.confidence_valid,
+        "analysis_incomplete": synthesis.analysis_incomplete,
+        "degraded_agents": synthesis.degraded_agents,
+        "skipped_agents": synthesis.skipped_agents,
+        "short_circuit": synthesis.short_circuit,
+        "analysis_grade": synthesis.analysis_grade,
+        "quality_gate": synthesis.quality_gate,
+        "founder_summary": getattr(synthesis, 'founder_summary', None),
+        "inference_warning": getattr(synthesis, 'inference_warning', None),
+    }
+
+
 def failover_error_payload(exc, agent: str, concept_name: Optional[str] = None) -> dict:
     """B-90-8: the stable terminal contract for failover-lane failures.
 
@@ -398,6 +430,7 @@ def _get_history_path() -> Path:
 
 MASTER_PROMPT_PATH = _get_master_prompt_path()
 HISTORY_PATH = _get_history_path()
+_HISTORY_LOCK = threading.Lock()
 VALIDATION_HISTORY_MAX_ENTRIES = 20
 MASTER_PROMPT_UNAVAILABLE = (
     "# Error Building Master Prompt\n\nThe live methodology is temporarily unavailable."
@@ -566,6 +599,19 @@ def save_validation_history(history: dict[str, Any]) -> bool:
     return _write_validation_history(bounded)
 
 
+def _append_validation_history(entry: dict[str, Any], last_updated: str) -> bool:
+    """Load, append and save as one step; run_full_trinity calls this on the
+    offload pool, so the lock keeps concurrent appends from losing entries."""
+    with _HISTORY_LOCK:
+        history = load_validation_history()
+        history.setdefault("validations", [])
+        history.setdefault("metadata", {})
+        history["validations"].append(entry)
+        history["metadata"]["total_validations"] = len(history["validations"])
+        history["metadata"]["last_updated"] = last_updated
+        return save_validation_history(history)
+
+
 def get_latest_validation() -> dict[str, Any]:
     """Get most recent validation result."""
     history = load_validation_history()
@@ -701,7 +747,8 @@ def _create_mcp_instance():
         URI: genesis://config/master_prompt
         Format: Markdown
         """
-        return load_master_prompt()
+        from .contract_snapshot import contract_snapshot
+        return contract_snapshot().master_prompt()
 
 
     @app.resource("genesis://history/latest")
@@ -749,8 +796,8 @@ def _create_mcp_instance():
         URI: genesis://state/project_info
         Format: JSON
         """
-        info = get_project_info()
-        return json.dumps(info, indent=2)
+        from .contract_snapshot import contract_snapshot
+        return contract_snapshot().project_info_json
 
 
     # ===== TOOLS =====
@@ -764,6 +811,7 @@ def _create_mcp_instance():
         llm_provider: Optional[str] = None,
         api_key: Optional[str] = None,
         user_uuid: Optional[str] = None,
+        fields: Optional[List[str]] = None,
         ctx: Context = None
     ) -> dict:
         """
@@ -786,6 +834,8 @@ def _create_mcp_instance():
             context: Optional additional context or background
             llm_provider: Optional LLM provider override ('groq', 'anthropic', 'openai', 'gemini', 'mistral', 'ollama', 'mock')
             api_key: Optional API key for the provider (ephemeral, never stored)
+            fields: Optional JSON-pointer paths (e.g. "/confidence") — return
+                only those parts of the result, plus the quality envelope.
 
         Returns:
             Structured analysis with reasoning chain, scores, and recommendations
@@ -828,7 +878,12 @@ def _create_mcp_instance():
             result = await agent.analyze(concept)
 
             _iq = getattr(result, '_inference_quality', 'unknown')
-            from .utils.reasoning_view import normalize_detail, consult_steps
+            from .utils.reasoning_view import (
+                consult_steps,
+                normalize_detail,
+                normalize_fields,
+                project_fields,
+            )
             detail = normalize_detail(detail)
             payload = {
                 "agent": AGENT_X_NAME,
@@ -858,7 +913,7 @@ def _create_mcp_instance():
             ))
             attach_failover_disclosure(payload, result)
             persist_trinity_result(user_uuid, "consult_agent_x", payload)
-            return wrap_response(payload)
+            return project_fields(wrap_response(payload), normalize_fields(fields))
 
         except (FailoverExhaustedError, FailoverTerminalError) as e:
             # B-90-8: the executor's typed contract survives the MCP boundary
@@ -881,6 +936,7 @@ def _create_mcp_instance():
         llm_provider: Optional[str] = None,
         api_key: Optional[str] = None,
         user_uuid: Optional[str] = None,
+        fields: Optional[List[str]] = None,
         ctx: Context = None
     ) -> dict:
         """
@@ -907,6 +963,8 @@ def _create_mcp_instance():
             prior_reasoning: Optional reasoning from X agent to consider
             llm_provider: Optional LLM provider override ('groq', 'anthropic', 'openai', 'gemini', 'mistral', 'ollama', 'mock')
             api_key: Optional API key for the provider (ephemeral, never stored)
+            fields: Optional JSON-pointer paths (e.g. "/confidence") — return
+                only those parts of the result, plus the quality envelope.
 
         Returns:
             Structured analysis with reasoning chain, ethics score, and veto status
@@ -963,7 +1021,12 @@ def _create_mcp_instance():
             result = await agent.analyze(concept, prior)
 
             _iq = getattr(result, '_inference_quality', 'unknown')
-            from .utils.reasoning_view import normalize_detail, consult_steps
+            from .utils.reasoning_view import (
+                consult_steps,
+                normalize_detail,
+                normalize_fields,
+                project_fields,
+            )
             detail = normalize_detail(detail)
             payload = {
                 "agent": AGENT_Z_NAME,
@@ -997,7 +1060,7 @@ def _create_mcp_instance():
             ))
             attach_failover_disclosure(payload, result)
             persist_trinity_result(user_uuid, "consult_agent_z", payload)
-            return wrap_response(payload)
+            return project_fields(wrap_response(payload), normalize_fields(fields))
 
         except (FailoverExhaustedError, FailoverTerminalError) as e:
             return wrap_response(failover_error_payload(e, AGENT_Z_NAME, concept_name))
@@ -1019,6 +1082,7 @@ def _create_mcp_instance():
         llm_provider: Optional[str] = None,
         api_key: Optional[str] = None,
         user_uuid: Optional[str] = None,
+        fields: Optional[List[str]] = None,
         ctx: Context = None
     ) -> dict:
         """
@@ -1042,6 +1106,8 @@ def _create_mcp_instance():
             prior_reasoning: Optional reasoning from X and Z agents to consider
             llm_provider: Optional LLM provider override ('groq', 'anthropic', 'openai', 'gemini', 'mistral', 'ollama', 'mock')
             api_key: Optional API key for the provider (ephemeral, never stored)
+            fields: Optional JSON-pointer paths (e.g. "/confidence") — return
+                only those parts of the result, plus the quality envelope.
 
         Returns:
             Structured analysis with security score, vulnerabilities, and Socratic questions
@@ -1096,7 +1162,12 @@ def _create_mcp_instance():
             agent = CSAgent(llm_provider=provider)
             result = await agent.analyze(concept, prior)
 
-            from .utils.reasoning_view import normalize_detail, consult_steps
+            from .utils.reasoning_view import (
+                consult_steps,
+                normalize_detail,
+                normalize_fields,
+                project_fields,
+            )
             detail = normalize_detail(detail)
             payload = {
                 "agent": AGENT_CS_NAME,
@@ -1132,7 +1203,7 @@ def _create_mcp_instance():
             ))
             attach_failover_disclosure(payload, result)
             persist_trinity_result(user_uuid, "consult_agent_cs", payload)
-            return wrap_response(payload)
+            return project_fields(wrap_response(payload), normalize_fields(fields))
 
         except (FailoverExhaustedError, FailoverTerminalError) as e:
             return wrap_response(failover_error_payload(e, AGENT_CS_NAME, concept_name))
@@ -1160,6 +1231,11 @@ def _create_mcp_instance():
         cs_provider: Optional[str] = None,
         cs_api_key: Optional[str] = None,
         user_uuid: Optional[str] = None,
+        on_veto: str = "continue",
+        deadline_seconds: Optional[float] = None,
+        mode: str = "full",
+        triage_escalate: bool = True,
+        fields: Optional[List[str]] = None,
         ctx: Context = None
     ) -> dict:
         """
@@ -1205,6 +1281,35 @@ def _create_mcp_instance():
             z_api_key: Optional API key override for Z agent only
             cs_provider: Optional provider override for CS agent only
             cs_api_key: Optional API key override for CS agent only
+            on_veto: What to do after a real (non-degraded) Z veto — "continue"
+                (default) still runs CS; "short_circuit" skips the CS stage and
+                its stagger, since the verdict is already REJECT. The skipped
+                stage is reported as degraded (`skipped_agents`, quality
+                "skipped"), so score and confidence are withheld exactly as for
+                any incomplete run. Unknown values behave as "continue".
+            deadline_seconds: How long the caller will wait for this run. Falls
+                back to the X-VerifiMind-Deadline header, then the server
+                default; clamped to 5-600s. Retries, staggers and failover
+                hops that cannot finish in time are skipped, and stages that
+                cannot start in time degrade (REQUEST_DEADLINE_EXCEEDED)
+                instead of running past it.
+            mode: "full" (default) runs the X → Z → CS chain. "triage" issues
+                ONE compact call (served by the X lane's provider) for the
+                X/Z/CS scores, veto flag and top concerns, synthesized by the
+                same rules and quality gate; the result is labelled
+                `analysis_grade: "triage"`, is always JSON and is never written
+                to the shared history. Unknown values behave as "full".
+            triage_escalate: In triage mode, re-run as a full Trinity when the
+                triage score lands within VERIFIMIND_TRIAGE_ESCALATION_MARGIN
+                (default 0.5) of a recommendation threshold. The escalated
+                response is a normal full run carrying a `_triage` record.
+            fields: Optional JSON-pointer paths (e.g. "/synthesis/overall_score",
+                "/z_analysis/veto_triggered") — return only those parts of the
+                JSON result. The quality envelope (_inference_quality,
+                _overall_quality, analysis_incomplete, _warning) is always kept,
+                errors are never pruned, and `_fields` lists any path that did
+                not resolve. Applied after `detail`, so "/reasoning/..." paths
+                need detail "standard" or "full". Markdown is not projected.
 
         Returns:
             Complete Trinity validation result with all agent analyses and synthesis
@@ -1237,6 +1342,7 @@ def _create_mcp_instance():
         session = SessionContext(concept_name=concept_name)
         _run_session_id = session.session_id
         _completion_emitted = False
+        _deadline_token = None
 
         def _emit_completion_once(**fields):
             # F-331-T1: the final outcome must not be pre-claimed — whichever
@@ -1261,8 +1367,24 @@ def _create_mcp_instance():
             if user_uuid:
                 emit_tracer(user_uuid, "run_full_trinity")
             # v0.5.44: normalize reasoning verbosity (invalid → "standard")
-            from .utils.reasoning_view import normalize_detail
+            from .utils.reasoning_view import (
+                normalize_detail,
+                normalize_fields,
+                project_fields,
+            )
             detail = normalize_detail(detail)
+            fields = normalize_fields(fields)
+            on_veto = (
+                "short_circuit"
+                if str(on_veto or "").strip().lower() == "short_circuit"
+                else "continue"
+            )
+            # End-to-end deadline: published for the provider layer for the
+            # duration of this run, and passed explicitly to the stage gates.
+            run_deadline = resolve_deadline(deadline_seconds, request_headers())
+            _deadline_token = set_current_deadline(run_deadline)
+            from .utils.triage import TRIAGE_MODE, normalize_mode
+            mode = normalize_mode(mode)
             # Check Accept header for markdown content negotiation
             output_format = "json"
             if ctx and hasattr(ctx, 'request_context'):
@@ -1372,6 +1494,156 @@ def _create_mcp_instance():
             )
             retry_budget = TrinityRetryBudget()
 
+            # Detached jobs (submit_trinity) poll per-stage progress. Outside a
+            # job this is a no-op; inside one it publishes only the session
+            # record (score/veto/provider) plus quality and error code.
+            from .utils.trinity_jobs import record_job_stage
+
+            def _report_stage(agent_id: str, quality: str) -> None:
+                record = {"inference_quality": quality}
+                record.update(session.read(agent_id) or {})
+                if agent_id in stage_errors:
+                    record["error_code"] = stage_errors[agent_id]["error_code"]
+                record_job_stage(agent_id, record)
+
+            # mode="triage": one compact structured call scored by the same
+            # synthesis rules (utils/triage.py). A clear verdict returns here;
+            # a near-boundary one falls through to the full chain below.
+            triage_meta = None
+            if mode == TRIAGE_MODE:
+                from .agents import TriageAgent
+                from .utils.provider_failures import unavailable_agent_result
+                from .utils.triage import triage_escalation_reason
+                triage_agent = TriageAgent(llm_provider=resolved_providers["X"])
+                try:
+                    triage_result = await analyze_with_completion_retry(
+                        lambda: triage_agent.analyze(concept),
+                        agent_id="TRIAGE",
+                        byok=byok_status["X"],
+                        session_id=session.session_id,
+                        budget=retry_budget,
+                        deadline=run_deadline,
+                    )
+                    t_x, t_z, t_cs = triage_result.to_agent_analyses()
+                except Exception as e:
+                    triage_result, stage_errors["TRIAGE"] = trinity_stage_failure(
+                        agent_id="TRIAGE",
+                        provider=resolved_providers["X"],
+                        exc=e,
+                        byok=byok_status["X"],
+                        session_id=session.session_id,
+                    )
+                    t_x, t_z, t_cs = (
+                        unavailable_agent_result(agent_id, e)
+                        for agent_id in ("X", "Z", "CS")
+                    )
+                triage_quality = getattr(t_x, "_inference_quality", "unknown")
+                triage_trinity = create_trinity_result(
+                    concept_name=concept_name,
+                    concept_description=concept_description,
+                    x_result=t_x,
+                    z_result=t_z,
+                    cs_result=t_cs,
+                    analysis_grade=TRIAGE_MODE,
+                )
+                triage_synthesis = triage_trinity.synthesis
+                triage_provider = actual_provider_used(
+                    triage_result, resolved_providers["X"]
+                )
+                if "TRIAGE" not in stage_errors:
+                    session.write("TRIAGE", {
+                        "score": triage_synthesis.overall_score,
+                        "veto": triage_synthesis.veto_triggered,
+                        "provider": triage_provider,
+                    })
+                _report_stage("TRIAGE", triage_quality)
+                escalation = (
+                    triage_escalation_reason(triage_synthesis)
+                    if triage_escalate else None
+                )
+                triage_meta = {
+                    "inference_quality": triage_quality,
+                    "overall_score": triage_synthesis.overall_score,
+                    "recommendation": triage_synthesis.recommendation,
+                    "escalated": bool(escalation),
+                }
+                logger.info(
+                    "Trinity triage: quality=%s escalated=%s session=%s",
+                    triage_quality,
+                    bool(escalation),
+                    session.session_id,
+                )
+                if escalation:
+                    triage_meta["escalation_reason"] = escalation
+                    # The triage failure (if any) is not a failure of the
+                    # full run that replaces it.
+                    stage_errors.pop("TRIAGE", None)
+                else:
+                    triage_overall = (
+                        "full" if triage_quality == "real"
+                        else "synthetic" if triage_quality == "mock"
+                        else "degraded" if triage_quality == "fallback"
+                        else "partial"
+                    )
+                    triage_payload = {
+                        "validation_id": triage_trinity.validation_id,
+                        "concept_name": concept_name,
+                        "mode": TRIAGE_MODE,
+                        "scores": {
+                            "innovation_score": triage_synthesis.innovation_score,
+                            "strategic_value": (
+                                t_x.strategic_value
+                                if triage_quality == "real" else None
+                            ),
+                            "ethics_score": triage_synthesis.ethics_score,
+                            "security_score": triage_synthesis.security_score,
+                        },
+                        "top_concerns": (
+                            triage_result.top_concerns[:3]
+                            if triage_quality == "real" else None
+                        ),
+                        "synthesis": _synthesis_payload(triage_synthesis),
+                        "human_decision_required": True,
+                        "saved_to_history": False,
+                        "_agent_chain_status": {"triage": triage_quality},
+                        "_overall_quality": triage_overall,
+                        "_triage": triage_meta,
+                        "_byok": byok_status["X"],
+                        "_byok_agents": {"TRIAGE": byok_status["X"]},
+                        "_providers_used": {"TRIAGE": triage_provider},
+                        **trinity_failover_meta({"TRIAGE": triage_result}),
+                        "_deadline": run_deadline.to_metadata(),
+                        **session.to_metadata(),
+                    }
+                    if stage_errors:
+                        triage_payload.update({
+                            "status": "error",
+                            "_stage_errors": stage_errors,
+                            "_agents_failed": sorted(stage_errors),
+                        })
+                    _triage_retries = retry_budget.summary()
+                    if _triage_retries:
+                        triage_payload["_stage_retries"] = _triage_retries
+                    if triage_overall != "full":
+                        triage_payload["_warning"] = (
+                            triage_synthesis.inference_warning or MOCK_MODE_WARNING
+                        )
+                    if save_to_history:
+                        triage_payload["_history_warning"] = (
+                            "Triage-grade results are not written to history; "
+                            "run mode='full' to save a validation."
+                        )
+                    # Triage-grade results never reach the UUID history: its
+                    # record has no grade, so the dashboard would show one
+                    # compact call as a full X/Z/CS validation.
+                    _emit_completion_once(
+                        outcome=triage_overall,
+                        agents_failed=sorted(stage_errors) or None,
+                        retried_stages=sorted(_triage_retries) or None,
+                        mode=TRIAGE_MODE,
+                    )
+                    return project_fields(wrap_response(triage_payload), fields)
+
             # Step 1: X Agent analysis (no prior reasoning)
             try:
                 x_result = await analyze_with_completion_retry(
@@ -1380,6 +1652,7 @@ def _create_mcp_instance():
                     byok=byok_status["X"],
                     session_id=session.session_id,
                     budget=retry_budget,
+                    deadline=run_deadline,
                 )
                 x_quality = getattr(x_result, '_inference_quality', 'unknown')
                 chain_status["x_agent"] = x_quality
@@ -1407,6 +1680,7 @@ def _create_mcp_instance():
                 x_quality = "unavailable"
                 chain_status["x_agent"] = x_quality
                 x_cot = None
+            _report_stage("X", x_quality)
 
             # Step 2: Z Agent analysis (sees X's reasoning)
             from .utils import (
@@ -1416,6 +1690,7 @@ def _create_mcp_instance():
                 check_z_agent_response,
                 unavailable_agent_token_monitor,
             )
+            from .utils.provider_failures import skipped_agent_result
             try:
                 # v0.5.60 gate audit: prior assembly lives INSIDE the stage
                 # gate — a failure here degrades this stage instead of
@@ -1429,6 +1704,7 @@ def _create_mcp_instance():
                     byok=byok_status["Z"],
                     session_id=session.session_id,
                     budget=retry_budget,
+                    deadline=run_deadline,
                 )
                 z_quality = getattr(z_result, '_inference_quality', 'unknown')
                 chain_status["z_agent"] = z_quality
@@ -1492,91 +1768,118 @@ def _create_mcp_instance():
                 z_quality = "unavailable"
                 chain_status["z_agent"] = z_quality
                 z_cot = None
+            _report_stage("Z", z_quality)
 
             # Step 3: CS Agent analysis (sees X and Z reasoning)
-            # v0.5.60: Z and CS bill the same hosted provider today — a short
-            # stagger between their calls reduces same-window quota collision
-            # (VM-TR §1.3). Cross-provider configurations skip it entirely.
-            cs_stagger_applied = await stagger_if_shared_provider(
-                resolved_providers["Z"], resolved_providers["CS"]
+            # on_veto="short_circuit": a real Z veto already forces REJECT in
+            # synthesis, so CS (a full LLM call plus the stagger) cannot change
+            # the verdict. Only a trusted veto qualifies — a degraded Z stage
+            # never short-circuits, and the skip is itself a degraded stage.
+            cs_skipped = (
+                on_veto == "short_circuit"
+                and z_quality == "real"
+                and bool(z_result.veto_triggered)
             )
-            if cs_stagger_applied:
-                logger.info(
-                    "Trinity CS stage staggered after Z (shared provider) session=%s",
-                    session.session_id,
-                )
-            # v0.5.60 (P3-B): CS gets the same token-ceiling instrumentation Z
-            # has had since v0.5.3 — CS has truncated in production with no
-            # monitor. Failure handling mirrors the Z monitor's UNAVAILABLE shape.
-            try:
-                # v0.5.60 gate audit: prior assembly inside the stage gate
-                # (see Z-stage note).
-                cs_prior = PriorReasoning()
-                if x_cot is not None:
-                    cs_prior.add(x_cot)
-                if z_cot is not None:
-                    cs_prior.add(z_cot)
-                cs_result = await analyze_with_completion_retry(
-                    lambda: cs_agent.analyze(concept, cs_prior),
-                    agent_id="CS",
-                    byok=byok_status["CS"],
-                    session_id=session.session_id,
-                    budget=retry_budget,
-                )
-                cs_quality = getattr(cs_result, '_inference_quality', 'unknown')
+            if cs_skipped:
+                cs_result = skipped_agent_result("CS")
+                cs_quality = cs_result._inference_quality
                 chain_status["cs_agent"] = cs_quality
+                cs_token_monitor = unavailable_agent_token_monitor(
+                    configured_ceiling=CS_AGENT_CEILING,
+                )
+                cs_token_monitor["skipped"] = True
+                cs_stagger_applied = False
                 logger.info(
-                    "Trinity CS stage: quality=%s session=%s",
-                    cs_quality,
+                    "Trinity CS stage skipped after Z veto session=%s",
                     session.session_id,
                 )
-                cs_output_tokens = getattr(cs_result, '_output_tokens', 0)
-                cs_effective_ceiling = getattr(
-                    cs_result, '_completion_token_reservation', None
-                )
-                if (
-                    not isinstance(cs_effective_ceiling, int)
-                    or isinstance(cs_effective_ceiling, bool)
-                    or cs_effective_ceiling <= 0
-                ):
-                    cs_effective_ceiling = CS_AGENT_CEILING
-                cs_token_monitor = check_cs_agent_response(
-                    cs_output_tokens,
-                    ceiling=cs_effective_ceiling,
-                    configured_ceiling=CS_AGENT_CEILING,
+            else:
+                # v0.5.60: Z and CS bill the same hosted provider today — a short
+                # stagger between their calls reduces same-window quota collision
+                # (VM-TR §1.3). Cross-provider configurations skip it entirely.
+                cs_stagger_applied = await stagger_if_shared_provider(
+                    resolved_providers["Z"], resolved_providers["CS"],
+                    deadline=run_deadline,
                 )
-                if cs_token_monitor["risk_level"] in ("HIGH", "CRITICAL"):
-                    logger.warning(
-                        "CS Agent token ceiling risk: %s (%s/%s) risk=%s",
-                        cs_token_monitor["utilization"],
-                        cs_token_monitor["token_count"],
-                        cs_token_monitor["ceiling"],
-                        cs_token_monitor["risk_level"],
+                if cs_stagger_applied:
+                    logger.info(
+                        "Trinity CS stage staggered after Z (shared provider) session=%s",
+                        session.session_id,
                     )
-                session.write("CS", {
-                    "score": cs_result.security_score if cs_quality == "real" else None,
-                    "provider": resolved_providers["CS"].get_model_name(),
-                })
-            except Exception as e:
-                cs_result, stage_errors["CS"] = trinity_stage_failure(
-                    agent_id="CS",
-                    provider=resolved_providers["CS"],
-                    exc=e,
-                    byok=byok_status["CS"],
-                    session_id=session.session_id,
-                )
-                cs_token_monitor = unavailable_agent_token_monitor(
-                    configured_ceiling=CS_AGENT_CEILING,
-                    exc=e,
-                    truncated=(
-                        True
-                        if stage_errors["CS"]["error_code"]
-                        == "PROVIDER_OUTPUT_TRUNCATED"
-                        else None
-                    ),
-                )
-                cs_quality = "unavailable"
-                chain_status["cs_agent"] = cs_quality
+                # v0.5.60 (P3-B): CS gets the same token-ceiling instrumentation Z
+                # has had since v0.5.3 — CS has truncated in production with no
+                # monitor. Failure handling mirrors the Z monitor's UNAVAILABLE shape.
+                try:
+                    # v0.5.60 gate audit: prior assembly inside the stage gate
+                    # (see Z-stage note).
+                    cs_prior = PriorReasoning()
+                    if x_cot is not None:
+                        cs_prior.add(x_cot)
+                    if z_cot is not None:
+                        cs_prior.add(z_cot)
+                    cs_result = await analyze_with_completion_retry(
+                        lambda: cs_agent.analyze(concept, cs_prior),
+                        agent_id="CS",
+                        byok=byok_status["CS"],
+                        session_id=session.session_id,
+                        budget=retry_budget,
+                        deadline=run_deadline,
+                    )
+                    cs_quality = getattr(cs_result, '_inference_quality', 'unknown')
+                    chain_status["cs_agent"] = cs_quality
+                    logger.info(
+                        "Trinity CS stage: quality=%s session=%s",
+                        cs_quality,
+                        session.session_id,
+                    )
+                    cs_output_tokens = getattr(cs_result, '_output_tokens', 0)
+                    cs_effective_ceiling = getattr(
+                        cs_result, '_completion_token_reservation', None
+                    )
+                    if (
+                        not isinstance(cs_effective_ceiling, int)
+                        or isinstance(cs_effective_ceiling, bool)
+                        or cs_effective_ceiling <= 0
+                    ):
+                        cs_effective_ceiling = CS_AGENT_CEILING
+                    cs_token_monitor = check_cs_agent_response(
+                        cs_output_tokens,
+                        ceiling=cs_effective_ceiling,
+                        configured_ceiling=CS_AGENT_CEILING,
+                    )
+                    if cs_token_monitor["risk_level"] in ("HIGH", "CRITICAL"):
+                        logger.warning(
+                            "CS Agent token ceiling risk: %s (%s/%s) risk=%s",
+                            cs_token_monitor["utilization"],
+                            cs_token_monitor["token_count"],
+                            cs_token_monitor["ceiling"],
+                            cs_token_monitor["risk_level"],
+                        )
+                    session.write("CS", {
+                        "score": cs_result.security_score if cs_quality == "real" else None,
+                        "provider": resolved_providers["CS"].get_model_name(),
+                    })
+                except Exception as e:
+                    cs_result, stage_errors["CS"] = trinity_stage_failure(
+                        agent_id="CS",
+                        provider=resolved_providers["CS"],
+                        exc=e,
+                        byok=byok_status["CS"],
+                        session_id=session.session_id,
+                    )
+                    cs_token_monitor = unavailable_agent_token_monitor(
+                        configured_ceiling=CS_AGENT_CEILING,
+                        exc=e,
+                        truncated=(
+                            True
+                            if stage_errors["CS"]["error_code"]
+                            == "PROVIDER_OUTPUT_TRUNCATED"
+                            else None
+                        ),
+                    )
+                    cs_quality = "unavailable"
+                    chain_status["cs_agent"] = cs_quality
+            _report_stage("CS", cs_quality)
 
             # v0.4.3.1 C-S-P Propagation: Compute overall quality
             quality_values = list(chain_status.values())
@@ -1630,9 +1933,6 @@ def _create_mcp_instance():
             # success rather than echoing the caller's requested boolean.
             history_saved = False
             if save_to_history and not stage_errors:
-                history = load_validation_history()
-                history.setdefault("validations", [])
-                history.setdefault("metadata", {})
                 history_entry = trinity_result.model_dump()
                 for result_key, agent_id, quality in (
                     ("x_analysis", "X", x_quality),
@@ -1645,10 +1945,11 @@ def _create_mcp_instance():
                             "withheld": True,
                             "inference_quality": quality,
                         }
-                history["validations"].append(history_entry)
-                history["metadata"]["total_validations"] = len(history["validations"])
-                history["metadata"]["last_updated"] = str(trinity_result.completed_at)
-                history_saved = save_validation_history(history)
+                history_saved = await run_in_thread(
+                    _append_validation_history,
+                    history_entry,
+                    str(trinity_result.completed_at),
+                )
 
             history_retention = validation_history_retention_contract()
 
@@ -1664,6 +1965,13 @@ def _create_mcp_instance():
                     for aid in ("X", "Z", "CS")
                 },
             }
+            _cascades = {
+                aid: getattr(res, "_model_cascade", None)
+                for aid, res in _stage_results.items()
+                if getattr(res, "_model_cascade", None)
+            }
+            if _cascades:
+                _byok_meta["_model_cascade"] = _cascades
             _byok_meta.update(trinity_failover_meta(_stage_results))
             _stage_failure_meta = {}
             if stage_errors:
@@ -1677,6 +1985,12 @@ def _create_mcp_instance():
             _trinity_retries = retry_budget.summary()
             if _trinity_retries:
                 _stage_failure_meta["_stage_retries"] = _trinity_retries
+            if cs_skipped:
+                _stage_failure_meta["_stages_skipped"] = ["CS"]
+                _stage_failure_meta["_on_veto"] = on_veto
+            _stage_failure_meta["_deadline"] = run_deadline.to_metadata()
+            if triage_meta is not None:
+                _stage_failure_meta["_triage"] = triage_meta
 
             # F-331-T1: the success-path completion is emitted per return
             # branch, AFTER the response is fully constructed — the outcome is
@@ -1690,6 +2004,8 @@ def _create_mcp_instance():
                     agents_failed=sorted(stage_errors) or None,
                     retried_stages=sorted(_trinity_retries) or None,
                     stagger_applied=cs_stagger_applied,
+                    short_circuited=cs_skipped or None,
+                    escalated_from_triage=(triage_meta is not None) or None,
                 )
 
             # Return result — Markdown-first if requested (v0.4.1)
@@ -1697,7 +2013,7 @@ def _create_mcp_instance():
                 from .reporting import generate_markdown_report
                 md_payload = {
                     "format": "markdown",
-                    "content": generate_markdown_report(trinity_result),
+                    "content": await run_in_thread(generate_markdown_report, trinity_result),
                     "validation_id": trinity_result.validation_id,
                     "saved_to_history": history_saved,
                     "history_retention": history_retention,
@@ -1782,20 +2098,7 @@ def _create_mcp_instance():
                         cs_result.confidence if cs_quality == "real" else None
                     )
                 },
-                "synthesis": {
-                    "overall_score": trinity_result.synthesis.overall_score,
-                    "recommendation": trinity_result.synthesis.recommendation,
-                    "veto_triggered": trinity_result.synthesis.veto_triggered,
-                    "strengths": trinity_result.synthesis.strengths[:3],
-                    "concerns": trinity_result.synthesis.concerns[:3],
-                    "confidence": trinity_result.synthesis.confidence,
-                    "confidence_valid": trinity_result.synthesis.confidence_valid,
-                    "analysis_incomplete": trinity_result.synthesis.analysis_incomplete,
-                    "degraded_agents": trinity_result.synthesis.degraded_agents,
-                    "quality_gate": trinity_result.synthesis.quality_gate,
-                    "founder_summary": getattr(trinity_result.synthesis, 'founder_summary', None),
-                    "inference_warning": getattr(trinity_result.synthesis, 'inference_warning', None),
-                },
+                "synthesis": _synthesis_payload(trinity_result.synthesis),
                 "human_decision_required": True,
                 "saved_to_history": history_saved,
                 "history_retention": history_retention,
@@ -1834,7 +2137,7 @@ def _create_mcp_instance():
             if not stage_errors:
                 persist_trinity_result(user_uuid, "run_full_trinity", payload)
             _emit_success_completion()
-            return wrap_response(payload)
+            return project_fields(wrap_response(payload), fields)
 
         except (FailoverExhaustedError, FailoverTerminalError) as e:
             # B-90-8: hosted-lane typed contract — distinct from BYOK_AUTH_FAILED
@@ -1873,6 +2176,9 @@ def _create_mcp_instance():
                 agent="Trinity",
                 original_error=e,
             ))
+        finally:
+            if _deadline_token is not None:
+                reset_current_deadline(_deadline_token)
 
     # ===== v0.4.0 TEMPLATE TOOLS =====
 
@@ -1900,27 +2206,11 @@ def _create_mcp_instance():
         if user_uuid:
             emit_tracer(user_uuid, "list_prompt_templates")
         try:
-            from .templates import TemplateRegistry
-
-            registry = TemplateRegistry()
-
-            # Parse tags if provided. v0.5.60 (P2-A): the parameter is a
-            # comma-separated string, but MCP clients naturally send arrays,
-            # which arrive here stringified — '["stride"]' then became the
-            # literal tag '["stride"]' and matched nothing. A JSON-array-shaped
-            # value is now decoded before splitting; the documented string form
-            # is unchanged.
-            tag_list = None
-            if tags:
-                raw_tags = tags.strip()
-                if raw_tags.startswith('[') and raw_tags.endswith(']'):
-                    try:
-                        decoded = json.loads(raw_tags)
-                        if isinstance(decoded, list):
-                            raw_tags = ','.join(str(item) for item in decoded)
-                    except (ValueError, TypeError):
-                        pass  # fall through: treat as a literal string
-                tag_list = [t.strip() for t in raw_tags.split(',') if t.strip()]
+            from .templates.registry import get_registry_async
+
+            registry = await get_registry_async()
+
+            tag_list = _parse_tag_list(tags)
 
             templates = registry.list_templates(
                 agent_id=agent_id,
@@ -1979,9 +2269,9 @@ def _create_mcp_instance():
         if user_uuid:
             emit_tracer(user_uuid, "get_prompt_template")
         try:
-            from .templates import TemplateRegistry
+            from .templates.registry import get_registry_async
 
-            registry = TemplateRegistry()
+            registry = await get_registry_async()
             template = registry.get_template(template_id, include_custom=False)
 
             if not template:
@@ -2051,12 +2341,12 @@ def _create_mcp_instance():
             emit_tracer(user_uuid, "export_prompt_template")
         try:
             from .templates import (
-                TemplateRegistry,
                 export_template_markdown,
                 export_template_json,
             )
+            from .templates.registry import get_registry_async
 
-            registry = TemplateRegistry()
+            registry = await get_registry_async()
             template = registry.get_template(template_id, include_custom=False)
 
             if not template:
@@ -2164,9 +2454,9 @@ def _create_mcp_instance():
         if user_uuid:
             emit_tracer(user_uuid, "get_template_statistics")
         try:
-            from .templates import TemplateRegistry
+            from .templates.registry import get_registry_async
 
-            registry = TemplateRegistry()
+            registry = await get_registry_async()
             stats = registry.get_statistics(include_custom=False)
 
             # Add library info
@@ -2340,9 +2630,276 @@ def _create_mcp_instance():
         """
         return _coordination_contained("coordination_team_status")
 
+    # ===== PREVIEW TOOLS (dark-launched; availability.PREVIEW_TOOL_GROUPS) =====
+    from .availability import preview_group_enabled
+    if preview_group_enabled("trinity_jobs"):
+        _register_trinity_job_tools(app, run_full_trinity)
+    if preview_group_enabled("template_search"):
+        _register_template_search_tools(app)
+
     return app
 
 
+def _parse_tag_list(tags: Optional[str]) -> Optional[List[str]]:
+    """Split the comma-separated ``tags`` tool argument.
+
+    v0.5.60 (P2-A): the parameter is a comma-separated string, but MCP clients
+    naturally send arrays, which arrive here stringified — '["stride"]' then
+    became the literal tag '["stride"]' and matched nothing. A
+    JSON-array-shaped value is now decoded before splitting; the documented
+    string form is unchanged.
+    """
+    if not tags:
+        return None
+    raw_tags = tags.strip()
+    if raw_tags.startswith('[') and raw_tags.endswith(']'):
+        try:
+            decoded = json.loads(raw_tags)
+            if isinstance(decoded, list):
+                raw_tags = ','.join(str(item) for item in decoded)
+        except (ValueError, TypeError):
+            pass  # fall through: treat as a literal string
+    return [t.strip() for t in raw_tags.split(',') if t.strip()]
+
+
+MAX_TEMPLATE_SEARCH_RESULTS = 50
+
+
+def _register_template_search_tools(app) -> None:
+    """Register the ranked template-search preview tool."""
+
+    @app.tool()
+    async def search_prompt_templates(
+        query: str,
+        agent_id: Optional[str] = None,
+        category: Optional[str] = None,
+        tags: Optional[str] = None,
+        limit: int = 10,
+        user_uuid: Optional[str] = None,
+        ctx: Context = None
+    ) -> dict:
+        """
+        Search prompt templates by free text, best match first.
+
+        PREVIEW — ranks the built-in library by relevance of the query to each
+        template's name, tags, description and content (name matches weigh
+        most). A partial word matches the words it begins ("secur" finds
+        "security"). Filters behave exactly as in list_prompt_templates.
+
+        Args:
+            query: Free-text search (e.g., 'privacy risk assessment')
+            agent_id: Filter by agent (X, Z, CS, or 'all')
+            category: Filter by category (startup, security, ethics, etc.)
+            tags: Comma-separated tags to filter by (e.g., 'genesis:phase-1,default')
+            limit: Maximum number of results (1-50, default 10)
+
+        Returns:
+            Matching templates with metadata and a relevance score
+        """
+        if user_uuid:
+            emit_tracer(user_uuid, "search_prompt_templates")
+        try:
+            from .templates.registry import get_registry_async
+
+            registry = await get_registry_async()
+            tag_list = _parse_tag_list(tags)
+            limit = max(1, min(int(limit), MAX_TEMPLATE_SEARCH_RESULTS))
+            results = registry.search_templates(
+                query,
+                agent_id=agent_id,
+                category=category,
+                tags=tag_list,
+                limit=limit,
+                include_custom=False,
+            )
+
+            return wrap_response({
+                "count": len(results),
+                "query": query,
+                "filters": {
+                    "agent_id": agent_id,
+                    "category": category,
+                    "tags": tag_list
+                },
+                "templates": [
+                    {
+                        "template_id": t.template_id,
+                        "name": t.name,
+                        "agent_id": t.agent_id,
+                        "category": t.category,
+                        "version": t.version,
+                        "tags": t.tags,
+                        "description": t.description,
+                        "variable_count": len(t.variables),
+                        "score": round(score, 3)
+                    }
+                    for t, score in results
+                ]
+            })
+
+        except Exception:
+            return wrap_response({
+                "status": "error",
+                "error": TEMPLATE_READ_UNAVAILABLE
+            })
+
+
+def _job_not_found() -> dict:
+    """Stable not-found denial; unknown and expired ids are indistinguishable."""
+    return wrap_response(build_error_response(
+        error_code="TRINITY_JOB_NOT_FOUND",
+        message="No Trinity job with this id exists on this instance.",
+        recovery_hint=(
+            "Finished jobs are retained for a limited time and are instance-local. "
+            "Submit the concept again with submit_trinity."
+        ),
+        agent="Trinity",
+    ))
+
+
+def _job_payload(job, runner) -> dict:
+    view = job.snapshot()
+    position = runner.queue_position(job)
+    if position is not None:
+        view["queue_position"] = position
+    return wrap_response(view)
+
+
+def _register_trinity_job_tools(app, run_full_trinity) -> None:
+    """Register the detached-job preview tools around ``run_full_trinity``.
+
+    ``run_full_trinity`` is whatever ``@app.tool()`` returned; the underlying
+    coroutine function is used so a job runs the exact synchronous contract.
+    """
+    from .utils.trinity_jobs import (
+        TRINITY_JOB_MAX_WAIT_SECONDS,
+        TrinityJobQueueFull,
+        get_trinity_job_runner,
+    )
+    run_trinity = getattr(run_full_trinity, "fn", run_full_trinity)
+
+    @app.tool()
+    async def submit_trinity(
+        concept_name: str,
+        concept_description: str,
+        context: Optional[str] = None,
+        save_to_history: bool = False,
+        detail: str = "standard",
+        llm_provider: Optional[str] = None,
+        api_key: Optional[str] = None,
+        x_provider: Optional[str] = None,
+        x_api_key: Optional[str] = None,
+        z_provider: Optional[str] = None,
+        z_api_key: Optional[str] = None,
+        cs_provider: Optional[str] = None,
+        cs_api_key: Optional[str] = None,
+        user_uuid: Optional[str] = None,
+        on_veto: str = "continue",
+        deadline_seconds: Optional[float] = None,
+        mode: str = "full",
+        triage_escalate: bool = True,
+        fields: Optional[List[str]] = None,
+        ctx: Context = None
+    ) -> dict:
+        """
+        Submit a Trinity validation as a detached job and return its id at once.
+
+        PREVIEW — accepts exactly the run_full_trinity arguments and runs the
+        same X → Z → CS contract on the server's job pool, so the connection
+        does not stay open for the whole chain. Poll with get_trinity_job or
+        block briefly with wait_trinity_job. Results are JSON (no Markdown
+        negotiation) and are retained for a limited time on this instance.
+
+        BYOK keys are held in memory only until the job starts, then dropped.
+
+        Returns:
+            job_id, status ("queued") and queue_position
+        """
+        if user_uuid:
+            emit_tracer(user_uuid, "submit_trinity")
+        runner = get_trinity_job_runner()
+        call_kwargs = {
+            "concept_name": concept_name,
+            "concept_description": concept_description,
+            "context": context,
+            "save_to_history": save_to_history,
+            "detail": detail,
+            "llm_provider": llm_provider,
+            "api_key": api_key,
+            "x_provider": x_provider,
+            "x_api_key": x_api_key,
+            "z_provider": z_provider,
+            "z_api_key": z_api_key,
+            "cs_provider": cs_provider,
+            "cs_api_key": cs_api_key,
+            "user_uuid": user_uuid,
+            "on_veto": on_veto,
+            # Measured from when the job starts running, not from submission.
+            "deadline_seconds": deadline_seconds,
+            "mode": mode,
+            "triage_escalate": triage_escalate,
+            "fields": fields,
+            # The request context ends with this call; a detached run must
+            # not reach back into it.
+            "ctx": None,
+        }
+        try:
+            job = runner.submit(lambda: run_trinity(**call_kwargs))
+        except TrinityJobQueueFull:
+            payload = build_error_response(
+                error_code="TRINITY_JOB_QUEUE_FULL",
+                message="The Trinity job queue on this instance is full.",
+                recovery_hint="Try again shortly, or call run_full_trinity directly.",
+                agent="Trinity",
+            )
+            payload["retryable"] = True
+            return wrap_response(payload)
+        return _job_payload(job, runner)
+
+    @app.tool()
+    async def get_trinity_job(
+        job_id: str,
+        ctx: Context = None
+    ) -> dict:
+        """
+        Return the status of a detached Trinity job.
+
+        PREVIEW — status is one of queued, running, succeeded or failed.
+        stage_results lists each finished stage (score, veto, provider,
+        inference quality) while the job runs; the full run_full_trinity
+        payload is under "result" once the job is terminal.
+        """
+        runner = get_trinity_job_runner()
+        job = runner.get(job_id)
+        if job is None:
+            return _job_not_found()
+        return _job_payload(job, runner)
+
+    @app.tool()
+    async def wait_trinity_job(
+        job_id: str,
+        timeout_seconds: float = TRINITY_JOB_MAX_WAIT_SECONDS,
+        ctx: Context = None
+    ) -> dict:
+        """
+        Wait briefly for a detached Trinity job, then return its status.
+
+        PREVIEW — blocks for at most timeout_seconds (capped server-side to
+        stay inside common client timeouts) and returns the same shape as
+        get_trinity_job, finished or not. Call again while status is queued
+        or running.
+        """
+        runner = get_trinity_job_runner()
+        try:
+            timeout = float(timeout_seconds)
+        except (TypeError, ValueError):
+            timeout = TRINITY_JOB_MAX_WAIT_SECONDS
+        job = await runner.wait(job_id, timeout)
+        if job is None:
+            return _job_not_found()
+        return _job_payload(job, runner)
+
+
 def create_http_server():
     """Create MCP server for HTTP deployment.
 
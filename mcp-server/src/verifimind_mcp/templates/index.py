@@ -0,0 +1,224 @@
+"""
+Template Index for VerifiMind-PEAS
+==================================
+
+Secondary indexes over one template map (built-in or custom), maintained by
+TemplateRegistry on load/register/unregister:
+
+- agent_id (upper-cased) → template ids
+- category (lower-cased) → template ids
+- tag (lower-cased)      → template ids
+- genesis phase          → template ids (membership: every phase tag)
+- token                  → {template id: weighted frequency} (search)
+
+Filtering is set intersection instead of a scan that re-lowercases every tag
+of every template per call, and the statistics breakdowns are read from the
+indexes. Results keep the registry's insertion order.
+
+Search ranks by a TF-IDF style score over the name, tags, description and
+content, with field weights favouring the name. A query token with no exact
+match falls back to the vocabulary tokens it prefixes ("secur" → "security").
+"""
+
+import math
+import re
+from typing import Dict, Iterable, List, Optional, Set
+
+from .models import GenesisPhase, PromptTemplate
+
+SHARED_AGENT = "ALL"
+
+# Weight of one token occurrence per field.
+FIELD_WEIGHTS = {
+    "name": 3.0,
+    "tags": 2.0,
+    "description": 2.0,
+    "content": 1.0,
+}
+MIN_PREFIX_LENGTH = 3
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_STOPWORDS = frozenset({
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "in",
+    "is", "it", "of", "on", "or", "that", "the", "this", "to", "with", "you",
+    "your",
+})
+_PHASES = frozenset(phase.value for phase in GenesisPhase)
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Lower-case alphanumeric tokens, minus stopwords and single characters."""
+    if not text:
+        return []
+    return [
+        token for token in _TOKEN_RE.findall(text.lower())
+        if len(token) > 1 and token not in _STOPWORDS
+    ]
+
+
+def _add_to(index: Dict[str, Set[str]], key: str, template_id: str) -> None:
+    index.setdefault(key, set()).add(template_id)
+
+
+def _discard_from(index: Dict[str, Set[str]], key: str, template_id: str) -> None:
+    ids = index.get(key)
+    if ids is not None:
+        ids.discard(template_id)
+        if not ids:
+            del index[key]
+
+
+class TemplateIndex:
+    """Secondary and inverted indexes over one ``template_id → template`` map."""
+
+    def __init__(self, source: Dict[str, PromptTemplate]):
+        self.source = source
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        self._order: Dict[str, int] = {}
+        self._next = 0
+        self._keys: Dict[str, dict] = {}
+        self.by_agent: Dict[str, Set[str]] = {}
+        self.by_category: Dict[str, Set[str]] = {}
+        self.by_tag: Dict[str, Set[str]] = {}
+        self.by_phase: Dict[str, Set[str]] = {}
+        self.primary_phase: Dict[str, Optional[str]] = {}
+        self.postings: Dict[str, Dict[str, float]] = {}
+        for template in self.source.values():
+            self.add(template)
+
+    def is_current_for(self, source: Dict[str, PromptTemplate]) -> bool:
+        """False when the map was replaced or changed behind the registry's back."""
+        return source is self.source and len(self._order) == len(source)
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def add(self, template: PromptTemplate) -> None:
+        template_id = template.template_id
+        if template_id in self._order:
+            self.remove(template_id)
+        self._order[template_id] = self._next
+        self._next += 1
+
+        agent = str(template.agent_id).upper()
+        category = str(template.category).lower()
+        tags = [str(tag).lower() for tag in template.tags or []]
+        phases = [tag for tag in tags if tag in _PHASES]
+        _add_to(self.by_agent, agent, template_id)
+        _add_to(self.by_category, category, template_id)
+        for tag in tags:
+            _add_to(self.by_tag, tag, template_id)
+        for phase in phases:
+            _add_to(self.by_phase, phase, template_id)
+        self.primary_phase[template_id] = phases[0] if phases else None
+
+        weights: Dict[str, float] = {}
+        for field, text in (
+            ("name", template.name),
+            ("tags", " ".join(template.tags or [])),
+            ("description", template.description),
+            ("content", template.content),
+        ):
+            for token in tokenize(text):
+                weights[token] = weights.get(token, 0.0) + FIELD_WEIGHTS[field]
+        for token, weight in weights.items():
+            self.postings.setdefault(token, {})[template_id] = weight
+
+        self._keys[template_id] = {
+            "agent": agent,
+            "category": category,
+            "tags": tags,
+            "phases": phases,
+            "tokens": list(weights),
+        }
+
+    def remove(self, template_id: str) -> None:
+        keys = self._keys.pop(template_id, None)
+        if keys is None:
+            return
+        del self._order[template_id]
+        self.primary_phase.pop(template_id, None)
+        _discard_from(self.by_agent, keys["agent"], template_id)
+        _discard_from(self.by_category, keys["category"], template_id)
+        for tag in keys["tags"]:
+            _discard_from(self.by_tag, tag, template_id)
+        for phase in keys["phases"]:
+            _discard_from(self.by_phase, phase, template_id)
+        for token in keys["tokens"]:
+            posting = self.postings.get(token)
+            if posting is not None:
+                posting.pop(template_id, None)
+                if not posting:
+                    del self.postings[token]
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def matching_ids(
+        self,
+        agent_id: Optional[str] = None,
+        category: Optional[str] = None,
+        tags: Optional[Iterable[str]] = None,
+    ) -> Set[str]:
+        """Ids passing every given filter (tags: must carry ALL of them).
+
+        An X/Z/CS agent query includes the shared "all" templates; an "all"
+        query returns exactly the shared ones.
+        """
+        ids: Set[str] = set(self._order)
+        if agent_id:
+            agent = agent_id.upper()
+            ids &= self.by_agent.get(agent, set()) | self.by_agent.get(SHARED_AGENT, set())
+        if category:
+            ids &= self.by_category.get(category.lower(), set())
+        for tag in tags or ():
+            ids &= self.by_tag.get(tag.lower(), set())
+            if not ids:
+                break
+        return ids
+
+    def position(self, template_id: str) -> int:
+        """Insertion rank of an indexed template."""
+        return self._order[template_id]
+
+    def ordered(self, ids: Iterable[str]) -> List[PromptTemplate]:
+        """Templates for ``ids`` in registry insertion order."""
+        return [
+            self.source[template_id]
+            for template_id in sorted(ids, key=self._order.__getitem__)
+        ]
+
+    def _expand(self, token: str) -> List[str]:
+        if token in self.postings:
+            return [token]
+        if len(token) < MIN_PREFIX_LENGTH:
+            return []
+        return [candidate for candidate in self.postings if candidate.startswith(token)]
+
+    def search(self, query: str) -> Dict[str, float]:
+        """Relevance score per matching template id (higher is better)."""
+        total = len(self._order)
+        scores: Dict[str, float] = {}
+        for query_token in dict.fromkeys(tokenize(query)):
+            for token in self._expand(query_token):
+                posting = self.postings[token]
+                idf = math.log(1 + total / len(posting))
+                for template_id, weight in posting.items():
+                    scores[template_id] = (
+                        scores.get(template_id, 0.0) + idf * (1 + math.log(weight))
+                    )
+        return scores
+
+    def agent_counts(self) -> Dict[str, int]:
+        """Attribution count per agent: X/Z/CS, everything else under "all"."""
+        counts = {"X": 0, "Z": 0, "CS": 0, "all": 0}
+        for agent, ids in self.by_agent.items():
+            counts[agent if agent in ("X", "Z", "CS") else "all"] += len(ids)
+        return counts
@@ -5,6 +5,7 @@ Template Data Models for VerifiMind-PEAS v0.4.0
 Defines core data structures for the Unified Prompt Template system:
 - TemplateVariable: Variable definition with type hints
 - PromptTemplate: Template with metadata, variables, version
+- CompiledTemplate: Content parsed once into literals and placeholders
 - TemplateLibraryEntry: Library catalog entry
 - ExportFormat/ExportConfig: Export configuration
 
@@ -12,10 +13,12 @@ Author: Alton Lee
 Version: 0.4.0
 """
 
+import re
 from datetime import datetime
 from enum import Enum
-from typing import Optional, List, Any
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from string import Formatter
+from typing import Optional, List, Any, Dict, Iterable, Mapping, Tuple
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator
 
 
 class GenesisPhase(str, Enum):
@@ -93,6 +96,94 @@ class TemplateVariable(BaseModel):
     })
 
 
+_FIELD_ROOT = re.compile(r"[^.\[]*")
+_CONVERSIONS = {"r": repr, "s": str, "a": ascii}
+
+
+class CompiledTemplate:
+    """
+    Template content parsed once into literal segments and placeholders.
+
+    Rendering joins the literals with the formatted values, which is what
+    ``str.format`` produced, without re-parsing the content per call. Fields
+    with attribute/index access or nested format specs keep the
+    ``str.format`` path. ``error`` names why the content cannot render
+    (unknown or positional placeholders, unbalanced braces); it is None for a
+    renderable template.
+    """
+
+    __slots__ = ("segments", "required", "defaults", "placeholders", "simple", "error")
+
+    def __init__(self, content: str, variables: List["TemplateVariable"]):
+        declared = {v.name for v in variables}
+        # Same resolution as before: provided > default > "" (optional only).
+        self.required: Tuple[str, ...] = tuple(
+            v.name for v in variables if v.required and v.default is None
+        )
+        self.defaults: Dict[str, Any] = {}
+        for v in variables:
+            if v.default is not None:
+                self.defaults[v.name] = v.default
+            elif not v.required:
+                self.defaults[v.name] = ""
+        self.segments: Tuple[Tuple[str, Optional[str], str, Optional[str]], ...] = ()
+        self.placeholders: Tuple[str, ...] = ()
+        self.simple = True
+        self.error: Optional[str] = None
+
+        try:
+            parsed = list(Formatter().parse(content))
+        except ValueError as e:
+            self.error = f"Malformed template content: {e}"
+            return
+
+        unknown: List[str] = []
+        names: List[str] = []
+        for _literal, field, spec, conversion in parsed:
+            if field is None:
+                continue
+            root = _FIELD_ROOT.match(field).group(0)
+            if not root or root.isdigit():
+                self.error = f"Positional placeholder in template: {{{field}}}"
+                return
+            if root not in declared and root not in unknown:
+                unknown.append(root)
+            if root not in names:
+                names.append(root)
+            if root != field or "{" in (spec or "") or conversion not in (None, *_CONVERSIONS):
+                self.simple = False
+        if unknown:
+            self.error = f"Unknown variable in template: {unknown[0]!r}"
+            if len(unknown) > 1:
+                self.error = f"Unknown variables in template: {unknown}"
+            return
+        self.segments = tuple(parsed)
+        self.placeholders = tuple(names)
+
+    def missing(self, values: Mapping[str, Any]) -> List[str]:
+        return [name for name in self.required if name not in values]
+
+    def render(self, content: str, values: Mapping[str, Any]) -> str:
+        """Render with ``values`` (already checked for missing variables)."""
+        if self.error:
+            raise ValueError(self.error)
+        defaults = self.defaults
+        if not self.simple:
+            context = {**defaults, **values}
+            return content.format(**{name: context[name] for name in self.placeholders})
+        parts: List[str] = []
+        for literal, field, spec, conversion in self.segments:
+            if literal:
+                parts.append(literal)
+            if field is None:
+                continue
+            value = values[field] if field in values else defaults[field]
+            if conversion:
+                value = _CONVERSIONS[conversion](value)
+            parts.append(format(value, spec))
+        return "".join(parts)
+
+
 class PromptTemplate(BaseModel):
     """
     Prompt Template with metadata, variables, and version control.
@@ -198,6 +289,39 @@ class PromptTemplate(BaseModel):
                     pass
         return None
 
+    _compiled: Optional[CompiledTemplate] = PrivateAttr(default=None)
+    _compiled_key: Optional[tuple] = PrivateAttr(default=None)
+
+    def _plan(self) -> CompiledTemplate:
+        # Cached per content/variables objects: reassigning either (or growing
+        # the variable list) recompiles on the next call.
+        key = self._compiled_key
+        if (
+            key is None
+            or key[0] is not self.content
+            or key[1] is not self.variables
+            or key[2] != len(self.variables)
+        ):
+            self._compiled = CompiledTemplate(self.content, self.variables)
+            self._compiled_key = (self.content, self.variables, len(self.variables))
+        return self._compiled
+
+    def compile(self) -> CompiledTemplate:
+        """
+        Parse the content once and check it against the declared variables.
+
+        Returns:
+            The cached CompiledTemplate
+
+        Raises:
+            ValueError: If the content can never render (unknown or
+                positional placeholders, unbalanced braces)
+        """
+        compiled = self._plan()
+        if compiled.error:
+            raise ValueError(f"Template {self.template_id} cannot render: {compiled.error}")
+        return compiled
+
     def get_required_variables(self) -> List[TemplateVariable]:
         """Get list of required variables."""
         return [v for v in self.variables if v.required]
@@ -219,30 +343,27 @@ class PromptTemplate(BaseModel):
         Raises:
             ValueError: If required variables are missing
         """
-        # Check required variables
-        missing = []
-        for var in self.get_required_variables():
-            if var.name not in kwargs and var.default is None:
-                missing.append(var.name)
-
+        compiled = self._plan()
+        missing = compiled.missing(kwargs)
         if missing:
             raise ValueError(f"Missing required variables: {missing}")
+        return compiled.render(self.content, kwargs)
 
-        # Build render context with defaults
-        context = {}
-        for var in self.variables:
-            if var.name in kwargs:
-                context[var.name] = kwargs[var.name]
-            elif var.default is not None:
-                context[var.name] = var.default
-            elif not var.required:
-                context[var.name] = ""
-
-        # Render template
-        try:
-            return self.content.format(**context)
-        except KeyError as e:
-            raise ValueError(f"Unknown variable in template: {e}")
+    def render_many(self, rows: Iterable[Mapping[str, Any]]) -> List[str]:
+        """
+        Render the template once per mapping of variable values.
+
+        Raises:
+            ValueError: On the first row with missing required variables
+        """
+        compiled = self._plan()
+        rendered = []
+        for row in rows:
+            missing = compiled.missing(row)
+            if missing:
+                raise ValueError(f"Missing required variables: {missing}")
+            rendered.append(compiled.render(self.content, row))
+        return rendered
 
     def is_compatible_with_provider(self, provider: str) -> bool:
         """Check if template is compatible with a provider."""
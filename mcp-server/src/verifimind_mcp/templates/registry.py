@@ -6,15 +6,18 @@ Singleton registry managing all prompt templates, including:
 - Built-in library templates (loaded from YAML)
 - Custom user-defined templates
 - Template lookup and filtering
+- Indexed filtering and ranked search (see index.py)
+- Compiled snapshot start-up and incremental hot reload (see snapshot.py)
 
 Author: Alton Lee
 Version: 0.4.0
 """
 
 import logging
+import os
 from pathlib import Path
-from typing import Optional, List, Dict, Any
-from threading import Lock
+from typing import Optional, List, Dict, Any, Tuple
+from threading import Event, Lock, Thread
 
 import yaml
 
@@ -24,9 +27,25 @@ from .models import (
     TemplateLibraryEntry,
     GenesisPhase,
 )
+from .index import TemplateIndex
+from .snapshot import (
+    CompiledLibrary,
+    file_digest,
+    file_signature,
+    load_snapshot,
+    snapshot_is_configured,
+    snapshot_path,
+    write_snapshot,
+)
 
 logger = logging.getLogger(__name__)
 
+# libyaml's C loader when PyYAML was built with it; same safe subset.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Seconds between library change checks; 0 (default) disables the watcher.
+TEMPLATE_RELOAD_INTERVAL = float(os.getenv("TEMPLATE_RELOAD_INTERVAL", "0"))
+
 
 class TemplateRegistry:
     """
@@ -36,10 +55,21 @@ class TemplateRegistry:
     - Built-in library templates (loaded from YAML)
     - Custom user-defined templates
     - Template filtering by agent, category, tags
+    - Ranked full-text search over name, tags, description and content
+
+    Each template map has a TemplateIndex kept in step on load, register and
+    unregister. Indexes are created on first use, so a registry whose maps
+    were replaced wholesale is re-indexed rather than served stale.
+
+    Built-in libraries are compiled per file (CompiledLibrary). A (re)load
+    builds complete new maps and swaps them in with plain attribute
+    assignment, so readers see either the old or the new library, never a
+    half-loaded one.
     """
 
     _instance: Optional['TemplateRegistry'] = None
     _lock: Lock = Lock()
+    _reload_lock: Lock = Lock()
 
     def __new__(cls) -> 'TemplateRegistry':
         """Singleton pattern implementation."""
@@ -64,25 +94,125 @@ class TemplateRegistry:
         # Load built-in templates on initialization
         self._load_builtin_templates()
 
+    def _index(self, custom: bool = False) -> TemplateIndex:
+        """The (lazily built) index for the built-in or custom template map."""
+        attr = "_custom_index" if custom else "_builtin_index"
+        source = self._custom_templates if custom else self._templates
+        index = getattr(self, attr, None)
+        if index is None or not index.is_current_for(source):
+            index = TemplateIndex(source)
+            setattr(self, attr, index)
+        return index
+
     def _load_builtin_templates(self) -> None:
-        """Load all built-in templates from library YAML files."""
+        """Load all built-in templates, from the snapshot where it is current."""
         if not self._library_path.exists():
             logger.warning(f"Library path does not exist: {self._library_path}")
             return
+        self._compile_libraries(use_snapshot=True, force=True)
+
+    def _compile_libraries(
+        self, use_snapshot: bool = False, force: bool = False
+    ) -> Dict[str, List[str]]:
+        """Bring the built-in maps in line with the library files on disk.
+
+        Unless ``force``, a file whose (mtime, size) signature or content
+        digest is unchanged keeps its already-compiled templates. A changed
+        file that no longer parses keeps its previous version (a bad edit must
+        not empty a live library); a new file that does not parse is skipped.
+
+        Returns:
+            Library file names by change kind: added, changed, removed
+        """
+        previous: Dict[str, CompiledLibrary] = {} if force else dict(
+            getattr(self, "_library_files", {})
+        )
+        path = snapshot_path(self._library_path)
+        snapshot = load_snapshot(path) if use_snapshot else {}
+        compiled: Dict[str, CompiledLibrary] = {}
+        changes: Dict[str, List[str]] = {"added": [], "changed": [], "removed": []}
+        parsed_any = False
 
         for yaml_file in self._library_path.glob("*.yaml"):
+            name = yaml_file.name
+            old = previous.pop(name, None)
             try:
-                self._load_library_file(yaml_file)
+                signature = file_signature(yaml_file)
+                if old is not None and old.signature == signature:
+                    compiled[name] = old
+                    continue
+                raw = yaml_file.read_bytes()
+                digest = file_digest(raw)
+                if old is not None and old.sha256 == digest:
+                    old.signature = signature
+                    compiled[name] = old
+                    continue
+                library = self._restore_library_file(
+                    yaml_file, signature, digest, snapshot.get(name)
+                )
+                if library is None:
+                    library = self._load_library_file(yaml_file, raw, signature, digest)
+                    parsed_any = True
             except Exception as e:
                 logger.error(f"Failed to load library {yaml_file}: {e}")
+                if old is not None:
+                    compiled[name] = old
+                continue
+            compiled[name] = library
+            if not force:
+                changes["changed" if old is not None else "added"].append(name)
 
-    def _load_library_file(self, file_path: Path) -> None:
-        """Load a single library YAML file."""
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
+        changes["removed"] = sorted(previous)
+        self._install_libraries(compiled)
 
-        if not data:
-            return
+        if parsed_any and path is not None and snapshot_is_configured():
+            try:
+                write_snapshot(path, compiled)
+            except OSError as e:
+                logger.warning(f"Could not write template snapshot {path}: {e}")
+        return changes
+
+    def _restore_library_file(
+        self,
+        file_path: Path,
+        signature: Tuple[int, int],
+        digest: str,
+        cached: Optional[Dict[str, Any]],
+    ) -> Optional[CompiledLibrary]:
+        """A library from its snapshot entry, or None if absent or stale."""
+        if not cached or cached.get("sha256") != digest:
+            return None
+        try:
+            library = CompiledLibrary.from_snapshot(file_path, signature, cached)
+        except Exception as e:
+            logger.info(f"Re-parsing {file_path.name}: snapshot entry invalid ({e})")
+            return None
+        logger.debug(f"Restored library {library.entry.library_id} from snapshot")
+        return library
+
+    def _install_libraries(self, compiled: Dict[str, CompiledLibrary]) -> None:
+        """Swap in complete new built-in maps (and their index)."""
+        templates: Dict[str, PromptTemplate] = {}
+        libraries: Dict[str, TemplateLibraryEntry] = {}
+        for library in compiled.values():
+            for template in library.templates:
+                templates[template.template_id] = template
+            libraries[library.entry.library_id] = library.entry
+        index = TemplateIndex(templates)
+        self._library_files = compiled
+        self._builtin_index = index
+        self._templates = templates
+        self._libraries = libraries
+
+    def _load_library_file(
+        self,
+        file_path: Path,
+        raw: bytes,
+        signature: Tuple[int, int],
+        digest: str,
+    ) -> CompiledLibrary:
+        """Parse and validate a single library YAML file."""
+        data = yaml.load(raw.decode('utf-8'), Loader=_YAML_LOADER) or {}
 
         # Extract library metadata
         library_id = data.get('library_id', file_path.stem)
@@ -97,20 +227,26 @@ class TemplateRegistry:
             file_path=str(file_path),
             templates=[]
         )
+        library = CompiledLibrary(
+            file_name=file_path.name,
+            signature=signature,
+            sha256=digest,
+            entry=library_entry,
+        )
 
         # Load templates from the file
         templates_data = data.get('templates', [])
         for template_data in templates_data:
             try:
                 template = self._parse_template_data(template_data, library_entry)
-                self._templates[template.template_id] = template
+                library.templates.append(template)
                 library_entry.templates.append(template.template_id)
                 logger.debug(f"Loaded template: {template.template_id}")
             except Exception as e:
                 logger.error(f"Failed to parse template in {file_path}: {e}")
 
-        self._libraries[library_id] = library_entry
         logger.info(f"Loaded library: {library_id} with {len(library_entry.templates)} templates")
+        return library
 
     def _parse_template_data(
         self,
@@ -157,6 +293,7 @@ class TemplateRegistry:
             recommended_temperature=data.get('recommended_temperature', 0.7),
             recommended_max_tokens=data.get('recommended_max_tokens', 4096)
         )
+        template.compile()
 
         return template
 
@@ -202,40 +339,58 @@ class TemplateRegistry:
         Returns:
             List of matching templates
         """
-        # Start with all templates
-        all_templates = list(self._templates.values())
+        # v0.5.60 (P2-B root cause): the stored shared value is lowercase
+        # "all" but the agent comparison was against 'ALL', so shared
+        # templates matched NO query — not even agent_id="all" — since the
+        # feature shipped. The index case-normalizes both sides: an X/Z/CS
+        # query includes the shared templates; an "all" query returns exactly
+        # the shared ones. Built-in matches come first, in load order.
+        results = []
+        for index in self._indexes(include_custom):
+            results.extend(
+                index.ordered(index.matching_ids(agent_id, category, tags))
+            )
+        return results
+
+    def _indexes(self, include_custom: bool) -> List[TemplateIndex]:
+        indexes = [self._index()]
         if include_custom:
-            all_templates.extend(self._custom_templates.values())
-
-        # Filter by agent_id. v0.5.60 (P2-B root cause): the stored shared
-        # value is lowercase "all" but this comparison was against 'ALL', so
-        # shared templates matched NO query — not even agent_id="all" — since
-        # the feature shipped. Comparison is now case-normalized on both sides:
-        # an X/Z/CS query includes the shared templates; an "all" query returns
-        # exactly the shared ones.
-        if agent_id:
-            agent_id_upper = agent_id.upper()
-            all_templates = [
-                t for t in all_templates
-                if t.agent_id.upper() in (agent_id_upper, 'ALL')
-            ]
-
-        # Filter by category
-        if category:
-            all_templates = [
-                t for t in all_templates
-                if t.category.lower() == category.lower()
-            ]
-
-        # Filter by tags (must have ALL specified tags)
-        if tags:
-            tags_lower = [tag.lower() for tag in tags]
-            all_templates = [
-                t for t in all_templates
-                if all(tag.lower() in [tt.lower() for tt in t.tags] for tag in tags_lower)
-            ]
-
-        return all_templates
+            indexes.append(self._index(custom=True))
+        return indexes
+
+    def search_templates(
+        self,
+        query: str,
+        agent_id: Optional[str] = None,
+        category: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        limit: int = 10,
+        include_custom: bool = False,
+    ) -> List[Tuple[PromptTemplate, float]]:
+        """
+        Rank templates by relevance to a free-text query.
+
+        Args:
+            query: Free text matched against name, tags, description, content
+            agent_id: Optional agent filter (same semantics as list_templates)
+            category: Optional category filter
+            tags: Optional tag filter (must have ALL specified tags)
+            limit: Maximum number of results
+            include_custom: Opt in to process-local custom templates
+
+        Returns:
+            (template, score) pairs, best first; ties keep registry order
+        """
+        ranked = []
+        for rank, index in enumerate(self._indexes(include_custom)):
+            allowed = index.matching_ids(agent_id, category, tags)
+            for template_id, score in index.search(query).items():
+                if template_id in allowed:
+                    ranked.append(
+                        (-score, rank, index.position(template_id), index.source[template_id])
+                    )
+        ranked.sort(key=lambda item: item[:3])
+        return [(template, -neg_score) for neg_score, _, _, template in ranked[:max(limit, 0)]]
 
     def list_libraries(self) -> List[TemplateLibraryEntry]:
         """Get all registered template libraries."""
@@ -303,7 +458,8 @@ class TemplateRegistry:
             The registered PromptTemplate
 
         Raises:
-            ValueError: If template_id already exists
+            ValueError: If template_id already exists, or the content cannot
+                render with the declared variables
         """
         # Generate template_id if not provided
         if not template_id:
@@ -342,9 +498,12 @@ class TemplateRegistry:
             description=description,
             changelog=[f"v1.0.0 - Initial version"]
         )
+        template.compile()
 
         # Register
+        index = self._index(custom=True)
         self._custom_templates[template_id] = template
+        index.add(template)
         logger.info(f"Registered custom template: {template_id}")
 
         return template
@@ -360,7 +519,9 @@ class TemplateRegistry:
             True if template was removed, False if not found
         """
         if template_id in self._custom_templates:
+            index = self._index(custom=True)
             del self._custom_templates[template_id]
+            index.remove(template_id)
             logger.info(f"Unregistered custom template: {template_id}")
             return True
         return False
@@ -379,9 +540,10 @@ class TemplateRegistry:
         Returns:
             List of templates for that phase
         """
-        return self.list_templates(
-            tags=[phase.value], include_custom=include_custom
-        )
+        results = []
+        for index in self._indexes(include_custom):
+            results.extend(index.ordered(index.by_phase.get(phase.value, ())))
+        return results
 
     def get_agent_default_template(self, agent_id: str) -> Optional[PromptTemplate]:
         """
@@ -403,12 +565,62 @@ class TemplateRegistry:
         return templates[0] if templates else None
 
     def reload_libraries(self) -> None:
-        """Reload all library templates from YAML files."""
-        self._templates.clear()
-        self._libraries.clear()
-        self._load_builtin_templates()
+        """Re-parse every library YAML file and swap the result in."""
+        with self._reload_lock:
+            self._compile_libraries(force=True)
         logger.info("Reloaded all library templates")
 
+    def refresh_libraries(self) -> Dict[str, List[str]]:
+        """Re-parse only the library files that changed since the last load.
+
+        Returns:
+            Library file names by change kind: added, changed, removed
+        """
+        with self._reload_lock:
+            changes = self._compile_libraries()
+        if any(changes.values()):
+            logger.info(f"Refreshed template libraries: {changes}")
+        return changes
+
+    def start_watching(self, interval: float = TEMPLATE_RELOAD_INTERVAL) -> bool:
+        """Check the library for changes every ``interval`` seconds.
+
+        Runs refresh_libraries on a daemon thread; a non-positive interval (the
+        default unless TEMPLATE_RELOAD_INTERVAL is set) leaves it off.
+
+        Returns:
+            True if a watcher is running after the call
+        """
+        if interval <= 0:
+            return False
+        with self._reload_lock:
+            if getattr(self, "_watcher", None) is not None:
+                return True
+            stop = Event()
+
+            def watch() -> None:
+                while not stop.wait(interval):
+                    try:
+                        self.refresh_libraries()
+                    except Exception as e:
+                        logger.error(f"Template library refresh failed: {e}")
+
+            self._watch_stop = stop
+            self._watcher = Thread(target=watch, name="template-library-watcher", daemon=True)
+            self._watcher.start()
+        logger.info(f"Watching template libraries every {interval:g}s")
+        return True
+
+    def stop_watching(self) -> None:
+        """Stop the library watcher, if one is running."""
+        with self._reload_lock:
+            watcher = getattr(self, "_watcher", None)
+            if watcher is None:
+                return
+            self._watch_stop.set()
+            self._watcher = None
+        watcher.join(timeout=5)
+
     def get_statistics(self, include_custom: bool = False) -> Dict[str, Any]:
         """Get registry statistics.
 
@@ -422,27 +634,19 @@ class TemplateRegistry:
         answer "where does each template live" (attribution).
         """
         custom_count = len(self._custom_templates) if include_custom else 0
-        counted = list(self._templates.values())
-        if include_custom:
-            counted.extend(self._custom_templates.values())
 
         by_agent: Dict[str, int] = {"X": 0, "Z": 0, "CS": 0, "all": 0}
-        for template in counted:
-            raw = str(template.agent_id).upper()
-            by_agent[raw if raw in ("X", "Z", "CS") else "all"] += 1
-
         phase_values = [phase.value for phase in GenesisPhase]
         by_phase: Dict[str, int] = dict.fromkeys(phase_values, 0)
         unphased = 0
-        for template in counted:
-            primary = next(
-                (tag for tag in (template.tags or []) if tag in by_phase),
-                None,
-            )
-            if primary is None:
-                unphased += 1
-            else:
-                by_phase[primary] += 1
+        for index in self._indexes(include_custom):
+            for agent, count in index.agent_counts().items():
+                by_agent[agent] += count
+            for primary in index.primary_phase.values():
+                if primary is None:
+                    unphased += 1
+                else:
+                    by_phase[primary] += 1
         if unphased:
             by_phase["unphased"] = unphased
 
@@ -466,3 +670,25 @@ def get_registry() -> TemplateRegistry:
     if _registry is None:
         _registry = TemplateRegistry()
     return _registry
+
+
+_construct_lock = Lock()
+
+
+def _construct_registry() -> TemplateRegistry:
+    with _construct_lock:
+        return TemplateRegistry()
+
+
+async def get_registry_async() -> TemplateRegistry:
+    """``TemplateRegistry()`` for async callers.
+
+    The first construction parses the library, so it runs on the offload pool
+    instead of the event loop; concurrent first callers wait there, not on a
+    half-loaded instance. Afterwards the singleton is returned directly.
+    """
+    instance = TemplateRegistry._instance
+    if instance is not None and instance._initialized and not _construct_lock.locked():
+        return instance
+    from ..utils.offload import run_in_thread
+    return await run_in_thread(_construct_registry)
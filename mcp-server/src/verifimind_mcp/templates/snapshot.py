@@ -0,0 +1,176 @@
+"""
+Compiled Template Snapshot for VerifiMind-PEAS
+==============================================
+
+Parsing the YAML library (``yaml.safe_load`` + Pydantic validation of every
+template) is the bulk of TemplateRegistry start-up. A snapshot stores the
+already-validated models as JSON, one entry per library file keyed by the
+SHA-256 of that file's bytes; a file whose digest matches is restored with a
+single ``model_validate`` per template and never touches YAML.
+
+- Built into the image: ``python -m verifimind_mcp.templates.snapshot``
+  writes DEFAULT_SNAPSHOT_NAME next to the library files.
+- VERIFIMIND_TEMPLATE_SNAPSHOT=<path> reads (and refreshes) that file
+  instead; ``off`` disables snapshots entirely.
+- A missing, unreadable, foreign-format or stale entry is simply re-parsed
+  from YAML — a snapshot can make start-up faster, never different.
+
+JSON rather than pickle: the snapshot path may be operator-configured and
+writable, and restoring it must not be able to execute code.
+
+Each loaded file is also recorded with its (mtime_ns, size) signature so
+TemplateRegistry.refresh_libraries can re-parse only the files that changed.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .models import PromptTemplate, TemplateLibraryEntry, TemplateVariable
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_ENV = "VERIFIMIND_TEMPLATE_SNAPSHOT"
+DEFAULT_SNAPSHOT_NAME = ".compiled-templates.json"
+
+# Bump when the YAML → model mapping in TemplateRegistry changes; the model
+# field names are folded in automatically.
+SNAPSHOT_FORMAT = 2
+
+
+def _format_key() -> str:
+    fields = ",".join(
+        f"{model.__name__}:{'/'.join(sorted(model.model_fields))}"
+        for model in (PromptTemplate, TemplateVariable, TemplateLibraryEntry)
+    )
+    return f"{SNAPSHOT_FORMAT}:{hashlib.sha256(fields.encode()).hexdigest()[:16]}"
+
+
+@dataclass
+class CompiledLibrary:
+    """One library file, parsed and validated."""
+
+    file_name: str
+    signature: Tuple[int, int]
+    sha256: str
+    entry: TemplateLibraryEntry
+    templates: List[PromptTemplate] = field(default_factory=list)
+
+    def to_snapshot(self) -> Dict[str, Any]:
+        return {
+            "sha256": self.sha256,
+            "library": self.entry.model_dump(mode="json"),
+            "templates": [t.model_dump(mode="json") for t in self.templates],
+        }
+
+    @classmethod
+    def from_snapshot(
+        cls, file_path: Path, signature: Tuple[int, int], data: Dict[str, Any]
+    ) -> "CompiledLibrary":
+        entry = TemplateLibraryEntry.model_validate(
+            {**data["library"], "file_path": str(file_path)}
+        )
+        return cls(
+            file_name=file_path.name,
+            signature=signature,
+            sha256=data["sha256"],
+            entry=entry,
+            templates=[PromptTemplate.model_validate(t) for t in data["templates"]],
+        )
+
+
+def file_signature(path: Path) -> Tuple[int, int]:
+    stat = path.stat()
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def file_digest(raw: bytes) -> str:
+    return hashlib.sha256(raw).hexdigest()
+
+
+def snapshot_path(library_path: Path) -> Optional[Path]:
+    """Where the snapshot lives, or None when snapshots are disabled."""
+    configured = os.getenv(SNAPSHOT_ENV, "").strip()
+    if configured.lower() in ("0", "false", "no", "off"):
+        return None
+    if configured:
+        return Path(configured)
+    return library_path / DEFAULT_SNAPSHOT_NAME
+
+
+def snapshot_is_configured() -> bool:
+    """True when an operator pointed the snapshot at an explicit path.
+
+    Only then is a stale snapshot rewritten at runtime; the default location
+    sits inside the installed package and is written at build time only.
+    """
+    configured = os.getenv(SNAPSHOT_ENV, "").strip()
+    return bool(configured) and configured.lower() not in ("0", "false", "no", "off")
+
+
+def load_snapshot(path: Optional[Path]) -> Dict[str, Dict[str, Any]]:
+    """Snapshot entries by library file name; empty when absent or foreign."""
+    if path is None or not path.is_file():
+        return {}
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable template snapshot {path}: {e}")
+        return {}
+    if not isinstance(data, dict) or data.get("format") != _format_key():
+        logger.info(f"Ignoring template snapshot {path}: format changed")
+        return {}
+    libraries = data.get("libraries")
+    return libraries if isinstance(libraries, dict) else {}
+
+
+def write_snapshot(path: Path, libraries: Dict[str, CompiledLibrary]) -> None:
+    """Atomically replace the snapshot (write to a temp file, then rename)."""
+    payload = {
+        "format": _format_key(),
+        "libraries": {
+            name: library.to_snapshot() for name, library in libraries.items()
+        },
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(prefix=".snapshot-", dir=str(path.parent))
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(payload, f, separators=(",", ":"))
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+def main() -> None:
+    """Build the snapshot for the shipped library (run at image build time)."""
+    from .registry import TemplateRegistry
+
+    logging.basicConfig(level=logging.INFO)
+    registry = TemplateRegistry()
+    path = snapshot_path(registry._library_path)
+    if path is None:
+        raise SystemExit(f"{SNAPSHOT_ENV} disables snapshots; nothing written")
+    if not registry._library_path.is_dir():
+        raise SystemExit(
+            f"Template library not found at {registry._library_path}; nothing written"
+        )
+    if not registry._templates:
+        raise SystemExit(
+            f"No templates loaded from {registry._library_path}; nothing written"
+        )
+    write_snapshot(path, registry._library_files)
+    print(f"Wrote {len(registry._templates)} templates to {path}")
+
+
+if __name__ == "__main__":
+    main()
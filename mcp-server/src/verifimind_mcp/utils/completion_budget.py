@@ -0,0 +1,119 @@
+"""Adaptive per-agent completion budgets learned from observed output sizes.
+
+Why this exists
+---------------
+Every agent call reserves the configured ``max_tokens`` (8192, or
+``GROQ_SAFE_MAX_OUTPUT_TOKENS`` on Groq) although real outputs are a fraction
+of that — ``token_monitor`` measures them on every run. Providers admit and
+schedule on input + *reserved* completion tokens, so an oversized reservation
+costs TPM headroom, provokes 413 admission rejections and queues us behind
+smaller requests for output we never produce.
+
+Contract
+--------
+* Outputs are recorded per ``(agent, model, detail)`` where ``detail`` is
+  ``"orchestrated"`` (the call carries prior agents' reasoning) or
+  ``"standalone"`` — the two prompt shapes whose outputs differ most.
+* Only real-inference successes with an API-reported output count are
+  recorded; a degraded result says nothing about how long a good answer is.
+* Until ``MIN_SAMPLES`` outputs are seen the configured budget is used
+  unchanged. After that the budget is the ``BUDGET_PERCENTILE`` output plus
+  ``BUDGET_MARGIN_RATIO``, never below the largest output in the window,
+  never below ``MIN_ADAPTIVE_BUDGET`` and never above the configured budget.
+* A truncated response (``_provider_output_truncated``) drops that key's
+  window, so it returns to the configured budget and relearns — a learned
+  budget never causes a second truncation in a row.
+* ``BaseAgent`` retries a call once at the configured budget when its output
+  filled a learned (smaller) reservation, so the caller never receives the
+  cut-off answer.
+* ``VERIFIMIND_ADAPTIVE_COMPLETION_BUDGET=0`` restores fixed budgets.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import os
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+ADAPTIVE_BUDGET_ENV = "VERIFIMIND_ADAPTIVE_COMPLETION_BUDGET"
+
+BUDGET_PERCENTILE = float(os.getenv("VERIFIMIND_COMPLETION_BUDGET_PERCENTILE", "0.95"))
+BUDGET_MARGIN_RATIO = float(os.getenv("VERIFIMIND_COMPLETION_BUDGET_MARGIN", "0.25"))
+MIN_SAMPLES = int(os.getenv("VERIFIMIND_COMPLETION_BUDGET_MIN_SAMPLES", "20"))
+WINDOW_SIZE = 200
+MIN_ADAPTIVE_BUDGET = 1024
+
+BudgetKey = Tuple[str, str, str]
+
+
+def adaptive_budget_enabled() -> bool:
+    return os.getenv(ADAPTIVE_BUDGET_ENV, "1").strip().lower() not in (
+        "0", "false", "no", "off",
+    )
+
+
+def budget_key(agent_id: str, model: str, orchestrated: bool) -> BudgetKey:
+    return (agent_id, model, "orchestrated" if orchestrated else "standalone")
+
+
+class CompletionBudgetController:
+    """Rolling window of observed output sizes per budget key."""
+
+    def __init__(self, window_size: int = WINDOW_SIZE):
+        self._window_size = window_size
+        self._samples: Dict[BudgetKey, Deque[int]] = {}
+
+    def record_output(self, key: BudgetKey, output_tokens: int) -> None:
+        if output_tokens <= 0:
+            return
+        window = self._samples.get(key)
+        if window is None:
+            window = self._samples[key] = deque(maxlen=self._window_size)
+        window.append(int(output_tokens))
+
+    def record_truncation(self, key: BudgetKey) -> None:
+        if self._samples.pop(key, None) is not None:
+            logger.warning(
+                "completion budget: truncation on agent=%s model=%s detail=%s; "
+                "reverting to the configured budget",
+                *key,
+            )
+
+    def budget_for(self, key: BudgetKey, configured: int) -> int:
+        """The completion budget to request; ``configured`` until learned."""
+        window = self._samples.get(key)
+        if not adaptive_budget_enabled() or window is None or len(window) < MIN_SAMPLES:
+            return configured
+        ordered = sorted(window)
+        rank = max(0, math.ceil(BUDGET_PERCENTILE * len(ordered)) - 1)
+        learned = ordered[rank] * (1 + BUDGET_MARGIN_RATIO)
+        # Never below the largest output that already fit.
+        budget = int(math.ceil(max(learned, ordered[-1], MIN_ADAPTIVE_BUDGET)))
+        return min(configured, budget)
+
+    def snapshot(self) -> Dict[str, Dict[str, int]]:
+        """Sample counts and window maxima, for diagnostics."""
+        return {
+            "/".join(key): {"samples": len(window), "max_output_tokens": max(window)}
+            for key, window in self._samples.items()
+            if window
+        }
+
+
+_controller: Optional[CompletionBudgetController] = None
+
+
+def get_completion_budget_controller() -> CompletionBudgetController:
+    global _controller
+    if _controller is None:
+        _controller = CompletionBudgetController()
+    return _controller
+
+
+def reset_completion_budget_controller() -> None:
+    global _controller
+    _controller = None
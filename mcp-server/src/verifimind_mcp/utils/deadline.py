@@ -0,0 +1,170 @@
+"""End-to-end request deadline for Trinity runs.
+
+Why this exists
+---------------
+Every existing bound is local: ``TrinityRetryBudget`` caps retry sleep,
+``_total_deadline()`` caps one failover run, ``RETRY_AFTER_CAP_SECONDS`` caps
+one wait. None of them knows how long the CALLER will actually wait, so a run
+could keep retrying, staggering and hopping after the client had already
+given up — work nobody will ever receive.
+
+A run now carries one absolute deadline, resolved from (first match wins):
+
+1. the ``deadline_seconds`` tool parameter,
+2. the ``X-VerifiMind-Deadline`` request header (seconds),
+3. ``VERIFIMIND_REQUEST_DEADLINE_SECONDS`` (server default),
+
+clamped to ``[DEADLINE_MIN_SECONDS, DEADLINE_MAX_SECONDS]``. The budget runs
+from the request's arrival: time it spent in the LLM admission queue
+(``ADMISSION_WAIT_HEADER``, set by middleware/llm_admission.py) is already
+spent.
+
+The deadline is published through a context variable for the duration of the
+run, so the provider layer (``generate_with_failover``) reads it without a
+new parameter on every provider signature — the same seam pattern as the job
+stage reporter. Outside a run there is no deadline and nothing changes.
+
+Consumers:
+
+* stages that cannot start in time raise ``RequestDeadlineExceeded`` and
+  degrade through the unchanged stage-failure contract;
+* the shared-provider stagger and the completion retry are skipped when they
+  would not leave ``STAGE_MIN_SECONDS`` for the call they precede;
+* ``generate_with_failover`` bounds the provider call (and a failover run's
+  own deadline and Retry-After sleeps) by the time remaining.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import os
+import time
+from typing import Mapping, Optional
+
+DEADLINE_HEADER = "x-verifimind-deadline"
+ADMISSION_WAIT_HEADER = "x-verifimind-admission-wait"
+DEFAULT_REQUEST_DEADLINE_SECONDS = float(
+    os.getenv("VERIFIMIND_REQUEST_DEADLINE_SECONDS", "120")
+)
+DEADLINE_MIN_SECONDS = 5.0
+DEADLINE_MAX_SECONDS = 600.0
+# Below this much remaining time a stage is not worth starting: no hosted
+# provider completes an agent analysis faster, so the call would only burn
+# quota before being cut off.
+STAGE_MIN_SECONDS = float(os.getenv("VERIFIMIND_STAGE_MIN_SECONDS", "3"))
+
+_current_deadline: contextvars.ContextVar[Optional["RequestDeadline"]] = (
+    contextvars.ContextVar("verifimind_request_deadline", default=None)
+)
+
+
+class RequestDeadlineExceeded(Exception):
+    """A stage or provider call could not finish before the request deadline."""
+
+
+class RequestDeadline:
+    """Absolute monotonic expiry for one request."""
+
+    def __init__(self, seconds: float, *, source: str = "default", elapsed: float = 0.0):
+        self.budget_seconds = float(seconds)
+        self.source = source
+        self.admission_wait_seconds = max(0.0, float(elapsed))
+        self.expires_at = time.monotonic() + self.budget_seconds - self.admission_wait_seconds
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0.0
+
+    def allows(self, seconds: float, *, reserve: float = STAGE_MIN_SECONDS) -> bool:
+        """True when ``seconds`` can be spent and still leave ``reserve``."""
+        return seconds + reserve <= self.remaining()
+
+    def check(self, what: str) -> None:
+        """Raise if there is not enough time left to start ``what``."""
+        if self.remaining() < STAGE_MIN_SECONDS:
+            raise RequestDeadlineExceeded(f"request deadline reached before {what}")
+
+    def to_metadata(self) -> dict:
+        metadata = {
+            "budget_seconds": self.budget_seconds,
+            "source": self.source,
+            "remaining_seconds": round(self.remaining(), 3),
+        }
+        if self.admission_wait_seconds:
+            metadata["admission_wait_seconds"] = round(self.admission_wait_seconds, 3)
+        return metadata
+
+
+def _coerce_seconds(value) -> Optional[float]:
+    if value is None or isinstance(value, bool):
+        return None
+    try:
+        seconds = float(value)
+    except (TypeError, ValueError):
+        return None
+    if seconds != seconds or seconds <= 0:  # NaN or non-positive
+        return None
+    return seconds
+
+
+def resolve_deadline(
+    requested: Optional[float] = None,
+    headers: Optional[Mapping[str, str]] = None,
+) -> RequestDeadline:
+    """Build the run deadline from parameter, header, or server default."""
+    seconds = _coerce_seconds(requested)
+    source = "parameter"
+    if seconds is None and headers:
+        seconds = _coerce_seconds(headers.get(DEADLINE_HEADER))
+        source = "header"
+    if seconds is None:
+        seconds = DEFAULT_REQUEST_DEADLINE_SECONDS
+        source = "default"
+    seconds = min(DEADLINE_MAX_SECONDS, max(DEADLINE_MIN_SECONDS, seconds))
+    waited = _coerce_seconds((headers or {}).get(ADMISSION_WAIT_HEADER)) or 0.0
+    return RequestDeadline(seconds, source=source, elapsed=waited)
+
+
+def request_headers() -> dict:
+    """Headers of the HTTP request serving the current tool call, if any."""
+    try:
+        from fastmcp.server.dependencies import get_http_headers
+        return {k.lower(): v for k, v in (get_http_headers() or {}).items()}
+    except Exception:
+        return {}  # stdio transport or no active request
+
+
+async def await_within_deadline(awaitable, what: str = "provider call"):
+    """Await ``awaitable`` bounded by the current request deadline, if any.
+
+    For work that does not run under the caller's own deadline (a coalesced
+    provider call shared with other requests): the caller stops waiting at
+    its deadline with ``RequestDeadlineExceeded``, whatever the work does.
+    """
+    deadline = current_deadline()
+    if deadline is None:
+        return await awaitable
+    if deadline.expired():
+        awaitable.close()
+        raise RequestDeadlineExceeded(f"request deadline reached before {what}")
+    try:
+        return await asyncio.wait_for(awaitable, timeout=deadline.remaining())
+    except asyncio.TimeoutError:
+        if not deadline.expired():
+            raise  # the work's own timeout, not ours
+        raise RequestDeadlineExceeded(f"{what} cut off at the request deadline") from None
+
+
+def current_deadline() -> Optional[RequestDeadline]:
+    return _current_deadline.get()
+
+
+def set_current_deadline(deadline: Optional[RequestDeadline]) -> contextvars.Token:
+    return _current_deadline.set(deadline)
+
+
+def reset_current_deadline(token: contextvars.Token) -> None:
+    _current_deadline.reset(token)
@@ -0,0 +1,60 @@
+"""Optional orjson-backed JSON encoding for the HTTP transport.
+
+Why this exists
+---------------
+Starlette's ``JSONResponse`` renders with stdlib ``json``. The HTTP routes
+(/health, the contract and discovery documents, registration and dashboard
+JSON) are served on every probe and poll, and orjson encodes the same
+documents several times faster with less allocation.
+
+Contract
+--------
+* orjson is OPTIONAL. When it is not installed, or
+  ``VERIFIMIND_ORJSON=0``, ``dumps`` is Starlette's own stdlib rendering.
+* Both paths emit compact UTF-8 JSON that decodes to the same value
+  (non-string dict keys are stringified by both); a value neither can
+  encode raises ``TypeError`` on both, exactly as before.
+* MCP tool results are not affected: FastMCP serializes them with
+  pydantic-core, which is already native code.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+from starlette.responses import JSONResponse
+
+ORJSON_ENV = "VERIFIMIND_ORJSON"
+
+
+def orjson_enabled() -> bool:
+    return orjson is not None and os.getenv(ORJSON_ENV, "1").strip().lower() not in (
+        "0", "false", "no", "off",
+    )
+
+
+def dumps(content: Any) -> bytes:
+    """Compact UTF-8 JSON bytes, via orjson when available."""
+    if orjson_enabled():
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(
+        content,
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """Drop-in ``JSONResponse`` rendered by ``dumps``."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -0,0 +1,275 @@
+"""
+Non-blocking Log Pipeline — VerifiMind-PEAS HTTP Server
+
+Structured events (trinity_run_*, trinity_provider_failure, tool_invoked),
+TRACER_UUID lines and stdlib ``logging`` records used to be written to
+stdout/stderr synchronously from the event loop, with a flush per line. When
+the log sink backs up, every request handler stalls behind it.
+
+Once ``install_log_pipeline()`` has run (the HTTP server's lifespan does this
+on startup), all of them are handed to one bounded queue and written by a
+daemon thread:
+
+- Log records are formatted in the writer thread: ``%``-style arguments of
+  immutable types stay unformatted until then (anything else is rendered at
+  the call site, so later mutation cannot change what is logged).
+- Records become one JSON object per line — ``severity``, ``message``,
+  ``logger``, ``time`` — which Cloud Run ingests as ``jsonPayload``.
+- Event dicts are ``json.dumps``-ed in the writer thread; TRACER lines are
+  written verbatim (the analytics pipeline matches their text).
+- The writer flushes once per drained batch instead of once per line.
+- A full queue drops the item and counts it (``get_log_pipeline_stats``);
+  the caller never waits.
+
+Without the pipeline (CLI tools, tests, library use) ``emit_json`` and
+``emit_line`` write synchronously exactly as before.
+
+Environment:
+  VERIFIMIND_ASYNC_LOGGING  0/false/no/off keeps synchronous writes
+  LOG_QUEUE_SIZE            queue capacity (default 10000)
+  LOG_LEVEL                 root logger level once installed (default WARNING,
+                            which matches what reached the logs before)
+"""
+
+import atexit
+import datetime
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import threading
+from typing import Any, Dict, Optional, Union
+
+ASYNC_LOGGING_ENV = "VERIFIMIND_ASYNC_LOGGING"
+LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+LOG_LEVEL = os.getenv("LOG_LEVEL", "WARNING").upper()
+MAX_BATCH = 256
+
+# Argument types that cannot change between the call and the deferred format.
+_IMMUTABLE_ARGS = (str, int, float, bool, type(None), bytes)
+
+_SEVERITY = {
+    logging.DEBUG: "DEBUG",
+    logging.INFO: "INFO",
+    logging.WARNING: "WARNING",
+    logging.ERROR: "ERROR",
+    logging.CRITICAL: "CRITICAL",
+}
+
+_STOP = object()
+
+
+class _Line:
+    """A pre-structured output line: a dict (JSON-encoded later) or text."""
+
+    __slots__ = ("stream", "payload")
+
+    def __init__(self, stream: str, payload: Union[Dict[str, Any], str]):
+        self.stream = stream
+        self.payload = payload
+
+
+class JsonLineFormatter(logging.Formatter):
+    """One Cloud Logging JSON object per record."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        message = record.getMessage()
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            message = f"{message}\n{record.exc_text}"
+        if record.stack_info:
+            message = f"{message}\n{record.stack_info}"
+        return json.dumps({
+            "severity": _SEVERITY.get(record.levelno, record.levelname),
+            "message": message,
+            "logger": record.name,
+            "time": datetime.datetime.fromtimestamp(
+                record.created, tz=datetime.timezone.utc
+            ).isoformat(),
+        }, default=str)
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that leaves immutable ``%`` arguments for the writer thread."""
+
+    def __init__(self, pipeline: "LogPipeline"):
+        super().__init__(pipeline.queue)
+        self._pipeline = pipeline
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if record.exc_info:
+            # Tracebacks reference live frames: render them now.
+            record.exc_text = self._pipeline.formatter.formatException(record.exc_info)
+            record.exc_info = None
+        args = record.args
+        if args:
+            values = args.values() if isinstance(args, dict) else args
+            if not all(isinstance(value, _IMMUTABLE_ARGS) for value in values):
+                record.msg = record.getMessage()
+                record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        self._pipeline.put(record)
+
+
+class LogPipeline:
+    """Bounded queue plus the daemon thread that drains it to stdout/stderr."""
+
+    def __init__(self, capacity: int = LOG_QUEUE_SIZE):
+        self.queue: "queue.Queue[Any]" = queue.Queue(maxsize=capacity)
+        self.capacity = capacity
+        self.formatter = JsonLineFormatter()
+        self.dropped = 0
+        self.written = 0
+        self.write_errors = 0
+        self._drop_lock = threading.Lock()
+        self._thread = threading.Thread(
+            target=self._run, name="verifimind-log-writer", daemon=True
+        )
+        self._thread.start()
+
+    def put(self, item: Any) -> bool:
+        """Queue ``item``; False (and counted) when the queue is full."""
+        try:
+            self.queue.put_nowait(item)
+            return True
+        except queue.Full:
+            with self._drop_lock:
+                self.dropped += 1
+            return False
+
+    def _run(self) -> None:
+        while True:
+            batch = [self.queue.get()]
+            while len(batch) < MAX_BATCH:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            streams = set()
+            for item in batch:
+                if item is _STOP:
+                    self._flush(streams)
+                    return
+                self._write(item, streams)
+            self._flush(streams)
+
+    def _write(self, item: Any, streams: set) -> None:
+        try:
+            if isinstance(item, _Line):
+                stream = getattr(sys, item.stream)
+                payload = item.payload
+                line = payload if isinstance(payload, str) else json.dumps(payload)
+            else:
+                stream = sys.stdout
+                line = self.formatter.format(item)
+            stream.write(line + "\n")
+            streams.add(stream)
+            self.written += 1
+        except Exception:
+            self.write_errors += 1
+
+    def _flush(self, streams: set) -> None:
+        for stream in streams:
+            try:
+                stream.flush()
+            except Exception:
+                self.write_errors += 1
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """Write what is queued, then end the thread."""
+        try:
+            self.queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            return
+        self._thread.join(timeout)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": True,
+            "queued": self.queue.qsize(),
+            "capacity": self.capacity,
+            "written": self.written,
+            "dropped": self.dropped,
+            "write_errors": self.write_errors,
+        }
+
+
+_pipeline: Optional[LogPipeline] = None
+_handler: Optional[_DeferredQueueHandler] = None
+_previous_root: Optional[tuple] = None  # (handlers, level) to restore on shutdown
+_install_lock = threading.Lock()
+
+
+def async_logging_enabled() -> bool:
+    return os.getenv(ASYNC_LOGGING_ENV, "1").strip().lower() not in ("0", "false", "no", "off")
+
+
+def install_log_pipeline(level: Optional[str] = None) -> bool:
+    """Route root logging, events and TRACER lines through the queue.
+
+    Returns True when the pipeline is active. Idempotent.
+    """
+    global _pipeline, _handler, _previous_root
+    if not async_logging_enabled():
+        return False
+    with _install_lock:
+        if _pipeline is not None:
+            return True
+        _pipeline = LogPipeline()
+        _handler = _DeferredQueueHandler(_pipeline)
+        root = logging.getLogger()
+        _previous_root = (list(root.handlers), root.level)
+        for existing in _previous_root[0]:
+            root.removeHandler(existing)
+        root.addHandler(_handler)
+        root.setLevel(level or LOG_LEVEL)
+        atexit.register(shutdown_log_pipeline)
+    return True
+
+
+def shutdown_log_pipeline() -> None:
+    """Drain and stop the pipeline; later writes are synchronous again."""
+    global _pipeline, _handler, _previous_root
+    with _install_lock:
+        pipeline, handler, previous = _pipeline, _handler, _previous_root
+        _pipeline = _handler = _previous_root = None
+    if handler is not None:
+        root = logging.getLogger()
+        root.removeHandler(handler)
+        if previous is not None:
+            for existing in previous[0]:
+                root.addHandler(existing)
+            root.setLevel(previous[1])
+    if pipeline is not None:
+        pipeline.stop()
+
+
+def emit_json(payload: Dict[str, Any], stream: str = "stderr") -> None:
+    """Write one JSON event line. The payload must not be mutated afterwards."""
+    pipeline = _pipeline
+    if pipeline is not None:
+        pipeline.put(_Line(stream, payload))
+        return
+    print(json.dumps(payload), file=getattr(sys, stream), flush=True)
+
+
+def emit_line(text: str, stream: str = "stdout") -> None:
+    """Write one verbatim text line (TRACER format)."""
+    pipeline = _pipeline
+    if pipeline is not None:
+        pipeline.put(_Line(stream, text))
+        return
+    print(text, file=getattr(sys, stream), flush=True)
+
+
+def get_log_pipeline_stats() -> Dict[str, Any]:
+    """Queue depth, written/dropped counters (for monitoring)."""
+    pipeline = _pipeline
+    if pipeline is None:
+        return {"enabled": False}
+    return pipeline.stats()
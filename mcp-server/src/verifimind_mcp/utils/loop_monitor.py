@@ -0,0 +1,228 @@
+"""
+Event-loop lag monitor with a slow-callback detector.
+
+Tail latency for every concurrent MCP session is bounded by the longest
+synchronous stretch on the event loop, and nothing measured it. While the HTTP
+server runs, ``start_loop_monitor()`` (its lifespan) keeps two probes going:
+
+- A heartbeat task sleeps LOOP_MONITOR_INTERVAL seconds at a time; how late
+  each wake-up is, is the loop lag. Samples feed a fixed-bucket histogram,
+  the running mean and the maximum.
+- A watchdog thread checks the heartbeat. Once it is SLOW_CALLBACK_MS past
+  due, the loop is stuck inside one callback, so the watchdog records the
+  asyncio task that is running and the innermost frames of the loop thread
+  (``sys._current_frames``) — the code that is blocking, captured while it
+  still blocks. When the loop catches up, the stall is logged with its
+  measured duration and kept in a short recent-stalls list.
+
+A stall that ends before the watchdog's next poll is still counted, just
+without a culprit. Neither probe touches the callbacks themselves, so the
+cost is one wake-up per interval on each side.
+
+``get_loop_monitor_stats()`` is served on /health.
+
+Environment:
+  VERIFIMIND_LOOP_MONITOR  0/false/no/off disables the monitor
+  LOOP_MONITOR_INTERVAL    heartbeat interval in seconds (default 0.1)
+  SLOW_CALLBACK_MS         stall threshold in milliseconds (default 100)
+"""
+
+import asyncio
+import collections
+import datetime
+import logging
+import os
+import sys
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+LOOP_MONITOR_ENV = "VERIFIMIND_LOOP_MONITOR"
+LOOP_MONITOR_INTERVAL = float(os.getenv("LOOP_MONITOR_INTERVAL", "0.1"))
+SLOW_CALLBACK_MS = float(os.getenv("SLOW_CALLBACK_MS", "100"))
+RECENT_STALLS = 20
+STACK_DEPTH = 6
+
+# Upper bounds (ms) of the lag histogram buckets; the last bucket is open.
+LAG_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000)
+
+
+def loop_monitor_enabled() -> bool:
+    return os.getenv(LOOP_MONITOR_ENV, "1").strip().lower() not in ("0", "false", "no", "off")
+
+
+def _describe_task(task: Optional[asyncio.Task]) -> Optional[str]:
+    if task is None:
+        return None
+    coro = task.get_coro()
+    name = getattr(coro, "__qualname__", None) or type(coro).__name__
+    return f"{task.get_name()}:{name}"
+
+
+def _describe_stack(frame) -> List[str]:
+    """Innermost-last ``file:line function`` entries, at most STACK_DEPTH."""
+    entries = []
+    while frame is not None and len(entries) < STACK_DEPTH:
+        code = frame.f_code
+        entries.append(f"{os.path.basename(code.co_filename)}:{frame.f_lineno} {code.co_name}")
+        frame = frame.f_back
+    entries.reverse()
+    return entries
+
+
+class LoopMonitor:
+    """Heartbeat task plus watchdog thread for one event loop."""
+
+    def __init__(
+        self,
+        interval: float = LOOP_MONITOR_INTERVAL,
+        slow_ms: float = SLOW_CALLBACK_MS,
+    ):
+        self.interval = interval
+        self.slow_ms = slow_ms
+        self.samples = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.last_ms = 0.0
+        self.buckets = [0] * (len(LAG_BUCKETS_MS) + 1)
+        self.stalls = 0
+        self.recent: "collections.deque[Dict[str, Any]]" = collections.deque(maxlen=RECENT_STALLS)
+        self._beat = time.monotonic()
+        self._suspect: Optional[Dict[str, Any]] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        self._stop = threading.Event()
+        self._watchdog: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start both probes on the running loop."""
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+        self._beat = time.monotonic()
+        self._task = self._loop.create_task(self._heartbeat(), name="verifimind-loop-monitor")
+        self._watchdog = threading.Thread(
+            target=self._watch, name="verifimind-loop-watchdog", daemon=True
+        )
+        self._watchdog.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._task is not None:
+            self._task.cancel()
+        if self._watchdog is not None:
+            self._watchdog.join(1.0)
+
+    async def _heartbeat(self) -> None:
+        interval = self.interval
+        while True:
+            started = time.monotonic()
+            self._beat = started
+            await asyncio.sleep(interval)
+            self.observe((time.monotonic() - started - interval) * 1000.0)
+
+    def observe(self, lag_ms: float) -> None:
+        """Record one heartbeat's lag; a lag past the threshold is a stall."""
+        lag_ms = max(lag_ms, 0.0)
+        self.samples += 1
+        self.total_ms += lag_ms
+        self.last_ms = lag_ms
+        self.max_ms = max(self.max_ms, lag_ms)
+        bucket = 0
+        while bucket < len(LAG_BUCKETS_MS) and lag_ms > LAG_BUCKETS_MS[bucket]:
+            bucket += 1
+        self.buckets[bucket] += 1
+
+        suspect, self._suspect = self._suspect, None
+        if lag_ms < self.slow_ms:
+            return
+        self.stalls += 1
+        stall = {
+            "blocked_ms": round(lag_ms, 1),
+            "at": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+            "task": suspect["task"] if suspect else None,
+            "stack": suspect["stack"] if suspect else [],
+        }
+        self.recent.append(stall)
+        logger.warning(
+            "Event loop blocked for %.0f ms (task=%s at %s)",
+            lag_ms, stall["task"], stall["stack"][-1] if stall["stack"] else "unknown",
+        )
+
+    def _watch(self) -> None:
+        overdue = self.interval + self.slow_ms / 1000.0
+        poll = max(self.slow_ms / 2000.0, 0.005)
+        while not self._stop.wait(poll):
+            if self._suspect is None and time.monotonic() - self._beat > overdue:
+                self._suspect = self._capture()
+
+    def _capture(self) -> Dict[str, Any]:
+        try:
+            task = asyncio.current_task(self._loop)
+        except RuntimeError:
+            task = None
+        frame = sys._current_frames().get(self._loop_thread)
+        return {"task": _describe_task(task), "stack": _describe_stack(frame)}
+
+    def _percentile_ms(self, fraction: float) -> Optional[float]:
+        """Upper bound of the bucket holding the given quantile (None if open)."""
+        if not self.samples:
+            return 0.0
+        target = self.samples * fraction
+        seen = 0
+        for bound, count in zip(LAG_BUCKETS_MS, self.buckets):
+            seen += count
+            if seen >= target:
+                return float(bound)
+        return None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": True,
+            "interval_ms": round(self.interval * 1000.0, 1),
+            "slow_callback_ms": self.slow_ms,
+            "samples": self.samples,
+            "lag_ms": {
+                "last": round(self.last_ms, 2),
+                "mean": round(self.total_ms / self.samples, 2) if self.samples else 0.0,
+                "max": round(self.max_ms, 2),
+                "p99_le": self._percentile_ms(0.99),
+            },
+            "histogram_ms": {
+                **{f"le_{bound}": count for bound, count in zip(LAG_BUCKETS_MS, self.buckets)},
+                "gt_{}".format(LAG_BUCKETS_MS[-1]): self.buckets[-1],
+            },
+            "slow_callbacks": self.stalls,
+            "recent_stalls": list(self.recent),
+        }
+
+
+_monitor: Optional[LoopMonitor] = None
+
+
+def start_loop_monitor() -> bool:
+    """Start monitoring the running loop. True when a monitor is active."""
+    global _monitor
+    if not loop_monitor_enabled():
+        return False
+    if _monitor is None:
+        monitor = LoopMonitor()
+        monitor.start()
+        _monitor = monitor
+    return True
+
+
+def stop_loop_monitor() -> None:
+    global _monitor
+    monitor, _monitor = _monitor, None
+    if monitor is not None:
+        monitor.stop()
+
+
+def get_loop_monitor_stats() -> Dict[str, Any]:
+    monitor = _monitor
+    if monitor is None:
+        return {"enabled": False}
+    return monitor.stats()
@@ -0,0 +1,193 @@
+"""Confidence-gated model cascade for hosted agent calls.
+
+Why this exists
+---------------
+Every agent call goes to the configured hosted model with a multi-thousand
+token budget, yet most concepts are unambiguous: a smaller model of the same
+family reaches the same structured verdict, confidently, at a fraction of the
+latency and quota. A cascade runs that draft model first and pays for the
+configured model only when the draft is not good enough to keep.
+
+Contract
+--------
+* Only hosted lanes cascade — providers marked by ``mark_hosted_failover`` in
+  ``get_agent_provider``. BYOK, session-config, operator-override, Ollama and
+  mock providers always call exactly the model the caller chose.
+* The draft model is ``<AGENT>_AGENT_DRAFT_MODEL`` on the family the hosted
+  lane resolved to. Unset (the default) means no cascade for that agent;
+  ``VERIFIMIND_MODEL_CASCADE=0`` disables every cascade.
+* The draft result is escalated to the configured model when it is not real
+  inference, when the schema had to be repaired or is incomplete, when its
+  confidence is below the agent's ``min_confidence``, when the draft call
+  failed, or — for agents with ``confirm_veto`` — when it triggers a Z veto
+  (a REJECT must rest on the configured model, never on the draft alone).
+  Thresholds live in ``config_helper.AGENT_CASCADE_POLICY``.
+* Every hop is disclosed in ``_provider_attempts``: the draft attempt is
+  tagged ``"cascade": "draft"`` with outcome ``success`` when kept or
+  ``cascade_escalated`` (plus ``escalation_reason``) when not, and
+  ``_model_cascade`` summarises the decision (emitted per agent next to
+  ``_provider_used`` / ``_providers_used``). A cascade never sets
+  ``_failover_occurred`` — escalation is not failover.
+* Draft providers are built once per (agent, family, draft model) and
+  reused, so a cascade does not pay SDK client construction on every call;
+  a failed construction is not cached.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import logging
+import os
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+CASCADE_ENV = "VERIFIMIND_MODEL_CASCADE"
+DRAFT_MODEL_ENV_SUFFIX = "_AGENT_DRAFT_MODEL"
+
+_draft_providers: Dict[Tuple[str, str, str], Any] = {}
+
+
+def model_cascade_enabled() -> bool:
+    return os.getenv(CASCADE_ENV, "1").strip().lower() not in (
+        "0", "false", "no", "off",
+    )
+
+
+def draft_model_for(agent_id: str) -> Optional[str]:
+    """The configured draft model for an agent, or None (no cascade)."""
+    return os.getenv(f"{agent_id}{DRAFT_MODEL_ENV_SUFFIX}", "").strip() or None
+
+
+def cascade_draft_provider(agent_id: str, provider: Any) -> Optional[Any]:
+    """Build the draft provider for a hosted agent lane, or None."""
+    from ..config_helper import AGENT_CASCADE_POLICY
+    from ..llm.failover import (
+        _provider_family,
+        _safe_model_name,
+        hosted_failover_agent,
+    )
+
+    if not model_cascade_enabled() or agent_id not in AGENT_CASCADE_POLICY:
+        return None
+    if hosted_failover_agent(provider) is None:
+        return None
+    draft_model = draft_model_for(agent_id)
+    if not draft_model:
+        return None
+    family = _provider_family(provider)
+    if _safe_model_name(provider) in (draft_model, f"{family}/{draft_model}"):
+        return None  # the lane already runs the draft model
+    key = (agent_id, family, draft_model)
+    cached = _draft_providers.get(key)
+    if cached is not None:
+        return cached
+    try:
+        from ..llm import get_provider
+        draft = get_provider(family, model=draft_model)
+    except Exception as exc:
+        logger.warning(
+            "cascade: draft construction failed agent=%s family=%s exception_type=%s",
+            agent_id,
+            family,
+            type(exc).__name__,
+        )
+        return None
+    _draft_providers[key] = draft
+    return draft
+
+
+def reset_draft_providers() -> None:
+    """Drop the cached draft providers (tests, configuration changes)."""
+    _draft_providers.clear()
+
+
+def escalation_reason(agent_id: str, result: Any) -> Optional[str]:
+    """Why a draft result must be re-run on the configured model, or None."""
+    from ..config_helper import AGENT_CASCADE_POLICY
+
+    policy = AGENT_CASCADE_POLICY.get(agent_id, {})
+    if getattr(result, "_inference_quality", "unknown") != "real":
+        return "draft_degraded"
+    if getattr(result, "_schema_repaired_fields", None) or getattr(
+        result, "_schema_incomplete_fields", None
+    ):
+        return "schema_repaired"
+    if result.confidence < policy.get("min_confidence", 0.0):
+        return "low_confidence"
+    if policy.get("confirm_veto") and getattr(result, "veto_triggered", False):
+        return "veto_confirmation"
+    return None
+
+
+def _attempt(provider: Any, outcome: str, duration_ms: int, **extra) -> Dict[str, Any]:
+    from ..llm.failover import _provider_family, _safe_model_name
+
+    entry = {
+        "provider": _provider_family(provider),
+        "model": _safe_model_name(provider),
+        "outcome_class": outcome,
+        "duration_ms": duration_ms,
+    }
+    entry.update(extra)
+    return entry
+
+
+async def analyze_with_cascade(
+    agent: Any,
+    draft_provider: Any,
+    concept: Any,
+    prior_reasoning: Any = None,
+    metrics: Any = None,
+) -> Any:
+    """Run ``agent`` on the draft model first; escalate per the policy."""
+    draft_agent = copy.copy(agent)
+    draft_agent.llm = draft_provider
+    started = time.monotonic()
+    try:
+        draft = await draft_agent._analyze(concept, prior_reasoning, metrics)
+        reason = escalation_reason(agent.AGENT_ID, draft)
+    except asyncio.CancelledError:
+        raise
+    except Exception as exc:
+        # A failed draft is not the caller's failure: the configured model
+        # still gets its full attempt below.
+        logger.info(
+            "cascade: draft call failed agent=%s exception_type=%s",
+            agent.AGENT_ID,
+            type(exc).__name__,
+        )
+        draft, reason = None, "draft_failed"
+    draft_ms = int((time.monotonic() - started) * 1000)
+    summary = {"draft_model": draft_provider.get_model_name(), "escalated": bool(reason)}
+
+    if reason is None:
+        draft._provider_attempts = [
+            _attempt(draft_provider, "success", draft_ms, cascade="draft")
+        ]
+        draft._model_cascade = summary
+        logger.info("cascade: agent %s kept draft result", agent.AGENT_ID)
+        return draft
+
+    summary["reason"] = reason
+    logger.info("cascade: agent %s escalated (%s)", agent.AGENT_ID, reason)
+    started = time.monotonic()
+    result = await agent._analyze(concept, prior_reasoning, metrics)
+    final_ms = int((time.monotonic() - started) * 1000)
+    attempts: List[Dict[str, Any]] = [
+        _attempt(
+            draft_provider, "cascade_escalated", draft_ms,
+            cascade="draft", escalation_reason=reason,
+        )
+    ]
+    # The failover executor (enabled path) already recorded the configured
+    # model's own attempts; otherwise record its single successful call.
+    attempts.extend(
+        getattr(result, "_provider_attempts", None)
+        or [_attempt(agent.llm, "success", final_ms, cascade="escalated")]
+    )
+    result._provider_attempts = attempts
+    result._model_cascade = summary
+    return result
@@ -0,0 +1,174 @@
+"""
+Executor offload for blocking and CPU-heavy work called from async code.
+
+Every MCP session shares one event loop, so a synchronous Firestore query, a
+history-file read or a large JSON extraction run inline stalls every other
+session for its whole duration. Call sites hand such work to one of two
+bounded pools instead:
+
+- ``run_in_thread(fn, *args, **kwargs)``: blocking I/O (sync SDK calls, file
+  reads, first-time library parses). A fixed thread pool; callers queue when
+  it is busy rather than spawning threads. The caller's contextvars are
+  carried over, as with ``asyncio.to_thread``.
+- ``run_cpu(fn, *args, cost=n)``: pure transforms of plain data (text in,
+  dicts out). With OFFLOAD_PROCESSES > 0 they run in a process pool (spawned
+  workers, so arguments and results must pickle and ``fn`` must be a
+  module- or class-level function); otherwise on the thread pool, which
+  still bounds the loop stall to the interpreter switch interval. ``cost`` is
+  the caller's size estimate — below CPU_OFFLOAD_MIN_COST the call runs
+  inline, since a pool hop costs more than small inputs take to process.
+
+Both pools are created on first use; ``shutdown_offload()`` (the HTTP
+server's lifespan) stops them. ``get_offload_stats()`` reports calls, inline
+runs, in-flight and peak concurrency, errors and cumulative seconds per pool.
+
+Environment:
+  OFFLOAD_THREADS       thread pool size (default 8)
+  OFFLOAD_PROCESSES     process pool size; 0 (default) keeps CPU work on threads
+  CPU_OFFLOAD_MIN_COST  run_cpu inline threshold for ``cost`` (default 16384)
+"""
+
+import asyncio
+import contextvars
+import functools
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+OFFLOAD_THREADS = int(os.getenv("OFFLOAD_THREADS", "8"))
+OFFLOAD_PROCESSES = int(os.getenv("OFFLOAD_PROCESSES", "0"))
+CPU_OFFLOAD_MIN_COST = int(os.getenv("CPU_OFFLOAD_MIN_COST", "16384"))
+
+
+class _PoolStats:
+    __slots__ = ("calls", "inline", "in_flight", "peak", "errors", "seconds")
+
+    def __init__(self):
+        self.calls = 0
+        self.inline = 0
+        self.in_flight = 0
+        self.peak = 0
+        self.errors = 0
+        self.seconds = 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "inline": self.inline,
+            "in_flight": self.in_flight,
+            "peak": self.peak,
+            "errors": self.errors,
+            "seconds": round(self.seconds, 3),
+        }
+
+
+_thread_pool: Optional[ThreadPoolExecutor] = None
+_process_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+_stats = {"thread": _PoolStats(), "process": _PoolStats()}
+
+
+def _threads() -> ThreadPoolExecutor:
+    global _thread_pool
+    pool = _thread_pool
+    if pool is None:
+        with _pool_lock:
+            if _thread_pool is None:
+                _thread_pool = ThreadPoolExecutor(
+                    max_workers=max(1, OFFLOAD_THREADS),
+                    thread_name_prefix="verifimind-offload",
+                )
+            pool = _thread_pool
+    return pool
+
+
+def _processes() -> Optional[ProcessPoolExecutor]:
+    global _process_pool
+    if OFFLOAD_PROCESSES <= 0:
+        return None
+    pool = _process_pool
+    if pool is None:
+        with _pool_lock:
+            if _process_pool is None:
+                # spawn, not fork: forking a process that runs threads (the
+                # log writer, this module's own pool) can copy held locks.
+                _process_pool = ProcessPoolExecutor(
+                    max_workers=OFFLOAD_PROCESSES,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            pool = _process_pool
+    return pool
+
+
+async def _submit(kind: str, pool: Executor, call: Callable[[], Any]) -> Any:
+    stats = _stats[kind]
+    stats.calls += 1
+    stats.in_flight += 1
+    stats.peak = max(stats.peak, stats.in_flight)
+    started = time.perf_counter()
+    try:
+        return await asyncio.get_running_loop().run_in_executor(pool, call)
+    except BaseException:
+        stats.errors += 1
+        raise
+    finally:
+        stats.in_flight -= 1
+        stats.seconds += time.perf_counter() - started
+
+
+async def run_in_thread(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run blocking ``fn`` on the bounded thread pool and await its result."""
+    context = contextvars.copy_context()
+    call = functools.partial(context.run, fn, *args, **kwargs)
+    return await _submit("thread", _threads(), call)
+
+
+async def run_cpu(fn: Callable[..., Any], *args: Any, cost: Optional[int] = None) -> Any:
+    """Run a pure CPU transform off the loop (inline when ``cost`` is small)."""
+    if cost is not None and cost < CPU_OFFLOAD_MIN_COST:
+        _stats["process" if OFFLOAD_PROCESSES > 0 else "thread"].inline += 1
+        return fn(*args)
+    pool = _processes()
+    if pool is None:
+        return await run_in_thread(fn, *args)
+    try:
+        return await _submit("process", pool, functools.partial(fn, *args))
+    except BrokenProcessPool:
+        logger.warning("CPU offload pool broke; rebuilding it and running this call on a thread")
+        _discard_process_pool(pool)
+        return await run_in_thread(fn, *args)
+
+
+def _discard_process_pool(pool: ProcessPoolExecutor) -> None:
+    global _process_pool
+    with _pool_lock:
+        if _process_pool is pool:
+            _process_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_offload(wait: bool = False) -> None:
+    """Stop both pools; the next offloaded call creates them again."""
+    global _thread_pool, _process_pool
+    with _pool_lock:
+        pools = (_thread_pool, _process_pool)
+        _thread_pool = _process_pool = None
+    for pool in pools:
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=True)
+
+
+def get_offload_stats() -> Dict[str, Any]:
+    """Per-pool offload counters (for /health)."""
+    return {
+        "threads": {"size": max(1, OFFLOAD_THREADS), **_stats["thread"].as_dict()},
+        "processes": {"size": max(0, OFFLOAD_PROCESSES), **_stats["process"].as_dict()},
+        "cpu_min_cost": CPU_OFFLOAD_MIN_COST,
+    }
@@ -1,11 +1,11 @@
 """Privacy-safe provider failure contracts for Trinity and standalone tools."""
 
-import json
 import re
-import sys
 from typing import Any, Optional
 
 from ..llm.failover import FailoverExhaustedError, FailoverTerminalError
+from .deadline import RequestDeadlineExceeded
+from .log_pipeline import emit_json
 
 
 _DIAGNOSTIC_VALUE_ALLOWED = re.compile(r"[^A-Za-z0-9._:/-]")
@@ -97,6 +97,17 @@ def provider_failure_contract(
             "retry_after_seconds": None,
         }
 
+    if isinstance(exc, RequestDeadlineExceeded):
+        return {
+            "error_code": "REQUEST_DEADLINE_EXCEEDED",
+            "message": "This stage could not finish within the request deadline.",
+            "recovery_hint": (
+                "Retry with a larger deadline_seconds, or use a lower-latency provider."
+            ),
+            "retryable": True,
+            "retry_after_seconds": None,
+        }
+
     status = _provider_status_code(exc)
     exception_name = type(exc).__name__.lower()
     try:
@@ -323,11 +334,7 @@ def emit_structured_failure(
         "exception_type": safe_diagnostic_value(type(exc).__name__),
         "retryable": retryable,
     }
-    print(
-        json.dumps({key: value for key, value in event.items() if value is not None}),
-        file=sys.stderr,
-        flush=True,
-    )
+    emit_json({key: value for key, value in event.items() if value is not None})
 
 
 def emit_trinity_run_event(
@@ -360,11 +367,11 @@ def emit_trinity_run_event(
             payload[key] = [safe_diagnostic_value(item) for item in value]
         else:
             payload[key] = safe_diagnostic_value(value)
-    print(json.dumps(payload), file=sys.stderr, flush=True)
+    emit_json(payload)
 
 
-def unavailable_agent_result(agent_id: str, exc: Exception):
-    """Create an internal placeholder that synthesis must treat as unavailable."""
+def _placeholder_agent_result(agent_id: str):
+    """Zero-valued analysis for a stage that produced no real inference."""
     from ..models import XAgentAnalysis, ZAgentAnalysis, CSAgentAnalysis
 
     if agent_id == "X":
@@ -399,10 +406,15 @@ def unavailable_agent_result(agent_id: str, exc: Exception):
             recommendation="Analysis unavailable.",
             confidence=0.0,
         )
-
-    result._inference_quality = "unavailable"
     result._schema_repaired_fields = []
     result._schema_incomplete_fields = []
+    return result
+
+
+def unavailable_agent_result(agent_id: str, exc: Exception):
+    """Create an internal placeholder that synthesis must treat as unavailable."""
+    result = _placeholder_agent_result(agent_id)
+    result._inference_quality = "unavailable"
     if isinstance(exc, (FailoverExhaustedError, FailoverTerminalError)):
         result._provider_attempts = list(getattr(exc, "attempts", []))
         result._failover_occurred = bool(getattr(exc, "hop_executed", False))
@@ -410,6 +422,21 @@ def unavailable_agent_result(agent_id: str, exc: Exception):
     return result
 
 
+def skipped_agent_result(agent_id: str):
+    """Placeholder for a stage deliberately not run (Z-veto short-circuit).
+
+    Synthesis treats ``skipped`` like any other non-real quality — the stage
+    is degraded, so its scores and findings never reach the verdict — and
+    additionally reports it as skipped rather than failed.
+    """
+    from .synthesis import SKIPPED_INFERENCE_QUALITY
+
+    result = _placeholder_agent_result(agent_id)
+    result.recommendation = "Analysis skipped."
+    result._inference_quality = SKIPPED_INFERENCE_QUALITY
+    return result
+
+
 def trinity_stage_failure(
     *,
     agent_id: str,
@@ -145,6 +145,16 @@ def build_reasoning_block(
         result: Any,
     ) -> Dict[str, Any]:
         quality = chain_status.get(quality_key, "unknown")
+        if quality == "skipped":
+            return {
+                "withheld": True,
+                "skipped": True,
+                "quality": quality,
+                "reason": (
+                    "This stage was not run: on_veto='short_circuit' stopped "
+                    "the chain after a real Z veto."
+                ),
+            }
         if quality != "real":
             return {
                 "withheld": True,
@@ -169,3 +179,106 @@ def build_reasoning_block(
             "warning": inference_warning,
         },
     }
+
+
+# ---------------------------------------------------------------------------
+# Field projection — the `fields` parameter.
+#
+# `detail` decides how much reasoning is BUILT; `fields` decides how much of
+# the built payload is RETURNED. Automated clients that only read scores pass
+# JSON-pointer paths (RFC 6901, e.g. "/synthesis/overall_score",
+# "/scores/x") and the response is pruned before it is serialized. The
+# quality/honesty envelope (PROJECTION_ALWAYS_KEPT) survives every projection
+# so a pruned response can never hide that its scores are withheld or
+# degraded — including a partial run's failed, retried or skipped stages, its
+# deadline and its triage decision. Error payloads are never projected. Unknown or malformed paths are
+# reported under `_fields`, never an error — like an unknown `detail` value.
+# ---------------------------------------------------------------------------
+
+PROJECTION_ALWAYS_KEPT = (
+    "error",
+    "error_code",
+    "analysis_incomplete",
+    "_inference_quality",
+    "_overall_quality",
+    "_warning",
+    "_system_notice",
+    "_server_version",
+    "status",
+    "_stage_errors",
+    "_agents_failed",
+    "_stage_retries",
+    "_stages_skipped",
+    "_on_veto",
+    "_deadline",
+    "_triage",
+)
+MAX_PROJECTION_FIELDS = 64
+
+_MISSING = object()
+
+
+def _parse_pointer(pointer: str) -> Optional[List[str]]:
+    """RFC 6901 pointer → reference tokens; None when malformed or root."""
+    if not isinstance(pointer, str) or not pointer.startswith("/") or pointer == "/":
+        return None
+    return [
+        token.replace("~1", "/").replace("~0", "~")
+        for token in pointer[1:].split("/")
+    ]
+
+
+def normalize_fields(fields: Any) -> Optional[List[str]]:
+    """Coerce the `fields` argument to a list of pointers; None = no projection.
+
+    Accepts a list of pointers or one comma-separated string.
+    """
+    if not fields:
+        return None
+    if isinstance(fields, str):
+        fields = fields.split(",")
+    normalized = [str(f).strip() for f in fields if str(f).strip()]
+    return normalized[:MAX_PROJECTION_FIELDS] or None
+
+
+def _resolve(node: Any, tokens: List[str]) -> Any:
+    for token in tokens:
+        if isinstance(node, dict):
+            node = node.get(token, _MISSING)
+        elif isinstance(node, list) and token.isdigit() and int(token) < len(node):
+            node = node[int(token)]
+        else:
+            return _MISSING
+        if node is _MISSING:
+            return _MISSING
+    return node
+
+
+def _place(target: Dict[str, Any], tokens: List[str], value: Any) -> None:
+    # Array indices are rebuilt as object keys: the projection is a sparse
+    # view, and a list with holes would misstate the source's positions.
+    for token in tokens[:-1]:
+        child = target.get(token)
+        if not isinstance(child, dict):
+            child = target[token] = {}
+        target = child
+    target[tokens[-1]] = value
+
+
+def project_fields(payload: Dict[str, Any], fields: Optional[List[str]]) -> Dict[str, Any]:
+    """Return only the requested pointers of ``payload`` (plus the envelope)."""
+    if not fields or not isinstance(payload, dict) or "error" in payload:
+        return payload
+    projected: Dict[str, Any] = {
+        key: payload[key] for key in PROJECTION_ALWAYS_KEPT if key in payload
+    }
+    missing: List[str] = []
+    for pointer in fields:
+        tokens = _parse_pointer(pointer)
+        value = _MISSING if tokens is None else _resolve(payload, tokens)
+        if value is _MISSING:
+            missing.append(pointer)
+        else:
+            _place(projected, tokens, value)
+    projected["_fields"] = {"requested": list(fields), "missing": missing}
+    return projected
@@ -50,6 +50,44 @@ COMPILED_INJECTION_PATTERNS = [
     re.compile(pattern, re.IGNORECASE) for pattern in PROMPT_INJECTION_PATTERNS
 ]
 
+
+def _literal_prefix(pattern: str) -> str:
+    """
+    Lower-cased literal text every match of ``pattern`` must start with.
+
+    Reads escaped punctuation and plain characters up to the first regex
+    construct; a character made optional by a following quantifier is dropped.
+    """
+    prefix = []
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\" and i + 1 < len(pattern) and not pattern[i + 1].isalnum():
+            literal, step = pattern[i + 1], 2
+        elif char in ".^$*+?{}[]|()\\":
+            break
+        else:
+            literal, step = char, 1
+        if pattern[i + step:i + step + 1] in ("?", "*", "{"):
+            break
+        prefix.append(literal)
+        i += step
+    return "".join(prefix).lower()
+
+
+# Per family, a literal the text must contain for the regex to possibly
+# match. Scanning one lower-cased copy with ``in`` (a C substring search) lets
+# clean text skip the case-insensitive regex scans entirely.
+INJECTION_ANCHORS = [_literal_prefix(pattern) for pattern in PROMPT_INJECTION_PATTERNS]
+
+# Non-ASCII characters that re.IGNORECASE matches against ASCII letters but
+# str.lower() does not map to them (KELVIN SIGN already lowers to "k").
+_CASE_FOLD_TABLE = str.maketrans({
+    '\u0130': 'i',  # LATIN CAPITAL LETTER I WITH DOT ABOVE
+    '\u0131': 'i',  # LATIN SMALL LETTER DOTLESS I
+    '\u017f': 's',  # LATIN SMALL LETTER LONG S
+})
+
 # Characters that should be escaped or removed
 DANGEROUS_CHARS = {
     '\x00': '',  # Null byte
@@ -57,6 +95,16 @@ DANGEROUS_CHARS = {
     '\x0c': '',  # Form feed
     '\x1b': '',  # Escape character
 }
+_DANGEROUS_TABLE = str.maketrans(DANGEROUS_CHARS)
+
+# Every character ``\s`` matches apart from the plain space and newline.
+# Text with none of these and no double space is already normalized, so the
+# collapse regex only runs on input it will actually change.
+_ODD_WHITESPACE = re.compile(
+    '[\t\x0b\x0c\r\x1c-\x1f\x85\xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000]'
+)
+_HORIZONTAL_WHITESPACE = re.compile(r'[^\S\n]+')
+_EXCESS_NEWLINES = re.compile(r'\n{3,}')
 
 
 class SanitizationError(Exception):
@@ -83,9 +131,7 @@ class SanitizationResult:
 
 def remove_dangerous_chars(text: str) -> str:
     """Remove potentially dangerous control characters."""
-    for char, replacement in DANGEROUS_CHARS.items():
-        text = text.replace(char, replacement)
-    return text
+    return text.translate(_DANGEROUS_TABLE)
 
 
 def detect_prompt_injection(text: str) -> List[str]:
@@ -94,11 +140,12 @@ def detect_prompt_injection(text: str) -> List[str]:
     
     Returns list of detected patterns (empty if none found).
     """
-    detected = []
-    for pattern in COMPILED_INJECTION_PATTERNS:
-        if pattern.search(text):
-            detected.append(pattern.pattern)
-    return detected
+    folded = text.translate(_CASE_FOLD_TABLE).lower()
+    return [
+        pattern.pattern
+        for pattern, anchor in zip(COMPILED_INJECTION_PATTERNS, INJECTION_ANCHORS)
+        if anchor in folded and pattern.search(text)
+    ]
 
 
 def sanitize_html(text: str) -> str:
@@ -119,9 +166,11 @@ def normalize_whitespace(text: str) -> str:
     - Collapses multiple newlines to double newline
     """
     # Collapse multiple spaces (not newlines) to single space
-    text = re.sub(r'[^\S\n]+', ' ', text)
+    if '  ' in text or _ODD_WHITESPACE.search(text):
+        text = _HORIZONTAL_WHITESPACE.sub(' ', text)
     # Collapse 3+ newlines to double newline
-    text = re.sub(r'\n{3,}', '\n\n', text)
+    if '\n\n\n' in text:
+        text = _EXCESS_NEWLINES.sub('\n\n', text)
     return text.strip()
 
 
@@ -140,48 +189,67 @@ def truncate_with_notice(text: str, max_length: int, field_name: str) -> tuple[s
     return truncated, True
 
 
-def sanitize_concept_name(name: str) -> SanitizationResult:
+def _sanitize_free_text(
+    text: str,
+    noun: str,
+    log_label: str,
+    field_name: str,
+    max_length: int,
+) -> SanitizationResult:
     """
-    Sanitize concept name input.
-    
-    - Removes dangerous characters
-    - Escapes HTML
-    - Checks for prompt injection
-    - Enforces length limit
+    Shared pipeline for the free-text fields (name, description, context).
+
+    Each stage runs once: control-character strip, whitespace normalization,
+    injection scan, HTML escape, truncation. ``was_modified`` compares the
+    escaped value with the normalized value already in hand.
     """
     warnings = []
     was_modified = False
     
     # Remove dangerous chars
-    cleaned = remove_dangerous_chars(name)
-    if cleaned != name:
+    cleaned = remove_dangerous_chars(text)
+    if cleaned != text:
         was_modified = True
-        warnings.append("Removed control characters from name")
+        warnings.append(f"Removed control characters from {noun}")
     
     # Normalize whitespace
-    cleaned = normalize_whitespace(cleaned)
+    normalized = normalize_whitespace(cleaned)
     
     # Check for prompt injection
-    injections = detect_prompt_injection(cleaned)
+    injections = detect_prompt_injection(normalized)
     if injections:
         warnings.append(f"Potential prompt injection detected: {len(injections)} patterns")
-        logger.warning(f"Prompt injection patterns in concept name: {injections}")
+        logger.warning(f"Prompt injection patterns in {log_label}: {injections}")
         # We log but don't block - the LLM should handle this with proper system prompts
     
     # Escape HTML
-    cleaned = sanitize_html(cleaned)
-    if cleaned != normalize_whitespace(remove_dangerous_chars(name)):
+    cleaned = sanitize_html(normalized)
+    if cleaned != normalized:
         was_modified = True
     
     # Truncate if needed
-    cleaned, truncated = truncate_with_notice(cleaned, MAX_CONCEPT_NAME_LENGTH, "concept_name")
+    cleaned, truncated = truncate_with_notice(cleaned, max_length, field_name)
     if truncated:
         was_modified = True
-        warnings.append(f"Name truncated to {MAX_CONCEPT_NAME_LENGTH} characters")
+        warnings.append(f"{noun.capitalize()} truncated to {max_length} characters")
     
     return SanitizationResult(cleaned, was_modified, warnings)
 
 
+def sanitize_concept_name(name: str) -> SanitizationResult:
+    """
+    Sanitize concept name input.
+    
+    - Removes dangerous characters
+    - Escapes HTML
+    - Checks for prompt injection
+    - Enforces length limit
+    """
+    return _sanitize_free_text(
+        name, "name", "concept name", "concept_name", MAX_CONCEPT_NAME_LENGTH
+    )
+
+
 def sanitize_description(description: str) -> SanitizationResult:
     """
     Sanitize concept description input.
@@ -191,36 +259,9 @@ def sanitize_description(description: str) -> SanitizationResult:
     - Checks for prompt injection
     - Enforces length limit
     """
-    warnings = []
-    was_modified = False
-    
-    # Remove dangerous chars
-    cleaned = remove_dangerous_chars(description)
-    if cleaned != description:
-        was_modified = True
-        warnings.append("Removed control characters from description")
-    
-    # Normalize whitespace
-    cleaned = normalize_whitespace(cleaned)
-    
-    # Check for prompt injection
-    injections = detect_prompt_injection(cleaned)
-    if injections:
-        warnings.append(f"Potential prompt injection detected: {len(injections)} patterns")
-        logger.warning(f"Prompt injection patterns in description: {injections}")
-    
-    # Escape HTML
-    cleaned = sanitize_html(cleaned)
-    if cleaned != normalize_whitespace(remove_dangerous_chars(description)):
-        was_modified = True
-    
-    # Truncate if needed
-    cleaned, truncated = truncate_with_notice(cleaned, MAX_DESCRIPTION_LENGTH, "description")
-    if truncated:
-        was_modified = True
-        warnings.append(f"Description truncated to {MAX_DESCRIPTION_LENGTH} characters")
-    
-    return SanitizationResult(cleaned, was_modified, warnings)
+    return _sanitize_free_text(
+        description, "description", "description", "description", MAX_DESCRIPTION_LENGTH
+    )
 
 
 def sanitize_category(category: str) -> SanitizationResult:
@@ -259,36 +300,9 @@ def sanitize_context(context: str) -> SanitizationResult:
     
     Context provides additional information about the concept.
     """
-    warnings = []
-    was_modified = False
-    
-    # Remove dangerous chars
-    cleaned = remove_dangerous_chars(context)
-    if cleaned != context:
-        was_modified = True
-        warnings.append("Removed control characters from context")
-    
-    # Normalize whitespace
-    cleaned = normalize_whitespace(cleaned)
-    
-    # Check for prompt injection
-    injections = detect_prompt_injection(cleaned)
-    if injections:
-        warnings.append(f"Potential prompt injection detected: {len(injections)} patterns")
-        logger.warning(f"Prompt injection patterns in context: {injections}")
-    
-    # Escape HTML
-    cleaned = sanitize_html(cleaned)
-    if cleaned != normalize_whitespace(remove_dangerous_chars(context)):
-        was_modified = True
-    
-    # Truncate if needed
-    cleaned, truncated = truncate_with_notice(cleaned, MAX_CONTEXT_LENGTH, "context")
-    if truncated:
-        was_modified = True
-        warnings.append(f"Context truncated to {MAX_CONTEXT_LENGTH} characters")
-    
-    return SanitizationResult(cleaned, was_modified, warnings)
+    return _sanitize_free_text(
+        context, "context", "context", "context", MAX_CONTEXT_LENGTH
+    )
 
 
 def sanitize_concept_input(
@@ -0,0 +1,173 @@
+"""In-flight coalescing (single-flight) for identical agent provider calls.
+
+Why this exists
+---------------
+An MCP host that times out and retries ``consult_agent_x`` or
+``run_full_trinity``, or several users submitting the same demo concept at
+once, would otherwise each issue their own provider call — multiplying quota
+use exactly when the hosted tier is already rate-limited. While one call for a
+given key is in flight, every identical call awaits that same call instead.
+
+Contract
+--------
+* The key is a digest of the agent, the provider class and model, the fully
+  rendered prompt (sanitized concept, prior reasoning, template text — so a
+  prompt or template change is a different key), the generation parameters,
+  and a keyed fingerprint of the provider's API key. Two BYOK callers with
+  different keys never share a call; the raw key never enters the key.
+* Only *concurrent* calls are coalesced. Nothing is cached: the entry is
+  removed the moment the shared call settles, so a later retry (including
+  ``analyze_with_completion_retry``) always reaches the provider afresh.
+* The shared call runs in its own task, in an empty context: it belongs to
+  no caller, so no caller's request state (``X-VerifiMind-Deadline``, job,
+  headers) applies to it. Each waiter bounds its own wait instead — the agent
+  path by its own request deadline — so joiners with different deadlines
+  are each cut off exactly when they would have been alone.
+* A waiter that is cancelled (client disconnect, deadline) detaches without
+  cancelling the shared call; only when the LAST waiter has gone is the
+  orphaned call cancelled, so no work runs for nobody.
+* Every waiter receives its own shallow copy of the provider response, and
+  a failure is re-raised to every waiter, exactly as if each had made the
+  call alone.
+* ``VERIFIMIND_SINGLE_FLIGHT=0`` disables coalescing entirely.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import hashlib
+import hmac
+import logging
+import os
+import secrets
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+SINGLE_FLIGHT_ENV = "VERIFIMIND_SINGLE_FLIGHT"
+
+# Process-local HMAC key for API-key fingerprints: stable for the life of the
+# instance (so equal keys coalesce) and never persisted or emitted.
+_FINGERPRINT_KEY = secrets.token_bytes(32)
+
+
+def single_flight_enabled() -> bool:
+    return os.getenv(SINGLE_FLIGHT_ENV, "1").strip().lower() not in (
+        "0", "false", "no", "off",
+    )
+
+
+def key_fingerprint(api_key: Optional[str]) -> str:
+    """Non-reversible, instance-local fingerprint of a provider API key."""
+    if not api_key:
+        return "-"
+    return hmac.new(
+        _FINGERPRINT_KEY, str(api_key).encode("utf-8"), hashlib.sha256
+    ).hexdigest()
+
+
+def agent_call_key(
+    *,
+    agent_id: str,
+    provider: Any,
+    prompt: str,
+    temperature: float,
+    max_tokens: int,
+) -> str:
+    """Coalescing key for one agent provider call (see module contract)."""
+    parts = (
+        agent_id,
+        type(provider).__name__,
+        provider.get_model_name(),
+        str(getattr(provider, "base_url", "") or ""),
+        key_fingerprint(getattr(provider, "api_key", None)),
+        repr(temperature),
+        repr(max_tokens),
+        prompt,
+    )
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+class _Flight:
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Per-key coalescing of concurrent awaitables on one event loop."""
+
+    def __init__(self) -> None:
+        self._flights: Dict[str, _Flight] = {}
+        self.coalesced = 0
+
+    def in_flight(self) -> int:
+        return len(self._flights)
+
+    def is_in_flight(self, key: str) -> bool:
+        flight = self._flights.get(key)
+        return flight is not None and not flight.task.done()
+
+    def forget(self, key: str) -> None:
+        """Detach the in-flight call for ``key``: its current waiters still get
+        its result, but the next caller starts a fresh call."""
+        self._flights.pop(key, None)
+
+    async def do(self, key: str, call: Callable[[], Awaitable[Any]]) -> Any:
+        flight = self._flights.get(key)
+        loop = asyncio.get_running_loop()
+        if (
+            flight is None
+            or flight.task.done()
+            or flight.task.get_loop() is not loop
+        ):
+            task = loop.create_task(call(), context=contextvars.Context())
+            flight = _Flight(task)
+            self._flights[key] = flight
+            task.add_done_callback(lambda _t, k=key, f=flight: self._settle(k, f))
+        else:
+            self.coalesced += 1
+            logger.debug("single-flight: joined in-flight call key=%s", key[:12])
+
+        flight.waiters += 1
+        try:
+            result = await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            if not flight.task.done() and flight.waiters == 1:
+                # Last interested caller left: nobody can receive the result.
+                flight.task.cancel()
+            raise
+        finally:
+            flight.waiters -= 1
+        return dict(result) if isinstance(result, dict) else result
+
+    def _settle(self, key: str, flight: _Flight) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+        # A cancelled or failed flight nobody awaited must not log
+        # "exception was never retrieved" noise.
+        if not flight.task.cancelled():
+            flight.task.exception()
+
+
+_single_flight: Optional[SingleFlight] = None
+
+
+def get_single_flight() -> SingleFlight:
+    global _single_flight
+    if _single_flight is None:
+        _single_flight = SingleFlight()
+    return _single_flight
+
+
+def reset_single_flight() -> None:
+    """Drop the singleton (tests)."""
+    global _single_flight
+    _single_flight = None
@@ -20,6 +20,9 @@ from ..models import (
 
 
 REAL_INFERENCE_QUALITY = "real"
+# A stage deliberately not run (on_veto="short_circuit" after a real Z veto).
+# It is degraded like any non-real stage; it is only reported differently.
+SKIPPED_INFERENCE_QUALITY = "skipped"
 
 
 def _is_degraded_quality(quality: str) -> bool:
@@ -35,6 +38,14 @@ def _degraded_agent_ids(quality_by_agent: Dict[str, str]) -> Set[str]:
     }
 
 
+def _skipped_agent_ids(quality_by_agent: Dict[str, str]) -> Set[str]:
+    return {
+        agent_id
+        for agent_id, quality in quality_by_agent.items()
+        if quality == SKIPPED_INFERENCE_QUALITY
+    }
+
+
 def calculate_overall_score(
     x_result: XAgentAnalysis,
     z_result: ZAgentAnalysis,
@@ -165,9 +176,11 @@ def synthesize_concerns(
     z_result: ZAgentAnalysis,
     cs_result: CSAgentAnalysis,
     degraded_agents: Optional[Set[str]] = None,
+    skipped_agents: Optional[Set[str]] = None,
 ) -> List[str]:
     """Extract and synthesize key concerns from all analyses."""
     degraded_agents = degraded_agents or set()
+    skipped_agents = skipped_agents or set()
     concerns = []
     
     # From X: Risks
@@ -190,7 +203,10 @@ def synthesize_concerns(
             concerns.append(f"Security: {vuln}")
 
     for agent_id in sorted(degraded_agents):
-        concerns.insert(0, f"{agent_id} analysis incomplete — human review required")
+        if agent_id in skipped_agents:
+            concerns.insert(0, f"{agent_id} analysis skipped after Z veto — human review required")
+        else:
+            concerns.insert(0, f"{agent_id} analysis incomplete — human review required")
     
     return concerns[:5]  # Limit to top 5
 
@@ -240,6 +256,7 @@ def build_founder_summary(
     cs_result: CSAgentAnalysis,
     degraded_agents: Optional[Set[str]] = None,
     trusted_veto: Optional[bool] = None,
+    skipped_agents: Optional[Set[str]] = None,
 ) -> dict:
     """
     Build a plain-language founder summary — no jargon, actionable guidance.
@@ -248,6 +265,7 @@ def build_founder_summary(
     founder or first-time entrepreneur can read and act on immediately.
     """
     degraded_agents = degraded_agents or set()
+    skipped_agents = skipped_agents or set()
     if trusted_veto is None:
         trusted_veto = (
             "Z" not in degraded_agents and bool(z_result.veto_triggered)
@@ -304,7 +322,10 @@ def build_founder_summary(
             things_to_address.append(vuln)
     for agent_id in sorted(degraded_agents):
         things_to_address.insert(
-            0, f"{agent_id} did not complete a trustworthy analysis."
+            0,
+            f"{agent_id} was not run because the ethics veto already decided the outcome."
+            if agent_id in skipped_agents
+            else f"{agent_id} did not complete a trustworthy analysis.",
         )
 
     # Next steps (from X if available, else synthesized)
@@ -347,13 +368,15 @@ def build_founder_summary(
 def create_synthesis(
     x_result: XAgentAnalysis,
     z_result: ZAgentAnalysis,
-    cs_result: CSAgentAnalysis
+    cs_result: CSAgentAnalysis,
+    analysis_grade: str = "full",
 ) -> TrinitySynthesis:
     """
     Create a complete synthesis from all three agent analyses.
 
     This is the core synthesis function that combines all perspectives
-    into a unified assessment.
+    into a unified assessment. ``analysis_grade="triage"`` applies the same
+    rules but labels the result as a single-call screen.
     """
     quality_by_agent = {
         "X": getattr(x_result, "_inference_quality", "unknown"),
@@ -361,6 +384,7 @@ def create_synthesis(
         "CS": getattr(cs_result, "_inference_quality", "unknown"),
     }
     degraded_agents = _degraded_agent_ids(quality_by_agent)
+    skipped_agents = _skipped_agent_ids(quality_by_agent)
 
     calculated_score = calculate_overall_score(
         x_result,
@@ -379,8 +403,20 @@ def create_synthesis(
         cs_quality=quality_by_agent["CS"],
     )
 
+    trusted_veto = "Z" not in degraded_agents and z_result.veto_triggered
+    # Only a trusted veto can justify a skip; a skip without one is treated
+    # as plain degradation so the warning below never claims a veto.
+    short_circuit = "z_veto" if skipped_agents and trusted_veto else None
+
     inference_warning = None
-    if degraded_agents:
+    if short_circuit and degraded_agents == skipped_agents:
+        inference_warning = (
+            f"{', '.join(sorted(skipped_agents))} was skipped because a real Z veto "
+            "had already decided the outcome (on_veto='short_circuit'). The REJECT "
+            "verdict rests on the Z veto alone; the aggregate score and confidence "
+            "have been withheld and a human must review before acting on it."
+        )
+    elif degraded_agents:
         quality_details = ", ".join(
             f"{agent_id}='{quality_by_agent[agent_id]}'"
             for agent_id in sorted(degraded_agents)
@@ -396,10 +432,12 @@ def create_synthesis(
     # Build summary
     summary_parts = []
 
+    if analysis_grade == "triage":
+        summary_parts.append("TRIAGE-GRADE screen (single compact call)")
+
     if inference_warning:
         summary_parts.append("⚠️ DEGRADED TRINITY INFERENCE — human review required")
 
-    trusted_veto = "Z" not in degraded_agents and z_result.veto_triggered
     if trusted_veto:
         summary_parts.append("VETO TRIGGERED by Z Guardian.")
         summary_parts.append(f"Reason: {z_result.ethical_concerns[0] if z_result.ethical_concerns else 'Ethical red line crossed'}")
@@ -417,7 +455,9 @@ def create_synthesis(
         else f"Ethics: {z_result.ethics_score}/10"
     )
     summary_parts.append(
-        "Security: unavailable"
+        "Security: skipped"
+        if "CS" in skipped_agents
+        else "Security: unavailable"
         if "CS" in degraded_agents
         else f"Security: {cs_result.security_score}/10"
     )
@@ -441,6 +481,7 @@ def create_synthesis(
         cs_result,
         degraded_agents,
         trusted_veto=trusted_veto,
+        skipped_agents=skipped_agents,
     )
     # Surface the degraded-inference caveat at the top of the founder verdict too
     if inference_warning and isinstance(founder_summary, dict):
@@ -466,7 +507,7 @@ def create_synthesis(
             x_result, z_result, cs_result, degraded_agents
         ),
         concerns=synthesize_concerns(
-            x_result, z_result, cs_result, degraded_agents
+            x_result, z_result, cs_result, degraded_agents, skipped_agents
         ),
         recommendations=synthesize_recommendations(
             x_result, z_result, cs_result, degraded_agents
@@ -476,6 +517,9 @@ def create_synthesis(
         confidence_valid=not degraded_agents,
         analysis_incomplete=bool(degraded_agents),
         degraded_agents=sorted(degraded_agents),
+        skipped_agents=sorted(skipped_agents),
+        short_circuit=short_circuit,
+        analysis_grade=analysis_grade,
         quality_gate={
             "passed": not degraded_agents,
             "required_quality": REAL_INFERENCE_QUALITY,
@@ -500,7 +544,8 @@ def create_trinity_result(
     concept_description: str,
     x_result: XAgentAnalysis,
     z_result: ZAgentAnalysis,
-    cs_result: CSAgentAnalysis
+    cs_result: CSAgentAnalysis,
+    analysis_grade: str = "full",
 ) -> TrinityResult:
     """
     Create a complete Trinity validation result.
@@ -508,7 +553,9 @@ def create_trinity_result(
     This is the main function called by run_full_trinity to
     package all results into a single response.
     """
-    synthesis = create_synthesis(x_result, z_result, cs_result)
+    synthesis = create_synthesis(
+        x_result, z_result, cs_result, analysis_grade=analysis_grade
+    )
     
     return TrinityResult(
         validation_id=str(uuid.uuid4())[:8],
@@ -0,0 +1,61 @@
+"""Triage-grade Trinity screening: boundary escalation rules.
+
+Why this exists
+---------------
+A full Trinity run is three long chain-of-thought calls. Portfolio
+pre-screening needs a cheaper first pass: ``run_full_trinity(mode="triage")``
+asks one compact call for the X/Z/CS scores, veto flag and top concerns
+(``TriageAnalysis``), expands them into the three agent analyses and runs the
+UNCHANGED synthesis rules — so the quality gate, the degraded-verdict cap and
+the trusted-veto REJECT all apply exactly as in a full run.
+
+A compact screen is least trustworthy exactly where its verdict is closest to
+flipping. When the synthesized score sits within ``TRIAGE_ESCALATION_MARGIN``
+of a recommendation threshold, the run escalates to the full chain instead
+of returning a triage verdict. Verdicts that triage cannot improve on are
+returned as-is:
+
+* a trusted Z veto (REJECT is decisive regardless of score);
+* a degraded triage call (no score to compare; the result is already capped
+  at REVISE and a full run would hit the same unavailable provider).
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Optional
+
+from ..models import TrinitySynthesis
+
+TRIAGE_MODE = "triage"
+FULL_MODE = "full"
+
+# Overall-score thresholds of synthesis.determine_recommendation
+# (reject < 4.0 <= revise < 5.5 <= caution < 7.5 <= proceed).
+RECOMMENDATION_THRESHOLDS = (4.0, 5.5, 7.5)
+# Below this CS score the verdict is forced to REVISE.
+SECURITY_REVISE_THRESHOLD = 4.0
+TRIAGE_ESCALATION_MARGIN = float(os.getenv("VERIFIMIND_TRIAGE_ESCALATION_MARGIN", "0.5"))
+
+
+def normalize_mode(mode) -> str:
+    """Unknown values behave as a full run."""
+    return TRIAGE_MODE if str(mode or "").strip().lower() == TRIAGE_MODE else FULL_MODE
+
+
+def triage_escalation_reason(
+    synthesis: TrinitySynthesis,
+    margin: float = TRIAGE_ESCALATION_MARGIN,
+) -> Optional[str]:
+    """Why a triage verdict should be confirmed by the full chain, or None."""
+    if synthesis.analysis_incomplete or synthesis.overall_score is None:
+        return None
+    if synthesis.veto_triggered:
+        return None
+    for threshold in RECOMMENDATION_THRESHOLDS:
+        if abs(synthesis.overall_score - threshold) <= margin:
+            return f"overall_score {synthesis.overall_score} within {margin} of {threshold}"
+    security = synthesis.security_score
+    if security is not None and abs(security - SECURITY_REVISE_THRESHOLD) <= margin:
+        return f"security_score {security} within {margin} of {SECURITY_REVISE_THRESHOLD}"
+    return None
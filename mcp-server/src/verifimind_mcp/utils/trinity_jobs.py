@@ -0,0 +1,281 @@
+"""Detached Trinity jobs — submit now, poll for the result later.
+
+Why this exists
+---------------
+A synchronous ``run_full_trinity`` holds the caller's HTTP connection open for
+the whole X → Z → CS chain, plus the shared-provider stagger, plus up to
+``RETRY_SLEEP_BUDGET_SECONDS`` of provider-stated retry waits. MCP hosts such
+as mcp-remote time the call out well before that worst case, and the completed
+analysis is then discarded with nobody left to receive it. In the detached
+mode the connection lives only as long as a submit or a short poll; the run
+itself executes on an in-process worker pool and its payload is retained
+under a TTL for the caller to collect.
+
+Contract
+--------
+* ``submit`` returns immediately with an unguessable job id. The id is the
+  only handle to the result — there is no listing surface — so possession of
+  the id is the read capability, exactly like the payload the caller would
+  have received synchronously.
+* Work is queued, not rejected, up to ``TRINITY_JOB_QUEUE_LIMIT`` pending
+  jobs; beyond that ``submit`` raises ``TrinityJobQueueFull`` so the handler
+  can return an honest, retryable error instead of an unbounded backlog.
+* At most ``TRINITY_JOB_WORKERS`` runs execute concurrently per instance.
+* Finished jobs (any terminal state) are retained for ``TRINITY_JOB_TTL_SECONDS``
+  and purged lazily on the next access — the store is instance-local and is
+  cleared when the instance is replaced, like the validation history.
+* While a job runs, each completed stage reports its session record (score,
+  veto, provider — never concept text or keys) through ``record_job_stage``,
+  so a poll can show partial progress before the final payload exists.
+* BYOK keys are held only while the job is queued: the call arguments are
+  dropped the moment the run starts, and are never part of any snapshot.
+* Each job runs in a copy of its submitter's context, so the run reads its
+  own request's headers (``X-VerifiMind-Deadline``, session config) and
+  never those of whichever request happened to start the workers.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import datetime as _dt
+import logging
+import os
+import secrets
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+TRINITY_JOB_WORKERS = int(os.getenv("TRINITY_JOB_WORKERS", "2"))
+TRINITY_JOB_QUEUE_LIMIT = int(os.getenv("TRINITY_JOB_QUEUE_LIMIT", "32"))
+TRINITY_JOB_TTL_SECONDS = float(os.getenv("TRINITY_JOB_TTL_SECONDS", "900"))
+# A single wait_trinity_job call must stay well inside the same client-side
+# timeouts this module exists to avoid; callers loop on it instead.
+TRINITY_JOB_MAX_WAIT_SECONDS = 25.0
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+TERMINAL_JOB_STATES = (JOB_SUCCEEDED, JOB_FAILED)
+
+# The job whose run is executing in the current task. Stage reporting reads
+# this instead of threading a callback through the tool signature, so a
+# synchronous run_full_trinity (no job) pays nothing and exposes nothing.
+_current_job: contextvars.ContextVar[Optional["TrinityJob"]] = contextvars.ContextVar(
+    "verifimind_trinity_job", default=None
+)
+
+
+class TrinityJobQueueFull(Exception):
+    """Raised by ``submit`` when the pending queue is at its limit."""
+
+
+class TrinityJob:
+    """One detached run and everything a poll may reveal about it."""
+
+    def __init__(self, job_id: str, run: Callable[[], Awaitable[dict]]):
+        self.job_id = job_id
+        self.status = JOB_QUEUED
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.stages: Dict[str, dict] = {}
+        self.result: Optional[dict] = None
+        self.error_code: Optional[str] = None
+        self.done = asyncio.Event()
+        self._run: Optional[Callable[[], Awaitable[dict]]] = run
+        self._context = contextvars.copy_context()
+
+    def snapshot(self, *, include_result: bool = True) -> dict:
+        """Poll-surface view; the final (or error) payload only once terminal."""
+        view: Dict[str, Any] = {
+            "job_id": self.job_id,
+            "status": self.status,
+            "stages_completed": list(self.stages),
+            "stage_results": {aid: dict(rec) for aid, rec in self.stages.items()},
+            "submitted_at": _iso(self.created_at),
+            "started_at": _iso(self.started_at),
+            "finished_at": _iso(self.finished_at),
+        }
+        if self.finished_at is not None:
+            view["expires_at"] = _iso(self.finished_at + TRINITY_JOB_TTL_SECONDS)
+        if self.error_code:
+            view["error_code"] = self.error_code
+        if include_result and self.status in TERMINAL_JOB_STATES and self.result is not None:
+            view["result"] = self.result
+        return view
+
+
+def _iso(ts: Optional[float]) -> Optional[str]:
+    if ts is None:
+        return None
+    return _dt.datetime.fromtimestamp(ts, _dt.timezone.utc).isoformat()
+
+
+def record_job_stage(agent_id: str, record: Optional[dict]) -> None:
+    """Publish one finished stage to the job running in this task, if any."""
+    job = _current_job.get()
+    if job is None:
+        return
+    job.stages[agent_id] = dict(record or {})
+
+
+class TrinityJobRunner:
+    """Bounded in-process worker pool with TTL retention of finished jobs."""
+
+    def __init__(
+        self,
+        *,
+        workers: int = TRINITY_JOB_WORKERS,
+        queue_limit: int = TRINITY_JOB_QUEUE_LIMIT,
+        ttl_seconds: float = TRINITY_JOB_TTL_SECONDS,
+    ):
+        self.workers = max(1, int(workers))
+        self.queue_limit = max(1, int(queue_limit))
+        self.ttl_seconds = float(ttl_seconds)
+        self._jobs: Dict[str, TrinityJob] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: list = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    # Workers bind to the loop that is running when the first job arrives
+    # (module import happens before uvicorn's loop exists). A new loop — as
+    # in the unit suite — gets a fresh queue and fresh workers. They start
+    # in an empty context: the submit that happens to create them must not
+    # leak its request state into every later job.
+    def _ensure_workers(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._queue is not None:
+            return
+        self._loop = loop
+        self._queue = asyncio.Queue(maxsize=self.queue_limit)
+        self._tasks = [
+            loop.create_task(
+                self._worker(), name=f"trinity-job-worker-{i}", context=contextvars.Context(),
+            )
+            for i in range(self.workers)
+        ]
+
+    async def _worker(self) -> None:
+        assert self._queue is not None
+        queue = self._queue
+        while True:
+            job = await queue.get()
+            try:
+                await self._execute(job)
+            finally:
+                queue.task_done()
+
+    async def _execute(self, job: TrinityJob) -> None:
+        run, job._run = job._run, None  # drop BYOK-bearing arguments now
+        context, job._context = job._context, None
+        job.status = JOB_RUNNING
+        job.started_at = time.time()
+
+        async def run_as_job():
+            _current_job.set(job)
+            return await run()
+
+        try:
+            payload = await asyncio.get_running_loop().create_task(run_as_job(), context=context)
+        except Exception as exc:
+            # The wrapped tool already converts every failure into a payload;
+            # reaching here means the wrapper itself broke. Record the class
+            # only — never the message, which may reflect provider output.
+            logger.warning(
+                "Trinity job %s failed outside the tool contract (error_type=%s)",
+                job.job_id[:8], type(exc).__name__,
+            )
+            job.status = JOB_FAILED
+            job.error_code = "TRINITY_JOB_ERROR"
+        else:
+            job.result = payload
+            if isinstance(payload, dict) and payload.get("status") == "error":
+                job.status = JOB_FAILED
+                job.error_code = payload.get("error_code") or "TRINITY_ERROR"
+            else:
+                job.status = JOB_SUCCEEDED
+        finally:
+            job.finished_at = time.time()
+            job.done.set()
+
+    def _purge_expired(self) -> None:
+        now = time.time()
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job.finished_at is not None and now - job.finished_at > self.ttl_seconds
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+    def submit(self, run: Callable[[], Awaitable[dict]]) -> TrinityJob:
+        """Queue ``run`` (a zero-argument coroutine factory) as a new job."""
+        self._ensure_workers()
+        self._purge_expired()
+        job = TrinityJob(secrets.token_urlsafe(16), run)
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            raise TrinityJobQueueFull() from None
+        self._jobs[job.job_id] = job
+        return job
+
+    def get(self, job_id: str) -> Optional[TrinityJob]:
+        self._purge_expired()
+        if not isinstance(job_id, str):
+            return None
+        return self._jobs.get(job_id)
+
+    async def wait(self, job_id: str, timeout: float) -> Optional[TrinityJob]:
+        """Block up to ``timeout`` seconds (capped) for the job to finish."""
+        job = self.get(job_id)
+        if job is None or job.done.is_set():
+            return job
+        timeout = max(0.0, min(float(timeout), TRINITY_JOB_MAX_WAIT_SECONDS))
+        try:
+            await asyncio.wait_for(job.done.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        return job
+
+    def queue_position(self, job: TrinityJob) -> Optional[int]:
+        """1-based position among queued jobs, or None once it has started."""
+        if job.status != JOB_QUEUED:
+            return None
+        queued = sorted(
+            (j for j in self._jobs.values() if j.status == JOB_QUEUED),
+            key=lambda j: j.created_at,
+        )
+        for index, candidate in enumerate(queued, start=1):
+            if candidate is job:
+                return index
+        return None
+
+    def stats(self) -> dict:
+        counts: Dict[str, int] = {}
+        for job in self._jobs.values():
+            counts[job.status] = counts.get(job.status, 0) + 1
+        return {
+            "workers": self.workers,
+            "queue_limit": self.queue_limit,
+            "ttl_seconds": self.ttl_seconds,
+            "jobs": counts,
+        }
+
+
+_runner: Optional[TrinityJobRunner] = None
+
+
+def get_trinity_job_runner() -> TrinityJobRunner:
+    global _runner
+    if _runner is None:
+        _runner = TrinityJobRunner()
+    return _runner
+
+
+def reset_trinity_job_runner() -> None:
+    """Drop the singleton (tests)."""
+    global _runner
+    _runner = None
@@ -28,7 +28,10 @@ What deliberately does NOT retry here:
   the one observed outlier (54s) exceeds any interactive request budget, and
   holding the connection that long converts an honest partial into a probable
   client-side timeout;
-* anything once the per-run ``RETRY_SLEEP_BUDGET_SECONDS`` is spent.
+* anything once the per-run ``RETRY_SLEEP_BUDGET_SECONDS`` is spent;
+* a wait that would leave the retried call too little of the request
+  deadline to finish (see ``utils/deadline.py``) — the client would never
+  receive the result.
 
 The completion guardrail: a retry either produces a REAL second attempt or
 propagates the second failure into the unchanged degradation contract. Nothing
@@ -42,6 +45,7 @@ import json
 import sys
 from typing import Any, Optional
 
+from .deadline import RequestDeadline
 from .provider_failures import provider_failure_contract, safe_diagnostic_value
 
 # Explicit sleep seam: production uses asyncio.sleep; the unit suite patches
@@ -139,6 +143,7 @@ async def analyze_with_completion_retry(
     byok: bool,
     session_id: Optional[str],
     budget: TrinityRetryBudget,
+    deadline: Optional[RequestDeadline] = None,
 ):
     """Run one stage's analyze; on a provider-stated retryable wait, retry once.
 
@@ -152,7 +157,14 @@ async def analyze_with_completion_retry(
     block handles it unchanged. When the retry itself fails, the propagated
     exception carries ``_trinity_retry_attempted = True`` for the stage-error
     record.
+
+    With a ``deadline``, a stage that cannot start in time raises
+    ``RequestDeadlineExceeded`` (degrading through the same except block)
+    and a retry whose wait would not leave time for the second call is not
+    attempted.
     """
+    if deadline is not None:
+        deadline.check(f"{agent_id} stage")
     try:
         return await analyze_call()
     except Exception as first_exc:
@@ -160,6 +172,8 @@ async def analyze_with_completion_retry(
         wait = retry_wait_for(contract)
         if wait is None or not budget.allow(wait):
             raise
+        if deadline is not None and not deadline.allows(wait):
+            raise
         budget.consume(wait)
         _emit_retry_event(
             agent_id=agent_id,
@@ -215,15 +229,22 @@ def _provider_family(provider: Any) -> Optional[str]:
     return name.removesuffix("Provider").lower() if name else None
 
 
-async def stagger_if_shared_provider(prior_provider: Any, next_provider: Any) -> bool:
+async def stagger_if_shared_provider(
+    prior_provider: Any,
+    next_provider: Any,
+    deadline: Optional[RequestDeadline] = None,
+) -> bool:
     """Sleep a fixed gap when two consecutive stages bill the same provider.
 
     Returns True when a stagger was applied. Cross-provider pairs (e.g. BYOK
-    splits) skip the sleep entirely so clean configurations pay nothing.
+    splits) skip the sleep entirely so clean configurations pay nothing, and
+    so does a run whose deadline cannot afford the gap plus the next stage.
     """
     prior = _provider_family(prior_provider)
     nxt = _provider_family(next_provider)
     if prior is None or nxt is None or prior != nxt:
         return False
+    if deadline is not None and not deadline.allows(SHARED_PROVIDER_STAGGER_SECONDS):
+        return False
     await _sleep(SHARED_PROVIDER_STAGGER_SECONDS)
     return True
@@ -16,6 +16,8 @@ Extended here for Scholar tools:
 import re
 import logging
 
+from .log_pipeline import emit_line
+
 logger = logging.getLogger(__name__)
 
 _UUID_RE = re.compile(
@@ -45,5 +47,5 @@ def emit_tracer(uuid: str, tool: str) -> None:
     if not is_valid_uuid(uuid):
         return
     safe_uuid = uuid.strip()
-    print(f"TRACER_UUID: {safe_uuid} tool={tool} tier=scholar", flush=True)
+    emit_line(f"TRACER_UUID: {safe_uuid} tool={tool} tier=scholar")
     logger.debug("UUID tracer emitted: tool=%s uuid_prefix=%s", tool, safe_uuid[:8])
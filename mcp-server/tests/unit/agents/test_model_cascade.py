@@ -0,0 +1,171 @@
+"""Confidence-gated model cascade (hosted lanes only).
+
+Pinned: a confident draft is kept and disclosed; low confidence, a degraded
+draft, a failed draft and an unconfirmed Z veto escalate to the configured
+model with both hops in ``_provider_attempts``; the ``_model_cascade``
+summary reaches the tool payload; the draft provider is built once per
+(agent, model); unmarked (BYOK) providers and unconfigured agents never
+cascade.
+"""
+
+import pytest
+
+from verifimind_mcp import llm as llm_pkg
+from verifimind_mcp.agents import XAgent, ZAgent
+from verifimind_mcp.llm.failover import mark_hosted_failover
+from verifimind_mcp.models import Concept
+from verifimind_mcp.server import attach_failover_disclosure
+from verifimind_mcp.utils.model_cascade import (
+    CASCADE_ENV,
+    cascade_draft_provider,
+    reset_draft_providers,
+)
+
+_X_CONTENT = {
+    "reasoning_steps": [{"step_number": 1, "thought": "t", "confidence": 0.9}],
+    "innovation_score": 7.0,
+    "strategic_value": 7.0,
+    "opportunities": ["o"],
+    "risks": ["r"],
+    "recommendation": "Proceed.",
+    "confidence": 0.9,
+}
+
+_Z_CONTENT = {
+    "reasoning_steps": [{"step_number": 1, "thought": "t", "confidence": 0.9}],
+    "ethics_score": 2.0,
+    "z_protocol_compliance": False,
+    "ethical_concerns": ["Covert surveillance."],
+    "mitigation_measures": [],
+    "recommendation": "Reject.",
+    "veto_triggered": True,
+    "confidence": 0.95,
+    "jurisdiction_detected": ["EU"],
+    "compliance_timeline": ["2026-08-02 EU AI Act"],
+    "scoring_breakdown": {"ethical_alignment": {"score": 2}},
+    "applicable_frameworks": {"tier_2_eu": ["EU AI Act"]},
+}
+
+
+class _Provider:
+    def __init__(self, model, content=None, quality="real", error=None):
+        self.model = model
+        self.content = content
+        self.quality = quality
+        self.error = error
+        self.calls = 0
+
+    async def generate(self, **_kwargs):
+        self.calls += 1
+        if self.error:
+            raise self.error
+        return {"content": dict(self.content), "_inference_quality": self.quality}
+
+    def get_model_name(self):
+        return self.model
+
+
+@pytest.fixture
+def concept():
+    return Concept(name="cascade-probe", description="A plain concept.")
+
+
+@pytest.fixture
+def draft_factory(monkeypatch):
+    drafts = {}
+
+    def factory(content, **kwargs):
+        draft = _Provider("groq/small-model", content, **kwargs)
+        drafts["built"] = 0
+
+        def get_provider(_family, model=None):
+            drafts["built"] += 1
+            return draft
+
+        reset_draft_providers()
+        monkeypatch.setattr(llm_pkg, "get_provider", get_provider)
+        return draft
+
+    monkeypatch.setenv("X_AGENT_DRAFT_MODEL", "small-model")
+    monkeypatch.setenv("Z_AGENT_DRAFT_MODEL", "small-model")
+    factory.drafts = drafts
+    yield factory
+    reset_draft_providers()
+
+
+def _hosted(agent_id, content):
+    return mark_hosted_failover(
+        _Provider("groq/openai/gpt-oss-120b", content), agent_id, "groq", "gemini"
+    )
+
+
+class TestPolicy:
+    def test_byok_lanes_never_cascade(self, draft_factory):
+        draft_factory(_X_CONTENT)
+        byok = _Provider("groq/openai/gpt-oss-120b", _X_CONTENT)
+        assert cascade_draft_provider("X", byok) is None
+
+    def test_unconfigured_agent_and_kill_switch(self, draft_factory, monkeypatch):
+        draft_factory(_X_CONTENT)
+        assert cascade_draft_provider("CS", _hosted("CS", _X_CONTENT)) is None
+        monkeypatch.setenv(CASCADE_ENV, "0")
+        assert cascade_draft_provider("X", _hosted("X", _X_CONTENT)) is None
+
+    def test_draft_provider_is_built_once_per_agent_and_model(self, draft_factory):
+        draft = draft_factory(_X_CONTENT)
+        assert cascade_draft_provider("X", _hosted("X", _X_CONTENT)) is draft
+        assert cascade_draft_provider("X", _hosted("X", _X_CONTENT)) is draft
+        assert draft_factory.drafts["built"] == 1
+        cascade_draft_provider("Z", _hosted("Z", _Z_CONTENT))
+        assert draft_factory.drafts["built"] == 2
+
+
+class TestCascade:
+    @pytest.mark.asyncio
+    async def test_confident_draft_is_kept(self, draft_factory, concept):
+        draft = draft_factory(_X_CONTENT)
+        primary = _hosted("X", _X_CONTENT)
+        result = await XAgent(llm_provider=primary).analyze(concept)
+
+        assert (draft.calls, primary.calls) == (1, 0)
+        assert result._model_cascade == {"draft_model": "groq/small-model", "escalated": False}
+        assert result._provider_attempts[-1]["outcome_class"] == "success"
+        assert result._provider_attempts[-1]["model"] == "groq/small-model"
+
+        payload = {}
+        attach_failover_disclosure(payload, result)
+        assert payload["_model_cascade"] == result._model_cascade
+
+    @pytest.mark.asyncio
+    async def test_low_confidence_escalates(self, draft_factory, concept):
+        draft = draft_factory({**_X_CONTENT, "confidence": 0.4})
+        primary = _hosted("X", _X_CONTENT)
+        result = await XAgent(llm_provider=primary).analyze(concept)
+
+        assert (draft.calls, primary.calls) == (1, 1)
+        assert result.confidence == 0.9
+        first, last = result._provider_attempts
+        assert first["outcome_class"] == "cascade_escalated"
+        assert first["escalation_reason"] == "low_confidence"
+        assert last["model"] == "groq/openai/gpt-oss-120b"
+        assert result._model_cascade["reason"] == "low_confidence"
+
+    @pytest.mark.asyncio
+    async def test_degraded_or_failed_draft_escalates(self, draft_factory, concept):
+        draft_factory(_X_CONTENT, quality="partial")
+        result = await XAgent(llm_provider=_hosted("X", _X_CONTENT)).analyze(concept)
+        assert result._model_cascade["reason"] == "draft_degraded"
+
+        draft_factory(_X_CONTENT, error=RuntimeError("draft down"))
+        result = await XAgent(llm_provider=_hosted("X", _X_CONTENT)).analyze(concept)
+        assert result._model_cascade["reason"] == "draft_failed"
+
+    @pytest.mark.asyncio
+    async def test_z_veto_needs_configured_model_confirmation(self, draft_factory, concept):
+        draft_factory(_Z_CONTENT)
+        primary = _hosted("Z", _Z_CONTENT)
+        result = await ZAgent(llm_provider=primary).analyze(concept)
+
+        assert primary.calls == 1
+        assert result._model_cascade["reason"] == "veto_confirmation"
+        assert result.veto_triggered is True
@@ -8,11 +8,15 @@ instant through the explicit `trinity_retry._sleep` seam; tests that need to
 OBSERVE the sleep values (test_v0560_trinity_completion) override the same
 seam with a recorder, which wins because test-requested fixtures apply after
 autouse ones.
+
+Learned completion budgets are process-wide state; each test starts from the
+configured budgets so call order never changes a requested max_tokens.
 """
 
 import pytest
 
 from verifimind_mcp.utils import trinity_retry
+from verifimind_mcp.utils.completion_budget import reset_completion_budget_controller
 
 
 @pytest.fixture(autouse=True)
@@ -21,3 +25,10 @@ def _instant_trinity_sleeps(monkeypatch):
         return None
 
     monkeypatch.setattr(trinity_retry, "_sleep", _instant)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_completion_budgets():
+    reset_completion_budget_controller()
+    yield
+    reset_completion_budget_controller()
@@ -0,0 +1,163 @@
+"""
+Record/replay cassettes at the provider-call boundary.
+
+Pinned: a recorded call replays without touching the provider — including
+under MockProvider, as in a run with no API keys; a changed prompt or
+schema misses loudly instead of replaying a stale answer; replay timing
+follows the recorded latency times the scale factor; repeated calls replay
+in recorded order; the raw model text is kept for parser benchmarks;
+emails and API keys never reach the cassette files.
+"""
+
+import json
+
+import pytest
+
+import verifimind_mcp.llm.cassette as cs
+import verifimind_mcp.llm.failover as fo
+from verifimind_mcp.llm.provider import GeminiProvider, MockProvider, strip_markdown_code_fences
+
+MULTI_OBJECT = '{"innovation_score": 8}\n{"strategic_value": 7, "risks": ["cost"]}'
+SCHEMA = {"title": "XAgentAnalysis", "required": ["innovation_score", "strategic_value", "risks"]}
+
+
+class _RecordingProvider:
+    """Stands in for a hosted provider: raw text through the shared cleaner."""
+
+    def __init__(self, answers):
+        self.answers = list(answers)
+        self.calls = 0
+
+    def get_model_name(self):
+        return "groq/openai/gpt-oss-120b"
+
+    async def generate(self, prompt, output_schema=None, temperature=0.7, max_tokens=4096):
+        self.calls += 1
+        text = self.answers.pop(0)
+        strip_markdown_code_fences(text)
+        return {
+            "content": {"answer": text[:10]},
+            "usage": {"input_tokens": 11, "output_tokens": 22, "total_tokens": 33},
+            "_inference_quality": "real",
+            "_failover_correlation": "ephemeral",
+        }
+
+
+def _call(**overrides):
+    kwargs = {"prompt": "Evaluate: a solar kiosk", "output_schema": SCHEMA,
+              "temperature": 0.7, "max_tokens": 2048}
+    kwargs.update(overrides)
+    return kwargs
+
+
+@pytest.fixture
+def cassette_env(tmp_path, monkeypatch):
+    def configure(mode, scale="0"):
+        cs.reset_cassette()
+        monkeypatch.setenv(cs.CASSETTE_MODE_ENV, mode)
+        monkeypatch.setenv(cs.CASSETTE_DIR_ENV, str(tmp_path))
+        monkeypatch.setenv(cs.CASSETTE_TIME_SCALE_ENV, scale)
+        return cs.active_cassette()
+
+    yield configure
+    cs.reset_cassette()
+
+
+class TestRecordReplay:
+
+    @pytest.mark.asyncio
+    async def test_replay_under_mock_needs_no_provider(self, cassette_env):
+        cassette_env("record")
+        recorded = await fo.generate_with_failover(_RecordingProvider([MULTI_OBJECT]), **_call())
+
+        cassette = cassette_env("replay")
+        mock = MockProvider()
+        replayed = await fo.generate_with_failover(mock, **_call(max_tokens=8192))
+        assert mock.call_count == 0
+        assert replayed["content"] == recorded["content"]
+        assert replayed["usage"]["total_tokens"] == 33
+        assert "_failover_correlation" not in replayed
+        assert cassette.stats()["replayed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_changed_prompt_or_schema_misses(self, cassette_env):
+        cassette_env("record")
+        await fo.generate_with_failover(_RecordingProvider([MULTI_OBJECT]), **_call())
+        cassette = cassette_env("replay")
+        with pytest.raises(cs.CassetteMissError):
+            await fo.generate_with_failover(MockProvider(), **_call(prompt="Evaluate: a wind kiosk"))
+        with pytest.raises(cs.CassetteMissError):
+            await fo.generate_with_failover(MockProvider(), **_call(output_schema={"title": "Other"}))
+        assert cassette.stats()["misses"] == 2
+
+    @pytest.mark.asyncio
+    async def test_repeated_calls_replay_in_order(self, cassette_env):
+        cassette_env("record")
+        provider = _RecordingProvider(["first answer", "second answer"])
+        await fo.generate_with_failover(provider, **_call())
+        await fo.generate_with_failover(provider, **_call())
+
+        cassette_env("replay")
+        answers = [
+            (await fo.generate_with_failover(MockProvider(), **_call()))["content"]["answer"]
+            for _ in range(3)
+        ]
+        assert answers == ["first answ", "second ans", "second ans"]
+
+    @pytest.mark.asyncio
+    async def test_replay_timing_is_scaled(self, cassette_env, monkeypatch):
+        cassette_env("record")
+        await fo.generate_with_failover(_RecordingProvider([MULTI_OBJECT]), **_call())
+        key = cs.cassette_key(_call()["prompt"], SCHEMA, 0.7)
+        path = cassette_env("replay", scale="0.5")._path(key)
+        entry = json.loads(path.read_text())
+        entry["latency_ms"] = 400
+        path.write_text(json.dumps(entry) + "\n")
+
+        sleeps = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+
+        monkeypatch.setattr(cs.asyncio, "sleep", fake_sleep)
+        await fo.generate_with_failover(MockProvider(), **_call())
+        assert sleeps == [pytest.approx(0.2)]
+
+
+class TestRecording:
+
+    @pytest.mark.asyncio
+    async def test_raw_text_feeds_the_parsers(self, cassette_env):
+        cassette = cassette_env("record")
+        await fo.generate_with_failover(_RecordingProvider([MULTI_OBJECT]), **_call())
+        [entry] = list(cassette.entries())
+        assert entry["raw"] == [MULTI_OBJECT]
+        assert entry["model"] == "groq/openai/gpt-oss-120b"
+        assert entry["max_tokens"] == 2048 and entry["latency_ms"] >= 0
+
+        clean = strip_markdown_code_fences(entry["raw"][0])
+        merged = GeminiProvider._merge_json_objects(clean, SCHEMA["required"])
+        assert merged == {"innovation_score": 8, "strategic_value": 7, "risks": ["cost"]}
+
+    @pytest.mark.asyncio
+    async def test_secrets_are_scrubbed(self, cassette_env, tmp_path):
+        cassette_env("record")
+        prompt = "Contact founder@example.com, key gsk_abcdefghijklmnopqrstuv"
+        await fo.generate_with_failover(
+            _RecordingProvider(["reply to founder@example.com"]), **_call(prompt=prompt))
+        written = "".join(p.read_text() for p in tmp_path.glob("*.jsonl"))
+        assert "founder@example.com" not in written and "gsk_abc" not in written
+        assert "[email]" in written and "[api_key]" in written
+
+    @pytest.mark.asyncio
+    async def test_no_cassette_without_the_env(self, monkeypatch):
+        cs.reset_cassette()
+        monkeypatch.delenv(cs.CASSETTE_MODE_ENV, raising=False)
+        try:
+            assert cs.active_cassette() is None
+            cs.note_raw_output("ignored")  # no recording in progress: no-op
+            mock = MockProvider()
+            await fo.generate_with_failover(mock, prompt="p")
+            assert mock.call_count == 1
+        finally:
+            cs.reset_cassette()
@@ -0,0 +1,155 @@
+"""
+Native structured output (response_format json_schema) for Groq/OpenAI/Cerebras.
+
+Pinned: capable models get the agent schema as a json_schema response_format
+with quality-required fields promoted to required and a short field list in
+the prompt; other models (and the kill switch) keep the prompt-hint path; a
+400 rejecting the format falls back ONCE to the prompt hint and the model
+stays on that path afterwards.
+"""
+
+import json
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from verifimind_mcp.llm import provider as provider_mod
+from verifimind_mcp.llm.provider import (
+    NATIVE_STRUCTURED_OUTPUT_ENV,
+    GroqProvider,
+    OpenAIProvider,
+    native_response_format,
+)
+from verifimind_mcp.models import ZAgentAnalysis
+
+_SCHEMA = ZAgentAnalysis.model_json_schema()
+
+
+def _response(payload):
+    response = MagicMock()
+    response.choices = [MagicMock()]
+    response.choices[0].finish_reason = "stop"
+    response.choices[0].message.content = json.dumps(payload)
+    response.usage.prompt_tokens = 100
+    response.usage.completion_tokens = 100
+    response.usage.total_tokens = 200
+    return response
+
+
+class _SchemaRejected(Exception):
+    status_code = 400
+
+
+@pytest.fixture(autouse=True)
+def clean_capability_state(monkeypatch):
+    monkeypatch.delenv(NATIVE_STRUCTURED_OUTPUT_ENV, raising=False)
+    monkeypatch.setattr(provider_mod, "_NATIVE_SCHEMA_REJECTED", set())
+    monkeypatch.setattr(provider_mod, "_NATIVE_FORMAT_CACHE", {})
+
+
+def _groq(model="openai/gpt-oss-120b", side_effect=None):
+    provider = GroqProvider(model=model, api_key="gsk_test")
+    provider.client = MagicMock()
+    provider.client.chat.completions.create = AsyncMock(
+        side_effect=side_effect, return_value=_response({"ok": True})
+    )
+    return provider
+
+
+class TestCapabilityTable:
+    def test_wire_schema_requires_promised_fields(self):
+        response_format = native_response_format("groq", "openai/gpt-oss-120b", _SCHEMA)
+        wire = response_format["json_schema"]["schema"]
+        assert response_format["type"] == "json_schema"
+        assert "scoring_breakdown" in wire["required"]
+        assert "quality_required" not in json.dumps(wire)
+        # The caller's schema is never mutated.
+        assert "scoring_breakdown" not in _SCHEMA.get("required", [])
+
+    def test_unlisted_model_and_kill_switch(self, monkeypatch):
+        assert native_response_format("groq", "llama-3.1-8b-instant", _SCHEMA) is None
+        assert native_response_format("gemini", "gemini-2.5-flash", _SCHEMA) is None
+        monkeypatch.setenv(NATIVE_STRUCTURED_OUTPUT_ENV, "0")
+        assert native_response_format("openai", "gpt-5.5", _SCHEMA) is None
+
+    def test_format_is_built_once_per_schema(self):
+        first = native_response_format("openai", "gpt-5.5", _SCHEMA)
+        assert native_response_format("openai", "gpt-5.5", _SCHEMA) is first
+
+
+class TestGroq:
+    @pytest.mark.asyncio
+    async def test_capable_model_uses_native_format(self):
+        provider = _groq()
+        result = await provider.generate("probe", output_schema=_SCHEMA, max_tokens=1024)
+
+        kwargs = provider.client.chat.completions.create.await_args.kwargs
+        assert kwargs["response_format"]["type"] == "json_schema"
+        prompt = kwargs["messages"][0]["content"]
+        assert "scoring_breakdown" in prompt
+        assert "Do NOT output multiple" not in prompt
+        assert result["_structured_output"] == "native"
+
+    @pytest.mark.asyncio
+    async def test_unlisted_model_keeps_prompt_hint(self):
+        provider = _groq(model="llama-3.1-8b-instant")
+        result = await provider.generate("probe", output_schema=_SCHEMA, max_tokens=1024)
+
+        kwargs = provider.client.chat.completions.create.await_args.kwargs
+        assert "response_format" not in kwargs
+        assert "IMPORTANT: You MUST respond" in kwargs["messages"][0]["content"]
+        assert result["_structured_output"] == "prompt"
+
+    @pytest.mark.asyncio
+    async def test_rejected_format_falls_back_once_and_is_remembered(self):
+        provider = _groq(side_effect=[
+            _SchemaRejected("response_format json_schema is not supported"),
+            _response({"ok": True}),
+            _response({"ok": True}),
+        ])
+        result = await provider.generate("probe", output_schema=_SCHEMA, max_tokens=1024)
+
+        create = provider.client.chat.completions.create
+        assert create.await_count == 2
+        assert "response_format" not in create.await_args.kwargs
+        assert result["_structured_output"] == "prompt"
+
+        await provider.generate("probe", output_schema=_SCHEMA, max_tokens=1024)
+        assert create.await_count == 3
+        assert "response_format" not in create.await_args.kwargs
+
+    @pytest.mark.asyncio
+    async def test_unrelated_400_is_not_swallowed(self):
+        provider = _groq(side_effect=_SchemaRejected("invalid api key"))
+        with pytest.raises(_SchemaRejected):
+            await provider.generate("probe", output_schema=_SCHEMA, max_tokens=1024)
+        assert provider.client.chat.completions.create.await_count == 1
+
+
+class TestOpenAI:
+    def _provider(self, model):
+        provider = OpenAIProvider.__new__(OpenAIProvider)
+        provider.model = model
+        provider.client = MagicMock()
+        provider.client.chat.completions.create = AsyncMock(
+            return_value=_response({"ok": True})
+        )
+        return provider
+
+    @pytest.mark.asyncio
+    async def test_native_drops_the_schema_dump(self):
+        provider = self._provider("gpt-5.5")
+        await provider.generate("probe", output_schema=_SCHEMA)
+
+        kwargs = provider.client.chat.completions.create.await_args.kwargs
+        assert kwargs["response_format"]["type"] == "json_schema"
+        assert "matching this schema" not in kwargs["messages"][0]["content"]
+
+    @pytest.mark.asyncio
+    async def test_legacy_model_keeps_json_mode(self):
+        provider = self._provider("gpt-3.5-turbo")
+        await provider.generate("probe", output_schema=_SCHEMA)
+
+        kwargs = provider.client.chat.completions.create.await_args.kwargs
+        assert kwargs["response_format"] == {"type": "json_object"}
+        assert "matching this schema" in kwargs["messages"][0]["content"]
@@ -0,0 +1,200 @@
+"""
+Background health probing of the hosted provider families.
+
+Pinned: repeated infrastructure failures from probes open a family's circuit
+within the failure window, with no real request involved; auth and
+rate-limit failures never touch the circuit; a closed circuit's failure
+count is not reset by a probe, but a successful half-open probe closes it;
+open circuits, families with recent real traffic and an exhausted budget
+are skipped; only hosted-marked providers and their hop targets are probed;
+the prober is off without its opt-in flag.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+import verifimind_mcp.llm.failover as fo
+from verifimind_mcp.llm import health_prober as hp
+
+
+class APIConnectionError(Exception):
+    pass
+
+
+class AuthenticationError(Exception):
+    pass
+
+
+class RateLimitError(Exception):
+    pass
+
+
+class _Provider:
+    def __init__(self, family, outcomes=()):
+        self.family = family
+        self.outcomes = list(outcomes)
+        self.probes = 0
+
+    def get_model_name(self):
+        return f"{self.family}/model"
+
+    async def probe(self):
+        self.probes += 1
+        outcome = self.outcomes.pop(0) if self.outcomes else None
+        if isinstance(outcome, Exception):
+            raise outcome
+        if outcome == "hang":
+            await asyncio.sleep(10)
+
+
+@pytest.fixture(autouse=True)
+def _clean_circuits():
+    fo.reset_circuits()
+    yield
+    fo.reset_circuits()
+
+
+def _prober(providers, **kw):
+    kw.setdefault("interval", 60)
+    kw.setdefault("retry_seconds", 0)
+    return hp.ProviderProber(resolve=lambda: providers, **kw)
+
+
+class TestCircuitFeed:
+
+    @pytest.mark.asyncio
+    async def test_infrastructure_failures_open_the_circuit(self):
+        groq = _Provider("groq", [APIConnectionError()] * 3)
+        prober = _prober({"groq": groq})
+        for _ in range(3):
+            await prober.run_due()
+        assert groq.probes == 3
+        assert fo.circuit_snapshot()["groq"] == "open"
+        assert await prober.probe_family("groq", groq) == hp.SKIPPED_OPEN
+        family = prober.stats()["families"]["groq"]
+        assert family["failures"] == 3 and family["last_outcome"] == "connection_error"
+
+    @pytest.mark.asyncio
+    async def test_failure_reprobes_sooner(self):
+        groq = _Provider("groq", [APIConnectionError()])
+        prober = _prober({"groq": groq}, retry_seconds=10, interval=60)
+        await prober.run_due()
+        assert prober._due["groq"] - time.monotonic() <= 10
+        await prober.run_due()  # not due yet
+        assert groq.probes == 1
+        prober._due["groq"] = 0
+        await prober.run_due()
+        assert prober._due["groq"] - time.monotonic() > 10
+
+    @pytest.mark.asyncio
+    async def test_timeout_counts_as_infrastructure(self):
+        slow = _Provider("gemini", ["hang"])
+        prober = _prober({"gemini": slow}, timeout=0.01)
+        assert await prober.probe_family("gemini", slow) == "attempt_timeout"
+        assert fo._circuit_for("gemini").consecutive_failures == 1
+
+    @pytest.mark.asyncio
+    async def test_auth_and_rate_limit_never_touch_the_circuit(self):
+        groq = _Provider("groq", [AuthenticationError(), RateLimitError()])
+        prober = _prober({"groq": groq})
+        await prober.probe_family("groq", groq)
+        await prober.probe_family("groq", groq)
+        assert fo._circuit_for("groq").consecutive_failures == 0
+        assert prober.stats()["families"]["groq"]["failures"] == 2
+
+    @pytest.mark.asyncio
+    async def test_success_does_not_reset_a_closed_circuit(self):
+        fo.record_provider_failure("groq")
+        fo.record_provider_failure("groq")
+        groq = _Provider("groq")
+        assert await _prober({}).probe_family("groq", groq) == hp.OK
+        assert fo._circuit_for("groq").consecutive_failures == 2
+
+    @pytest.mark.asyncio
+    async def test_half_open_success_closes_the_circuit(self):
+        past = time.monotonic() - fo.CIRCUIT_COOLDOWN_S - 1
+        for _ in range(fo.CIRCUIT_FAILURE_THRESHOLD):
+            fo.record_provider_failure("groq", now=past)
+        assert fo.circuit_snapshot()["groq"] == "half_open"
+        groq = _Provider("groq")
+        assert await _prober({}).probe_family("groq", groq) == hp.OK
+        assert fo.circuit_snapshot()["groq"] == "closed"
+
+    @pytest.mark.asyncio
+    async def test_half_open_circuit_neutral_failure_releases_the_slot(self):
+        past = time.monotonic() - fo.CIRCUIT_COOLDOWN_S - 1
+        for _ in range(fo.CIRCUIT_FAILURE_THRESHOLD):
+            fo.record_provider_failure("groq", now=past)
+        groq = _Provider("groq", [AuthenticationError()])
+        await _prober({}).probe_family("groq", groq)
+        assert fo._circuit_for("groq").half_open_probe_inflight is False
+        assert fo.circuit_snapshot()["groq"] == "half_open"
+
+
+class TestStandDown:
+
+    @pytest.mark.asyncio
+    async def test_recent_real_traffic_skips_the_family(self):
+        fo.note_provider_traffic("gemini")
+        gemini = _Provider("gemini")
+        prober = _prober({"gemini": gemini}, idle_seconds=30)
+        assert await prober.probe_family("gemini", gemini) == hp.SKIPPED_TRAFFIC
+        assert gemini.probes == 0
+        assert prober.stats()["families"]["gemini"]["skipped"] == {hp.SKIPPED_TRAFFIC: 1}
+
+    @pytest.mark.asyncio
+    async def test_hosted_generate_marks_traffic(self):
+        class _Hosted(_Provider):
+            async def generate(self, **kwargs):
+                return {"content": "ok"}
+
+        provider = fo.mark_hosted_failover(_Hosted("groq"), "X", "groq", None)
+        await fo.generate_with_failover(provider, prompt="p")
+        assert fo.last_provider_traffic("groq") is not None
+        await fo.generate_with_failover(_Hosted("anthropic"), prompt="p")  # BYOK: unmarked
+        assert fo.last_provider_traffic("anthropic") is None
+
+    @pytest.mark.asyncio
+    async def test_budget_caps_probes(self):
+        providers = {name: _Provider(name) for name in ("gemini", "groq", "cerebras")}
+        prober = _prober(providers, budget=2)
+        await prober.run_due()
+        assert sum(p.probes for p in providers.values()) == 2
+        assert prober.stats()["budget_used"] == 2
+        assert prober.stats()["families"]["cerebras"]["skipped"] == {hp.SKIPPED_BUDGET: 1}
+
+
+class TestResolution:
+
+    def test_only_hosted_families_and_hop_targets(self, monkeypatch):
+        import verifimind_mcp.config_helper as ch
+        import verifimind_mcp.llm as llm_pkg
+
+        def get_agent_provider(agent_id):
+            if agent_id == "X":
+                return fo.mark_hosted_failover(_Provider("groq"), "X", "groq", "gemini")
+            if agent_id == "Z":
+                return _Provider("anthropic")  # operator override: never marked
+            raise ValueError("no key")
+
+        monkeypatch.setattr(ch, "get_agent_provider", get_agent_provider)
+        monkeypatch.setattr(llm_pkg, "get_provider", lambda name: _Provider(name))
+        found = hp.resolve_hosted_providers()
+        assert sorted(found) == ["gemini", "groq"]
+
+    @pytest.mark.asyncio
+    async def test_lifecycle_is_opt_in(self, monkeypatch):
+        assert hp.get_provider_prober_stats() == {"enabled": False}
+        monkeypatch.delenv(hp.PROBE_ENV, raising=False)
+        assert hp.start_provider_prober() is False
+        monkeypatch.setenv(hp.PROBE_ENV, "1")
+        monkeypatch.setattr(hp, "resolve_hosted_providers", lambda: {})
+        assert hp.start_provider_prober() is True
+        try:
+            await asyncio.sleep(0.05)
+            assert hp.get_provider_prober_stats()["enabled"] is True
+        finally:
+            await hp.stop_provider_prober()
+        assert hp.get_provider_prober_stats() == {"enabled": False}
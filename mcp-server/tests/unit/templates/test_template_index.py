@@ -0,0 +1,173 @@
+"""
+Indexed template filtering and ranked search.
+
+Pinned: index-backed list_templates returns exactly what the original linear
+scan returned (same members, same order) for every filter combination over
+the shipped library; the indexes follow register/unregister and a wholesale
+map replacement; search ranks name matches first, expands prefixes, honours
+the list filters; search_prompt_templates is a dark-launched preview tool.
+"""
+
+import itertools
+
+import pytest
+
+from verifimind_mcp.availability import PREVIEW_TOOL_GROUPS, PREVIEW_TOOLS_ENV
+from verifimind_mcp.templates.index import TemplateIndex, tokenize
+from verifimind_mcp.templates.models import GenesisPhase, PromptTemplate
+from verifimind_mcp.templates.registry import TemplateRegistry
+
+from ..mcp_tool_harness import call
+
+
+def _scan(registry, agent_id=None, category=None, tags=None, include_custom=False):
+    """The pre-index linear filter, kept as the reference behaviour."""
+    templates = list(registry._templates.values())
+    if include_custom:
+        templates.extend(registry._custom_templates.values())
+    if agent_id:
+        templates = [t for t in templates if t.agent_id.upper() in (agent_id.upper(), "ALL")]
+    if category:
+        templates = [t for t in templates if t.category.lower() == category.lower()]
+    if tags:
+        templates = [
+            t for t in templates
+            if all(tag.lower() in [tt.lower() for tt in t.tags] for tag in tags)
+        ]
+    return [t.template_id for t in templates]
+
+
+def _hermetic():
+    reg = object.__new__(TemplateRegistry)
+    reg._templates = {}
+    reg._libraries = {}
+    reg._custom_templates = {}
+    reg._initialized = True
+    reg._library_path = None
+    return reg
+
+
+def _template(template_id, name, agent_id="X", tags=("custom",), **extra):
+    return PromptTemplate(
+        template_id=template_id, name=name, agent_id=agent_id,
+        content=extra.pop("content", "Analyze {concept}"), tags=list(tags),
+        category=extra.pop("category", "custom"), **extra,
+    )
+
+
+class TestFilterParity:
+    def test_every_filter_combination_matches_the_scan(self):
+        registry = TemplateRegistry()
+        assert registry.list_templates()
+        agents = [None, "X", "z", "CS", "all", "nobody"]
+        categories = [None] + sorted({t.category for t in registry.list_templates()}) + ["NONE"]
+        tags = [None, ["default"], ["Genesis:Phase-1"], ["genesis:phase-3", "default"]]
+        for agent_id, category, tag_list in itertools.product(agents, categories, tags):
+            got = [
+                t.template_id for t in registry.list_templates(agent_id, category, tag_list)
+            ]
+            assert got == _scan(registry, agent_id, category, tag_list), (
+                agent_id, category, tag_list,
+            )
+
+    def test_phase_lookup_uses_membership(self):
+        registry = TemplateRegistry()
+        for phase in GenesisPhase:
+            got = [t.template_id for t in registry.get_templates_by_genesis_phase(phase)]
+            assert got == _scan(registry, tags=[phase.value])
+
+
+class TestMaintenance:
+    def test_register_and_unregister_update_the_indexes(self):
+        reg = _hermetic()
+        template = reg.register_custom_template(
+            name="Zebra crossing review", agent_id="Z", content="Stripes {x}",
+            variables=[{"name": "x", "description": "Stripe count"}],
+            tags=["genesis:phase-2"], template_id="custom-zebra",
+        )
+        assert [t for t, _ in reg.search_templates("zebra", include_custom=True)] == [template]
+        assert reg.list_templates(agent_id="Z", include_custom=True) == [template]
+        assert reg.get_statistics(include_custom=True)["templates_by_phase"]["genesis:phase-2"] == 1
+        assert reg.search_templates("zebra") == []
+
+        assert reg.unregister_custom_template("custom-zebra")
+        assert reg.search_templates("zebra", include_custom=True) == []
+        assert reg.list_templates(agent_id="Z", include_custom=True) == []
+
+    def test_replaced_map_is_reindexed(self):
+        reg = _hermetic()
+        assert reg.list_templates() == []
+        reg._templates = {"t-1": _template("t-1", "Replacement")}
+        assert [t.template_id for t in reg.list_templates(agent_id="X")] == ["t-1"]
+
+    def test_phase_tags_match_case_insensitively(self):
+        reg = _hermetic()
+        reg.register_custom_template(
+            name="Shouted phase", agent_id="X", content="Review {x}",
+            variables=[{"name": "x", "description": "Subject"}],
+            tags=["Genesis:Phase-2"], template_id="custom-shouted",
+        )
+        got = reg.get_templates_by_genesis_phase(GenesisPhase.PHASE_2, include_custom=True)
+        assert [t.template_id for t in got] == ["custom-shouted"]
+        assert reg.get_statistics(include_custom=True)["templates_by_phase"]["genesis:phase-2"] == 1
+
+    def test_remove_drops_every_posting(self):
+        index = TemplateIndex({})
+        index.add(_template("t-1", "Lonely unicorn", tags=["genesis:phase-1"]))
+        index.remove("t-1")
+        assert len(index) == 0
+        assert not (index.by_agent or index.by_tag or index.by_phase or index.postings)
+
+
+class TestSearch:
+    def test_tokenizer_drops_stopwords_and_single_characters(self):
+        assert tokenize("The X-Agent, and a API review!") == ["agent", "api", "review"]
+
+    def test_name_match_outranks_content_match(self):
+        index = TemplateIndex({})
+        index.add(_template("body", "Generic", content="privacy privacy {c}"))
+        index.add(_template("title", "Privacy check"))
+        scores = index.search("privacy")
+        assert scores["title"] > scores["body"] > 0
+
+    def test_library_search_ranks_filters_and_expands_prefixes(self):
+        registry = TemplateRegistry()
+        top = registry.search_templates("privacy assessment", limit=3)
+        assert top[0][0].template_id == "ethics-privacy-assessment"
+        assert [s for _, s in top] == sorted((s for _, s in top), reverse=True)
+
+        prefixed = registry.search_templates("secur", limit=5)
+        assert prefixed and all(
+            "secur" in (t.name + " ".join(t.tags) + t.category + t.content).lower()
+            for t, _ in prefixed
+        )
+
+        filtered = registry.search_templates("review", agent_id="Z", limit=50)
+        assert filtered and all(t.agent_id.upper() in ("Z", "ALL") for t, _ in filtered)
+        assert registry.search_templates("review", limit=0) == []
+        assert registry.search_templates("zzqx") == []
+
+
+class TestSearchTool:
+    @pytest.mark.asyncio
+    async def test_tool_is_preview_gated(self, monkeypatch):
+        from verifimind_mcp.server import _create_mcp_instance
+
+        monkeypatch.delenv(PREVIEW_TOOLS_ENV, raising=False)
+        dark = {t.name for t in await _create_mcp_instance().list_tools(run_middleware=False)}
+        monkeypatch.setenv(PREVIEW_TOOLS_ENV, "template_search")
+        lit = {t.name for t in await _create_mcp_instance().list_tools(run_middleware=False)}
+        assert lit - dark == set(PREVIEW_TOOL_GROUPS["template_search"])
+
+    @pytest.mark.asyncio
+    async def test_tool_returns_ranked_templates(self, monkeypatch):
+        from verifimind_mcp.server import _create_mcp_instance
+
+        monkeypatch.setenv(PREVIEW_TOOLS_ENV, "template_search")
+        payload = await call(_create_mcp_instance(), "search_prompt_templates", {
+            "query": "privacy", "tags": '["genesis:phase-2"]', "limit": 100,
+        })
+        assert payload["filters"]["tags"] == ["genesis:phase-2"]
+        assert payload["count"] == len(payload["templates"]) >= 1
+        assert payload["templates"][0]["template_id"] == "ethics-privacy-assessment"
+        assert payload["templates"][0]["score"] > 0
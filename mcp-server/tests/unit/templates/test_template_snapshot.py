@@ -0,0 +1,164 @@
+"""
+Compiled template snapshot and incremental library reload.
+
+Pinned: a current snapshot restores the same templates without parsing YAML;
+stale or foreign snapshot entries fall back to the YAML parse; refresh
+re-parses only changed files, keeps a live library when an edit does not
+parse, and swaps complete maps in; the watcher is opt-in.
+"""
+
+import json
+import os
+import shutil
+import time
+from pathlib import Path
+
+import pytest
+
+from verifimind_mcp.templates import registry as registry_module
+from verifimind_mcp.templates.registry import TemplateRegistry
+from verifimind_mcp.templates.snapshot import SNAPSHOT_ENV, load_snapshot, main
+
+_LIBRARY = Path(registry_module.__file__).parent / "library"
+_EXTRA = """
+library_id: extra
+name: Extra
+agent_id: X
+templates:
+  - template_id: extra-one
+    name: Extra one
+    content: "Look at {concept}"
+    variables:
+      - name: concept
+        description: Concept to look at
+"""
+
+
+@pytest.fixture
+def library(tmp_path, monkeypatch):
+    lib = tmp_path / "library"
+    lib.mkdir()
+    for name in ("ethics_review.yaml", "security_audit.yaml"):
+        shutil.copy(_LIBRARY / name, lib / name)
+    monkeypatch.setenv(SNAPSHOT_ENV, str(tmp_path / "snapshot.json"))
+    return lib
+
+
+def _registry(library_path):
+    reg = object.__new__(TemplateRegistry)
+    reg._templates = {}
+    reg._libraries = {}
+    reg._custom_templates = {}
+    reg._initialized = True
+    reg._library_path = library_path
+    reg._load_builtin_templates()
+    return reg
+
+
+def _dump(reg):
+    return {tid: t.model_dump(exclude={"created_at", "updated_at"})
+            for tid, t in reg._templates.items()}
+
+
+def _touch(path, text):
+    path.write_text(text, encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestSnapshot:
+    def test_current_snapshot_skips_yaml(self, library, monkeypatch):
+        parsed = _registry(library)
+        assert Path(os.environ[SNAPSHOT_ENV]).is_file()
+
+        def no_yaml(*_args):
+            raise AssertionError("YAML parsed despite a current snapshot")
+
+        monkeypatch.setattr(TemplateRegistry, "_load_library_file", no_yaml)
+        restored = _registry(library)
+        assert _dump(restored) == _dump(parsed)
+        assert restored._templates
+        assert restored.get_statistics() == parsed.get_statistics()
+        assert {e.library_id: e.file_path for e in restored.list_libraries()} == {
+            e.library_id: e.file_path for e in parsed.list_libraries()
+        }
+
+    def test_stale_entry_is_reparsed(self, library):
+        _registry(library)
+        edited = (library / "ethics_review.yaml").read_text(encoding="utf-8")
+        _touch(library / "ethics_review.yaml", edited.replace(
+            "template_id: ethics-privacy-assessment",
+            "template_id: ethics-privacy-assessment-v2",
+        ))
+        reg = _registry(library)
+        assert reg.get_template("ethics-privacy-assessment-v2") is not None
+        assert reg.get_template("ethics-privacy-assessment") is None
+
+    def test_foreign_format_is_ignored(self, tmp_path):
+        path = tmp_path / "snap.json"
+        path.write_text(json.dumps({"format": "0:old", "libraries": {"x": {}}}))
+        assert load_snapshot(path) == {}
+        path.write_text("{not json")
+        assert load_snapshot(path) == {}
+
+    def test_disabled_snapshot_writes_nothing(self, library, tmp_path, monkeypatch):
+        monkeypatch.setenv(SNAPSHOT_ENV, "off")
+        assert _registry(library)._templates
+        assert not (tmp_path / "snapshot.json").exists()
+        with pytest.raises(SystemExit):
+            main()
+
+    @pytest.mark.parametrize("populate", [False, True])
+    def test_missing_or_empty_library_fails_the_build(self, tmp_path, monkeypatch, populate):
+        lib = tmp_path / "library"
+        monkeypatch.setenv(SNAPSHOT_ENV, str(tmp_path / "snapshot.json"))
+        if populate:
+            lib.mkdir()
+            (lib / "broken.yaml").write_text("templates: [", encoding="utf-8")
+        monkeypatch.setattr(registry_module, "TemplateRegistry", lambda: _registry(lib))
+        with pytest.raises(SystemExit) as exc_info:
+            main()
+        assert exc_info.value.code != 0
+        assert str(lib) in str(exc_info.value.code)
+        assert not Path(os.environ[SNAPSHOT_ENV]).exists()
+
+
+class TestRefresh:
+    def test_only_changed_files_are_reparsed(self, library):
+        reg = _registry(library)
+        security = [t for t in reg._templates.values() if t.template_id.startswith("security")]
+        before = reg._templates
+
+        (library / "extra.yaml").write_text(_EXTRA, encoding="utf-8")
+        (library / "ethics_review.yaml").unlink()
+        changes = reg.refresh_libraries()
+
+        assert changes == {"added": ["extra.yaml"], "changed": [], "removed": ["ethics_review.yaml"]}
+        assert reg._templates is not before
+        assert reg.get_template("extra-one") is not None
+        assert not any(t.startswith("ethics") for t in reg._templates)
+        # Untouched file: the very same compiled objects, not a re-parse.
+        assert all(reg._templates[t.template_id] is t for t in security)
+        assert reg.search_templates("extra")[0][0].template_id == "extra-one"
+        assert reg.refresh_libraries() == {"added": [], "changed": [], "removed": []}
+
+    def test_unparseable_edit_keeps_the_live_library(self, library):
+        reg = _registry(library)
+        count = len(reg._templates)
+        _touch(library / "security_audit.yaml", "templates: [unclosed\n")
+        assert reg.refresh_libraries()["changed"] == []
+        assert len(reg._templates) == count
+
+    def test_watcher_is_opt_in_and_picks_up_edits(self, library):
+        reg = _registry(library)
+        assert reg.start_watching(0) is False
+        assert reg.start_watching(0.05) is True
+        try:
+            (library / "extra.yaml").write_text(_EXTRA, encoding="utf-8")
+            deadline = time.monotonic() + 5
+            while reg.get_template("extra-one") is None and time.monotonic() < deadline:
+                time.sleep(0.02)
+            assert reg.get_template("extra-one") is not None
+        finally:
+            reg.stop_watching()
+        assert reg._watcher is None
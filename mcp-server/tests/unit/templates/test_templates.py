@@ -221,6 +221,52 @@ def test_prompt_template_render_with_defaults():
     assert rendered == "default_value"
 
 
+@pytest.mark.unit
+def test_prompt_template_compiled_render_matches_str_format():
+    """Compiled rendering produces exactly what str.format produced."""
+    template = PromptTemplate(
+        template_id="test",
+        name="Test",
+        agent_id="X",
+        content="{{literal}} {name!r} scored {score:.1f}/10 [{note}] {name}",
+        variables=[
+            TemplateVariable(name="name", description="Name"),
+            TemplateVariable(name="score", description="Score", type_hint="float"),
+            TemplateVariable(name="note", description="Note", required=False),
+        ]
+    )
+    rendered = template.render(name="Vera", score=7.25)
+    assert rendered == "{literal} 'Vera' scored 7.2/10 [] Vera"
+    assert template.render_many([{"name": "A", "score": 1}, {"name": "B", "score": 2}]) == [
+        "{literal} 'A' scored 1.0/10 [] A",
+        "{literal} 'B' scored 2.0/10 [] B",
+    ]
+
+    for library_template in get_registry().list_templates():
+        values = {v.name: f"<{v.name}>" for v in library_template.variables}
+        assert library_template.render(**values) == library_template.content.format(**values)
+
+
+@pytest.mark.unit
+def test_prompt_template_compile_rejects_unrenderable_content(registry):
+    """Unknown placeholders fail at compile/registration, not only at render."""
+    template = PromptTemplate(
+        template_id="test", name="Test", agent_id="X", content="Hello {who}"
+    )
+    with pytest.raises(ValueError, match="Unknown variable in template: 'who'"):
+        template.render()
+    with pytest.raises(ValueError, match="cannot render"):
+        template.compile()
+    for content in ("Hello {who}", "Positional {}", "Unbalanced {"):
+        with pytest.raises(ValueError):
+            registry.register_custom_template(name="Bad", agent_id="X", content=content)
+    assert registry.list_templates(include_custom=True) == []
+
+    # Reassigning content recompiles.
+    template.content = "Hello"
+    assert template.render() == "Hello"
+
+
 @pytest.mark.unit
 def test_prompt_template_provider_compatibility(sample_template):
     """Test provider compatibility check."""
@@ -0,0 +1,187 @@
+"""
+Pure-ASGI security stack: IP blocklist → CORS → rate limiting → LLM admission.
+
+Pinned: blocked callers get the same 403 and allowed responses carry the
+X-RateLimit-* headers (injected at the response start, replacing any the app
+set); streamed bodies are forwarded chunk by chunk; the request headers are
+decoded once for the whole stack; exempt paths are not counted; and the
+per-request overhead is below the BaseHTTPMiddleware layers it replaces.
+"""
+
+import asyncio
+import time
+
+import pytest
+from starlette.applications import Starlette
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.middleware.cors import CORSMiddleware
+from starlette.responses import JSONResponse, StreamingResponse
+from starlette.routing import Route
+
+from verifimind_mcp.middleware import identity as identity_module
+from verifimind_mcp.middleware import rate_limiter
+from verifimind_mcp.middleware.identity import RequestIdentity
+from verifimind_mcp.middleware.ip_blocklist import IPBlocklistMiddleware
+from verifimind_mcp.middleware.llm_admission import LLMAdmissionMiddleware
+from verifimind_mcp.middleware.rate_limiter import RateLimitMiddleware
+
+CHUNKS = [b"event: message\n", b"data: {}\n\n", b"data: {\"done\": true}\n\n"]
+
+
+async def _health(request):
+    return JSONResponse({"status": "ok"})
+
+
+async def _mcp(request):
+    await request.body()
+
+    async def stream():
+        for chunk in CHUNKS:
+            yield chunk
+
+    return StreamingResponse(
+        stream(), media_type="text/event-stream", headers={"X-RateLimit-Tier": "app"},
+    )
+
+
+def _routes():
+    return [Route("/health", _health), Route("/mcp/", _mcp, methods=["POST"])]
+
+
+def _stack(app):
+    # Same order as http_server: add_middleware inserts at 0 (last added = outermost)
+    app = LLMAdmissionMiddleware(app)
+    app = RateLimitMiddleware(app)
+    app = CORSMiddleware(app, allow_origins=["*"], allow_methods=["GET", "POST", "OPTIONS"])
+    return IPBlocklistMiddleware(app)
+
+
+async def _call(app, method="GET", path="/health", headers=(), client="203.0.113.7", body=b""):
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+        "method": method, "scheme": "https", "path": path, "raw_path": path.encode(),
+        "root_path": "", "query_string": b"", "server": ("testserver", 443),
+        "client": (client, 50000),
+        "headers": [(k.lower().encode(), v.encode()) for k, v in headers],
+    }
+    sent = []
+    delivered = False
+
+    async def receive():
+        nonlocal delivered
+        if not delivered:
+            delivered = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        await asyncio.sleep(3600)
+
+    async def send(message):
+        sent.append(message)
+
+    await app(scope, receive, send)
+    return sent
+
+
+def _headers(messages):
+    start = next(m for m in messages if m["type"] == "http.response.start")
+    return start["status"], {k.decode(): v.decode() for k, v in start["headers"]}
+
+
+@pytest.fixture
+def fresh_store(monkeypatch):
+    monkeypatch.setattr(rate_limiter, "_rate_limit_store", rate_limiter.RateLimitStore())
+
+
+class TestBehaviour:
+
+    @pytest.mark.asyncio
+    async def test_blocked_ip_gets_403(self, fresh_store):
+        status, _ = _headers(await _call(_stack(Starlette(routes=_routes())), path="/health",
+                                         headers=[("x-forwarded-for", "35.161.55.221")]))
+        assert status == 403
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_headers_injected_on_stream(self, fresh_store):
+        messages = await _call(
+            _stack(Starlette(routes=_routes())), "POST", "/mcp/",
+            headers=[("content-type", "application/json")], body=b"{}",
+        )
+        status, headers = _headers(messages)
+        assert status == 200
+        assert headers["x-ratelimit-tier"] == "anonymous"  # replaced, not duplicated
+        assert headers["x-ratelimit-limit"] == str(rate_limiter.TIER_LIMITS["anonymous"])
+        bodies = [m["body"] for m in messages if m["type"] == "http.response.body" and m["body"]]
+        assert bodies == CHUNKS
+
+    @pytest.mark.asyncio
+    async def test_exempt_path_is_not_counted(self, fresh_store):
+        _, headers = _headers(await _call(_stack(Starlette(routes=_routes()))))
+        assert "x-ratelimit-limit" not in headers
+        assert rate_limiter._rate_limit_store.get_stats()["active_ips"] == 0
+
+    @pytest.mark.asyncio
+    async def test_limit_exceeded_returns_429_with_cors(self, fresh_store):
+        app = _stack(Starlette(routes=_routes()))
+        limit = int(rate_limiter.RATE_LIMIT_PER_IP * rate_limiter.RATE_LIMIT_BURST_MULTIPLIER)
+        headers = [("origin", "https://example.test")]
+        for _ in range(limit):
+            await _call(app, "POST", "/mcp/", headers=headers, body=b"{}")
+        status, response_headers = _headers(await _call(app, "POST", "/mcp/", headers=headers, body=b"{}"))
+        assert status == 429
+        assert response_headers["x-ratelimit-remaining"] == "0"
+        assert response_headers["access-control-allow-origin"] == "*"
+
+    @pytest.mark.asyncio
+    async def test_headers_decoded_once_per_request(self, fresh_store, monkeypatch):
+        parses = []
+        original = RequestIdentity.from_scope.__func__
+
+        def counting(cls, scope):
+            parses.append(scope["path"])
+            return original(cls, scope)
+
+        monkeypatch.setattr(identity_module.RequestIdentity, "from_scope", classmethod(counting))
+        await _call(_stack(Starlette(routes=_routes())), "POST", "/mcp/", body=b"{}")
+        assert parses == ["/mcp/"]
+
+    def test_client_ip_matches_request_helper(self):
+        def ident(headers, client="10.0.0.1"):
+            return RequestIdentity({k: v for k, v in headers}, client)
+
+        assert ident([("x-forwarded-for", " 198.51.100.1 , 10.0.0.2")]).client_ip == "198.51.100.1"
+        assert ident([("x-real-ip", " 198.51.100.2 ")]).client_ip == "198.51.100.2"
+        assert ident([]).client_ip == "10.0.0.1"
+        assert ident([], client="").client_ip == "unknown"
+        assert ident([("x-verifimind-uuid", "nope")]).tier() == ("anonymous", "invalid")
+        assert ident([]).tier() == ("anonymous", "absent")
+
+
+class _PassThrough(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        return await call_next(request)
+
+
+class TestOverhead:
+
+    @pytest.mark.slow
+    @pytest.mark.asyncio
+    async def test_stack_is_cheaper_than_base_http_middleware(self, fresh_store, monkeypatch):
+        # Keep every request under the limit so both stacks do the same work.
+        monkeypatch.setattr(rate_limiter, "RATE_LIMIT_BURST_MULTIPLIER", 1e9)
+        monkeypatch.setattr(rate_limiter, "RATE_LIMIT_GLOBAL", 10**9)
+        endpoint = Starlette(routes=_routes())
+        asgi = _stack(endpoint)
+        # The replaced layers' floor: two BaseHTTPMiddleware shells doing no work at all.
+        legacy = _PassThrough(CORSMiddleware(_PassThrough(endpoint), allow_origins=["*"]))
+
+        async def best(app, method, path):
+            timings = []
+            for _ in range(5):
+                start = time.perf_counter()
+                for _ in range(100):
+                    await _call(app, method, path, body=b"{}")
+                timings.append(time.perf_counter() - start)
+            return min(timings)
+
+        for method, path in (("GET", "/health"), ("POST", "/mcp/")):
+            new, old = await best(asgi, method, path), await best(legacy, method, path)
+            assert new < old, (path, new, old)
@@ -0,0 +1,150 @@
+"""
+Contract snapshot — contract, availability and discovery documents per configuration generation.
+
+Pinned: the snapshot equals what the live builders return; it is rebuilt only
+when a contract input changes (preview tools, cascade drafts, failover flag and
+evidence, the date); discovery documents are served from pre-serialized bytes
+with a weak ETag and answer a matching If-None-Match with 304; a failed
+master-prompt build is not kept; and header-derived document keys are bounded.
+"""
+
+import json
+from datetime import date
+
+import pytest
+from starlette.testclient import TestClient
+
+from verifimind_mcp import contract_snapshot as cs
+from verifimind_mcp.availability import PREVIEW_TOOLS_ENV, get_tool_availability
+from verifimind_mcp.contract import get_public_contract
+from verifimind_mcp.llm import failover
+from verifimind_mcp.server import get_project_info, load_master_prompt
+from verifimind_mcp.utils.model_cascade import DRAFT_MODEL_ENV_SUFFIX
+
+
+@pytest.fixture(autouse=True)
+def fresh_snapshot(monkeypatch):
+    for name in cs._input_env_names():
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.delenv(cs.SNAPSHOT_ENV, raising=False)
+    cs.reset_contract_snapshot()
+    yield
+    cs.reset_contract_snapshot()
+
+
+@pytest.fixture
+def client():
+    from http_server import app
+    return TestClient(app)
+
+
+class TestGeneration:
+
+    def test_snapshot_matches_live_builders(self):
+        snapshot = cs.contract_snapshot()
+        assert snapshot.contract == get_public_contract()
+        assert snapshot.tool_availability == get_tool_availability()
+        assert json.loads(snapshot.project_info_json) == get_project_info()
+        assert snapshot.master_prompt() == load_master_prompt()
+
+    def test_unchanged_inputs_reuse_the_snapshot(self):
+        assert cs.contract_snapshot() is cs.contract_snapshot()
+
+    @pytest.mark.parametrize("name, value", [
+        (PREVIEW_TOOLS_ENV, "trinity_jobs"),
+        (f"X{DRAFT_MODEL_ENV_SUFFIX}", "gemini-draft"),
+        (failover.ENABLE_ENV, "1"),
+    ])
+    def test_changed_input_rebuilds(self, monkeypatch, name, value):
+        before = cs.contract_snapshot()
+        monkeypatch.setenv(name, value)
+        after = cs.contract_snapshot()
+        assert after is not before
+        assert after.contract == get_public_contract()
+        assert after.tool_availability == get_tool_availability()
+
+    def test_date_is_part_of_the_generation(self, monkeypatch):
+        before = cs.contract_snapshot()
+
+        class _Tomorrow(date):
+            @classmethod
+            def today(cls):
+                return date.fromordinal(date.today().toordinal() + 1)
+
+        monkeypatch.setattr(cs, "date", _Tomorrow)
+        assert cs.contract_snapshot() is not before
+
+    def test_unvalidated_evidence_is_rechecked(self, monkeypatch):
+        monkeypatch.setenv(failover.ENABLE_ENV, "1")
+        snapshot = cs.contract_snapshot()
+        assert snapshot.contract["runtime_failover_enabled"] is False
+        assert snapshot.expires_at is not None
+        monkeypatch.setattr(snapshot, "expires_at", 0.0)
+        assert cs.contract_snapshot() is not snapshot
+
+    def test_kill_switch_rebuilds_every_read(self, monkeypatch):
+        monkeypatch.setenv(cs.SNAPSHOT_ENV, "0")
+        assert cs.contract_snapshot() is not cs.contract_snapshot()
+
+    def test_failed_master_prompt_is_not_kept(self, monkeypatch):
+        from verifimind_mcp import server
+        snapshot = cs.contract_snapshot()
+        monkeypatch.setattr(server, "load_master_prompt", lambda: server.MASTER_PROMPT_UNAVAILABLE)
+        assert snapshot.master_prompt() == server.MASTER_PROMPT_UNAVAILABLE
+        monkeypatch.undo()
+        assert snapshot.master_prompt() == load_master_prompt()
+
+    def test_document_keys_are_bounded(self, monkeypatch):
+        monkeypatch.setattr(cs, "MAX_DOCUMENTS", 2)
+        snapshot = cs.contract_snapshot()
+        builds = []
+        for key in ("a", "b", "c", "c"):
+            snapshot.document(key, lambda: builds.append(1) or b"{}")
+        assert len(snapshot._documents) == 2
+        assert len(builds) == 4  # "c" is rebuilt each time, never stored
+
+
+class TestEtag:
+
+    @pytest.mark.parametrize("header, expected", [
+        ('W/"abc"', True),
+        ('"abc"', True),
+        ('"x", W/"abc"', True),
+        ("*", True),
+        ('"abcd"', False),
+        ("", False),
+    ])
+    def test_if_none_match(self, header, expected):
+        assert cs.etag_matches(header, 'W/"abc"') is expected
+
+    @pytest.mark.parametrize("path", [
+        "/.well-known/mcp/server-card.json",
+        "/.well-known/mcp-config",
+        "/setup",
+    ])
+    def test_discovery_documents_revalidate(self, client, path):
+        first = client.get(path)
+        assert first.status_code == 200
+        etag = first.headers["etag"]
+        assert etag.startswith('W/"')
+        assert first.headers["cache-control"] == "no-cache"
+
+        second = client.get(path, headers={"If-None-Match": etag})
+        assert second.status_code == 304
+        assert second.content == b""
+        assert second.headers["etag"] == etag
+
+    def test_document_follows_the_request_host(self, client):
+        a = client.get("/.well-known/mcp-config", headers={"host": "a.example"})
+        b = client.get("/.well-known/mcp-config", headers={"host": "b.example"})
+        assert a.json()["mcpServers"]["verifimind-genesis"]["url"] == "http://a.example/mcp/"
+        assert b.json()["mcpServers"]["verifimind-genesis"]["url"] == "http://b.example/mcp/"
+        assert a.headers["etag"] != b.headers["etag"]
+
+    def test_new_generation_changes_the_etag(self, client, monkeypatch):
+        before = client.get("/.well-known/mcp-config")
+        monkeypatch.setenv(PREVIEW_TOOLS_ENV, "trinity_jobs")
+        after = client.get("/.well-known/mcp-config", headers={"If-None-Match": before.headers["etag"]})
+        assert after.status_code == 200
+        availability = after.json()["mcpServers"]["verifimind-genesis"]["tool_availability"]
+        assert "submit_trinity" in availability["preview_tools"]
@@ -0,0 +1,140 @@
+"""`fields` projection and the optional orjson HTTP encoder.
+
+Pinned: JSON-pointer projection keeps only the requested paths plus the
+quality envelope (a partial run's stage-failure metadata included), reports paths that did not resolve, never prunes an error
+payload, and is applied to the returned payload only; the fast encoder
+produces the same JSON value as Starlette's stdlib rendering.
+"""
+
+import json
+
+import pytest
+
+from verifimind_mcp import config_helper, server
+from verifimind_mcp.agents import CSAgent, XAgent, ZAgent
+from verifimind_mcp.utils import fast_json
+from verifimind_mcp.utils.reasoning_view import normalize_fields, project_fields
+
+from .mcp_tool_harness import call
+from .test_v0558_trinity_traceability import _NamedProvider, _real_results
+
+_PAYLOAD = {
+    "synthesis": {"overall_score": 7.9, "recommendation": "proceed"},
+    "z_analysis": {"veto_triggered": False, "ethics_score": 8.0},
+    "reasoning": {"x": {"steps": [{"n": 1, "thought": "a"}, {"n": 2, "thought": "b"}]}},
+    "analysis_incomplete": False,
+    "_overall_quality": "full",
+    "_server_version": "test",
+}
+
+
+class TestProjection:
+    def test_keeps_requested_paths_and_envelope(self):
+        projected = project_fields(
+            _PAYLOAD, ["/synthesis/overall_score", "/z_analysis/veto_triggered"]
+        )
+        assert projected["synthesis"] == {"overall_score": 7.9}
+        assert projected["z_analysis"] == {"veto_triggered": False}
+        assert projected["_overall_quality"] == "full"
+        assert projected["analysis_incomplete"] is False
+        assert "reasoning" not in projected
+        assert projected["_fields"]["missing"] == []
+
+    def test_array_index_and_escaped_tokens(self):
+        payload = {"a/b": {"~k": 1}, **_PAYLOAD}
+        projected = project_fields(payload, ["/reasoning/x/steps/1/thought", "/a~1b/~0k"])
+        assert projected["reasoning"] == {"x": {"steps": {"1": {"thought": "b"}}}}
+        assert projected["a/b"] == {"~k": 1}
+
+    def test_unresolved_and_malformed_paths_are_reported(self):
+        projected = project_fields(_PAYLOAD, ["/nope", "synthesis", "/reasoning/x/steps/9"])
+        assert projected["_fields"]["missing"] == [
+            "/nope", "synthesis", "/reasoning/x/steps/9",
+        ]
+
+    def test_errors_and_empty_fields_are_untouched(self):
+        error = {"error": True, "error_code": "X", "details": {"a": 1}}
+        assert project_fields(error, ["/error_code"]) is error
+        assert project_fields(_PAYLOAD, normalize_fields([])) is _PAYLOAD
+
+    def test_normalize_accepts_comma_string(self):
+        assert normalize_fields(" /a , /b ,") == ["/a", "/b"]
+        assert normalize_fields(None) is None
+
+
+class TestRunFullTrinity:
+    @pytest.mark.asyncio
+    async def test_projection_on_the_returned_payload_only(self, monkeypatch):
+        providers = {
+            "X": _NamedProvider("gemini/gemini-3.5-flash-lite"),
+            "Z": _NamedProvider("groq/openai/gpt-oss-120b"),
+            "CS": _NamedProvider("groq/openai/gpt-oss-120b"),
+        }
+        monkeypatch.setattr(config_helper, "get_trinity_providers", lambda _ctx: providers)
+        persisted = []
+        monkeypatch.setattr(
+            server, "persist_trinity_result",
+            lambda _uuid, _tool, payload: persisted.append(payload),
+        )
+        for agent_cls, result in zip((XAgent, ZAgent, CSAgent), _real_results()):
+            async def analyze(_self, _concept, _prior=None, _metrics=None, _r=result):
+                return _r
+            monkeypatch.setattr(agent_cls, "analyze", analyze)
+
+        payload = await call(server.create_http_server(), "run_full_trinity", {
+            "concept_name": "projection-probe",
+            "concept_description": "Scores only.",
+            "detail": "full",
+            "fields": ["/synthesis/recommendation"],
+        })
+
+        assert set(payload["synthesis"]) == {"recommendation"}
+        assert "reasoning" not in payload and "x_analysis" not in payload
+        assert payload["_fields"]["missing"] == []
+        assert "_overall_quality" in payload
+        assert persisted and "reasoning" in persisted[0]
+
+    @pytest.mark.asyncio
+    async def test_projection_keeps_stage_failure_metadata(self, monkeypatch):
+        providers = {
+            "X": _NamedProvider("gemini/gemini-3.5-flash-lite"),
+            "Z": _NamedProvider("groq/openai/gpt-oss-120b"),
+            "CS": _NamedProvider("groq/openai/gpt-oss-120b"),
+        }
+        monkeypatch.setattr(config_helper, "get_trinity_providers", lambda _ctx: providers)
+        monkeypatch.setattr(server, "persist_trinity_result", lambda *_args: None)
+        x_result, z_result, _ = _real_results()
+        for agent_cls, result in ((XAgent, x_result), (ZAgent, z_result)):
+            async def analyze(_self, _concept, _prior=None, _metrics=None, _r=result):
+                return _r
+            monkeypatch.setattr(agent_cls, "analyze", analyze)
+
+        async def cs_down(_self, _concept, _prior=None, _metrics=None):
+            raise RuntimeError("CS provider down")
+        monkeypatch.setattr(CSAgent, "analyze", cs_down)
+
+        payload = await call(server.create_http_server(), "run_full_trinity", {
+            "concept_name": "projection-probe",
+            "concept_description": "Scores only.",
+            "fields": ["/synthesis/overall_score"],
+        })
+
+        assert set(payload["synthesis"]) == {"overall_score"}
+        assert payload["status"] == "partial"
+        assert payload["_agents_failed"] == ["CS"]
+        assert "CS" in payload["_stage_errors"]
+        assert "_deadline" in payload
+
+
+class TestFastJSON:
+    def test_same_value_as_stdlib(self, monkeypatch):
+        content = {"a": [1, 2.5, None, True], "é": "ü", 3: "int key"}
+        fast = json.loads(fast_json.dumps(content))
+        monkeypatch.setenv(fast_json.ORJSON_ENV, "0")
+        stdlib = json.loads(fast_json.dumps(content))
+        assert fast == stdlib == {"a": [1, 2.5, None, True], "é": "ü", "3": "int key"}
+
+    def test_response_renders_through_dumps(self):
+        response = fast_json.FastJSONResponse({"ok": True})
+        assert json.loads(response.body) == {"ok": True}
+        assert response.media_type == "application/json"
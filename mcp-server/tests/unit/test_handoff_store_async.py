@@ -0,0 +1,214 @@
+"""
+Handoff store: per-agent index, LRU keys, write-behind, read-through.
+
+Pinned: agent-filtered reads stay correct across per-key eviction; at most
+max_keys namespaces stay in memory; add() never waits on Firestore while a
+loop runs and queued writes are committed in batches carrying the key hash,
+and by the app lifespan on shutdown;
+aget() loads another instance's records once per key (single query for
+concurrent readers), merged with local records, newest first.
+"""
+
+import asyncio
+
+import pytest
+
+from verifimind_mcp.coordination import handoff_store as hs
+
+
+def _record(agent_id, idx, ts=None):
+    record = hs.build_handoff_record(agent_id, "dev", [f"item-{idx}"], [], [], [], [], None)
+    record["handoff_id"] = f"id-{idx}"
+    record["filename"] = f"f-{idx}.md"
+    record["timestamp"] = ts or f"2026-10-01T00:00:{idx:02d}+00:00"
+    return record
+
+
+class _Doc:
+    def __init__(self, data):
+        self._data = data
+
+    def to_dict(self):
+        return dict(self._data)
+
+
+class _FakeAsyncFirestore:
+    """Just enough of firestore.AsyncClient for the handoff store."""
+
+    def __init__(self, docs=()):
+        self.docs = {d["filename"]: d for d in docs}
+        self.commits = []
+        self.queries = 0
+        self._where = None
+
+    def collection(self, _name):
+        return self
+
+    def document(self, doc_id):
+        return doc_id
+
+    def batch(self):
+        client, writes = self, []
+
+        class _Batch:
+            def set(self, ref, data):
+                writes.append((ref, data))
+
+            async def commit(self):
+                client.commits.append(list(writes))
+                client.docs.update({ref: data for ref, data in writes})
+
+        return _Batch()
+
+    def where(self, filter):
+        self._where = filter
+        return self
+
+    def order_by(self, *_args, **_kwargs):
+        return self
+
+    def limit(self, _n):
+        return self
+
+    async def get(self):
+        self.queries += 1
+        await asyncio.sleep(0)
+        wanted = self._where.value
+        return [_Doc(d) for d in sorted(
+            self.docs.values(), key=lambda d: d["timestamp"], reverse=True,
+        ) if d.get("pioneer_key_hash") == wanted]
+
+
+@pytest.fixture
+def firestore(monkeypatch):
+    monkeypatch.setenv("FIRESTORE_PROJECT_ID", "test-project")
+    monkeypatch.setattr(hs, "HANDOFF_FLUSH_INTERVAL", 0)
+    fake = _FakeAsyncFirestore()
+    monkeypatch.setattr(hs, "_get_firestore_async_client", lambda: fake)
+    return fake
+
+
+class TestLocalIndex:
+    def test_agent_filter_survives_eviction(self):
+        store = hs.HandoffStore(max_per_key=3)
+        for idx, agent in enumerate(["RNA", "XV", "RNA", "XV", "RNA"]):
+            store.add("k", _record(agent, idx))
+        assert [r["handoff_id"] for r in store.get_all("k")] == ["id-2", "id-3", "id-4"]
+        assert [r["handoff_id"] for r in store.get("k", agent_id="RNA", count=10)] == ["id-4", "id-2"]
+        assert [r["handoff_id"] for r in store.get("k", agent_id="XV", count=10)] == ["id-3"]
+        assert store.get("k", agent_id="nobody") == []
+
+    def test_least_recently_used_keys_are_dropped(self):
+        store = hs.HandoffStore(max_keys=2)
+        store.add("a", _record("RNA", 0))
+        store.add("b", _record("RNA", 1))
+        store.get("a")  # touch: "b" is now least recent
+        store.add("c", _record("RNA", 2))
+        assert store.count("a") == store.count("c") == 1
+        assert store.count("b") == 0
+
+
+class TestWriteBehind:
+    @pytest.mark.asyncio
+    async def test_writes_are_batched_with_key_hash(self, firestore, monkeypatch):
+        def no_sync_client():
+            raise AssertionError("blocking client used inside the event loop")
+
+        monkeypatch.setattr(hs, "_get_firestore_client", no_sync_client)
+        store = hs.HandoffStore()
+        for idx in range(3):
+            await store.aadd("pioneer-key-123", _record("RNA", idx))
+        assert store.count("pioneer-key-123") == 3
+        assert firestore.commits == []  # nothing awaited on the write path
+
+        for _ in range(20):
+            await asyncio.sleep(0)
+            if firestore.commits:
+                break
+        assert len(firestore.commits) == 1 and len(firestore.commits[0]) == 3
+        _, data = firestore.commits[0][0]
+        assert data["pioneer_key_hash"] == hs.pioneer_key_hash("pioneer-key-123")
+        assert data["pioneer_key_prefix"] == "pioneer-"
+        assert await store.flush() == 0
+
+    @pytest.mark.asyncio
+    async def test_shutdown_commits_queued_writes(self, firestore, monkeypatch):
+        import contextlib
+        import types
+
+        import http_server
+
+        @contextlib.asynccontextmanager
+        async def no_session_lifespan(_app):
+            yield
+
+        monkeypatch.setattr(hs, "HANDOFF_FLUSH_INTERVAL", 60)
+        monkeypatch.setattr(
+            http_server, "mcp_app", types.SimpleNamespace(lifespan=no_session_lifespan)
+        )
+        monkeypatch.setattr(http_server, "install_log_pipeline", lambda: None)
+        monkeypatch.setattr(http_server, "shutdown_log_pipeline", lambda: None)
+        monkeypatch.setattr(http_server, "shutdown_offload", lambda: None)
+        store = hs.HandoffStore()
+        monkeypatch.setattr(http_server, "get_handoff_store", lambda: store)
+
+        async with http_server.app_lifespan(http_server.app):
+            await store.aadd("pioneer-key-123", _record("RNA", 0))
+            await asyncio.sleep(0)
+            assert firestore.commits == []  # still waiting out the interval
+        assert [doc_id for doc_id, _ in firestore.commits[0]] == ["f-0.md"]
+        store._writer.cancel()
+
+    def test_no_loop_writes_synchronously(self, monkeypatch):
+        monkeypatch.setenv("FIRESTORE_PROJECT_ID", "test-project")
+        written = []
+
+        class _SyncRef:
+            def __init__(self, doc_id):
+                self.doc_id = doc_id
+
+            def set(self, data):
+                written.append((self.doc_id, data))
+
+        class _SyncClient:
+            def collection(self, _name):
+                return self
+
+            def document(self, doc_id):
+                return _SyncRef(doc_id)
+
+        monkeypatch.setattr(hs, "_get_firestore_client", lambda: _SyncClient())
+        hs.HandoffStore().add("k", _record("RNA", 0))
+        assert [doc_id for doc_id, _ in written] == ["f-0.md"]
+
+
+class TestReadThrough:
+    @pytest.mark.asyncio
+    async def test_other_instance_records_are_loaded_once(self, firestore):
+        writer = hs.HandoffStore()
+        for idx in (0, 2):
+            writer.add("shared-key", _record("XV", idx))
+        await writer.flush()
+        await asyncio.sleep(0)
+
+        reader = hs.HandoffStore()
+        reader.add("shared-key", _record("RNA", 1))  # local-only record
+        results = await asyncio.gather(*(
+            reader.aget("shared-key", count=10) for _ in range(5)
+        ))
+        assert firestore.queries == 1
+        assert [r["handoff_id"] for r in results[0]] == ["id-2", "id-1", "id-0"]
+        assert "pioneer_key_hash" not in results[0][0]
+        assert [r["handoff_id"] for r in await reader.aget("shared-key", agent_id="XV", count=10)] == [
+            "id-2", "id-0",
+        ]
+        assert firestore.queries == 1
+        assert await reader.aget("other-key") == []
+
+    @pytest.mark.asyncio
+    async def test_without_firestore_reads_are_local(self, monkeypatch):
+        monkeypatch.delenv("FIRESTORE_PROJECT_ID", raising=False)
+        monkeypatch.delenv("GOOGLE_CLOUD_PROJECT", raising=False)
+        store = hs.HandoffStore()
+        store.add("k", _record("RNA", 0))
+        assert [r["handoff_id"] for r in await store.aget("k")] == ["id-0"]
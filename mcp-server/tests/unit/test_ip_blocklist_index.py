@@ -0,0 +1,149 @@
+"""
+IP blocklist lookup structures — prefix index, UA automaton, verdict cache, file reload.
+
+Pinned: CIDR lookups agree with a linear membership scan (most specific range
+wins when ranges nest); the Aho-Corasick matcher reports exactly the pattern a
+first-match ``in`` scan would; verdicts are cached per identity in a bounded
+LRU; IP_BLOCKLIST_FILE entries are merged in when the file changes, and a bad
+file keeps the previous lists.
+"""
+
+import ipaddress
+import json
+import os
+import random
+from unittest.mock import MagicMock
+
+import pytest
+
+from verifimind_mcp.middleware import ip_blocklist as ib
+
+
+def _request(xff="", ua="python-httpx/0.27.0", client_host="203.0.113.1"):
+    req = MagicMock()
+    req.url.path = "/mcp/"
+    req.client = MagicMock()
+    req.client.host = client_host
+    req.headers = {"user-agent": ua, **({"x-forwarded-for": xff} if xff else {})}
+    return req
+
+
+@pytest.fixture
+def restore_blocklist(monkeypatch):
+    monkeypatch.setattr(ib, "_active", ib._active)
+    monkeypatch.setattr(ib, "_loaded_signature", ib._loaded_signature)
+    monkeypatch.setattr(ib, "_next_check", 0.0)
+    monkeypatch.setattr(ib, "BLOCKLIST_RELOAD_INTERVAL", 0)
+    monkeypatch.delenv(ib.BLOCKLIST_FILE_ENV, raising=False)
+
+
+class TestPrefixIndex:
+
+    def test_matches_linear_scan(self):
+        rng = random.Random(42)
+        cidrs = []
+        for i in range(2000):
+            if i % 2:
+                prefix = rng.choice((8, 16, 20, 24, 28, 32))
+                addr = ipaddress.IPv4Address(rng.getrandbits(32))
+            else:
+                prefix = rng.choice((32, 48, 56, 64, 128))
+                addr = ipaddress.IPv6Address(rng.getrandbits(128))
+            cidrs.append((str(ipaddress.ip_network(f"{addr}/{prefix}", strict=False)), f"R{i}"))
+        compiled = ib.CompiledBlocklist([], cidrs, [])
+        networks = [(ipaddress.ip_network(c), r) for c, r in cidrs]
+
+        probes = [str(net[rng.randrange(net.num_addresses)]) for net, _ in networks[:300]]
+        probes += [str(ipaddress.IPv4Address(rng.getrandbits(32))) for _ in range(300)]
+        probes += [str(ipaddress.IPv6Address(rng.getrandbits(128))) for _ in range(300)]
+        for probe in probes:
+            addr = ipaddress.ip_address(probe)
+            containing = [(n.prefixlen, r) for n, r in networks if addr in n]
+            expected = max(containing, key=lambda c: c[0])[1] if containing else ""
+            if containing and len({p for p, _ in containing}) < len(containing):
+                continue  # identical-length overlap: first listed wins, checked below
+            assert compiled.match_cidr(probe) == expected, probe
+
+    def test_most_specific_range_wins(self):
+        compiled = ib.CompiledBlocklist([], [
+            ("10.0.0.0/8", "WIDE"), ("10.1.0.0/16", "NARROW"), ("10.1.0.0/16", "DUPLICATE"),
+        ], [])
+        assert compiled.match_cidr("10.1.2.3") == "NARROW"
+        assert compiled.match_cidr("10.2.0.1") == "WIDE"
+        assert compiled.match_cidr("11.0.0.1") == ""
+        assert compiled.match_cidr("not-an-ip") == ""
+
+
+class TestPatternMatcher:
+
+    def test_matches_first_listed_substring(self):
+        rng = random.Random(7)
+        for _ in range(2000):
+            patterns = [
+                "".join(rng.choice("abc") for _ in range(rng.randint(1, 4)))
+                for _ in range(rng.randint(1, 6))
+            ]
+            matcher = ib._PatternMatcher(patterns)
+            for _ in range(10):
+                text = "".join(rng.choice("abcd") for _ in range(rng.randint(0, 16)))
+                assert matcher.search(text) == next((p for p in patterns if p in text), "")
+
+    def test_shipped_patterns_case_insensitive(self):
+        compiled = ib.build_blocklist()
+        for pattern in ib.BLOCKED_UA_PATTERNS:
+            assert compiled.match_ua(f"Mozilla/5.0 {pattern.upper()} x") == pattern.lower()
+        assert compiled.match_ua("mcp-remote/0.1.0 (claude-code)") == ""
+
+
+class TestVerdictCache:
+
+    def test_repeat_identity_skips_matching(self, monkeypatch):
+        compiled = ib.CompiledBlocklist([("198.51.100.9", "TEST")], [], ["evil"], cache_size=2)
+        calls = []
+        original = compiled.check_ips
+        monkeypatch.setattr(compiled, "check_ips", lambda ips: calls.append(ips) or original(ips))
+
+        assert compiled.cached_ip_verdict("198.51.100.9", "10.0.0.1") == (True, "198.51.100.9", "TEST")
+        assert compiled.cached_ip_verdict("198.51.100.9", "10.0.0.1")[0] is True
+        assert len(calls) == 1
+        for host in ("10.0.0.2", "10.0.0.3"):
+            compiled.cached_ip_verdict("", host)
+        assert len(compiled._ip_verdicts) == 2
+        compiled.cached_ip_verdict("198.51.100.9", "10.0.0.1")
+        assert len(calls) == 4  # evicted, recomputed
+
+        assert compiled.cached_ua_verdict("EVIL bot") == "evil"
+        assert compiled.cached_ua_verdict("fine") == ""
+
+
+class TestFileReload:
+
+    def test_file_entries_are_merged_and_reloaded(self, tmp_path, monkeypatch, restore_blocklist):
+        path = tmp_path / "blocklist.json"
+        path.write_text(json.dumps({
+            "ips": [["192.0.2.10", "FILE_SCANNER", "2026-10-19", "ops"]],
+            "cidrs": [["198.18.0.0/15", "FILE_NET"]],
+            "user_agents": ["BadBot"],
+        }))
+        monkeypatch.setenv(ib.BLOCKLIST_FILE_ENV, str(path))
+
+        assert ib._check_ip(_request(client_host="192.0.2.10")) == (True, "192.0.2.10", "FILE_SCANNER")
+        assert ib._check_ip(_request(xff="198.19.255.1"))[2] == "FILE_NET"
+        assert ib._check_ua(_request(ua="badbot/1.0")) == (True, "badbot")
+        assert ib._check_ip(_request(client_host="35.161.55.221"))[0]  # built-ins kept
+
+        path.write_text(json.dumps({"user_agents": ["OtherBot"]}))
+        os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 1_000_000_000))
+        assert ib._check_ua(_request(ua="badbot/1.0")) == (False, "")
+        assert ib._check_ua(_request(ua="otherbot")) == (True, "otherbot")
+
+    def test_invalid_file_keeps_previous_lists(self, tmp_path, monkeypatch, restore_blocklist):
+        path = tmp_path / "blocklist.json"
+        path.write_text(json.dumps({"user_agents": ["BadBot"]}))
+        monkeypatch.setenv(ib.BLOCKLIST_FILE_ENV, str(path))
+        assert ib._check_ua(_request(ua="badbot"))[0]
+
+        path.write_text(json.dumps({"ips": ["not-an-ip"], "user_agents": []}))
+        os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 1_000_000_000))
+        assert ib._check_ua(_request(ua="badbot"))[0]
+        assert ib.get_blocklist() is ib._active
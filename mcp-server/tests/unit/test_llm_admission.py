@@ -0,0 +1,235 @@
+"""
+Tests for LLM admission control (tier-priority in-flight limit + load shedding)
+
+Coverage:
+  - Admits up to max_in_flight, queues beyond it
+  - Freed slots go to the highest tier first, FIFO within a tier
+  - Full queue: higher tier displaces the lowest waiter, equal tier is shed
+  - Queue wait timeout → AdmissionRejected with Retry-After; a displacement
+    landing as the wait expires is still reported as displaced
+  - Time spent queued reaches the app, so the run deadline starts at arrival
+  - Retry-After grows with queue depth and observed call latency
+  - Only LLM-bound tools/call messages are gated
+  - Middleware: 503 + Retry-After when shed, pass-through otherwise
+  - Middleware: bodies over the buffering cap get 413, declared or streamed
+"""
+
+import asyncio
+import json
+
+import pytest
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from verifimind_mcp.middleware import llm_admission
+from verifimind_mcp.middleware.llm_admission import (
+    AdmissionRejected,
+    LLMAdmissionController,
+    TIER_PRIORITY,
+    LLMAdmissionMiddleware,
+    _llm_tool_calls,
+)
+from verifimind_mcp.utils.deadline import ADMISSION_WAIT_HEADER
+
+
+def _tool_call(name):
+    return json.dumps({
+        "jsonrpc": "2.0", "id": 1, "method": "tools/call",
+        "params": {"name": name, "arguments": {}},
+    }).encode()
+
+
+class TestController:
+
+    @pytest.mark.asyncio
+    async def test_admits_up_to_limit_then_queues(self):
+        ctl = LLMAdmissionController(max_in_flight=2, queue_limit=4, max_wait=5)
+        await ctl.acquire("anonymous")
+        await ctl.acquire("anonymous")
+        waiter = asyncio.ensure_future(ctl.acquire("anonymous"))
+        await asyncio.sleep(0)
+        assert not waiter.done()
+        assert ctl.queue_depth() == 1
+        ctl.release(1.0)
+        await waiter
+        assert ctl.in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_higher_tier_is_served_first(self):
+        ctl = LLMAdmissionController(max_in_flight=1, queue_limit=4, max_wait=5)
+        await ctl.acquire("anonymous")
+        order = []
+
+        async def wait(tier):
+            await ctl.acquire(tier)
+            order.append(tier)
+
+        tasks = [asyncio.ensure_future(wait(t))
+                 for t in ("anonymous", "scholar", "pioneer")]
+        await asyncio.sleep(0)
+        for _ in range(3):
+            ctl.release(1.0)
+            await asyncio.sleep(0)
+        await asyncio.gather(*tasks)
+        assert order == ["pioneer", "scholar", "anonymous"]
+
+    @pytest.mark.asyncio
+    async def test_full_queue_displaces_lower_tier_and_sheds_equal(self):
+        ctl = LLMAdmissionController(max_in_flight=1, queue_limit=1, max_wait=5)
+        await ctl.acquire("scholar")
+        anonymous = asyncio.ensure_future(ctl.acquire("anonymous"))
+        await asyncio.sleep(0)
+        pioneer = asyncio.ensure_future(ctl.acquire("pioneer"))
+        await asyncio.sleep(0)
+        with pytest.raises(AdmissionRejected) as displaced:
+            await anonymous
+        assert displaced.value.reason == "displaced"
+
+        with pytest.raises(AdmissionRejected) as shed:
+            await ctl.acquire("pioneer")
+        assert shed.value.reason == "queue_full"
+        assert shed.value.retry_after >= 1
+
+        ctl.release(1.0)
+        await pioneer
+
+    @pytest.mark.asyncio
+    async def test_wait_timeout_rejects(self):
+        ctl = LLMAdmissionController(max_in_flight=1, queue_limit=4, max_wait=0.01)
+        await ctl.acquire("pioneer")
+        with pytest.raises(AdmissionRejected) as rejected:
+            await ctl.acquire("pioneer")
+        assert rejected.value.reason == "queue_timeout"
+        assert ctl.queue_depth() == 0
+
+    @pytest.mark.asyncio
+    async def test_displacement_as_the_wait_expires_is_not_a_timeout(self, monkeypatch):
+        ctl = LLMAdmissionController(max_in_flight=1, queue_limit=1, max_wait=5)
+        await ctl.acquire("scholar")
+
+        async def displaced_then_expired(_awaitable, _timeout):
+            ctl._shed_one_below(TIER_PRIORITY["pioneer"])
+            raise asyncio.TimeoutError
+
+        monkeypatch.setattr(llm_admission.asyncio, "wait_for", displaced_then_expired)
+        with pytest.raises(AdmissionRejected) as rejected:
+            await ctl.acquire("anonymous")
+        assert rejected.value.reason == "displaced"
+        stats = ctl.get_stats()
+        assert (stats["displaced"], stats["timed_out"], stats["shed"]) == (1, 0, 0)
+
+    @pytest.mark.asyncio
+    async def test_plain_expiry_is_a_timeout(self):
+        ctl = LLMAdmissionController(max_in_flight=1, queue_limit=1, max_wait=0.01)
+        await ctl.acquire("scholar")
+        with pytest.raises(AdmissionRejected) as rejected:
+            await ctl.acquire("anonymous")
+        assert rejected.value.reason == "queue_timeout"
+        stats = ctl.get_stats()
+        assert (stats["displaced"], stats["timed_out"]) == (0, 1)
+
+    @pytest.mark.asyncio
+    async def test_retry_after_tracks_depth_and_latency(self):
+        ctl = LLMAdmissionController(max_in_flight=1, queue_limit=8, max_wait=5)
+        ctl.avg_latency = 10.0
+        assert ctl.retry_after() == 10
+        await ctl.acquire("anonymous")
+        waiters = [asyncio.ensure_future(ctl.acquire("anonymous")) for _ in range(2)]
+        await asyncio.sleep(0)
+        assert ctl.retry_after() == 30
+        for task in waiters:
+            task.cancel()
+        await asyncio.gather(*waiters, return_exceptions=True)
+
+    def test_zero_limit_disables(self):
+        ctl = LLMAdmissionController(max_in_flight=0)
+        assert ctl.enabled is False
+        asyncio.run(ctl.acquire("anonymous"))
+        assert ctl.in_flight == 0
+
+
+class TestToolDetection:
+
+    def test_llm_tools_are_gated(self):
+        assert _llm_tool_calls(_tool_call("run_full_trinity")) == 1
+        assert _llm_tool_calls(_tool_call("consult_agent_z")) == 1
+
+    def test_other_messages_pass(self):
+        assert _llm_tool_calls(_tool_call("list_prompt_templates")) == 0
+        assert _llm_tool_calls(b'{"jsonrpc":"2.0","method":"tools/list","id":1}') == 0
+        assert _llm_tool_calls(b"not json") == 0
+
+
+class TestMiddleware:
+
+    def _client(self, ctl):
+        async def mcp(request):
+            body = await request.json()
+            return JSONResponse({"echo": body["params"]["name"]})
+
+        app = Starlette(routes=[Route("/mcp/", mcp, methods=["POST"])])
+        return TestClient(LLMAdmissionMiddleware(app, controller=ctl))
+
+    def test_body_is_replayed_and_slot_released(self):
+        ctl = LLMAdmissionController(max_in_flight=1, queue_limit=0, max_wait=1)
+        client = self._client(ctl)
+        for _ in range(2):
+            resp = client.post("/mcp/", content=_tool_call("run_full_trinity"))
+            assert resp.status_code == 200
+            assert resp.json() == {"echo": "run_full_trinity"}
+        assert ctl.in_flight == 0
+
+    def test_queue_wait_is_passed_on_and_not_spoofable(self):
+        seen = []
+
+        async def mcp(request):
+            seen.append(request.headers.getlist(ADMISSION_WAIT_HEADER))
+            return JSONResponse({})
+
+        app = Starlette(routes=[Route("/mcp/", mcp, methods=["POST"])])
+        ctl = LLMAdmissionController(max_in_flight=1, queue_limit=0, max_wait=1)
+        client = TestClient(LLMAdmissionMiddleware(app, controller=ctl))
+        resp = client.post(
+            "/mcp/", content=_tool_call("run_full_trinity"),
+            headers={ADMISSION_WAIT_HEADER: "999"},
+        )
+        assert resp.status_code == 200
+        [[waited]] = seen
+        assert 0 <= float(waited) < 5
+
+    def test_shed_request_gets_503_with_retry_after(self):
+        ctl = LLMAdmissionController(max_in_flight=1, queue_limit=0, max_wait=1)
+        ctl.in_flight = 1  # instance already at its limit
+        resp = self._client(ctl).post("/mcp/", content=_tool_call("consult_agent_x"))
+        assert resp.status_code == 503
+        assert int(resp.headers["Retry-After"]) >= 1
+        assert resp.json()["error"] == "server_busy"
+
+    def test_non_llm_tool_bypasses_full_instance(self):
+        ctl = LLMAdmissionController(max_in_flight=1, queue_limit=0, max_wait=1)
+        ctl.in_flight = 1
+        resp = self._client(ctl).post(
+            "/mcp/", content=_tool_call("list_prompt_templates")
+        )
+        assert resp.status_code == 200
+
+    def test_oversized_body_is_refused_not_buffered(self, monkeypatch):
+        monkeypatch.setattr(llm_admission, "LLM_ADMISSION_MAX_BODY", 64)
+        ctl = LLMAdmissionController(max_in_flight=1, queue_limit=0, max_wait=1)
+        client = self._client(ctl)
+        resp = client.post("/mcp/", content=b"x" * 65)
+        assert resp.status_code == 413
+
+        def streamed():  # chunked: no Content-Length to check up front
+            for _ in range(10):
+                yield b"x" * 16
+
+        resp = client.post("/mcp/", content=streamed())
+        assert resp.status_code == 413
+        assert resp.json()["error"] == "payload_too_large"
+        assert ctl.in_flight == 0
+
+        monkeypatch.setattr(llm_admission, "LLM_ADMISSION_MAX_BODY", 4096)
+        assert client.post("/mcp/", content=_tool_call("run_full_trinity")).status_code == 200
@@ -0,0 +1,203 @@
+"""
+PolarAdapter cache under concurrency.
+
+Pinned: concurrent checks for one UUID share a single Polar lookup (and a
+failure reaches every waiter as one circuit-breaker failure); the cache is an
+LRU bounded by max_entries; a hit near expiry answers from cache and refreshes
+in the background; a webhook update or invalidation wins over a lookup that
+was already in flight; and PolarClient reuses one pooled httpx client.
+"""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+
+from verifimind_mcp.integrations.polar_client import PolarClient
+from verifimind_mcp.middleware.polar_adapter import PolarAdapter
+
+UUID = "abc12345-0000-0000-0000-000000000001"
+
+
+def _client(results):
+    """Mock PolarClient whose lookups wait for ``gate`` and then return in order."""
+    client = MagicMock()
+    client.gate = asyncio.Event()
+    answers = iter(results)
+
+    async def get_customer_state(uuid):
+        await client.gate.wait()
+        answer = next(answers)
+        if isinstance(answer, Exception):
+            raise answer
+        return {"pioneer": answer}
+
+    client.get_customer_state = AsyncMock(side_effect=get_customer_state)
+    client.has_pioneer_access = MagicMock(side_effect=lambda state: state["pioneer"])
+    return client
+
+
+def _http_error(status):
+    response = MagicMock()
+    response.status_code = status
+    return httpx.HTTPStatusError("error", request=MagicMock(), response=response)
+
+
+class TestCoalescing:
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_lookup(self):
+        client = _client([True])
+        adapter = PolarAdapter(client, cache_ttl=300)
+        checks = [asyncio.create_task(adapter.check_pioneer_access(UUID)) for _ in range(10)]
+        await asyncio.sleep(0)
+        client.gate.set()
+        assert await asyncio.gather(*checks) == [True] * 10
+        assert client.get_customer_state.call_count == 1
+        stats = adapter.get_cache_stats()
+        assert stats["lookups"] == 1 and stats["coalesced"] == 9 and stats["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_shared_failure_counts_once(self):
+        client = _client([_http_error(401)])
+        adapter = PolarAdapter(client, cache_ttl=300)
+        checks = [asyncio.create_task(adapter.check_pioneer_access(UUID)) for _ in range(5)]
+        await asyncio.sleep(0)
+        client.gate.set()
+        results = await asyncio.gather(*checks, return_exceptions=True)
+        assert all(isinstance(r, httpx.HTTPStatusError) for r in results)
+        assert adapter._consecutive_failures == 1
+        assert adapter._circuit_open is False
+
+    @pytest.mark.asyncio
+    async def test_distinct_uuids_are_not_coalesced(self):
+        client = _client([True, False])
+        client.gate.set()
+        adapter = PolarAdapter(client, cache_ttl=300)
+        assert await asyncio.gather(
+            adapter.check_pioneer_access("uuid-a"), adapter.check_pioneer_access("uuid-b")
+        ) == [True, False]
+        assert client.get_customer_state.call_count == 2
+
+
+class TestBoundedLRU:
+
+    @pytest.mark.asyncio
+    async def test_least_recently_checked_is_evicted(self):
+        client = _client([True, True, True, True])
+        client.gate.set()
+        adapter = PolarAdapter(client, cache_ttl=300, max_entries=2)
+        await adapter.check_pioneer_access("uuid-a")
+        await adapter.check_pioneer_access("uuid-b")
+        await adapter.check_pioneer_access("uuid-a")  # hit: a becomes most recent
+        await adapter.check_pioneer_access("uuid-c")
+        assert list(adapter._cache) == ["uuid-a", "uuid-c"]
+        assert adapter.get_cache_stats()["evictions"] == 1
+
+    def test_webhook_updates_respect_the_bound(self):
+        adapter = PolarAdapter(MagicMock(), cache_ttl=300, max_entries=3)
+        for i in range(10):
+            adapter.update_cache(f"uuid-{i}", True)
+        assert list(adapter._cache) == ["uuid-7", "uuid-8", "uuid-9"]
+
+
+class TestRefreshAhead:
+
+    @pytest.mark.asyncio
+    async def test_hit_near_expiry_refreshes_in_background(self):
+        client = _client([False])
+        adapter = PolarAdapter(client, cache_ttl=300, refresh_ahead=30)
+        adapter._cache[UUID] = (True, time.time() - 280)
+
+        assert await adapter.check_pioneer_access(UUID) is True  # served from cache
+        assert await adapter.check_pioneer_access(UUID) is True  # refresh already running
+        client.gate.set()
+        await asyncio.gather(*adapter._refresh_tasks.values())
+
+        assert client.get_customer_state.call_count == 1
+        assert adapter._cache[UUID][0] is False
+        assert time.time() - adapter._cache[UUID][1] < 5
+        assert adapter.get_cache_stats()["refreshes"] == 1
+
+    @pytest.mark.asyncio
+    async def test_fresh_hit_does_not_refresh(self):
+        client = _client([])
+        adapter = PolarAdapter(client, cache_ttl=300, refresh_ahead=30)
+        adapter.update_cache(UUID, True)
+        assert await adapter.check_pioneer_access(UUID) is True
+        assert not adapter._refresh_tasks
+        assert client.get_customer_state.call_count == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_keeps_the_entry(self):
+        client = _client([_http_error(401)])
+        client.gate.set()
+        adapter = PolarAdapter(client, cache_ttl=300, refresh_ahead=30)
+        adapter._cache[UUID] = (True, time.time() - 280)
+        assert await adapter.check_pioneer_access(UUID) is True
+        await asyncio.gather(*adapter._refresh_tasks.values())
+        assert adapter._cache[UUID][0] is True
+
+
+class TestWebhookOrdering:
+
+    @pytest.mark.asyncio
+    async def test_update_during_lookup_wins(self):
+        client = _client([True, False])
+        adapter = PolarAdapter(client, cache_ttl=300)
+        first = asyncio.create_task(adapter.check_pioneer_access(UUID))
+        await asyncio.sleep(0)
+
+        adapter.update_cache(UUID, False)  # customer.state_changed: revoked
+        client.gate.set()
+        assert await first is True  # the caller that asked first gets Polar's answer
+        assert adapter._cache[UUID][0] is False
+        assert await adapter.check_pioneer_access(UUID) is False
+
+    @pytest.mark.asyncio
+    async def test_invalidate_detaches_in_flight_lookup(self):
+        client = _client([True, False])
+        adapter = PolarAdapter(client, cache_ttl=300)
+        first = asyncio.create_task(adapter.check_pioneer_access(UUID))
+        await asyncio.sleep(0)
+
+        adapter.invalidate_cache(UUID)
+        second = asyncio.create_task(adapter.check_pioneer_access(UUID))
+        for _ in range(2):  # both lookups waiting on Polar before it answers
+            await asyncio.sleep(0)
+        client.gate.set()
+        assert await first is True
+        assert await second is False  # a new lookup, not the pre-invalidation one
+        assert client.get_customer_state.call_count == 2
+
+
+class TestPooledClient:
+
+    @pytest.mark.asyncio
+    async def test_one_http_client_across_calls(self, monkeypatch):
+        created = []
+
+        def handler(request):
+            return httpx.Response(200, json={"benefit_grants": []})
+
+        real_client = httpx.AsyncClient
+
+        def factory(**kwargs):
+            client = real_client(transport=httpx.MockTransport(handler), **kwargs)
+            created.append(client)
+            return client
+
+        monkeypatch.setattr(httpx, "AsyncClient", factory)
+        polar = PolarClient(access_token="polar_oat_test", environment="sandbox")
+        for _ in range(3):
+            assert await polar.get_customer_state(UUID) == {"benefit_grants": []}
+        assert len(created) == 1
+        assert created[0].headers["authorization"] == "Bearer polar_oat_test"
+
+        await polar.aclose()
+        assert created[0].is_closed
+        await polar.get_customer_state(UUID)
+        assert len(created) == 2
+        await polar.aclose()
@@ -0,0 +1,261 @@
+"""
+Registration data layer: maintained slot counters and email-index dedup.
+
+Pinned: registrations never touch the synchronous client when the async one
+is available; the slot cap is enforced from the per-tier counter, including
+for concurrent sign-ups competing for the last slot; duplicate emails (any
+letter case) resolve through the index to the existing record; opt-out frees
+the slot and the email; existing records are counted and indexed once when
+the counters are first used.
+"""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from verifimind_mcp import registration as reg
+from verifimind_mcp import registration_store as rs
+
+
+class _Snapshot:
+    def __init__(self, data):
+        self._data = data
+        self.exists = data is not None
+
+    def to_dict(self):
+        return dict(self._data) if self._data is not None else None
+
+
+class _Ref:
+    def __init__(self, db, path):
+        self.db, self.path = db, path
+
+    def collection(self, name):
+        return _Collection(self.db, self.path + (name,))
+
+    async def get(self, transaction=None):
+        # The snapshot is taken when the read is issued, then the round trip
+        # yields — so concurrent transactions really overlap.
+        if transaction is not None:
+            transaction.reads[self.path] = self.db.versions.get(self.path, 0)
+        snapshot = _Snapshot(self.db.docs.get(self.path))
+        await asyncio.sleep(0)
+        return snapshot
+
+
+class _Collection:
+    def __init__(self, db, path):
+        self.db, self.path = db, path
+
+    def document(self, doc_id):
+        return _Ref(self.db, self.path + (doc_id,))
+
+    async def add(self, data):
+        self.db.write(self.path + (f"auto-{len(self.db.docs)}",), dict(data))
+
+    async def stream(self):
+        for path, data in list(self.db.docs.items()):
+            if path[:-1] == self.path:
+                self.db.streams += 1
+                yield _Snapshot(data)
+
+
+class _Writes:
+    def __init__(self):
+        self.writes = []
+
+    def set(self, ref, data):
+        self.writes.append((ref.path, dict(data)))
+
+    def update(self, ref, data):
+        self.writes.append((ref.path, ("update", dict(data))))
+
+    def delete(self, ref):
+        self.writes.append((ref.path, None))
+
+
+class _Transaction(_Writes):
+    def __init__(self):
+        super().__init__()
+        self.reads = {}
+
+
+class _FakeAsyncFirestore:
+    """Document store with optimistic transactions, like Firestore's."""
+
+    def __init__(self):
+        self.docs = {}
+        self.versions = {}
+        self.streams = 0
+        self.retries = 0
+
+    def collection(self, name):
+        return _Collection(self, (name,))
+
+    def write(self, path, data):
+        if data is None:
+            self.docs.pop(path, None)
+        elif isinstance(data, tuple):
+            self.docs[path] = {**self.docs[path], **data[1]}
+        else:
+            self.docs[path] = data
+        self.versions[path] = self.versions.get(path, 0) + 1
+
+    def batch(self):
+        db = self
+
+        class _Batch(_Writes):
+            async def commit(self):
+                for path, data in self.writes:
+                    db.write(path, data)
+
+        return _Batch()
+
+    async def run_transaction(self, _db, fn, *args):
+        while True:
+            transaction = _Transaction()
+            result = await fn(transaction, *args)
+            if all(self.versions.get(p, 0) == v for p, v in transaction.reads.items()):
+                for path, data in transaction.writes:
+                    self.write(path, data)
+                return result
+            self.retries += 1
+
+    def slots(self, tier):
+        return self.docs.get((rs.COLLECTION_COUNTERS, tier), {}).get("count", 0)
+
+
+@pytest.fixture
+def firestore(monkeypatch):
+    fake = _FakeAsyncFirestore()
+    rs.reset_registration_store()
+    monkeypatch.setattr(rs, "_get_firestore_async", lambda: fake)
+    monkeypatch.setattr(rs, "_run_transaction", fake.run_transaction)
+    sync_db = MagicMock()
+    monkeypatch.setattr(reg, "_get_firestore", lambda: sync_db)
+    yield fake
+    assert sync_db.collection.call_count == 0, "blocking client used on the registration path"
+    rs.reset_registration_store()
+
+
+def _ea(email="pioneer@example.com", **kw):
+    return reg.EarlyAdopterRegistration(email=email, tc_accepted=True, privacy_acknowledged=True, **kw)
+
+
+class TestEarlyAdopter:
+
+    @pytest.mark.asyncio
+    async def test_new_registration_counts_and_indexes(self, firestore):
+        result = await reg.register_early_adopter(_ea(feedback="hello"))
+        assert result.persisted and result.feedback_received
+        assert firestore.docs[(reg.COLLECTION_EA, result.uuid)]["email"] == "pioneer@example.com"
+        index = firestore.docs[(f"{reg.COLLECTION_EA}_email_index", rs.email_key("pioneer@example.com"))]
+        assert index["uuid"] == result.uuid
+        assert firestore.slots("early_adopter") == 1
+        assert any(path[0] == reg.COLLECTION_FEEDBACK for path in firestore.docs)
+
+    @pytest.mark.asyncio
+    async def test_duplicate_email_returns_existing(self, firestore):
+        first = await reg.register_early_adopter(_ea())
+        again = await reg.register_early_adopter(_ea(email="Pioneer@Example.com"))
+        assert again.uuid == first.uuid
+        assert "already registered" in again.message
+        assert firestore.slots("early_adopter") == 1
+
+    @pytest.mark.asyncio
+    async def test_cap_is_enforced_from_counters(self, firestore, monkeypatch):
+        monkeypatch.setattr(reg, "EA_MAX_SLOTS", 2)
+        await reg.register_early_adopter(_ea("a@example.com"))
+        await reg.register_early_adopter(_ea("b@example.com"))
+        with pytest.raises(reg.SlotCapReachedError):
+            await reg.register_early_adopter(_ea("c@example.com"))
+        assert firestore.slots("early_adopter") == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_signups_for_the_last_slot(self, firestore, monkeypatch):
+        monkeypatch.setattr(reg, "EA_MAX_SLOTS", 3)
+        results = await asyncio.gather(
+            *(reg.register_early_adopter(_ea(f"user{i}@example.com")) for i in range(8)),
+            return_exceptions=True,
+        )
+        created = [r for r in results if isinstance(r, reg.RegistrationResponse)]
+        refused = [r for r in results if isinstance(r, reg.SlotCapReachedError)]
+        assert len(created) == 3 and len(refused) == 5
+        assert firestore.slots("early_adopter") == 3
+        assert firestore.retries > 0
+
+    @pytest.mark.asyncio
+    async def test_concurrent_duplicates_create_one_record(self, firestore):
+        results = await asyncio.gather(*(reg.register_early_adopter(_ea()) for _ in range(4)))
+        assert len({r.uuid for r in results}) == 1
+        assert sum(1 for path in firestore.docs if path[0] == reg.COLLECTION_EA) == 1
+
+    @pytest.mark.asyncio
+    async def test_optout_frees_slot_and_email(self, firestore):
+        first = await reg.register_early_adopter(_ea())
+        result = await reg.process_optout(first.uuid)
+        assert result.processed
+        record = firestore.docs[(reg.COLLECTION_EA, first.uuid)]
+        assert record["status"] == "deletion_requested" and record["email"] == "[deletion_requested]"
+        assert firestore.slots("early_adopter") == 0
+
+        again = await reg.register_early_adopter(_ea())
+        assert again.uuid != first.uuid
+        assert firestore.slots("early_adopter") == 1
+
+    @pytest.mark.asyncio
+    async def test_optout_unknown_uuid(self, firestore):
+        result = await reg.process_optout("01960000-0000-7000-8000-000000000000")
+        assert result.processed
+        assert firestore.slots("early_adopter") == 0
+
+
+class TestSeeding:
+
+    @pytest.mark.asyncio
+    async def test_existing_records_are_counted_and_indexed_once(self, firestore):
+        legacy = [
+            ("u1", "pilot", "old@example.com", "active"),
+            ("u2", "early_adopter", "two@example.com", "active"),
+            ("u3", "early_adopter", None, "active"),
+            ("u4", "early_adopter", "[deletion_requested]", "deletion_requested"),
+        ]
+        for uuid, tier, email, status in legacy:
+            firestore.docs[(reg.COLLECTION_EA, uuid)] = {
+                "uuid": uuid, "tier": tier, "email": email, "status": status,
+                "registered_at": "2026-04-01T00:00:00+00:00",
+            }
+
+        again = await reg.register_early_adopter(_ea("OLD@example.com"))
+        assert again.uuid == "u1" and again.tier == "pilot"
+        assert firestore.slots("pilot") == 1
+        assert firestore.slots("early_adopter") == 2
+
+        streamed = firestore.streams
+        await reg.register_early_adopter(_ea("new@example.com"))
+        assert firestore.streams == streamed  # not re-seeded
+        assert firestore.slots("early_adopter") == 3
+
+    @pytest.mark.asyncio
+    async def test_seeded_marker_skips_the_scan(self, firestore):
+        firestore.docs[(rs.COLLECTION_META, reg.COLLECTION_EA)] = {"seeded_at": "2026-01-01"}
+        firestore.docs[(reg.COLLECTION_EA, "legacy")] = {"uuid": "legacy", "tier": "early_adopter", "status": "active"}
+        await reg.register_early_adopter(_ea())
+        assert firestore.streams == 0
+        assert firestore.slots("early_adopter") == 1
+
+
+class TestLightweight:
+
+    @pytest.mark.asyncio
+    async def test_email_dedup_by_index(self, firestore):
+        first = await reg.register_user(reg.UserRegistrationRequest(email="light@example.com", consent=True))
+        again = await reg.register_user(reg.UserRegistrationRequest(email="light@example.com", consent=True))
+        assert again.uuid == first.uuid and "already registered" in again.message
+        assert firestore.slots("ea") == 0  # uncapped: no counter kept
+
+    @pytest.mark.asyncio
+    async def test_consent_only_is_written(self, firestore):
+        result = await reg.register_user(reg.UserRegistrationRequest(consent=True))
+        assert firestore.docs[(reg.COLLECTION_REGISTRATIONS, result.uuid)]["email"] is None
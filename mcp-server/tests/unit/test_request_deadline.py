@@ -0,0 +1,143 @@
+"""End-to-end request deadline — resolution, stage gates, retry and provider cut-off.
+
+The guardrail pinned here: work that cannot finish before the caller stops
+waiting is not started, and a stage cut off by the deadline degrades through
+the unchanged stage-failure contract rather than running on for nobody.
+"""
+
+import asyncio
+
+import pytest
+
+from verifimind_mcp.llm.failover import generate_with_failover
+from verifimind_mcp.utils import deadline as deadline_mod
+from verifimind_mcp.utils.deadline import (
+    DEADLINE_MAX_SECONDS,
+    DEADLINE_MIN_SECONDS,
+    DEFAULT_REQUEST_DEADLINE_SECONDS,
+    RequestDeadline,
+    RequestDeadlineExceeded,
+    reset_current_deadline,
+    resolve_deadline,
+    set_current_deadline,
+)
+from verifimind_mcp.utils.provider_failures import provider_failure_contract
+from verifimind_mcp.utils.trinity_retry import (
+    TrinityRetryBudget,
+    analyze_with_completion_retry,
+    stagger_if_shared_provider,
+)
+
+from .test_v0560_trinity_completion import (  # noqa: F401 — fixture
+    FakeProvider,
+    FakeRateLimitError,
+    make_stage,
+    no_sleep,
+)
+
+
+def _nearly_spent(seconds_left):
+    deadline = RequestDeadline(60)
+    deadline.expires_at -= 60 - seconds_left
+    return deadline
+
+
+class TestResolution:
+    def test_parameter_beats_header_beats_default(self):
+        headers = {"x-verifimind-deadline": "40"}
+        assert resolve_deadline(30, headers).budget_seconds == 30
+        assert resolve_deadline(None, headers).source == "header"
+        assert resolve_deadline(None, headers).budget_seconds == 40
+        fallback = resolve_deadline(None, {})
+        assert fallback.source == "default"
+        assert fallback.budget_seconds == DEFAULT_REQUEST_DEADLINE_SECONDS
+
+    def test_clamped_and_garbage_ignored(self):
+        assert resolve_deadline(0.5).budget_seconds == DEADLINE_MIN_SECONDS
+        assert resolve_deadline(10_000).budget_seconds == DEADLINE_MAX_SECONDS
+        assert resolve_deadline("soon").source == "default"
+        assert resolve_deadline(-3).source == "default"
+        assert resolve_deadline(True).source == "default"
+
+
+    def test_admission_queue_wait_is_already_spent(self):
+        headers = {"x-verifimind-deadline": "40", deadline_mod.ADMISSION_WAIT_HEADER: "25"}
+        deadline = resolve_deadline(None, headers)
+        assert deadline.budget_seconds == 40
+        assert 14 < deadline.remaining() <= 15
+        assert deadline.to_metadata()["admission_wait_seconds"] == 25
+        assert "admission_wait_seconds" not in resolve_deadline(None, {}).to_metadata()
+
+
+class TestStageGates:
+    def test_stage_that_cannot_start_in_time_raises(self, no_sleep):
+        stage, calls = make_stage(["must-not-reach"])
+        with pytest.raises(RequestDeadlineExceeded):
+            asyncio.run(analyze_with_completion_retry(
+                stage, agent_id="CS", byok=False, session_id="d1",
+                budget=TrinityRetryBudget(), deadline=_nearly_spent(0.5),
+            ))
+        assert calls["n"] == 0
+
+    def test_retry_skipped_when_wait_does_not_fit(self, no_sleep):
+        first = FakeRateLimitError(retry_after=8)
+        stage, calls = make_stage([first, "must-not-reach"])
+        with pytest.raises(FakeRateLimitError) as excinfo:
+            asyncio.run(analyze_with_completion_retry(
+                stage, agent_id="Z", byok=False, session_id="d2",
+                budget=TrinityRetryBudget(), deadline=_nearly_spent(9),
+            ))
+        assert excinfo.value is first
+        assert calls["n"] == 1
+        assert no_sleep.calls == []
+
+    def test_retry_still_runs_when_it_fits(self, no_sleep):
+        stage, calls = make_stage([FakeRateLimitError(retry_after=8), "ok"])
+        result = asyncio.run(analyze_with_completion_retry(
+            stage, agent_id="Z", byok=False, session_id="d3",
+            budget=TrinityRetryBudget(), deadline=RequestDeadline(60),
+        ))
+        assert result == "ok"
+        assert calls["n"] == 2
+
+    def test_stagger_skipped_when_deadline_is_tight(self, no_sleep):
+        groq = FakeProvider("groq/openai/gpt-oss-120b")
+        applied = asyncio.run(
+            stagger_if_shared_provider(groq, groq, deadline=_nearly_spent(4))
+        )
+        assert applied is False
+        assert no_sleep.calls == []
+
+    def test_deadline_failure_has_its_own_contract(self):
+        contract = provider_failure_contract(RequestDeadlineExceeded("late"))
+        assert contract["error_code"] == "REQUEST_DEADLINE_EXCEEDED"
+        assert contract["retry_after_seconds"] is None
+
+
+class _SlowProvider:
+    async def generate(self, **_kwargs):
+        await asyncio.sleep(60)
+
+    def get_model_name(self):
+        return "slow/model"
+
+
+class TestProviderCutOff:
+    @pytest.mark.asyncio
+    async def test_provider_call_is_bounded_by_remaining_time(self):
+        deadline = RequestDeadline(60)
+        deadline.expires_at = deadline_mod.time.monotonic() + 0.05
+        token = set_current_deadline(deadline)
+        try:
+            with pytest.raises(RequestDeadlineExceeded):
+                await generate_with_failover(_SlowProvider(), prompt="p")
+        finally:
+            reset_current_deadline(token)
+
+    @pytest.mark.asyncio
+    async def test_no_deadline_means_plain_delegation(self):
+        class _Fast:
+            async def generate(self, **kwargs):
+                return {"content": kwargs["prompt"]}
+
+        assert await generate_with_failover(_Fast(), prompt="p") == {"content": "p"}
@@ -0,0 +1,133 @@
+"""
+Tests for negotiated response compression.
+
+Coverage:
+  - Accept-Encoding negotiation (q-values, wildcard, server preference)
+  - Complete bodies: threshold, media-type and Content-Encoding skips
+  - Streamed bodies: every event is decodable as soon as it is sent
+  - Vary / Content-Length handling and bytes-saved metrics
+"""
+
+import asyncio
+import zlib
+
+import pytest
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse, PlainTextResponse, Response
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from verifimind_mcp.middleware import compression
+from verifimind_mcp.middleware.compression import (
+    CompressionMiddleware,
+    get_compression_stats,
+    negotiate_encoding,
+    reset_compression_stats,
+)
+
+_BIG = {"reasoning": ["The concept is sound and well scoped."] * 200}
+
+
+@pytest.fixture(autouse=True)
+def gzip_only(monkeypatch):
+    # Pin the coding set so results do not depend on optional packages.
+    monkeypatch.setattr(compression, "brotli", None)
+    monkeypatch.setattr(compression, "zstandard", None)
+    reset_compression_stats()
+
+
+class TestNegotiation:
+
+    def test_q_values_and_wildcard(self):
+        assert negotiate_encoding("gzip, deflate") == "gzip"
+        assert negotiate_encoding("gzip;q=0") is None
+        assert negotiate_encoding("*") == "gzip"
+        assert negotiate_encoding("*, gzip;q=0") is None
+        assert negotiate_encoding("") is None
+        assert negotiate_encoding("identity") is None
+
+    def test_server_preference_when_available(self, monkeypatch):
+        monkeypatch.setattr(compression, "brotli", object())
+        assert negotiate_encoding("gzip, br") == "br"
+        assert negotiate_encoding("gzip, br;q=0") == "gzip"
+
+
+def _client():
+    async def big(_request):
+        return JSONResponse(_BIG)
+
+    async def small(_request):
+        return JSONResponse({"ok": True})
+
+    async def binary(_request):
+        return Response(b"\x89PNG" * 1000, media_type="image/png")
+
+    async def encoded(_request):
+        return PlainTextResponse("x" * 4000, headers={"Content-Encoding": "identity"})
+
+    app = Starlette(routes=[
+        Route("/big", big), Route("/small", small),
+        Route("/binary", binary), Route("/encoded", encoded),
+    ])
+    return TestClient(CompressionMiddleware(app))
+
+
+class TestCompleteBodies:
+
+    def test_large_json_is_compressed(self):
+        resp = _client().get("/big", headers={"Accept-Encoding": "gzip"})
+        assert resp.headers["content-encoding"] == "gzip"
+        assert "Accept-Encoding" in resp.headers["vary"]
+        assert resp.json() == _BIG
+        stats = get_compression_stats()
+        assert stats["responses_compressed"] == 1
+        assert stats["bytes_saved"] > 0
+        assert int(resp.headers["content-length"]) == stats["bytes_out"]
+
+    def test_skips(self):
+        client = _client()
+        for path in ("/small", "/binary", "/encoded"):
+            resp = client.get(path, headers={"Accept-Encoding": "gzip"})
+            assert resp.headers.get("content-encoding") in (None, "identity"), path
+        resp = client.get("/big", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in resp.headers
+        assert get_compression_stats()["responses_compressed"] == 0
+
+
+class TestStreaming:
+
+    def test_each_event_is_flushed(self):
+        events = [b"event: message\ndata: " + b"x" * 300 + b"\n\n", b"data: done\n\n"]
+
+        async def app(_scope, _receive, send):
+            await send({
+                "type": "http.response.start", "status": 200,
+                "headers": [(b"content-type", b"text/event-stream")],
+            })
+            for i, event in enumerate(events):
+                await send({
+                    "type": "http.response.body", "body": event,
+                    "more_body": i < len(events) - 1,
+                })
+
+        sent = []
+
+        async def send(message):
+            sent.append(message)
+
+        scope = {
+            "type": "http", "method": "POST", "path": "/mcp/",
+            "headers": [(b"accept-encoding", b"gzip")],
+        }
+        asyncio.run(CompressionMiddleware(app)(scope, None, send))
+
+        start, first, last = sent
+        headers = dict(start["headers"])
+        assert headers[b"content-encoding"] == b"gzip"
+        assert b"content-length" not in headers
+        decoder = zlib.decompressobj(31)
+        # The first event decodes fully before the stream has ended.
+        assert decoder.decompress(first["body"]) == events[0]
+        assert first["more_body"] is True
+        assert decoder.decompress(last["body"]) == events[1]
+        assert get_compression_stats()["streams_compressed"] == 1
@@ -0,0 +1,209 @@
+"""Single-flight coalescing of identical concurrent agent provider calls.
+
+Pinned: concurrent identical calls share one provider call, different API
+keys never share, a cancelled waiter cannot kill the shared call, nothing
+is cached once the call settles, and every joiner is bound by its own request
+deadline — never by the deadline of whichever caller started the call.
+"""
+
+import asyncio
+
+import pytest
+
+from verifimind_mcp.utils.single_flight import (
+    SINGLE_FLIGHT_ENV,
+    SingleFlight,
+    agent_call_key,
+    single_flight_enabled,
+)
+
+
+class _Provider:
+    def __init__(self, api_key="hosted-key", model="groq/openai/gpt-oss-120b"):
+        self.api_key = api_key
+        self.model = model
+
+    def get_model_name(self):
+        return self.model
+
+
+def _key(provider, prompt="same prompt"):
+    return agent_call_key(
+        agent_id="X", provider=provider, prompt=prompt,
+        temperature=0.7, max_tokens=4096,
+    )
+
+
+class TestKey:
+    def test_identical_calls_share_a_key(self):
+        assert _key(_Provider()) == _key(_Provider())
+
+    def test_different_byok_keys_never_share(self):
+        assert _key(_Provider(api_key="key-a")) != _key(_Provider(api_key="key-b"))
+
+    def test_prompt_and_model_are_part_of_the_key(self):
+        assert _key(_Provider(), "a") != _key(_Provider(), "b")
+        assert _key(_Provider(model="m1")) != _key(_Provider(model="m2"))
+
+    def test_raw_key_is_not_recoverable_from_the_key(self):
+        assert "secret-byok" not in _key(_Provider(api_key="secret-byok"))
+
+
+class TestSingleFlight:
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_calls_share_one_call(self):
+        flights = SingleFlight()
+        calls = []
+        gate = asyncio.Event()
+
+        async def call():
+            calls.append(1)
+            await gate.wait()
+            return {"content": {"score": 7}}
+
+        waiters = [asyncio.ensure_future(flights.do("k", call)) for _ in range(3)]
+        await asyncio.sleep(0)
+        gate.set()
+        results = await asyncio.gather(*waiters)
+
+        assert len(calls) == 1
+        assert flights.coalesced == 2
+        assert all(r == {"content": {"score": 7}} for r in results)
+        assert results[0] is not results[1]  # each waiter gets its own copy
+        assert flights.in_flight() == 0
+
+    @pytest.mark.asyncio
+    async def test_failure_reaches_every_waiter(self):
+        flights = SingleFlight()
+
+        async def call():
+            await asyncio.sleep(0)
+            raise RuntimeError("provider down")
+
+        results = await asyncio.gather(
+            flights.do("k", call), flights.do("k", call), return_exceptions=True
+        )
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_cancel_shared_call(self):
+        flights = SingleFlight()
+        gate = asyncio.Event()
+
+        async def call():
+            await gate.wait()
+            return {"ok": True}
+
+        leaver = asyncio.ensure_future(flights.do("k", call))
+        stayer = asyncio.ensure_future(flights.do("k", call))
+        await asyncio.sleep(0)
+        leaver.cancel()
+        await asyncio.sleep(0)
+        gate.set()
+
+        assert await stayer == {"ok": True}
+        assert leaver.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_last_waiter_leaving_cancels_orphaned_call(self):
+        flights = SingleFlight()
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        async def call():
+            started.set()
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        only = asyncio.ensure_future(flights.do("k", call))
+        await started.wait()
+        only.cancel()
+        await asyncio.wait_for(cancelled.wait(), 1.0)
+        await asyncio.sleep(0)
+        assert flights.in_flight() == 0
+
+    @pytest.mark.asyncio
+    async def test_settled_calls_are_not_cached(self):
+        flights = SingleFlight()
+        calls = []
+
+        async def call():
+            calls.append(1)
+            return {"n": len(calls)}
+
+        assert await flights.do("k", call) == {"n": 1}
+        assert await flights.do("k", call) == {"n": 2}
+
+
+class _SlowProvider:
+    api_key = "hosted-key"
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+        self.calls = 0
+
+    def get_model_name(self):
+        return "groq/openai/gpt-oss-120b"
+
+    async def generate(self, **_kwargs):
+        self.calls += 1
+        await asyncio.sleep(self.seconds)
+        return {
+            "content": {
+                "reasoning_steps": [{"step_number": 1, "thought": "Shared.", "confidence": 0.9}],
+                "innovation_score": 8.0,
+                "strategic_value": 7.5,
+                "opportunities": ["Opportunity"],
+                "risks": ["Risk"],
+                "recommendation": "Proceed.",
+                "confidence": 0.8,
+            },
+            "usage": {"output_tokens": 100},
+            "_inference_quality": "real",
+        }
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("short_first", [True, False])
+async def test_joiners_keep_their_own_deadlines(monkeypatch, short_first):
+    from verifimind_mcp.agents.x_agent import XAgent
+    from verifimind_mcp.models.concepts import Concept
+    from verifimind_mcp.utils import single_flight
+    from verifimind_mcp.utils.deadline import (
+        RequestDeadlineExceeded,
+        resolve_deadline,
+        set_current_deadline,
+    )
+
+    monkeypatch.setattr(single_flight, "_single_flight", None)
+    provider = _SlowProvider(0.3)
+    concept = Concept(name="Shared call", description="Two callers, one provider call.")
+
+    async def consult(header_seconds, seconds_left):
+        deadline = resolve_deadline(None, {"x-verifimind-deadline": str(header_seconds)})
+        deadline.expires_at -= deadline.budget_seconds - seconds_left
+        set_current_deadline(deadline)
+        return await XAgent(llm_provider=provider).analyze(concept)
+
+    callers = [(10, 0.1), (90, 5.0)]  # (X-VerifiMind-Deadline, seconds left)
+    if not short_first:
+        callers.reverse()
+    tasks = [asyncio.ensure_future(consult(*caller)) for caller in callers]
+    results = dict(zip(
+        (header for header, _ in callers),
+        await asyncio.gather(*tasks, return_exceptions=True),
+    ))
+
+    assert provider.calls == 1
+    assert isinstance(results[10], RequestDeadlineExceeded)
+    assert results[90].innovation_score == 8.0
+
+
+def test_env_switch_disables(monkeypatch):
+    monkeypatch.setenv(SINGLE_FLIGHT_ENV, "0")
+    assert single_flight_enabled() is False
+    monkeypatch.delenv(SINGLE_FLIGHT_ENV)
+    assert single_flight_enabled() is True
@@ -0,0 +1,202 @@
+"""Detached Trinity jobs — runner contract and preview-tool gating.
+
+The guardrails pinned here: a job either surfaces the run's own payload or an
+honest failure code, the pending queue is bounded, finished jobs expire, and
+the preview tools stay out of every public surface until switched on.
+"""
+
+import asyncio
+import contextvars
+import time
+
+import pytest
+
+from verifimind_mcp.availability import (
+    PREVIEW_TOOL_GROUPS,
+    PREVIEW_TOOLS_ENV,
+    enabled_preview_tools,
+    get_tool_availability,
+)
+from verifimind_mcp.utils import trinity_jobs
+from verifimind_mcp.utils.trinity_jobs import (
+    JOB_FAILED,
+    JOB_QUEUED,
+    JOB_SUCCEEDED,
+    TRINITY_JOB_MAX_WAIT_SECONDS,
+    TrinityJobQueueFull,
+    TrinityJobRunner,
+    record_job_stage,
+)
+
+
+def _run_returning(payload, gate=None):
+    async def run():
+        if gate is not None:
+            await gate.wait()
+        record_job_stage("X", {"inference_quality": "real", "score": 7.5})
+        return payload
+    return run
+
+
+class TestRunner:
+    @pytest.mark.asyncio
+    async def test_success_exposes_stage_progress_and_final_payload(self):
+        runner = TrinityJobRunner(workers=1, queue_limit=4)
+        job = runner.submit(_run_returning({"validation_id": "v-1"}))
+        assert job.status == JOB_QUEUED
+
+        finished = await runner.wait(job.job_id, 1.0)
+        view = finished.snapshot()
+        assert view["status"] == JOB_SUCCEEDED
+        assert view["result"] == {"validation_id": "v-1"}
+        assert view["stages_completed"] == ["X"]
+        assert view["stage_results"]["X"]["score"] == 7.5
+        assert view["expires_at"] is not None
+
+    @pytest.mark.asyncio
+    async def test_error_payload_is_a_failed_job_with_its_code(self):
+        runner = TrinityJobRunner(workers=1, queue_limit=4)
+        job = runner.submit(_run_returning(
+            {"status": "error", "error_code": "TRINITY_ERROR"}
+        ))
+        await runner.wait(job.job_id, 1.0)
+        assert job.status == JOB_FAILED
+        assert job.snapshot()["error_code"] == "TRINITY_ERROR"
+
+    @pytest.mark.asyncio
+    async def test_wrapper_exception_is_failed_without_reflecting_message(self):
+        async def boom():
+            raise RuntimeError("provider said SECRET-CONCEPT")
+
+        runner = TrinityJobRunner(workers=1, queue_limit=4)
+        job = runner.submit(boom)
+        await runner.wait(job.job_id, 1.0)
+        view = job.snapshot()
+        assert view["status"] == JOB_FAILED
+        assert view["error_code"] == "TRINITY_JOB_ERROR"
+        assert "SECRET-CONCEPT" not in repr(view)
+
+    @pytest.mark.asyncio
+    async def test_call_arguments_are_dropped_once_the_run_starts(self):
+        gate = asyncio.Event()
+        runner = TrinityJobRunner(workers=1, queue_limit=4)
+        job = runner.submit(_run_returning({}, gate))
+        assert job._run is not None
+        await asyncio.sleep(0)
+        assert job._run is None
+        gate.set()
+        await runner.wait(job.job_id, 1.0)
+
+    @pytest.mark.asyncio
+    async def test_queue_is_bounded_and_reports_position(self):
+        gate = asyncio.Event()
+        runner = TrinityJobRunner(workers=1, queue_limit=1)
+        running = runner.submit(_run_returning({}, gate))
+        await asyncio.sleep(0)  # worker picks up the first job
+        queued = runner.submit(_run_returning({}, gate))
+        assert runner.queue_position(running) is None
+        assert runner.queue_position(queued) == 1
+        with pytest.raises(TrinityJobQueueFull):
+            runner.submit(_run_returning({}, gate))
+        gate.set()
+        await runner.wait(queued.job_id, 1.0)
+        assert queued.status == JOB_SUCCEEDED
+
+    @pytest.mark.asyncio
+    async def test_finished_jobs_expire_after_ttl(self):
+        runner = TrinityJobRunner(workers=1, queue_limit=4, ttl_seconds=60)
+        job = runner.submit(_run_returning({}))
+        await runner.wait(job.job_id, 1.0)
+        assert runner.get(job.job_id) is job
+        job.finished_at = time.time() - 61
+        assert runner.get(job.job_id) is None
+
+    @pytest.mark.asyncio
+    async def test_wait_is_capped_and_returns_unfinished_job(self, monkeypatch):
+        observed = {}
+
+        async def fake_wait_for(awaitable, timeout):
+            observed["timeout"] = timeout
+            awaitable.close()
+            raise asyncio.TimeoutError
+
+        gate = asyncio.Event()
+        runner = TrinityJobRunner(workers=1, queue_limit=4)
+        job = runner.submit(_run_returning({}, gate))
+        monkeypatch.setattr(trinity_jobs.asyncio, "wait_for", fake_wait_for)
+        result = await runner.wait(job.job_id, 10_000)
+        assert result is job
+        assert observed["timeout"] == TRINITY_JOB_MAX_WAIT_SECONDS
+        gate.set()
+
+    @pytest.mark.asyncio
+    async def test_each_job_runs_in_its_submitters_context(self, monkeypatch):
+        from verifimind_mcp.utils import deadline
+
+        headers = contextvars.ContextVar("test_request_headers", default={})
+        monkeypatch.setattr(deadline, "request_headers", lambda: headers.get())
+        runner = TrinityJobRunner(workers=1, queue_limit=4)
+
+        async def run():
+            current = deadline.current_deadline()
+            return {
+                "inherited": None if current is None else current.budget_seconds,
+                "resolved": deadline.resolve_deadline(None, deadline.request_headers()).budget_seconds,
+            }
+
+        async def submit_with(seconds):
+            headers.set({deadline.DEADLINE_HEADER: str(seconds)})
+            deadline.set_current_deadline(deadline.RequestDeadline(seconds, source="header"))
+            return runner.submit(run)
+
+        first = await asyncio.create_task(submit_with(30))  # starts the workers
+        second = await asyncio.create_task(submit_with(90))
+        await runner.wait(first.job_id, 1.0)
+        await runner.wait(second.job_id, 1.0)
+        assert first.result == {"inherited": 30, "resolved": 30}
+        assert second.result == {"inherited": 90, "resolved": 90}
+
+    def test_unknown_or_non_string_id_is_not_found(self):
+        runner = TrinityJobRunner()
+        assert runner.get("nope") is None
+        assert runner.get(None) is None
+
+    def test_stage_report_outside_a_job_is_a_no_op(self):
+        record_job_stage("X", {"score": 1.0})
+
+
+class TestPreviewGating:
+    def test_off_by_default_and_absent_from_availability(self, monkeypatch):
+        monkeypatch.delenv(PREVIEW_TOOLS_ENV, raising=False)
+        assert enabled_preview_tools() == ()
+        assert "preview_tools" not in get_tool_availability()
+
+    def test_enabled_group_is_listed_without_changing_the_public_counts(
+        self, monkeypatch
+    ):
+        monkeypatch.setenv(PREVIEW_TOOLS_ENV, "trinity_jobs")
+        availability = get_tool_availability()
+        assert availability["preview_tools"] == list(
+            PREVIEW_TOOL_GROUPS["trinity_jobs"]
+        )
+        assert availability["defined"] == 13
+        assert availability["active"] == 8
+
+    def test_unknown_group_names_enable_nothing(self, monkeypatch):
+        monkeypatch.setenv(PREVIEW_TOOLS_ENV, "trinity-jobs, everything")
+        assert enabled_preview_tools() == ()
+
+    @pytest.mark.asyncio
+    async def test_tools_registered_only_when_enabled(self, monkeypatch):
+        from verifimind_mcp.server import _create_mcp_instance
+
+        monkeypatch.delenv(PREVIEW_TOOLS_ENV, raising=False)
+        dark = {t.name for t in await _create_mcp_instance().list_tools(
+            run_middleware=False
+        )}
+        monkeypatch.setenv(PREVIEW_TOOLS_ENV, "trinity_jobs")
+        lit = {t.name for t in await _create_mcp_instance().list_tools(
+            run_middleware=False
+        )}
+        assert not dark & set(PREVIEW_TOOL_GROUPS["trinity_jobs"])
+        assert lit - dark == set(PREVIEW_TOOL_GROUPS["trinity_jobs"])
@@ -0,0 +1,161 @@
+"""mode="triage" — one compact call, synthesized by the full-run rules.
+
+Pinned: the triage result expands into the three agent analyses carrying the
+one call's quality marker, so the unchanged quality gate and veto rules
+apply; the result is labelled triage-grade and never written to the UUID
+validation history; near-boundary verdicts escalate
+to the full chain and clear ones do not.
+"""
+
+import pytest
+
+from verifimind_mcp import config_helper, server
+from verifimind_mcp.agents import CSAgent, TriageAgent, XAgent, ZAgent
+from verifimind_mcp.models import TriageAnalysis
+from verifimind_mcp.utils.synthesis import create_synthesis
+from verifimind_mcp.utils.triage import normalize_mode, triage_escalation_reason
+
+from .mcp_tool_harness import call
+from .test_v0558_trinity_traceability import _NamedProvider, _real_results
+
+
+def _triage(score=9.0, quality="real", veto=False):
+    result = TriageAnalysis(
+        innovation_score=score,
+        strategic_value=score,
+        ethics_score=score,
+        veto_triggered=veto,
+        veto_reason="Covert surveillance of minors." if veto else None,
+        security_score=score,
+        top_concerns=["Consent flow", "Abuse limits", "Vendor lock-in", "Fourth"],
+        recommendation="PROCEED — clear demand.",
+        confidence=0.8,
+    )
+    result._inference_quality = quality
+    return result
+
+
+def _synthesis(triage):
+    return create_synthesis(*triage.to_agent_analyses(), analysis_grade="triage")
+
+
+class TestSynthesis:
+    def test_real_triage_is_scored_and_labelled(self):
+        synthesis = _synthesis(_triage(9.0))
+        assert synthesis.overall_score == 9.0
+        assert synthesis.recommendation == "proceed"
+        assert synthesis.analysis_grade == "triage"
+        assert synthesis.summary.startswith("TRIAGE-GRADE")
+
+    def test_degraded_triage_degrades_every_stage(self):
+        synthesis = _synthesis(_triage(9.0, quality="partial"))
+        assert synthesis.degraded_agents == ["CS", "X", "Z"]
+        assert synthesis.overall_score is None
+        assert synthesis.recommendation == "revise"
+
+    def test_trusted_triage_veto_rejects(self):
+        synthesis = _synthesis(_triage(9.0, veto=True))
+        assert synthesis.recommendation == "reject"
+        assert synthesis.veto_reason == "Covert surveillance of minors."
+
+    def test_full_runs_keep_the_full_grade(self):
+        assert create_synthesis(*_real_results()).analysis_grade == "full"
+
+
+class TestEscalation:
+    def test_near_boundary_escalates(self):
+        assert triage_escalation_reason(_synthesis(_triage(7.3))) is not None
+        assert triage_escalation_reason(_synthesis(_triage(5.5))) is not None
+
+    def test_clear_verdict_does_not(self):
+        assert triage_escalation_reason(_synthesis(_triage(9.0))) is None
+
+    def test_veto_and_degraded_results_do_not(self):
+        assert triage_escalation_reason(_synthesis(_triage(4.0, veto=True))) is None
+        assert triage_escalation_reason(
+            _synthesis(_triage(7.5, quality="unavailable"))
+        ) is None
+
+    def test_unknown_mode_is_full(self):
+        assert normalize_mode("TRIAGE") == "triage"
+        assert normalize_mode("fast") == "full"
+        assert normalize_mode(None) == "full"
+
+
+class TestRunFullTrinity:
+    @pytest.fixture
+    def app(self, monkeypatch):
+        self.full_calls = []
+        self.triage_score = 9.0
+        providers = {
+            "X": _NamedProvider("gemini/gemini-3.5-flash-lite"),
+            "Z": _NamedProvider("groq/openai/gpt-oss-120b"),
+            "CS": _NamedProvider("groq/openai/gpt-oss-120b"),
+        }
+        monkeypatch.setattr(
+            config_helper, "get_trinity_providers", lambda _ctx: providers
+        )
+        x_result, z_result, cs_result = _real_results()
+
+        async def triage_analyze(_self, _concept, _prior=None, _metrics=None):
+            return _triage(self.triage_score)
+
+        def full(agent_id, result):
+            async def analyze(_self, _concept, _prior=None, _metrics=None):
+                self.full_calls.append(agent_id)
+                return result
+            return analyze
+
+        self.persisted = []
+        monkeypatch.setattr(
+            server, "persist_trinity_result",
+            lambda _uuid, tool, payload: self.persisted.append((tool, payload)),
+        )
+        monkeypatch.setattr(TriageAgent, "analyze", triage_analyze)
+        monkeypatch.setattr(XAgent, "analyze", full("X", x_result))
+        monkeypatch.setattr(ZAgent, "analyze", full("Z", z_result))
+        monkeypatch.setattr(CSAgent, "analyze", full("CS", cs_result))
+        return server.create_http_server()
+
+    @pytest.mark.asyncio
+    async def test_clear_triage_uses_one_call(self, app):
+        payload = await call(app, "run_full_trinity", {
+            "concept_name": "triage-probe",
+            "concept_description": "Clear pass.",
+            "mode": "triage",
+        })
+        assert self.full_calls == []
+        assert payload["mode"] == "triage"
+        assert payload["synthesis"]["analysis_grade"] == "triage"
+        assert payload["synthesis"]["recommendation"] == "proceed"
+        assert payload["top_concerns"] == ["Consent flow", "Abuse limits", "Vendor lock-in"]
+        assert payload["_triage"]["escalated"] is False
+        assert payload["saved_to_history"] is False
+        assert self.persisted == []
+
+    @pytest.mark.asyncio
+    async def test_near_boundary_escalates_to_full_chain(self, app):
+        self.triage_score = 7.4
+        payload = await call(app, "run_full_trinity", {
+            "concept_name": "triage-probe",
+            "concept_description": "Borderline.",
+            "mode": "triage",
+        })
+        assert self.full_calls == ["X", "Z", "CS"]
+        assert payload["synthesis"]["analysis_grade"] == "full"
+        assert payload["_triage"]["escalated"] is True
+        assert "7.5" in payload["_triage"]["escalation_reason"]
+        # The escalated run is a full validation and is recorded as one.
+        assert [p["synthesis"]["analysis_grade"] for _, p in self.persisted] == ["full"]
+
+    @pytest.mark.asyncio
+    async def test_escalation_can_be_disabled(self, app):
+        self.triage_score = 7.4
+        payload = await call(app, "run_full_trinity", {
+            "concept_name": "triage-probe",
+            "concept_description": "Borderline, no escalation.",
+            "mode": "triage",
+            "triage_escalate": False,
+        })
+        assert self.full_calls == []
+        assert payload["mode"] == "triage"
@@ -0,0 +1,142 @@
+"""on_veto="short_circuit" — skip CS once a real Z veto has decided the run.
+
+The skip must stay inside the degraded-stage contract: a skipped stage is
+never "real", so score and confidence stay withheld and the verdict rests on
+the trusted Z veto alone. Only a real Z veto may trigger the skip.
+"""
+
+import pytest
+
+from verifimind_mcp import config_helper, server
+from verifimind_mcp.agents import CSAgent, XAgent, ZAgent
+from verifimind_mcp.reporting.markdown_reporter import (
+    generate_markdown_report,
+    generate_yaml_frontmatter,
+)
+from verifimind_mcp.utils.provider_failures import skipped_agent_result
+from verifimind_mcp.utils.reasoning_view import build_reasoning_block
+from verifimind_mcp.utils.synthesis import (
+    create_synthesis,
+    create_trinity_result,
+)
+
+from .mcp_tool_harness import call
+from .test_v0558_trinity_traceability import _NamedProvider, _real_results
+
+
+def _vetoed_results():
+    x_result, z_result, _ = _real_results()
+    z_result.veto_triggered = True
+    return x_result, z_result, skipped_agent_result("CS")
+
+
+class TestSynthesis:
+    def test_skip_after_trusted_veto_rejects_and_withholds_aggregate(self):
+        synthesis = create_synthesis(*_vetoed_results())
+
+        assert synthesis.recommendation == "reject"
+        assert synthesis.veto_triggered is True
+        assert synthesis.overall_score is None
+        assert synthesis.confidence is None
+        assert synthesis.analysis_incomplete is True
+        assert synthesis.degraded_agents == ["CS"]
+        assert synthesis.skipped_agents == ["CS"]
+        assert synthesis.short_circuit == "z_veto"
+        assert "on_veto='short_circuit'" in synthesis.inference_warning
+        assert "Security: skipped" in synthesis.summary
+        assert synthesis.concerns[0].startswith("CS analysis skipped after Z veto")
+
+    def test_skip_without_trusted_veto_is_plain_degradation(self):
+        x_result, z_result, _ = _real_results()
+        synthesis = create_synthesis(x_result, z_result, skipped_agent_result("CS"))
+
+        assert synthesis.recommendation == "revise"
+        assert synthesis.short_circuit is None
+        assert synthesis.skipped_agents == ["CS"]
+        assert "on_veto" not in synthesis.inference_warning
+
+    def test_ordinary_runs_carry_no_skip_fields(self):
+        synthesis = create_synthesis(*_real_results())
+        assert synthesis.skipped_agents == []
+        assert synthesis.short_circuit is None
+
+
+class TestReporting:
+    def test_report_marks_cs_skipped_not_incomplete(self):
+        result = create_trinity_result("c", "d", *_vetoed_results())
+        report = generate_markdown_report(result)
+
+        assert "AGENT ANALYSIS SKIPPED" in report
+        assert "| CS Security | skipped |" in report
+        assert 'skipped_agents: "CS"' in generate_yaml_frontmatter(result)
+
+    def test_frontmatter_unchanged_without_skip(self):
+        result = create_trinity_result("c", "d", *_real_results())
+        assert "skipped_agents" not in generate_yaml_frontmatter(result)
+
+    def test_reasoning_block_flags_skipped_stage(self):
+        x_result, z_result, cs_result = _vetoed_results()
+        block = build_reasoning_block(
+            x_result, z_result, cs_result,
+            chain_status={"x_agent": "real", "z_agent": "real", "cs_agent": "skipped"},
+            overall_quality="partial",
+            inference_warning=None,
+            detail="standard",
+        )
+        assert block["cs"]["skipped"] is True
+        assert block["cs"]["withheld"] is True
+
+
+class TestRunFullTrinity:
+    @pytest.fixture
+    def app(self, monkeypatch):
+        x_result, z_result, cs_result = _real_results()
+        z_result.veto_triggered = True
+        self.cs_calls = 0
+        providers = {
+            "X": _NamedProvider("gemini/gemini-3.5-flash-lite"),
+            "Z": _NamedProvider("groq/openai/gpt-oss-120b"),
+            "CS": _NamedProvider("groq/openai/gpt-oss-120b"),
+        }
+        monkeypatch.setattr(
+            config_helper, "get_trinity_providers", lambda _ctx: providers
+        )
+
+        async def x_analyze(_self, _concept, _prior=None, _metrics=None):
+            return x_result
+
+        async def z_analyze(_self, _concept, _prior=None, _metrics=None):
+            return z_result
+
+        async def cs_analyze(_self, _concept, _prior=None, _metrics=None):
+            self.cs_calls += 1
+            return cs_result
+
+        monkeypatch.setattr(XAgent, "analyze", x_analyze)
+        monkeypatch.setattr(ZAgent, "analyze", z_analyze)
+        monkeypatch.setattr(CSAgent, "analyze", cs_analyze)
+        return server.create_http_server()
+
+    @pytest.mark.asyncio
+    async def test_short_circuit_skips_cs_call(self, app):
+        payload = await call(app, "run_full_trinity", {
+            "concept_name": "veto-probe",
+            "concept_description": "Short-circuit regression.",
+            "on_veto": "short_circuit",
+        })
+        assert self.cs_calls == 0
+        assert payload["_agent_chain_status"]["cs_agent"] == "skipped"
+        assert payload["_stages_skipped"] == ["CS"]
+        assert payload["synthesis"]["recommendation"] == "reject"
+        assert payload["synthesis"]["short_circuit"] == "z_veto"
+        assert payload["synthesis"]["overall_score"] is None
+
+    @pytest.mark.asyncio
+    async def test_default_still_runs_cs(self, app):
+        payload = await call(app, "run_full_trinity", {
+            "concept_name": "veto-probe",
+            "concept_description": "Default-mode regression.",
+        })
+        assert self.cs_calls == 1
+        assert payload["_agent_chain_status"]["cs_agent"] == "real"
+        assert "_stages_skipped" not in payload
@@ -0,0 +1,170 @@
+"""Adaptive completion budgets.
+
+Pinned: the configured budget holds until enough real outputs are seen; the
+learned budget is percentile + margin, never below the largest output that
+fit and never above the configured ceiling; a truncation — raised or silent —
+returns the key to the configured budget; the kill switch restores fixed
+budgets; BaseAgent requests the learned budget per (agent, model, detail)
+and retries once at the configured budget when output fills a learned one.
+"""
+
+import pytest
+
+from verifimind_mcp.agents import XAgent
+from verifimind_mcp.models import ChainOfThought, Concept, PriorReasoning, ReasoningStep
+from verifimind_mcp.utils import completion_budget as budget_mod
+from verifimind_mcp.utils.completion_budget import (
+    ADAPTIVE_BUDGET_ENV,
+    MIN_ADAPTIVE_BUDGET,
+    MIN_SAMPLES,
+    CompletionBudgetController,
+    budget_key,
+    get_completion_budget_controller,
+)
+
+_KEY = budget_key("X", "groq/openai/gpt-oss-120b", orchestrated=False)
+
+
+def _learned(outputs, configured=8192):
+    controller = CompletionBudgetController()
+    for output in outputs:
+        controller.record_output(_KEY, output)
+    return controller, controller.budget_for(_KEY, configured)
+
+
+class TestController:
+    def test_configured_until_enough_samples(self):
+        _, budget = _learned([1500] * (MIN_SAMPLES - 1))
+        assert budget == 8192
+
+    def test_percentile_plus_margin(self):
+        _, budget = _learned([1500] * MIN_SAMPLES)
+        assert budget == int(1500 * (1 + budget_mod.BUDGET_MARGIN_RATIO))
+
+    def test_never_below_largest_fitting_output_or_floor(self):
+        _, budget = _learned([1000] * 99 + [6000])
+        assert budget >= 6000
+        _, budget = _learned([100] * MIN_SAMPLES)
+        assert budget == MIN_ADAPTIVE_BUDGET
+
+    def test_never_above_configured(self):
+        _, budget = _learned([4000] * MIN_SAMPLES, configured=4096)
+        assert budget == 4096
+
+    def test_truncation_reverts_to_configured(self):
+        controller, _ = _learned([1500] * MIN_SAMPLES)
+        controller.record_truncation(_KEY)
+        assert controller.budget_for(_KEY, 8192) == 8192
+
+    def test_detail_levels_are_separate(self):
+        controller, _ = _learned([1500] * MIN_SAMPLES)
+        orchestrated = budget_key("X", "groq/openai/gpt-oss-120b", orchestrated=True)
+        assert controller.budget_for(orchestrated, 8192) == 8192
+
+    def test_kill_switch(self, monkeypatch):
+        controller, _ = _learned([1500] * MIN_SAMPLES)
+        monkeypatch.setenv(ADAPTIVE_BUDGET_ENV, "0")
+        assert controller.budget_for(_KEY, 8192) == 8192
+
+
+_CONTENT = {
+    "reasoning_steps": [{"step_number": 1, "thought": "t", "confidence": 0.9}],
+    "innovation_score": 7.0,
+    "strategic_value": 7.0,
+    "opportunities": ["o"],
+    "risks": ["r"],
+    "recommendation": "Proceed.",
+    "confidence": 0.9,
+}
+
+
+class _Truncated(ValueError):
+    _provider_output_truncated = True
+
+
+class _Provider:
+    def __init__(self, output_tokens, truncate_first=False):
+        self.output_tokens = output_tokens
+        self.truncate_first = truncate_first
+        self.requested = []
+
+    async def generate(self, **kwargs):
+        self.requested.append(kwargs["max_tokens"])
+        if self.truncate_first and len(self.requested) == 1:
+            raise _Truncated("output cut off at max_tokens")
+        return {
+            "content": dict(_CONTENT),
+            "usage": {"output_tokens": self.output_tokens},
+            "_inference_quality": "real",
+        }
+
+    def get_model_name(self):
+        return "groq/openai/gpt-oss-120b"
+
+
+class TestBaseAgent:
+    @pytest.mark.asyncio
+    async def test_agent_requests_learned_budget(self, monkeypatch):
+        monkeypatch.setenv("VERIFIMIND_SINGLE_FLIGHT", "0")
+        provider = _Provider(output_tokens=1500)
+        agent = XAgent(llm_provider=provider)
+        concept = Concept(name="budget-probe", description="A plain concept.")
+
+        for _ in range(MIN_SAMPLES + 1):
+            await agent.analyze(concept)
+
+        assert provider.requested[0] == agent.config.max_tokens
+        assert provider.requested[-1] < agent.config.max_tokens
+        # Orchestrated calls have their own (still unlearned) budget.
+        prior = PriorReasoning(chains=[ChainOfThought(
+            agent_id="X",
+            agent_name="X Intelligent",
+            concept_name="budget-probe",
+            reasoning_steps=[ReasoningStep(step_number=1, thought="prior")],
+            final_conclusion="Proceed.",
+        )])
+        await agent.analyze(concept, prior)
+        assert provider.requested[-1] == agent.config.max_tokens
+
+    @pytest.mark.asyncio
+    async def test_silently_filled_reservation_counts_as_truncation(self, monkeypatch):
+        monkeypatch.setenv("VERIFIMIND_SINGLE_FLIGHT", "0")
+        controller = get_completion_budget_controller()
+        model_key = budget_key("X", "groq/openai/gpt-oss-120b", orchestrated=False)
+        for _ in range(MIN_SAMPLES):
+            controller.record_output(model_key, 1500)
+        learned = controller.budget_for(model_key, 8192)
+
+        provider = _Provider(output_tokens=learned)
+        agent = XAgent(llm_provider=provider)
+        result = await agent.analyze(Concept(name="budget-probe", description="Long answer."))
+
+        # Filled the learned reservation: retried once at the configured one.
+        assert provider.requested == [learned, agent.config.max_tokens]
+        assert result._output_tokens == learned
+        assert controller.budget_for(model_key, 8192) == 8192
+
+    @pytest.mark.asyncio
+    async def test_raised_truncation_at_learned_budget_retries_once(self, monkeypatch):
+        monkeypatch.setenv("VERIFIMIND_SINGLE_FLIGHT", "0")
+        controller = get_completion_budget_controller()
+        model_key = budget_key("X", "groq/openai/gpt-oss-120b", orchestrated=False)
+        for _ in range(MIN_SAMPLES):
+            controller.record_output(model_key, 1500)
+        learned = controller.budget_for(model_key, 8192)
+
+        provider = _Provider(output_tokens=1500, truncate_first=True)
+        agent = XAgent(llm_provider=provider)
+        result = await agent.analyze(Concept(name="budget-probe", description="Long answer."))
+
+        assert provider.requested == [learned, agent.config.max_tokens]
+        assert result.confidence == 0.9
+
+    @pytest.mark.asyncio
+    async def test_truncation_at_configured_budget_is_not_retried(self, monkeypatch):
+        monkeypatch.setenv("VERIFIMIND_SINGLE_FLIGHT", "0")
+        provider = _Provider(output_tokens=1500, truncate_first=True)
+        agent = XAgent(llm_provider=provider)
+        with pytest.raises(_Truncated):
+            await agent.analyze(Concept(name="budget-probe", description="Long answer."))
+        assert provider.requested == [agent.config.max_tokens]
@@ -0,0 +1,115 @@
+"""
+Non-blocking log pipeline.
+
+Pinned: without the pipeline, events and TRACER lines are written inline as
+before; once installed, log records become Cloud Logging JSON lines and
+events/TRACER lines keep their exact wire format, all written by the
+background thread; immutable %-arguments are formatted late, mutable ones at
+the call; a stalled sink never blocks the caller, overflow is counted; and
+shutdown drains the queue and restores the previous root handlers.
+"""
+
+import json
+import logging
+import threading
+import time
+
+import pytest
+
+from verifimind_mcp.utils import log_pipeline as lp
+from verifimind_mcp.utils.uuid_tracer import emit_tracer
+
+VALID_UUID = "019d40d6-9e84-7738-9c0c-fa85b2930600"
+
+
+@pytest.fixture
+def pipeline(monkeypatch):
+    monkeypatch.delenv(lp.ASYNC_LOGGING_ENV, raising=False)
+    assert lp.install_log_pipeline(level="INFO")
+    yield
+    lp.shutdown_log_pipeline()
+
+
+class TestSynchronousFallback:
+
+    @pytest.mark.unit
+    def test_events_write_inline_without_pipeline(self, capsys):
+        lp.emit_json({"severity": "INFO", "event": "x"})
+        emit_tracer(VALID_UUID, "consult_agent_x")
+        captured = capsys.readouterr()
+        assert json.loads(captured.err) == {"severity": "INFO", "event": "x"}
+        assert captured.out == f"TRACER_UUID: {VALID_UUID} tool=consult_agent_x tier=scholar\n"
+        assert lp.get_log_pipeline_stats() == {"enabled": False}
+
+    @pytest.mark.unit
+    def test_kill_switch(self, monkeypatch):
+        monkeypatch.setenv(lp.ASYNC_LOGGING_ENV, "off")
+        assert lp.install_log_pipeline() is False
+        assert lp.get_log_pipeline_stats() == {"enabled": False}
+
+
+class TestPipeline:
+
+    @pytest.mark.unit
+    def test_lines_are_written_by_the_writer_thread(self, pipeline, capsys):
+        logging.getLogger("verifimind.test").warning("hello %s", "world")
+        lp.emit_json({"severity": "INFO", "event": "tool_invoked", "tool": "t"})
+        emit_tracer(VALID_UUID, "consult_agent_x")
+        lp.shutdown_log_pipeline()
+
+        captured = capsys.readouterr()
+        record, tracer = captured.out.splitlines()
+        payload = json.loads(record)
+        assert payload["severity"] == "WARNING"
+        assert payload["message"] == "hello world"
+        assert payload["logger"] == "verifimind.test"
+        assert "time" in payload
+        assert tracer == f"TRACER_UUID: {VALID_UUID} tool=consult_agent_x tier=scholar"
+        assert json.loads(captured.err) == {"severity": "INFO", "event": "tool_invoked", "tool": "t"}
+
+    @pytest.mark.unit
+    def test_mutable_arguments_are_rendered_at_the_call(self):
+        handler = lp._DeferredQueueHandler(lp.LogPipeline(capacity=4))
+        items = ["a"]
+        record = logging.LogRecord("n", logging.INFO, __file__, 1, "items=%s", (items,), None)
+        handler.prepare(record)
+        items.append("b")
+        assert record.getMessage() == "items=['a']"
+
+        lazy = logging.LogRecord("n", logging.INFO, __file__, 1, "%s/%d", ("x", 2), None)
+        handler.prepare(lazy)
+        assert lazy.args == ("x", 2)  # left for the writer thread
+
+    @pytest.mark.unit
+    def test_stalled_sink_drops_instead_of_blocking(self, monkeypatch):
+        release = threading.Event()
+
+        class _Stalled:
+            def write(self, text):
+                release.wait(5)
+
+            def flush(self):
+                pass
+
+        monkeypatch.setattr(lp.sys, "stderr", _Stalled())
+        pipeline = lp.LogPipeline(capacity=2)
+        try:
+            started = time.perf_counter()
+            results = [pipeline.put(lp._Line("stderr", {"n": i})) for i in range(50)]
+            assert time.perf_counter() - started < 1.0
+            assert results.count(False) == pipeline.dropped >= 45
+        finally:
+            release.set()
+            pipeline.stop()
+        assert pipeline.stats()["written"] + pipeline.dropped == 50
+
+    @pytest.mark.unit
+    def test_shutdown_restores_root_handlers(self, monkeypatch):
+        monkeypatch.delenv(lp.ASYNC_LOGGING_ENV, raising=False)
+        root = logging.getLogger()
+        before, level = list(root.handlers), root.level
+        lp.install_log_pipeline()
+        assert [type(h) for h in root.handlers] == [lp._DeferredQueueHandler]
+        assert lp.install_log_pipeline()  # idempotent
+        lp.shutdown_log_pipeline()
+        assert root.handlers == before and root.level == level
@@ -0,0 +1,157 @@
+"""
+Event-loop lag monitor and executor offload.
+
+Pinned: a callback that blocks the loop is reported with its measured
+duration, the task that was running and the blocking frame; small lags only
+feed the histogram; the monitor is off without the lifespan and behind its
+kill switch. Offloaded calls keep the loop responsive, carry contextvars,
+count their pool usage, and small CPU inputs stay inline; the template
+registry's first construction runs off the loop.
+"""
+
+import asyncio
+import contextvars
+import threading
+import time
+
+import pytest
+
+from verifimind_mcp.utils import loop_monitor as lm
+from verifimind_mcp.utils import offload
+
+
+def _block(seconds):
+    time.sleep(seconds)
+
+
+class TestLoopMonitor:
+
+    @pytest.mark.asyncio
+    async def test_blocking_callback_is_attributed(self):
+        monitor = lm.LoopMonitor(interval=0.02, slow_ms=50)
+        monitor.start()
+        try:
+            await asyncio.sleep(0.05)
+
+            async def hog():
+                _block(0.3)
+
+            await asyncio.create_task(hog(), name="hog-task")
+            await asyncio.sleep(0.1)
+        finally:
+            monitor.stop()
+
+        assert monitor.stalls >= 1
+        stall = max(monitor.recent, key=lambda s: s["blocked_ms"])
+        assert stall["blocked_ms"] >= 150
+        assert stall["task"] == "hog-task:TestLoopMonitor.test_blocking_callback_is_attributed.<locals>.hog"
+        assert any("_block" in frame for frame in stall["stack"])
+        stats = monitor.stats()
+        assert stats["slow_callbacks"] == monitor.stalls
+        assert sum(stats["histogram_ms"].values()) == stats["samples"]
+
+    def test_small_lag_is_not_a_stall(self):
+        monitor = lm.LoopMonitor(interval=0.1, slow_ms=100)
+        for lag in (0.5, 3, 20, 99):
+            monitor.observe(lag)
+        monitor.observe(-1)  # early wake-up clamps to zero
+        stats = monitor.stats()
+        assert stats["slow_callbacks"] == 0 and stats["recent_stalls"] == []
+        assert stats["samples"] == 5
+        assert stats["lag_ms"]["max"] == 99
+        assert stats["histogram_ms"]["le_1"] == 2
+        assert stats["lag_ms"]["p99_le"] == 100.0
+
+    @pytest.mark.asyncio
+    async def test_global_monitor_lifecycle(self, monkeypatch):
+        assert lm.get_loop_monitor_stats() == {"enabled": False}
+        monkeypatch.setenv(lm.LOOP_MONITOR_ENV, "off")
+        assert lm.start_loop_monitor() is False
+        monkeypatch.delenv(lm.LOOP_MONITOR_ENV)
+        assert lm.start_loop_monitor() is True
+        try:
+            assert lm.get_loop_monitor_stats()["enabled"] is True
+        finally:
+            lm.stop_loop_monitor()
+        assert lm.get_loop_monitor_stats() == {"enabled": False}
+
+
+class TestOffload:
+
+    @pytest.mark.asyncio
+    async def test_blocking_call_leaves_the_loop_free(self):
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        try:
+            await offload.run_in_thread(_block, 0.2)
+        finally:
+            task.cancel()
+        assert ticks >= 5
+
+    @pytest.mark.asyncio
+    async def test_contextvars_and_stats(self):
+        var = contextvars.ContextVar("var")
+        var.set("caller")
+        before = offload.get_offload_stats()["threads"]["calls"]
+        assert await offload.run_in_thread(var.get) == "caller"
+        stats = offload.get_offload_stats()["threads"]
+        assert stats["calls"] == before + 1 and stats["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_errors_propagate(self):
+        def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            await offload.run_in_thread(fail)
+
+    @pytest.mark.asyncio
+    async def test_small_cpu_input_runs_inline(self, monkeypatch):
+        monkeypatch.setattr(offload, "CPU_OFFLOAD_MIN_COST", 100)
+        caller = threading.get_ident()
+        assert await offload.run_cpu(threading.get_ident, cost=10) == caller
+        assert await offload.run_cpu(threading.get_ident, cost=1000) != caller
+
+    @pytest.mark.slow
+    @pytest.mark.asyncio
+    async def test_process_pool(self, monkeypatch):
+        from verifimind_mcp.llm.provider import GeminiProvider
+
+        monkeypatch.setattr(offload, "OFFLOAD_PROCESSES", 1)
+        monkeypatch.setattr(offload, "_process_pool", None)
+        text = 'noise {"a": 1} more {"a": 2, "b": 3}'
+        try:
+            result = await offload.run_cpu(GeminiProvider._extract_best_json, text, ["a", "b"])
+        finally:
+            offload.shutdown_offload(wait=True)
+        assert result == {"a": 2, "b": 3}
+        assert offload.get_offload_stats()["processes"]["calls"] >= 1
+
+
+class TestTemplateRegistry:
+
+    @pytest.mark.asyncio
+    async def test_first_construction_is_offloaded(self, monkeypatch):
+        from verifimind_mcp.templates import registry as registry_module
+        from verifimind_mcp.templates.registry import TemplateRegistry
+
+        monkeypatch.setattr(TemplateRegistry, "_instance", None)
+        calls = []
+        original = offload.run_in_thread
+
+        async def spy(fn, *args, **kwargs):
+            calls.append(fn)
+            return await original(fn, *args, **kwargs)
+
+        monkeypatch.setattr(offload, "run_in_thread", spy)
+        first = await registry_module.get_registry_async()
+        second = await registry_module.get_registry_async()
+        assert first is second and first.list_templates()
+        assert calls == [registry_module._construct_registry]